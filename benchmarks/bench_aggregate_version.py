@@ -0,0 +1,124 @@
+"""
+Benchmark AggregateVersion allocations on the commit and load paths.
+
+Compares the interned AggregateVersion against a copy of the previous,
+always-allocating implementation. Run it with:
+
+    python benchmarks/bench_aggregate_version.py
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from collections.abc import Hashable
+from typing import Callable, List
+from uuid import uuid4
+
+from building_blocks.domain.aggregate_root import AggregateRoot, AggregateVersion
+from building_blocks.domain.value_object import ValueObject
+
+COMMITS = 200
+ROWS = 10_000
+REPEAT = 5
+
+
+class LegacyAggregateVersion(ValueObject):
+    """The AggregateVersion implementation before interning, for reference."""
+
+    def __init__(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError(f"Expected int, got {type(value).__name__}")
+        if value < 0:
+            raise ValueError("Version cannot be negative")
+        self._value = value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def increment(self) -> LegacyAggregateVersion:
+        return LegacyAggregateVersion(self._value + 1)
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        return (self._value,)
+
+
+class Counter(AggregateRoot[str]):
+    pass
+
+
+def _commit_legacy(history: List[object]) -> None:
+    version = LegacyAggregateVersion(0)
+    for _ in range(COMMITS):
+        version = version.increment()
+        history.append(version)
+
+
+def _commit_interned(history: List[object]) -> None:
+    aggregate = Counter(str(uuid4()))
+    for _ in range(COMMITS):
+        aggregate.mark_changes_as_committed()
+        history.append(aggregate.version)
+
+
+def _load_legacy(history: List[object]) -> None:
+    for row in range(ROWS):
+        history.append(LegacyAggregateVersion(row % COMMITS))
+
+
+def _load_interned(history: List[object]) -> None:
+    for row in range(ROWS):
+        history.append(AggregateVersion.of(row % COMMITS))
+
+
+def _allocated_bytes(run: Callable[[List[object]], None]) -> int:
+    """
+    Bytes still allocated by ``run`` while every version it produced is alive.
+
+    Each version kept also costs one pointer in the history list, so 8 bytes
+    per operation is the floor.
+    """
+    history: List[object] = []
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    run(history)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def _best_of(run: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(run, number=number, repeat=REPEAT)) / number
+
+
+def main() -> None:
+    rows = [
+        (
+            "commit (increment)",
+            _best_of(lambda: LegacyAggregateVersion(7).increment(), 200_000),
+            _best_of(lambda: AggregateVersion.of(7).increment(), 200_000),
+        ),
+        (
+            "load (from row)",
+            _best_of(lambda: LegacyAggregateVersion(7), 200_000),
+            _best_of(lambda: AggregateVersion.of(7), 200_000),
+        ),
+    ]
+    for name, legacy, interned in rows:
+        print(
+            f"{name:<20} legacy={legacy * 1e9:>8.1f}ns"
+            f"  interned={interned * 1e9:>8.1f}ns  gain={legacy / interned:>5.2f}x"
+        )
+
+    for name, legacy_run, interned_run, count in (
+        ("commit path", _commit_legacy, _commit_interned, COMMITS),
+        ("load path", _load_legacy, _load_interned, ROWS),
+    ):
+        legacy = _allocated_bytes(legacy_run) / count
+        interned = _allocated_bytes(interned_run) / count
+        print(f"{name:<20} legacy={legacy:>8.1f}B/op  interned={interned:>8.1f}B/op")
+
+
+if __name__ == "__main__":
+    main()
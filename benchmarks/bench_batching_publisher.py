@@ -0,0 +1,71 @@
+"""
+Benchmark BatchingEventPublisher against per-event publishing.
+
+The broker stand-in charges a fixed round-trip latency per call, like a
+network hop to Kafka or NATS, and accepts batches in one call. Run it with:
+
+    python benchmarks/bench_batching_publisher.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Iterable
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+)
+from building_blocks.domain.messages import Event
+from building_blocks.infrastructure.batching_event_publisher import (
+    BatchingEventPublisher,
+)
+
+EVENTS = 2_000
+ROUND_TRIP_SECONDS = 0.0005
+
+
+class TaskCompleted(Event):
+    number: int
+
+
+class BrokerStandIn(AsyncEventPublisher[TaskCompleted]):
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.received = 0
+
+    async def publish(self, event: TaskCompleted) -> None:
+        await self.publish_many([event])
+
+    async def publish_many(self, events: Iterable[TaskCompleted]) -> None:
+        self.round_trips += 1
+        self.received += len(list(events))
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+
+async def _run(publisher: AsyncEventPublisher[TaskCompleted]) -> float:
+    events = [TaskCompleted(i) for i in range(EVENTS)]
+    start = time.perf_counter()
+    for event in events:
+        await publisher.publish(event)
+    if isinstance(publisher, BatchingEventPublisher):
+        await publisher.aclose()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f"{'publisher':<24} {'events/s':>10} {'round trips':>12}")
+    direct = BrokerStandIn()
+    elapsed = await _run(direct)
+    print(f"{'per event':<24} {EVENTS / elapsed:>10.0f} {direct.round_trips:>12}")
+    for batch_size in (10, 100):
+        broker = BrokerStandIn()
+        batching = BatchingEventPublisher(broker, max_batch_size=batch_size)
+        elapsed = await _run(batching)
+        assert broker.received == EVENTS
+        name = f"batches of {batch_size}"
+        print(f"{name:<24} {EVENTS / elapsed:>10.0f} {broker.round_trips:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
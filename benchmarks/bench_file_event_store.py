@@ -0,0 +1,55 @@
+"""
+Benchmark append throughput of AsyncFileEventStore.
+
+Appends one event per call to distinct streams, awaiting each append before
+the next and then running the appends concurrently, so group commit can
+cover many appends with one fsync. The log is written to a temporary
+directory on the local disk. Run it with:
+
+    python benchmarks/bench_file_event_store.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+
+from building_blocks.domain.messages import Event
+from building_blocks.domain.messages.codec import MessageCodec
+from building_blocks.infrastructure.file_event_store import AsyncFileEventStore
+
+APPENDS = 2_000
+
+
+class MoneyDeposited(Event):
+    account_id: str
+    amount: int
+
+
+async def _run(concurrency: int) -> None:
+    codec = MessageCodec()
+    codec.register(MoneyDeposited)
+    with tempfile.TemporaryDirectory() as directory:
+        async with AsyncFileEventStore(directory, codec) as store:
+
+            async def append(start: int) -> None:
+                for i in range(start, APPENDS, concurrency):
+                    stream_id = f"account-{i}"
+                    await store.append(stream_id, 0, [MoneyDeposited(stream_id, i)])
+
+            start = time.perf_counter()
+            await asyncio.gather(*(append(i) for i in range(concurrency)))
+            elapsed = time.perf_counter() - start
+            name = f"{concurrency} concurrent"
+            print(f"{name:<16} {APPENDS / elapsed:>12.0f} {store.sync_count:>8}")
+
+
+async def main() -> None:
+    print(f"{'appends':<16} {'appends/s':>12} {'fsyncs':>8}")
+    for concurrency in (1, 10, 100):
+        await _run(concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark identifier generators: generation cost and index insert locality.
+
+Insert locality is simulated with a sorted list standing in for a B-tree index.
+Existing keys are loaded first, then new keys are inserted; the benchmark
+reports how many inserts land at the right-hand edge of the index and how many
+distinct leaf pages (fixed-size runs of keys) the inserts touch. Random keys
+touch pages all over the index, which in a database means page splits and
+cache misses. Run it with:
+
+    python benchmarks/bench_id_generators.py
+"""
+
+from __future__ import annotations
+
+import bisect
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from building_blocks.infrastructure.id_generators import (
+    SnowflakeIdGenerator,
+    ULIDGenerator,
+    UUID4Generator,
+    UUIDv7Generator,
+)
+
+EXISTING_KEYS = 100_000
+NEW_KEYS = 10_000
+KEYS_PER_PAGE = 100
+REPEAT = 5
+
+
+def _generation_cost(next_id: Callable[[], Any]) -> float:
+    number = 100_000
+    return min(timeit.repeat(next_id, number=number, repeat=REPEAT)) / number
+
+
+def _insert_locality(next_id: Callable[[], Any]) -> Tuple[float, int]:
+    index: List[Any] = sorted(next_id() for _ in range(EXISTING_KEYS))
+    right_edge = 0
+    pages = set()
+    for _ in range(NEW_KEYS):
+        key = next_id()
+        position = bisect.bisect_right(index, key)
+        if position == len(index):
+            right_edge += 1
+        pages.add(position // KEYS_PER_PAGE)
+        index.insert(position, key)
+    return right_edge / NEW_KEYS, len(pages)
+
+
+def main() -> None:
+    generators = [
+        ("uuid4", UUID4Generator().next_id),
+        ("UUIDv7", UUIDv7Generator().next_id),
+        ("ULID", ULIDGenerator().next_id),
+        ("Snowflake", SnowflakeIdGenerator(worker_id=1).next_id),
+    ]
+    print(
+        f"{'generator':<10} {'ns/id':>8} {'right-edge inserts':>20}"
+        f" {'leaf pages touched':>20}"
+    )
+    for name, next_id in generators:
+        cost = _generation_cost(next_id)
+        right_edge, pages = _insert_locality(next_id)
+        print(f"{name:<10} {cost * 1e9:>8.0f} {right_edge:>20.1%} {pages:>20}")
+
+
+if __name__ == "__main__":
+    main()
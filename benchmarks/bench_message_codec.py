@@ -0,0 +1,121 @@
+"""
+Benchmark MessageCodec against Message.to_dict plus JSON.
+
+Encodes the same event with both approaches and reports time per message and
+encoded size. The codec writes into one reused buffer. A second table
+compares encoding a 50-event commit one event at a time with encode_many.
+Run it with:
+
+    python benchmarks/bench_message_codec.py
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from building_blocks.domain.messages import Event, MessageCodec, MessageMetadata
+
+NUMBER = 20_000
+BATCH_SIZE = 50
+REPEAT = 5
+
+
+class TaskAssigned(Event):
+    def __init__(
+        self,
+        task_id: UUID,
+        assignee_id: UUID,
+        title: str,
+        priority: int,
+        tags: list,
+        metadata: Optional[MessageMetadata] = None,
+    ) -> None:
+        super().__init__(metadata)
+        self._task_id = task_id
+        self._assignee_id = assignee_id
+        self._title = title
+        self._priority = priority
+        self._tags = tags
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "task_id": self._task_id,
+            "assignee_id": self._assignee_id,
+            "title": self._title,
+            "priority": self._priority,
+            "tags": self._tags,
+        }
+
+
+def _best(statement: Any) -> float:
+    return min(timeit.repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def _report(name: str, statement: Any, size: int) -> None:
+    print(f"{name:<22} {_best(statement) * 1e6:>10.2f} {size:>6}")
+
+
+def _report_batch(name: str, statement: Any, encoded: List[bytes]) -> None:
+    size = sum(len(data) for data in encoded) // BATCH_SIZE
+    cost = min(timeit.repeat(statement, number=NUMBER // BATCH_SIZE, repeat=REPEAT))
+    print(f"{name:<22} {cost / NUMBER * 1e6:>10.2f} {size:>6}")
+
+
+def main() -> None:
+    codec = MessageCodec()
+    codec.register(TaskAssigned)
+    event = TaskAssigned(uuid4(), uuid4(), "Write the report", 2, ["docs", "q3"])
+    buffer = bytearray()
+
+    def encode_json() -> bytes:
+        return json.dumps(event.to_dict(), default=str).encode()
+
+    def encode_codec() -> None:
+        del buffer[:]
+        codec.encode_into(event, buffer)
+
+    encoded_json = encode_json()
+    encoded = codec.encode(event)
+
+    def decode_codec() -> None:
+        codec.decode(encoded)
+
+    print(f"{'approach':<22} {'us/message':>10} {'bytes':>6}")
+    _report("to_dict + json", encode_json, len(encoded_json))
+    _report("codec encode_into", encode_codec, len(encoded))
+    _report("codec decode", decode_codec, len(encoded))
+
+    batch = [
+        TaskAssigned(uuid4(), uuid4(), f"Task {i}", i % 3, ["docs"])
+        for i in range(BATCH_SIZE)
+    ]
+
+    def encode_json_each() -> List[bytes]:
+        return [json.dumps(e.to_dict(), default=str).encode() for e in batch]
+
+    def encode_codec_each() -> List[bytes]:
+        return [codec.encode(e) for e in batch]
+
+    def encode_codec_many() -> bytes:
+        return codec.encode_many(batch)
+
+    encoded_batch = encode_codec_many()
+
+    def decode_codec_many() -> None:
+        for _ in codec.decode_many(encoded_batch):
+            pass
+
+    print()
+    print(f"{'approach':<22} {'us/message':>10} {'bytes':>6}")
+    _report_batch("json per event", encode_json_each, encode_json_each())
+    _report_batch("codec encode per event", encode_codec_each, encode_codec_each())
+    _report_batch("codec encode_many", encode_codec_many, [encoded_batch])
+    _report_batch("codec decode_many", decode_codec_many, [encoded_batch])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark loading an event-sourced aggregate with and without snapshots.
+
+An account with a long history is loaded through a SyncEventSourcedRepository
+over a SyncFileEventStore: by replaying every event, from a snapshot in a
+SyncFileSnapshotStore, and from one in a SyncInMemorySnapshotStore. With a
+snapshot, only the few events recorded after it are read and applied. Run it
+with:
+
+    python benchmarks/bench_snapshot_store.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from building_blocks.application.ports.outbound.snapshot_store import (
+    SyncSnapshotStore,
+)
+from building_blocks.domain.event_sourced_aggregate_root import (
+    EventSourcedAggregateRoot,
+    handles,
+)
+from building_blocks.domain.messages import Event
+from building_blocks.domain.messages.codec import MessageCodec
+from building_blocks.infrastructure.event_sourced_repository import (
+    SyncEventSourcedRepository,
+)
+from building_blocks.infrastructure.file_event_store import SyncFileEventStore
+from building_blocks.infrastructure.snapshot_store import (
+    SyncFileSnapshotStore,
+    SyncInMemorySnapshotStore,
+)
+
+EVENTS = 1_005
+SNAPSHOT_EVERY = 100
+LOADS = 200
+
+
+class MoneyDeposited(Event):
+    amount: int
+    reference: str
+
+
+class Account(EventSourcedAggregateRoot[int]):
+    snapshot_every = SNAPSHOT_EVERY
+
+    def __init__(self, account_id: int) -> None:
+        super().__init__(account_id)
+        self.balance = 0
+        self.references: Dict[str, int] = {}
+
+    def deposit(self, amount: int, reference: str) -> None:
+        self.record_event(MoneyDeposited(amount, reference))
+
+    @handles(MoneyDeposited)
+    def _on_deposited(self, event: MoneyDeposited) -> None:
+        self.balance += event.amount
+        self.references[event.reference] = event.amount
+
+
+def _time(repository: SyncEventSourcedRepository[Account]) -> float:
+    start = time.perf_counter()
+    for _ in range(LOADS):
+        repository.find_by_id(1)
+    return (time.perf_counter() - start) / LOADS
+
+
+def main() -> None:
+    codec = MessageCodec()
+    codec.register(MoneyDeposited)
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        with SyncFileEventStore(root / "events", codec) as events:
+            stores: List[Optional[SyncSnapshotStore]] = [
+                None,
+                SyncFileSnapshotStore(root / "snapshots"),
+                SyncInMemorySnapshotStore(),
+            ]
+            account = Account(1)
+            writer = SyncEventSourcedRepository(Account, events)
+            for i in range(EVENTS):
+                account.deposit(i, f"ref-{i}")
+                writer.save(account)
+                if account.snapshot_due:
+                    snapshot = account.take_snapshot()
+                    for store in stores:
+                        if store is not None:
+                            store.save(snapshot)
+
+            print(f"{'load':<24} {'us/load':>10}")
+            names = ["full replay", "file snapshot", "in-memory snapshot"]
+            for name, store in zip(names, stores):
+                repository = SyncEventSourcedRepository(Account, events, store)
+                loaded = repository.find_by_id(1)
+                assert loaded is not None and loaded.balance == account.balance
+                micros = _time(repository) * 1e6
+                print(f"{name:<24} {micros:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
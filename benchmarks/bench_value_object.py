@@ -0,0 +1,128 @@
+"""
+Benchmark ValueObject against SlottedValueObject and FrozenValueObject.
+
+Measures hashing, equality, dict lookups, per-instance memory and field reads
+for equivalent value objects. Run it with:
+
+    python benchmarks/bench_value_object.py
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from collections.abc import Hashable
+from typing import Callable, List
+
+from building_blocks.domain.value_object import (
+    FrozenValueObject,
+    SlottedValueObject,
+    ValueObject,
+)
+
+INSTANCES = 100_000
+REPEAT = 5
+
+
+class PlainMoney(ValueObject):
+    def __init__(self, amount: int, currency: str) -> None:
+        self._amount = amount
+        self._currency = currency
+
+    @property
+    def amount(self) -> int:
+        return self._amount
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        return (self._amount, self._currency)
+
+
+class SlottedMoney(SlottedValueObject):
+    __slots__ = ("_amount", "_currency")
+
+    def __init__(self, amount: int, currency: str) -> None:
+        self._amount = amount
+        self._currency = currency
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        return (self._amount, self._currency)
+
+
+class FrozenMoney(FrozenValueObject):
+    amount: int
+    currency: str
+
+
+def _best_of(statement: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number
+
+
+def _memory_per_instance(factory: Callable[[int], object]) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances: List[object] = [factory(i) for i in range(INSTANCES)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / INSTANCES
+
+
+def _report(
+    name: str, plain: float, other: float, unit: str, label: str = "slotted"
+) -> None:
+    print(
+        f"{name:<22} plain={plain:>10.1f}{unit}  {label}={other:>10.1f}{unit}"
+        f"  gain={plain / other:>5.2f}x"
+    )
+
+
+def main() -> None:
+    plain_a, plain_b = PlainMoney(10, "EUR"), PlainMoney(10, "EUR")
+    slotted_a, slotted_b = SlottedMoney(10, "EUR"), SlottedMoney(10, "EUR")
+    plain_index = {PlainMoney(i, "EUR"): i for i in range(1_000)}
+    slotted_index = {SlottedMoney(i, "EUR"): i for i in range(1_000)}
+    plain_key, slotted_key = PlainMoney(500, "EUR"), SlottedMoney(500, "EUR")
+
+    number = 200_000
+    _report(
+        "hash",
+        _best_of(lambda: hash(plain_a), number) * 1e9,
+        _best_of(lambda: hash(slotted_a), number) * 1e9,
+        "ns",
+    )
+    _report(
+        "eq",
+        _best_of(lambda: plain_a == plain_b, number) * 1e9,
+        _best_of(lambda: slotted_a == slotted_b, number) * 1e9,
+        "ns",
+    )
+    _report(
+        "dict lookup",
+        _best_of(lambda: plain_index[plain_key], number) * 1e9,
+        _best_of(lambda: slotted_index[slotted_key], number) * 1e9,
+        "ns",
+    )
+    _report(
+        "construction",
+        _best_of(lambda: PlainMoney(10, "EUR"), number) * 1e9,
+        _best_of(lambda: SlottedMoney(10, "EUR"), number) * 1e9,
+        "ns",
+    )
+    _report(
+        "memory / instance",
+        _memory_per_instance(lambda i: PlainMoney(i, "EUR")),
+        _memory_per_instance(lambda i: SlottedMoney(i, "EUR")),
+        "B ",
+    )
+    frozen = FrozenMoney(10, "EUR")
+    _report(
+        "field read",
+        _best_of(lambda: plain_a.amount, number) * 1e9,
+        _best_of(lambda: frozen.amount, number) * 1e9,
+        "ns",
+        label="frozen",
+    )
+
+
+if __name__ == "__main__":
+    main()
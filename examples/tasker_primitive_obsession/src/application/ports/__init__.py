@@ -25,6 +25,12 @@ from .inbound.create_task_use_case import (
     CreateTaskResponse,
     CreateTaskUseCase,
 )
+from .inbound.list_tasks_use_case import (
+    ListTasksRequest,
+    ListTasksResponse,
+    ListTasksUseCase,
+    TaskSummary,
+)
 from .inbound.register_user_use_case import (
     RegisterUserRequest,
     RegisterUserResponse,
@@ -62,6 +68,10 @@ __all__ = [
     "CreateTaskUseCase",
     "CreateTaskRequest",
     "CreateTaskResponse",
+    "ListTasksUseCase",
+    "ListTasksRequest",
+    "ListTasksResponse",
+    "TaskSummary",
     "RegisterUserUseCase",
     "RegisterUserRequest",
     "RegisterUserResponse",
@@ -0,0 +1,43 @@
+import datetime
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+from building_blocks.application.ports.inbound.use_case import AsyncUseCase as UseCase
+
+
+@dataclass(frozen=True)
+class ListTasksRequest:
+    after: Optional[str] = None
+    limit: int = 50
+
+
+@dataclass(frozen=True)
+class TaskSummary:
+    task_id: str
+    title: str
+    status: str
+    due_date: datetime.date
+
+
+@dataclass(frozen=True)
+class ListTasksResponse:
+    tasks: List[TaskSummary]
+    next_cursor: Optional[str] = None
+
+
+class ListTasksUseCase(UseCase[ListTasksRequest, ListTasksResponse]):
+    @abstractmethod
+    async def execute(self, request: ListTasksRequest) -> ListTasksResponse:
+        """
+        Execute the use case to list tasks a page at a time.
+
+        Args:
+            request (ListTasksRequest): The cursor of the previous page, if any,
+                and the page size.
+
+        Returns:
+            ListTasksResponse: The tasks of the page and the cursor to the next
+                page, or None if it is the last page.
+        """
+        pass
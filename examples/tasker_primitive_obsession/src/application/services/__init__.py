@@ -1,11 +1,13 @@
 from .authenticate_user_service import AuthenticateUserService
 from .change_user_role_service import ChangeUserRoleService
 from .create_task_service import CreateTaskService
+from .list_tasks_service import ListTasksService
 from .register_user_service import RegisterUserService
 from .validate_token_service import ValidateTokenService
 
 __all__ = [
     "CreateTaskService",
+    "ListTasksService",
     "ValidateTokenService",
     "AuthenticateUserService",
     "RegisterUserService",
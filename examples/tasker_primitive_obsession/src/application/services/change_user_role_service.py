@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from building_blocks.application.ports import AsyncUnitOfWork
 from examples.tasker_primitive_obsession.src.application.ports import (
     ChangeUserRoleFailedResponse,
     ChangeUserRoleRequest,
@@ -11,14 +12,18 @@ from examples.tasker_primitive_obsession.src.domain.ports import UserRepository
 
 
 class ChangeUserRoleService(ChangeUserRoleUseCase):
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self, user_repository: UserRepository, unit_of_work: AsyncUnitOfWork
+    ) -> None:
         """
         Initialize the service with a user repository.
 
         Args:
             user_repository: The repository to interact with user data.
+            unit_of_work: The unit of work that commits the changed user.
         """
         self._user_repository = user_repository
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: ChangeUserRoleRequest) -> ChangeUserRoleResponse:
         """
@@ -49,7 +54,8 @@ class ChangeUserRoleService(ChangeUserRoleUseCase):
 
         user.role = request.new_role
 
-        await self._user_repository.save(user)
+        async with self._unit_of_work:
+            await self._user_repository.save(user)
 
         return ChangeUserRoleSucceededResponse(
             user_id=str(user.id), previous_role=previous_role, new_role=user.role
@@ -1,5 +1,6 @@
 import uuid
 
+from building_blocks.application.ports import AsyncUnitOfWork
 from examples.tasker_primitive_obsession.src.application.ports import (
     CreateTaskRequest,
     CreateTaskResponse,
@@ -16,17 +17,21 @@ class CreateTaskService(CreateTaskUseCase):
     Service implementation for creating tasks.
 
     This service handles the creation of tasks by interacting with the
-    TaskRepository to persist the task data.
+    TaskRepository to persist the task data, within a unit of work.
     """
 
-    def __init__(self, task_repository: TaskRepository) -> None:
+    def __init__(
+        self, task_repository: TaskRepository, unit_of_work: AsyncUnitOfWork
+    ) -> None:
         """
         Initialize the service with a task repository.
 
         Args:
             task_repository: The repository to handle task persistence.
+            unit_of_work: The unit of work that commits the saved task.
         """
         self._task_repository = task_repository
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: CreateTaskRequest) -> CreateTaskResponse:
         """
@@ -49,6 +54,7 @@ class CreateTaskService(CreateTaskUseCase):
             progress=request.progress,
             assignee_email=request.assignee_email,
         )
-        await self._task_repository.save(task)
+        async with self._unit_of_work:
+            await self._task_repository.save(task)
 
         return CreateTaskResponse(task_id=str(task.id))
@@ -0,0 +1,53 @@
+from examples.tasker_primitive_obsession.src.application.ports import (
+    ListTasksRequest,
+    ListTasksResponse,
+    ListTasksUseCase,
+    TaskSummary,
+)
+from examples.tasker_primitive_obsession.src.domain.ports import (
+    TaskRepository,
+)
+
+
+class ListTasksService(ListTasksUseCase):
+    """
+    Service implementation for listing tasks.
+
+    This service reads tasks a page at a time through the repository's keyset
+    pagination, so listing deep pages costs the same as the first one.
+    """
+
+    def __init__(self, task_repository: TaskRepository) -> None:
+        """
+        Initialize the service with a task repository.
+
+        Args:
+            task_repository: The repository to read tasks from.
+        """
+        self._task_repository = task_repository
+
+    async def execute(self, request: ListTasksRequest) -> ListTasksResponse:
+        """
+        Execute the use case to list tasks a page at a time.
+
+        Args:
+            request (ListTasksRequest): The cursor of the previous page, if any,
+                and the page size.
+
+        Returns:
+            ListTasksResponse: The tasks of the page and the next cursor.
+        """
+        page = await self._task_repository.find_page(request.after, request.limit)
+
+        return ListTasksResponse(
+            tasks=[
+                TaskSummary(
+                    task_id=str(task.id),
+                    title=task.title,
+                    status=task.status,
+                    due_date=task.due_date,
+                )
+                for task in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
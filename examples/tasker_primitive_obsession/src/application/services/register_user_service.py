@@ -1,4 +1,6 @@
 import logging
+from typing import Optional
+from uuid import UUID
 
 from examples.tasker_primitive_obsession.src.application.ports import (
     PasswordHasher,
@@ -10,20 +12,28 @@ from examples.tasker_primitive_obsession.src.domain.entities.user import User
 from examples.tasker_primitive_obsession.src.domain.ports import UserRepository
 
 from building_blocks.abstractions.result import Err
+from building_blocks.application.ports import AsyncUnitOfWork
+from building_blocks.domain.ports import IdGenerator
 
 logger = logging.getLogger(__name__)
 
 
 class RegisterUserService(RegisterUserUseCase):
     def __init__(
-        self, user_repository: UserRepository, password_hasher: PasswordHasher
+        self,
+        user_repository: UserRepository,
+        unit_of_work: AsyncUnitOfWork,
+        password_hasher: PasswordHasher,
+        id_generator: Optional[IdGenerator[UUID]] = None,
     ) -> None:
         """
         Initialize the RegisterUserService.
         This service implements the RegisterUserUseCase to handle user registration.
         """
         self._user_repository = user_repository
+        self._unit_of_work = unit_of_work
         self._password_hasher = password_hasher
+        self._id_generator = id_generator
         self._logger = logger.getChild(self.__class__.__name__)
 
     async def execute(self, request: RegisterUserRequest) -> RegisterUserResponse:
@@ -39,7 +49,8 @@ class RegisterUserService(RegisterUserUseCase):
         self._logger.debug("Executing user registration with request: %s", request)
         user = await self._create_user(request)
 
-        await self._user_repository.save(user)
+        async with self._unit_of_work:
+            await self._user_repository.save(user)
 
         return RegisterUserResponse(user_id=user.id.hex)
 
@@ -58,6 +69,7 @@ class RegisterUserService(RegisterUserUseCase):
             email=request.email,
             password=request.password,
             role=request.role,
+            id_generator=self._id_generator,
         )
 
         if isinstance(user_result, Err):
@@ -10,6 +10,7 @@ from examples.tasker_primitive_obsession.src.domain.errors import ChangeUserRole
 from building_blocks.abstractions.result import Err, Ok, Result
 from building_blocks.domain.aggregate_root import AggregateRoot, AggregateVersion
 from building_blocks.domain.errors import DomainValidationError
+from building_blocks.domain.ports import IdGenerator
 
 
 class User(AggregateRoot[UUID]):
@@ -127,8 +128,9 @@ class User(AggregateRoot[UUID]):
         password: str,
         role: str = "engineer",
         version: Optional[AggregateVersion] = None,
+        id_generator: Optional[IdGenerator[UUID]] = None,
     ) -> Result[User, DomainValidationError]:
-        user_id = uuid4()
+        user_id = id_generator.next_id() if id_generator else uuid4()
 
         return cls.create(user_id, name, email, password, role, version)
 
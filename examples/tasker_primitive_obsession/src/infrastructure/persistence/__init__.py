@@ -2,10 +2,12 @@ from .database import get_session
 from .helpers import build_upsert_statement
 from .repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
 from .repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from .unit_of_work import SQLAlchemyUnitOfWork
 
 __all__ = [
     "get_session",
     "SQLAlchemyTaskRepository",
+    "SQLAlchemyUnitOfWork",
     "SQLAlchemyUserRepository",
     "build_upsert_statement",
 ]
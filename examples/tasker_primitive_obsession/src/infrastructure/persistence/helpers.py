@@ -1,13 +1,28 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List, Sequence, Union
 
-from sqlalchemy import Table
+from sqlalchemy import Table, case, delete, literal, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from building_blocks.domain.errors import ConcurrencyError
+
+# Keeps "WHERE id IN (...)" under the bound parameter limit of every driver,
+# such as the 999 of older SQLite builds.
+IN_CLAUSE_CHUNK_SIZE = 500
 
 
 def build_upsert_statement(
-    dialect_name: str, table: Table, values: dict[str, Any]
+    dialect_name: str,
+    table: Table,
+    values: Union[Dict[str, Any], Sequence[Dict[str, Any]]],
 ) -> Any:
+    """
+    Build an INSERT ... ON CONFLICT (id) DO UPDATE for one or more rows.
+
+    A list of rows becomes a single multi-row statement. Every row must have
+    the same keys.
+    """
     if dialect_name == "postgresql":
         insert_stmt = pg_insert(table)
     elif dialect_name == "sqlite":
@@ -15,16 +30,116 @@ def build_upsert_statement(
     else:
         raise NotImplementedError(f"Upsert not supported for {dialect_name}")
 
-    print(f"Building upsert statement for dialect: {dialect_name}")
-
+    rows = [values] if isinstance(values, dict) else list(values)
     columns = table.columns.keys()
 
     update_values = {
         k: getattr(insert_stmt.excluded, k)
-        for k in values
+        for k in rows[0]
         if k in columns and k != "id"
     }
 
-    return insert_stmt.values(**values).on_conflict_do_update(
+    return insert_stmt.values(rows).on_conflict_do_update(
         index_elements=["id"], set_=update_values
     )
+
+
+async def execute_versioned_update(
+    session: AsyncSession,
+    table: Table,
+    aggregate_type: str,
+    rows: List[Dict[str, Any]],
+) -> None:
+    """
+    Update rows by ID, only where their version is still the expected one.
+
+    Each row holds the new column values, its "id" and the "version" the
+    aggregate was loaded with. The rows are written by one statement per
+    chunk, ``UPDATE ... SET col = CASE id WHEN ? THEN ? ... END,
+    version = version + 1 WHERE (id, version) IN (...) RETURNING id``, kept
+    under the bound parameter limit. The returned IDs tell which rows were
+    written: row counts cannot, as drivers such as asyncpg report -1 for an
+    executemany.
+
+    Raises:
+        ConcurrencyError: If any row was changed or deleted concurrently.
+    """
+    if not rows:
+        return
+    columns = [key for key in rows[0] if key not in ("id", "version")]
+    # Two parameters for the WHERE and two per column in the CASE, per row.
+    chunk_size = max(1, IN_CLAUSE_CHUNK_SIZE // (2 + 2 * len(columns)))
+    conflicts: Dict[Any, int] = {}
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        statement = (
+            update(table)
+            .where(
+                tuple_(table.c.id, table.c.version).in_(
+                    [(row["id"], row["version"]) for row in chunk]
+                )
+            )
+            .values(
+                {
+                    **{
+                        column: case(
+                            {
+                                row["id"]: literal(row[column], table.c[column].type)
+                                for row in chunk
+                            },
+                            value=table.c.id,
+                        )
+                        for column in columns
+                    },
+                    "version": table.c.version + 1,
+                }
+            )
+            .returning(table.c.id)
+        )
+        result = await session.execute(statement)
+        written = set(result.scalars().all())
+        for row in chunk:
+            if row["id"] not in written:
+                conflicts[row["id"]] = row["version"]
+    if conflicts:
+        raise ConcurrencyError(aggregate_type, conflicts)
+
+
+async def select_by_ids(
+    session: AsyncSession,
+    model: Any,
+    ids: Iterable[Any],
+    chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+) -> List[Any]:
+    """
+    Load the rows of a model with the given IDs.
+
+    Runs one ``SELECT ... WHERE id IN (...)`` per chunk of ``chunk_size``
+    distinct IDs instead of one query per ID. Rows come back in no particular
+    order, and IDs with no row are left out.
+    """
+    distinct = list(dict.fromkeys(ids))
+    models: List[Any] = []
+    for start in range(0, len(distinct), chunk_size):
+        chunk = distinct[start : start + chunk_size]
+        result = await session.execute(select(model).where(model.id.in_(chunk)))
+        models.extend(result.scalars().all())
+    return models
+
+
+async def delete_by_ids(
+    session: AsyncSession,
+    model: Any,
+    ids: Iterable[Any],
+    chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+) -> None:
+    """
+    Delete the rows of a model with the given IDs.
+
+    Runs one ``DELETE ... WHERE id IN (...)`` per chunk of ``chunk_size``
+    distinct IDs. IDs with no row are ignored.
+    """
+    distinct = list(dict.fromkeys(ids))
+    for start in range(0, len(distinct), chunk_size):
+        chunk = distinct[start : start + chunk_size]
+        await session.execute(delete(model).where(model.id.in_(chunk)))
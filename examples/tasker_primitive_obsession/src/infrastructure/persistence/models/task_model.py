@@ -54,7 +54,7 @@ class TaskModel(OrmModel[Task, int]):
             description=self.description,
             status=self.status,
             due_date=self.due_date,
-            version=AggregateVersion(self.version),
+            version=AggregateVersion.of(self.version),
         )
 
     @classmethod
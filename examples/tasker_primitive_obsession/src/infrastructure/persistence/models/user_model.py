@@ -61,5 +61,5 @@ class UserModel(OrmModel[User, uuid.UUID]):
             email=self.email,
             password=self.password,
             role=self.role,
-            version=AggregateVersion(self.version),
+            version=AggregateVersion.of(self.version),
         )
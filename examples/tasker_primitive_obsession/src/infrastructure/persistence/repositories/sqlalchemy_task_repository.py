@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Optional, cast
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
-from sqlalchemy import Table, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from building_blocks.domain.ports import Page, decode_cursor, encode_cursor
+from building_blocks.domain.ports.outbound.pagination import check_limit
+from building_blocks.infrastructure.unit_of_work import TrackingUnitOfWork
 from examples.tasker_primitive_obsession.src.domain.entities.task import Task
 from examples.tasker_primitive_obsession.src.domain.ports import (
     TaskRepository,
 )
-from examples.tasker_primitive_obsession.src.infrastructure.persistence import (
-    build_upsert_statement,
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.helpers import (
+    delete_by_ids,
+    select_by_ids,
 )
 from examples.tasker_primitive_obsession.src.infrastructure.persistence.models import (
     TaskModel,
@@ -22,31 +26,36 @@ class SQLAlchemyTaskRepository(TaskRepository):
     SQLAlchemy implementation of the TaskRepository interface.
 
     This class provides methods to interact with the database for Task aggregates,
-    including finding, saving, and deleting tasks.
+    including finding, saving, and deleting tasks. Saves and deletes are
+    registered with the unit of work and written when it commits.
 
     Note: This is a placeholder for the actual implementation.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, unit_of_work: TrackingUnitOfWork) -> None:
         """
         Initialize the repository with a database session.
 
         Args:
             session: SQLAlchemy session for database operations.
+            unit_of_work: Unit of work that writes the saved and deleted tasks.
         """
         self._session = session
+        self._unit_of_work = unit_of_work
 
     async def save(self, aggregate: Task) -> None:
-        values = self._build_values(aggregate)
-
-        dialect_name = self._session.bind.dialect.name
-
-        upsert_statement = build_upsert_statement(
-            dialect_name, cast(Table, TaskModel.__table__), values
-        )
-
-        await self._session.execute(upsert_statement)
-        await self._session.commit()
+        # Stored tasks are at least version 1: the writer stores the version
+        # a task has once its insert commits.
+        if aggregate.version.value == 0:
+            self._unit_of_work.register_new(aggregate)
+        else:
+            self._unit_of_work.register_dirty(aggregate)
+
+    async def save_many(self, aggregates: Iterable[Task]) -> None:
+        # The unit of work writes all of them at commit, with one multi-row
+        # statement per kind of change.
+        for aggregate in aggregates:
+            await self.save(aggregate)
 
     async def find_all(self) -> List[Task]:
         statement = select(TaskModel)
@@ -54,6 +63,30 @@ class SQLAlchemyTaskRepository(TaskRepository):
         models = result.scalars().all()
         return [model.to_entity() for model in models]
 
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[Task]:
+        # yield_per fetches through a server-side cursor where the driver has
+        # one, holding at most batch_size rows in memory at a time.
+        statement = select(TaskModel).execution_options(yield_per=batch_size)
+        result = await self._session.stream_scalars(statement)
+        async for model in result:
+            yield model.to_entity()
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[Task]:
+        check_limit(limit)
+        # Seek past the last ID of the previous page through the primary key
+        # index, and read one extra row to learn whether a next page exists.
+        statement = select(TaskModel).order_by(TaskModel.id).limit(limit + 1)
+        if after is not None:
+            (last_id,) = decode_cursor(after)
+            statement = statement.where(TaskModel.id > last_id)
+        result = await self._session.execute(statement)
+        models = result.scalars().all()
+        tasks = [model.to_entity() for model in models[:limit]]
+        next_cursor = encode_cursor(tasks[-1].id) if len(models) > limit else None
+        return Page(tasks, next_cursor)
+
     async def find_by_id(self, id: int) -> Optional[Task]:
         model = await self._session.get(TaskModel, id)
 
@@ -61,19 +94,16 @@ class SQLAlchemyTaskRepository(TaskRepository):
             return model.to_entity()
         return None
 
+    async def find_by_ids(self, ids: Iterable[int]) -> Dict[int, Task]:
+        ids = list(dict.fromkeys(ids))
+        models = await select_by_ids(self._session, TaskModel, ids)
+        tasks = {model.id: model.to_entity() for model in models}
+        return {id: tasks[id] for id in ids if id in tasks}
+
     async def delete_by_id(self, id: int) -> None:
-        model = await self._session.get(TaskModel, id)
+        await self.delete_by_ids([id])
 
-        if model:
-            await self._session.delete(model)
-            await self._session.commit()
-
-    def _build_values(self, task: Task) -> dict:
-        return {
-            "id": task.id,
-            "title": task.title,
-            "description": task.description,
-            "status": task.status,
-            "due_date": task.due_date,
-            "version": task.version.value,
-        }
+    async def delete_by_ids(self, ids: Iterable[int]) -> None:
+        # Deletes by ID without loading the tasks, in the session's transaction:
+        # the unit of work commits it with the changes it registered.
+        await delete_by_ids(self._session, TaskModel, ids)
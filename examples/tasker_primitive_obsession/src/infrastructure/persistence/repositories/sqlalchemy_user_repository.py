@@ -1,17 +1,15 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Table, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from building_blocks.infrastructure.unit_of_work import TrackingUnitOfWork
 from examples.tasker_primitive_obsession.src.domain.entities.user import User
-from examples.tasker_primitive_obsession.src.domain.errors import (
-    UserEmailAlreadyExistsError,
-)
 from examples.tasker_primitive_obsession.src.domain.ports import UserRepository
-from examples.tasker_primitive_obsession.src.infrastructure.persistence import (
-    build_upsert_statement,
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.helpers import (
+    delete_by_ids,
+    select_by_ids,
 )
 from examples.tasker_primitive_obsession.src.infrastructure.persistence.models import (
     UserModel,
@@ -19,27 +17,23 @@ from examples.tasker_primitive_obsession.src.infrastructure.persistence.models i
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, unit_of_work: TrackingUnitOfWork) -> None:
         self._session = session
+        self._unit_of_work = unit_of_work
 
     async def save(self, user: User) -> None:
-        try:
-            values = self._build_values(user)
-
-            dialect_name = self._session.bind.dialect.name
-
-            upsert_statement = build_upsert_statement(
-                dialect_name, cast(Table, UserModel.__table__), values
-            )
-
-            await self._session.execute(upsert_statement)
-            await self._session.commit()
-        except IntegrityError as exc:
-            await self._session.rollback()
-
-            if "email" in str(exc.orig):
-                raise UserEmailAlreadyExistsError(user.email) from exc
-            raise ValueError(f"Failed to save user: {exc.orig}") from exc
+        # Stored users are at least version 1: the writer stores the version
+        # a user has once its insert commits.
+        if user.version.value == 0:
+            self._unit_of_work.register_new(user)
+        else:
+            self._unit_of_work.register_dirty(user)
+
+    async def save_many(self, aggregates: Iterable[User]) -> None:
+        # The unit of work writes all of them at commit, with one multi-row
+        # statement per kind of change.
+        for aggregate in aggregates:
+            await self.save(aggregate)
 
     async def find_all(self) -> List[User]:
         statement = select(UserModel)
@@ -48,6 +42,14 @@ class SQLAlchemyUserRepository(UserRepository):
 
         return [model.to_entity() for model in models]
 
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        # yield_per fetches through a server-side cursor where the driver has
+        # one, holding at most batch_size rows in memory at a time.
+        statement = select(UserModel).execution_options(yield_per=batch_size)
+        result = await self._session.stream_scalars(statement)
+        async for model in result:
+            yield model.to_entity()
+
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
         model = await self._session.get(UserModel, user_id)
 
@@ -55,12 +57,19 @@ class SQLAlchemyUserRepository(UserRepository):
             return model.to_entity()
         return None
 
+    async def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, User]:
+        ids = list(dict.fromkeys(ids))
+        models = await select_by_ids(self._session, UserModel, ids)
+        users = {model.id: model.to_entity() for model in models}
+        return {id: users[id] for id in ids if id in users}
+
     async def delete_by_id(self, id: UUID) -> None:
-        model = await self._session.get(UserModel, id)
+        await self.delete_by_ids([id])
 
-        if model:
-            await self._session.delete(model)
-            await self._session.commit()
+    async def delete_by_ids(self, ids: Iterable[UUID]) -> None:
+        # Deletes by ID without loading the users, in the session's transaction:
+        # the unit of work commits it with the changes it registered.
+        await delete_by_ids(self._session, UserModel, ids)
 
     async def find_by_email(self, email: str) -> Optional[User]:
         statement = select(UserModel).where(UserModel.email == email)
@@ -70,13 +79,3 @@ class SQLAlchemyUserRepository(UserRepository):
         if model:
             return model.to_entity()
         return None
-
-    def _build_values(self, user: User) -> Dict[str, Any]:
-        return {
-            "id": user.id,
-            "name": user.name,
-            "email": user.email,
-            "password": user.password,
-            "role": user.role,
-            "version": user.version.value,
-        }
@@ -0,0 +1,37 @@
+from examples.tasker_primitive_obsession.src.domain.entities.task import Task
+from examples.tasker_primitive_obsession.src.domain.entities.user import User
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.writers import (
+    SQLAlchemyTaskWriter,
+    SQLAlchemyUserWriter,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from building_blocks.infrastructure.unit_of_work import TrackingUnitOfWork
+
+
+class SQLAlchemyUnitOfWork(TrackingUnitOfWork):
+    """
+    Unit of work over one SQLAlchemy session.
+
+    Repositories built on the same unit of work register the aggregates they
+    save or delete with it, and every change of the use case is written at
+    commit in a single transaction, a few bulk statements per aggregate type.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the unit of work with a database session.
+
+        Args:
+            session: SQLAlchemy session shared with the repositories.
+        """
+        super().__init__()
+        self._session = session
+        self.add_writer(User, SQLAlchemyUserWriter(session))
+        self.add_writer(Task, SQLAlchemyTaskWriter(session))
+
+    async def _commit_transaction(self) -> None:
+        await self._session.commit()
+
+    async def _rollback_transaction(self) -> None:
+        await self._session.rollback()
@@ -0,0 +1,7 @@
+from .sqlalchemy_task_writer import SQLAlchemyTaskWriter
+from .sqlalchemy_user_writer import SQLAlchemyUserWriter
+
+__all__ = [
+    "SQLAlchemyTaskWriter",
+    "SQLAlchemyUserWriter",
+]
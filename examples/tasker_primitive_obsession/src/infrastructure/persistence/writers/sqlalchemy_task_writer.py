@@ -0,0 +1,63 @@
+from typing import Any, Dict, Sequence, cast
+
+from examples.tasker_primitive_obsession.src.domain.entities.task import Task
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.helpers import (
+    delete_by_ids,
+    execute_versioned_update,
+)
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.models import (
+    TaskModel,
+)
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from building_blocks.infrastructure.unit_of_work import AsyncAggregateWriter
+
+
+class SQLAlchemyTaskWriter(AsyncAggregateWriter[Task]):
+    """
+    Writes the Task aggregates registered in a unit of work in bulk.
+
+    Inserts are one executemany INSERT, which SQLAlchemy sends as multi-row
+    statements kept under the driver's bound parameter limit. Updates are one
+    version-checked UPDATE and deletes one DELETE ... WHERE id IN per chunk of
+    tasks. Nothing is committed here: the unit of work owns the transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the writer with the unit of work's session.
+
+        Args:
+            session: SQLAlchemy session for database operations.
+        """
+        self._session = session
+
+    async def insert_many(self, aggregates: Sequence[Task]) -> None:
+        rows = [self._build_insert_values(task) for task in aggregates]
+        await self._session.execute(insert(TaskModel), rows)
+
+    async def update_many(self, aggregates: Sequence[Task]) -> None:
+        rows = [self._build_values(task) for task in aggregates]
+        await execute_versioned_update(
+            self._session, cast(Table, TaskModel.__table__), "Task", rows
+        )
+
+    async def delete_many(self, aggregates: Sequence[Task]) -> None:
+        await delete_by_ids(
+            self._session, TaskModel, [task.id for task in aggregates]
+        )
+
+    def _build_insert_values(self, task: Task) -> Dict[str, Any]:
+        # A row stores the version its aggregate has once the insert commits.
+        return {**self._build_values(task), "version": task.version.value + 1}
+
+    def _build_values(self, task: Task) -> Dict[str, Any]:
+        return {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "due_date": task.due_date,
+            "version": task.version.value,
+        }
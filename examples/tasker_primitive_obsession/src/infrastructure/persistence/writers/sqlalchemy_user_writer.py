@@ -0,0 +1,76 @@
+from typing import Any, Dict, NoReturn, Sequence, cast
+
+from examples.tasker_primitive_obsession.src.domain.entities.user import User
+from examples.tasker_primitive_obsession.src.domain.errors import (
+    UserEmailAlreadyExistsError,
+)
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.helpers import (
+    delete_by_ids,
+    execute_versioned_update,
+)
+from examples.tasker_primitive_obsession.src.infrastructure.persistence.models import (
+    UserModel,
+)
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from building_blocks.infrastructure.unit_of_work import AsyncAggregateWriter
+
+
+class SQLAlchemyUserWriter(AsyncAggregateWriter[User]):
+    """
+    Writes the User aggregates registered in a unit of work in bulk.
+
+    Nothing is committed here: the unit of work owns the transaction and rolls
+    it back if a write fails.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the writer with the unit of work's session.
+
+        Args:
+            session: SQLAlchemy session for database operations.
+        """
+        self._session = session
+
+    async def insert_many(self, aggregates: Sequence[User]) -> None:
+        rows = [self._build_insert_values(user) for user in aggregates]
+        try:
+            await self._session.execute(insert(UserModel), rows)
+        except IntegrityError as exc:
+            self._raise_save_error(exc, aggregates)
+
+    async def update_many(self, aggregates: Sequence[User]) -> None:
+        rows = [self._build_values(user) for user in aggregates]
+        try:
+            await execute_versioned_update(
+                self._session, cast(Table, UserModel.__table__), "User", rows
+            )
+        except IntegrityError as exc:
+            self._raise_save_error(exc, aggregates)
+
+    async def delete_many(self, aggregates: Sequence[User]) -> None:
+        await delete_by_ids(
+            self._session, UserModel, [user.id for user in aggregates]
+        )
+
+    def _raise_save_error(self, exc: IntegrityError, users: Sequence[User]) -> NoReturn:
+        if "email" in str(exc.orig) and len(users) == 1:
+            raise UserEmailAlreadyExistsError(users[0].email) from exc
+        raise ValueError(f"Failed to save users: {exc.orig}") from exc
+
+    def _build_insert_values(self, user: User) -> Dict[str, Any]:
+        # A row stores the version its aggregate has once the insert commits.
+        return {**self._build_values(user), "version": user.version.value + 1}
+
+    def _build_values(self, user: User) -> Dict[str, Any]:
+        return {
+            "id": user.id,
+            "name": user.name,
+            "email": user.email,
+            "password": user.password,
+            "role": user.role,
+            "version": user.version.value,
+        }
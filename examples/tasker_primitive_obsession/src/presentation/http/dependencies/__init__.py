@@ -1,5 +1,5 @@
 from .auth_dependencies import get_validate_token_use_case
-from .task_dependencies import get_create_task_use_case
+from .task_dependencies import get_create_task_use_case, get_list_tasks_use_case
 from .user_dependencies import (
     get_authenticate_user_use_case,
     get_change_user_role_use_case,
@@ -8,6 +8,7 @@ from .user_dependencies import (
 
 __all__ = [
     "get_create_task_use_case",
+    "get_list_tasks_use_case",
     "get_register_user_use_case",
     "get_authenticate_user_use_case",
     "get_validate_token_use_case",
@@ -1,25 +1,39 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from examples.tasker_primitive_obsession.src.application.ports import CreateTaskUseCase
+from examples.tasker_primitive_obsession.src.application.ports import (
+    CreateTaskUseCase,
+    ListTasksUseCase,
+)
 from examples.tasker_primitive_obsession.src.application.services import (
     CreateTaskService,
+    ListTasksService,
 )
 from examples.tasker_primitive_obsession.src.infrastructure.persistence import (
     SQLAlchemyTaskRepository,
+    SQLAlchemyUnitOfWork,
 )
 from examples.tasker_primitive_obsession.src.presentation.wiring import (
     get_async_session,
+    get_unit_of_work,
 )
 
 
 async def get_task_repository(
     session: AsyncSession = Depends(get_async_session),
+    unit_of_work: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> SQLAlchemyTaskRepository:
-    return SQLAlchemyTaskRepository(session)
+    return SQLAlchemyTaskRepository(session, unit_of_work)
 
 
 async def get_create_task_use_case(
     repo: SQLAlchemyTaskRepository = Depends(get_task_repository),
+    unit_of_work: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateTaskUseCase:
-    return CreateTaskService(repo)
+    return CreateTaskService(repo, unit_of_work)
+
+
+async def get_list_tasks_use_case(
+    repo: SQLAlchemyTaskRepository = Depends(get_task_repository),
+) -> ListTasksUseCase:
+    return ListTasksService(repo)
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from building_blocks.infrastructure.id_generators import UUIDv7Generator
 from examples.tasker_primitive_obsession.src.application.ports import (
     AuthenticateUserUseCase,
     ChangeUserRoleUseCase,
@@ -16,6 +17,7 @@ from examples.tasker_primitive_obsession.src.infrastructure.hashing.bcrypt impor
     BCryptPasswordVerifier,
 )
 from examples.tasker_primitive_obsession.src.infrastructure.persistence import (
+    SQLAlchemyUnitOfWork,
     SQLAlchemyUserRepository,
 )
 from examples.tasker_primitive_obsession.src.infrastructure.token import (
@@ -24,21 +26,26 @@ from examples.tasker_primitive_obsession.src.infrastructure.token import (
 )
 from examples.tasker_primitive_obsession.src.presentation.wiring import (
     get_async_session,
+    get_unit_of_work,
 )
 
+user_id_generator = UUIDv7Generator()
+
 
 async def get_user_repository(
     session: AsyncSession = Depends(get_async_session),
+    unit_of_work: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> SQLAlchemyUserRepository:
-    return SQLAlchemyUserRepository(session)
+    return SQLAlchemyUserRepository(session, unit_of_work)
 
 
 async def get_register_user_use_case(
     repo: SQLAlchemyUserRepository = Depends(get_user_repository),
+    unit_of_work: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> RegisterUserUseCase:
     password_hasher = BCryptPasswordHasher()
 
-    return RegisterUserService(repo, password_hasher)
+    return RegisterUserService(repo, unit_of_work, password_hasher, user_id_generator)
 
 
 async def get_authenticate_user_use_case(
@@ -56,5 +63,6 @@ async def get_authenticate_user_use_case(
 
 async def get_change_user_role_use_case(
     repo: SQLAlchemyUserRepository = Depends(get_user_repository),
+    unit_of_work: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> ChangeUserRoleUseCase:
-    return ChangeUserRoleService(repo)
+    return ChangeUserRoleService(repo, unit_of_work)
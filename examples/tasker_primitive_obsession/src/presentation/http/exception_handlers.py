@@ -2,12 +2,14 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from building_blocks.domain.errors import (
+    ConcurrencyError,
     DomainError,
     DomainRuleViolationError,
     DomainValidationError,
 )
 
 ERROR_STATUS_MAP = {
+    ConcurrencyError: 409,
     DomainValidationError: 422,
     DomainRuleViolationError: 409,
     DomainError: 400,
@@ -5,6 +5,7 @@ from .change_user_role_dto_mapper import (
     ChangeUserRoleUseCaseToHttpResponseMapper,
 )
 from .create_task_dto_mapper import CreateTaskDtoMapper
+from .list_tasks_dto_mapper import ListTasksDtoMapper
 from .register_user_dto_mapper import RegisterUserDtoMapper
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     "ChangeUserRoleHttpToUseCaseRequestMapper",
     "ChangeUserRoleUseCaseToHttpResponseMapper",
     "CreateTaskDtoMapper",
+    "ListTasksDtoMapper",
     "RegisterUserDtoMapper",
     "AuthenticateUserDtoMapper",
 ]
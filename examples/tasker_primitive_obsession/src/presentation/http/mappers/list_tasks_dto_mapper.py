@@ -0,0 +1,43 @@
+from typing import Optional
+
+from examples.tasker_primitive_obsession.src.application.ports import (
+    ListTasksRequest,
+    ListTasksResponse,
+)
+from examples.tasker_primitive_obsession.src.presentation.http.responses import (
+    ListTasksHttpResponse,
+    TaskSummaryHttpResponse,
+)
+
+
+class ListTasksDtoMapper:
+    """
+    Mapper class to convert query parameters into a task listing request.
+    """
+
+    @staticmethod
+    def from_query(after: Optional[str], limit: int) -> ListTasksRequest:
+        """
+        Maps the query parameters to a service request object.
+        """
+
+        return ListTasksRequest(after=after, limit=limit)
+
+    @staticmethod
+    def to_http_response(response: ListTasksResponse) -> ListTasksHttpResponse:
+        """
+        Maps the response object to a HTTP response object.
+        """
+
+        return ListTasksHttpResponse(
+            tasks=[
+                TaskSummaryHttpResponse(
+                    task_id=task.task_id,
+                    title=task.title,
+                    status=task.status,
+                    due_date=task.due_date,
+                )
+                for task in response.tasks
+            ],
+            next_cursor=response.next_cursor,
+        )
@@ -5,10 +5,13 @@ from .change_user_role_http_response import (
     ChangeUserRoleSucceededHttpResponse,
 )
 from .create_task_http_response import CreateTaskHttpResponse
+from .list_tasks_http_response import ListTasksHttpResponse, TaskSummaryHttpResponse
 from .register_user_http_response import RegisterUserHttpResponse
 
 __all__ = [
     "CreateTaskHttpResponse",
+    "ListTasksHttpResponse",
+    "TaskSummaryHttpResponse",
     "RegisterUserHttpResponse",
     "AuthenticateUserHttpResponse",
     "ChangeUserRoleHttpResponse",
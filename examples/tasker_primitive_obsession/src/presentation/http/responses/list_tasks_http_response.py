@@ -0,0 +1,35 @@
+import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TaskSummaryHttpResponse(BaseModel):
+    """
+    Response model for a task in a task listing.
+
+    Attributes:
+        task_id (str): The unique identifier of the task.
+        title (str): The title of the task.
+        status (str): The status of the task.
+        due_date (datetime.date): The due date of the task.
+    """
+
+    task_id: str
+    title: str
+    status: str
+    due_date: datetime.date
+
+
+class ListTasksHttpResponse(BaseModel):
+    """
+    Response model for a page of tasks.
+
+    Attributes:
+        tasks (List[TaskSummaryHttpResponse]): The tasks of the page.
+        next_cursor (Optional[str]): Pass as ``after`` to get the next page.
+            None on the last page.
+    """
+
+    tasks: List[TaskSummaryHttpResponse]
+    next_cursor: Optional[str] = None
@@ -1,19 +1,25 @@
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from examples.tasker_primitive_obsession.src.application.ports import (
     CreateTaskUseCase,
+    ListTasksUseCase,
 )
 from examples.tasker_primitive_obsession.src.presentation.http.dependencies import (
     get_create_task_use_case,
+    get_list_tasks_use_case,
 )
 from examples.tasker_primitive_obsession.src.presentation.http.mappers import (
     CreateTaskDtoMapper,
+    ListTasksDtoMapper,
 )
 from examples.tasker_primitive_obsession.src.presentation.http.requests import (
     CreateTaskHttpRequest,
 )
 from examples.tasker_primitive_obsession.src.presentation.http.responses import (
     CreateTaskHttpResponse,
+    ListTasksHttpResponse,
 )
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -31,3 +37,24 @@ async def create_task(
     response = CreateTaskDtoMapper.to_http_response(service_response)
 
     return response
+
+
+@router.get("", response_model=ListTasksHttpResponse)
+async def list_tasks(
+    after: Optional[str] = Query(None, description="Cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    use_case: ListTasksUseCase = Depends(get_list_tasks_use_case),
+) -> ListTasksHttpResponse:
+    """
+    Endpoint to list tasks a page at a time, in ID order.
+
+    Pass the ``next_cursor`` of a page as ``after`` to get the next one.
+    """
+    service_request = ListTasksDtoMapper.from_query(after, limit)
+    try:
+        service_response = await use_case.execute(service_request)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
+    response = ListTasksDtoMapper.to_http_response(service_response)
+
+    return response
@@ -1,5 +1,14 @@
 from examples.tasker_primitive_obsession.src.infrastructure.persistence import (
+    SQLAlchemyUnitOfWork,
     get_session,
 )
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 get_async_session = get_session
+
+
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_async_session),
+) -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(session)
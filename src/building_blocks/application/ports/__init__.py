@@ -8,6 +8,15 @@ from building_blocks.application.ports.outbound.event_publisher import (
     AsyncEventPublisher,
     SyncEventPublisher,
 )
+from building_blocks.application.ports.outbound.event_store import (
+    AsyncEventStore,
+    SyncEventStore,
+)
+from building_blocks.application.ports.outbound.outbox import AsyncOutbox, OutboxEntry
+from building_blocks.application.ports.outbound.snapshot_store import (
+    AsyncSnapshotStore,
+    SyncSnapshotStore,
+)
 from building_blocks.application.ports.outbound.unit_of_work import (
     AsyncUnitOfWork,
     SyncUnitOfWork,
@@ -20,4 +29,10 @@ __all__ = [
     "SyncEventPublisher",
     "AsyncUnitOfWork",
     "SyncUnitOfWork",
+    "AsyncOutbox",
+    "OutboxEntry",
+    "AsyncEventStore",
+    "SyncEventStore",
+    "AsyncSnapshotStore",
+    "SyncSnapshotStore",
 ]
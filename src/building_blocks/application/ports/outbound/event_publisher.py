@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Iterable, TypeVar
 
 from building_blocks.domain.messages.event import Event
 
@@ -31,6 +31,20 @@ class AsyncEventPublisher(ABC, Generic[TEvent]):
             event: The domain event to be published.
         """
 
+    async def publish_many(self, events: Iterable[TEvent]) -> None:
+        """
+        Publish several events, in order.
+
+        The default implementation publishes the events one by one. Adapters
+        for brokers with a batch API should override it to send all events in
+        one round trip.
+
+        Args:
+            events: The domain events to be published.
+        """
+        for event in events:
+            await self.publish(event)
+
 
 class SyncEventPublisher(ABC, Generic[TEvent]):
     """
@@ -55,3 +69,17 @@ class SyncEventPublisher(ABC, Generic[TEvent]):
         Args:
             event: The domain event to be published.
         """
+
+    def publish_many(self, events: Iterable[TEvent]) -> None:
+        """
+        Publish several events, in order.
+
+        The default implementation publishes the events one by one. Adapters
+        for brokers with a batch API should override it to send all events in
+        one round trip.
+
+        Args:
+            events: The domain events to be published.
+        """
+        for event in events:
+            self.publish(event)
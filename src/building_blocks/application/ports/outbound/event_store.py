@@ -0,0 +1,112 @@
+"""
+Event store interface.
+
+An event store keeps the events of event-sourced aggregates, one append-only
+stream per aggregate, and guards each stream with an optimistic concurrency
+check on its version.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Generic, List, Sequence
+
+from building_blocks.application.ports.outbound.event_publisher import TEvent
+
+
+class AsyncEventStore(ABC, Generic[TEvent]):
+    """
+    Asynchronous outbound port for storing event streams.
+
+    A stream's version is the number of events stored in it, so a new stream
+    is at version 0 and its first event is at version 1. Appending states the
+    version the caller last read; if other events were appended since, the
+    append is rejected and nothing is stored.
+
+    Perfect for:
+    - Persisting EventSourcedAggregateRoot instances
+    - Rebuilding aggregates from their history, optionally after a snapshot
+    - Detecting concurrent changes to the same aggregate
+    """
+
+    @abstractmethod
+    async def append(
+        self, stream_id: str, expected_version: int, events: Sequence[TEvent]
+    ) -> int:
+        """
+        Append events to the end of a stream, atomically.
+
+        Args:
+            stream_id: ID of the stream, usually the aggregate ID
+            expected_version: Version the stream must be at, 0 for a new stream
+            events: The events to append, in order
+
+        Returns:
+            int: The version of the stream after the append
+
+        Raises:
+            ConcurrencyError: If the stream is not at expected_version
+        """
+
+    @abstractmethod
+    async def read(self, stream_id: str, from_version: int = 0) -> List[TEvent]:
+        """
+        Read the events of a stream that follow a version.
+
+        Args:
+            stream_id: ID of the stream
+            from_version: Version to read after; 0 reads the whole stream and
+                a snapshot's version reads only the events after it
+
+        Returns:
+            List[TEvent]: The events in order, empty if there are none
+        """
+
+
+class SyncEventStore(ABC, Generic[TEvent]):
+    """
+    Synchronous outbound port for storing event streams.
+
+    A stream's version is the number of events stored in it, so a new stream
+    is at version 0 and its first event is at version 1. Appending states the
+    version the caller last read; if other events were appended since, the
+    append is rejected and nothing is stored.
+
+    Perfect for:
+    - Persisting EventSourcedAggregateRoot instances
+    - Rebuilding aggregates from their history, optionally after a snapshot
+    - Detecting concurrent changes to the same aggregate
+    """
+
+    @abstractmethod
+    def append(
+        self, stream_id: str, expected_version: int, events: Sequence[TEvent]
+    ) -> int:
+        """
+        Append events to the end of a stream, atomically.
+
+        Args:
+            stream_id: ID of the stream, usually the aggregate ID
+            expected_version: Version the stream must be at, 0 for a new stream
+            events: The events to append, in order
+
+        Returns:
+            int: The version of the stream after the append
+
+        Raises:
+            ConcurrencyError: If the stream is not at expected_version
+        """
+
+    @abstractmethod
+    def read(self, stream_id: str, from_version: int = 0) -> List[TEvent]:
+        """
+        Read the events of a stream that follow a version.
+
+        Args:
+            stream_id: ID of the stream
+            from_version: Version to read after; 0 reads the whole stream and
+                a snapshot's version reads only the events after it
+
+        Returns:
+            List[TEvent]: The events in order, empty if there are none
+        """
@@ -0,0 +1,78 @@
+"""
+Transactional outbox interface.
+
+The outbox stores events in the same transaction as the state changes that
+produced them, so that events are published if and only if the changes are
+committed.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Generic, List, Sequence
+
+from building_blocks.application.ports.outbound.event_publisher import TEvent
+
+
+@dataclass(frozen=True)
+class OutboxEntry(Generic[TEvent]):
+    """
+    An event waiting in the outbox.
+
+    Attributes:
+        position: Storage-assigned position; entries are relayed in
+            increasing position order
+        event: The stored event
+    """
+
+    position: int
+    event: TEvent
+
+
+class AsyncOutbox(ABC, Generic[TEvent]):
+    """
+    Asynchronous outbound port for a transactional outbox.
+
+    Implementations write to the same database, and through the same
+    connection or session, as the repositories of the unit of work, so that
+    ``add_all`` becomes part of the business transaction. A relay later reads
+    the pending entries, publishes them and marks them as published.
+
+    Perfect for:
+    - Publishing events without broker round trips in the request path
+    - Never publishing events of a rolled-back transaction
+    - Never losing events of a committed transaction
+    """
+
+    @abstractmethod
+    async def add_all(self, events: Sequence[TEvent]) -> None:
+        """
+        Stage events for publication in the current transaction.
+
+        Args:
+            events: The events to store, in the order they were recorded.
+        """
+
+    @abstractmethod
+    async def fetch_pending(self, limit: int) -> List[OutboxEntry[TEvent]]:
+        """
+        Read the oldest events that have not been published yet.
+
+        Args:
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List[OutboxEntry[TEvent]]: Pending entries in position order.
+        """
+
+    @abstractmethod
+    async def mark_published(self, entries: Sequence[OutboxEntry[TEvent]]) -> None:
+        """
+        Record that entries have been published, so they are not relayed again.
+
+        Implementations may delete the entries or flag them.
+
+        Args:
+            entries: Entries returned by ``fetch_pending`` that were published.
+        """
@@ -0,0 +1,81 @@
+"""
+Snapshot store interface.
+
+A snapshot store keeps the latest snapshot of each event-sourced aggregate,
+so loading it only replays the events recorded after the snapshot.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from building_blocks.domain.event_sourced_aggregate_root import Snapshot
+
+
+class AsyncSnapshotStore(ABC):
+    """
+    Asynchronous outbound port for storing aggregate snapshots.
+
+    Snapshots are keyed by aggregate ID and version. A store keeps the latest
+    version of each aggregate: saving a snapshot older than the stored one
+    leaves the stored one in place. Use one store per aggregate type.
+
+    Snapshots are an optimization, never the source of truth: a store may
+    drop them at any time, and loading falls back to the full event stream.
+    """
+
+    @abstractmethod
+    async def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+        """
+
+    @abstractmethod
+    async def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+        """
+
+
+class SyncSnapshotStore(ABC):
+    """
+    Synchronous outbound port for storing aggregate snapshots.
+
+    Snapshots are keyed by aggregate ID and version. A store keeps the latest
+    version of each aggregate: saving a snapshot older than the stored one
+    leaves the stored one in place. Use one store per aggregate type.
+
+    Snapshots are an optimization, never the source of truth: a store may
+    drop them at any time, and loading falls back to the full event stream.
+    """
+
+    @abstractmethod
+    def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+        """
+
+    @abstractmethod
+    def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+        """
@@ -94,7 +94,7 @@ class SyncUnitOfWork(ABC):
         """
         return self
 
-    def __aexit__(
+    def __exit__(
         self,
         exc_type: Optional[type],
         exc_value: Optional[BaseException],
@@ -0,0 +1,122 @@
+"""
+Event-publishing use case decorators.
+
+This module provides AsyncEventPublishingUseCase and SyncEventPublishingUseCase,
+which collect the events recorded by every aggregate during a use case and
+publish those of committed changes in one batch once it returns.
+"""
+
+from __future__ import annotations
+
+from building_blocks.application.ports.inbound.use_case import (
+    AsyncUseCase,
+    SyncUseCase,
+    TRequest,
+    TResponse,
+)
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+    SyncEventPublisher,
+)
+from building_blocks.domain.event_collector import collect_events
+from building_blocks.domain.messages.event import Event
+
+
+class AsyncEventPublishingUseCase(AsyncUseCase[TRequest, TResponse]):
+    """
+    Use case decorator that publishes the use case's events in one batch.
+
+    The wrapped use case runs inside ``collect_events``, so every event
+    recorded by any aggregate during it is collected, in the order recorded.
+    Once it returns, the events whose changes were marked as committed by a
+    unit of work or repository are published with a single ``publish_many``
+    call; services no longer gather each aggregate's changes. If it raises,
+    nothing is published. Events of changes that were rolled back are not
+    published, even if the use case handled the error and returned, and
+    neither are events an OutboxUnitOfWork stored for its relay.
+
+    Publishing happens after the commit: if the broker is down the changes
+    are stored and the events are lost. Use the transactional outbox where
+    every event must be delivered.
+
+    Example:
+        >>> place_order = AsyncEventPublishingUseCase(
+        ...     PlaceOrderService(uow, orders, customers), publisher
+        ... )
+        >>> response = await place_order.execute(request)
+    """
+
+    def __init__(
+        self,
+        use_case: AsyncUseCase[TRequest, TResponse],
+        publisher: AsyncEventPublisher[Event],
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            use_case: The use case to run
+            publisher: The publisher that receives the collected events
+        """
+        self._use_case = use_case
+        self._publisher = publisher
+
+    async def execute(self, request: TRequest) -> TResponse:
+        """
+        Run the use case, then publish the events it committed.
+
+        Args:
+            request: The request passed to the wrapped use case
+
+        Returns:
+            TResponse: The response of the wrapped use case
+        """
+        with collect_events() as collector:
+            response = await self._use_case.execute(request)
+        events = collector.drain_committed()
+        if events:
+            await self._publisher.publish_many(events)
+        return response
+
+
+class SyncEventPublishingUseCase(SyncUseCase[TRequest, TResponse]):
+    """
+    Use case decorator that publishes the use case's events in one batch.
+
+    Synchronous counterpart of AsyncEventPublishingUseCase: the events
+    recorded by any aggregate while the wrapped use case runs are published
+    with a single ``publish_many`` call once it returns, provided their
+    changes were committed, and not at all if it raises.
+    """
+
+    def __init__(
+        self,
+        use_case: SyncUseCase[TRequest, TResponse],
+        publisher: SyncEventPublisher[Event],
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            use_case: The use case to run
+            publisher: The publisher that receives the collected events
+        """
+        self._use_case = use_case
+        self._publisher = publisher
+
+    def execute(self, request: TRequest) -> TResponse:
+        """
+        Run the use case, then publish the events it committed.
+
+        Args:
+            request: The request passed to the wrapped use case
+
+        Returns:
+            TResponse: The response of the wrapped use case
+        """
+        with collect_events() as collector:
+            response = self._use_case.execute(request)
+        events = collector.drain_committed()
+        if events:
+            self._publisher.publish_many(events)
+        return response
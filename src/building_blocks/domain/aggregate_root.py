@@ -8,33 +8,59 @@ following Domain-Driven Design (DDD) principles, using Vaughn Vernon's approach.
 from __future__ import annotations
 
 from abc import ABC
-from typing import Generic, Hashable, List, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from building_blocks.domain.entity import Entity
+from building_blocks.domain.event_collector import current_event_collector
 from building_blocks.domain.messages.event import Event
-from building_blocks.domain.value_object import ValueObject
+from building_blocks.domain.value_object import FrozenValueObject
 
 TId = TypeVar("TId")
 
+_INTERNED_VERSIONS = 256
 
-class AggregateVersion(ValueObject):
+
+class AggregateVersion(FrozenValueObject):
     """
     Value object representing the version of an aggregate root.
 
     This is used for optimistic concurrency control to ensure that updates
     to the aggregate are consistent and do not conflict with other changes.
+
+    The version is frozen: ``value`` is a plain slot read and cannot be
+    reassigned once the instance is built. Because of that, versions in the
+    common low range are shared: ``AggregateVersion.of`` and ``increment``
+    return interned instances instead of allocating new ones.
     """
 
-    def __init__(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError(f"Expected int, got {type(value).__name__}")
-        if value < 0:
-            raise ValueError("Version cannot be negative")
-        self._value = value
+    value: int
 
-    @property
-    def value(self) -> int:
-        return self._value
+    _interned: ClassVar[Tuple[AggregateVersion, ...]] = ()
+
+    def __post_init__(self) -> None:
+        """
+        Validate the version value.
+
+        Raises:
+            TypeError: If the value is not an int
+            ValueError: If the value is negative
+        """
+        if not isinstance(self.value, int):
+            raise TypeError(f"Expected int, got {type(self.value).__name__}")
+        if self.value < 0:
+            raise ValueError("Version cannot be negative")
 
     def increment(self) -> AggregateVersion:
         """
@@ -43,17 +69,88 @@ class AggregateVersion(ValueObject):
         optimistic concurrency control.
 
         Returns:
-            AggregateVersion: A new instance with the incremented version value.
+            AggregateVersion: An instance with the incremented version value.
         """
-        return AggregateVersion(self._value + 1)
+        return AggregateVersion._from_trusted(self.value + 1)
 
-    def _equality_components(self) -> Tuple[Hashable, ...]:
+    @classmethod
+    def of(cls, value: int) -> AggregateVersion:
         """
-        Return the components used for equality comparison.
+        Return the AggregateVersion for ``value``, reusing interned instances.
+
+        Prefer this over the constructor on hot paths such as mapping database
+        rows to aggregates: low versions are served from a shared cache without
+        allocating or re-validating.
+
+        Args:
+            value: The version number
 
-        This is used by the ValueObject base class to determine equality.
+        Returns:
+            AggregateVersion: The version instance
+
+        Raises:
+            TypeError: If the value is not an int
+            ValueError: If the value is negative
         """
-        return (self._value,)
+        if type(value) is int and 0 <= value < _INTERNED_VERSIONS:
+            return cls._interned[value]
+        return cls(value)
+
+    @classmethod
+    def _from_trusted(cls, value: int) -> AggregateVersion:
+        """
+        Return the AggregateVersion for a value known to be valid.
+
+        Skips validation, so it must only be used for values derived from an
+        existing version, such as in ``increment``.
+
+        Args:
+            value: A non-negative int version number
+
+        Returns:
+            AggregateVersion: The version instance
+        """
+        if value < _INTERNED_VERSIONS:
+            return cls._interned[value]
+        return cls._new_unchecked(value)
+
+
+AggregateVersion._interned = tuple(
+    AggregateVersion(value) for value in range(_INTERNED_VERSIONS)
+)
+
+
+class UncommittedChangesView(Sequence[Event]):
+    """
+    Read-only live view of an aggregate's uncommitted changes.
+
+    The view reads the aggregate's event buffer on each access instead of
+    copying it, so it always shows the events recorded and not yet committed
+    or drained. Slicing it returns a new list.
+    """
+
+    __slots__ = ("_aggregate",)
+
+    def __init__(self, aggregate: AggregateRoot[Any]) -> None:
+        self._aggregate = aggregate
+
+    def __len__(self) -> int:
+        return len(self._aggregate._uncommitted_events)
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Event]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Event, List[Event]]:
+        return self._aggregate._uncommitted_events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._aggregate._uncommitted_events)
+
+    def __repr__(self) -> str:
+        return f"UncommittedChangesView({self._aggregate._uncommitted_events!r})"
 
 
 class AggregateRoot(Entity[TId], Generic[TId], ABC):
@@ -82,7 +179,7 @@ class AggregateRoot(Entity[TId], Generic[TId], ABC):
                      If not provided, defaults to AggregateVersion(0).
         """
         super().__init__(aggregate_id)
-        self._version = version or AggregateVersion(0)
+        self._version = version or AggregateVersion.of(0)
         self._uncommitted_events = []
 
     @property
@@ -104,11 +201,48 @@ class AggregateRoot(Entity[TId], Generic[TId], ABC):
         Returns a copy to prevent external modification.
         Following Vaughn Vernon's naming convention.
 
+        Prefer ``uncommitted_changes_view`` to inspect the events, and
+        ``drain_uncommitted_changes`` to hand them off once committed; neither
+        copies the events.
+
         Returns:
             List[Event]: Copy of uncommitted domain events
         """
         return self._uncommitted_events.copy()
 
+    def uncommitted_changes_view(self) -> UncommittedChangesView:
+        """
+        Get a read-only view of the uncommitted domain events, without copying.
+
+        The view is live: it reflects events recorded, committed or drained
+        after it was taken.
+
+        Returns:
+            UncommittedChangesView: View of the uncommitted domain events
+        """
+        return UncommittedChangesView(self)
+
+    def drain_uncommitted_changes(self) -> List[Event]:
+        """
+        Mark all uncommitted changes as committed and hand them off.
+
+        The event buffer itself is returned and replaced by an empty one, so
+        the events are not copied and later events do not reach the caller's
+        list. Use it instead of ``uncommitted_changes`` followed by
+        ``mark_changes_as_committed`` once the aggregate is persisted.
+
+        The events are reported to the active ``EventCollector``, if any, as
+        committed.
+
+        Returns:
+            List[Event]: The events that were uncommitted, owned by the caller
+        """
+        events = self._uncommitted_events
+        self._uncommitted_events = []
+        self._increment_version()
+        self._report_committed(events)
+        return events
+
     def record_event(self, domain_event: Event) -> None:
         """
         Record a domain event to be published.
@@ -116,10 +250,21 @@ class AggregateRoot(Entity[TId], Generic[TId], ABC):
         This is the primary method for recording domain events when significant
         business events occur. Following Vaughn Vernon's naming convention.
 
+        The event is also added to the active ``EventCollector``, if any.
+
         Args:
             domain_event: The domain event to record
         """
         self._uncommitted_events.append(domain_event)
+        collector = current_event_collector()
+        if collector is not None:
+            collector.record(domain_event)
+
+    def _report_committed(self, events: List[Event]) -> None:
+        """Report drained events to the active collector as committed."""
+        collector = current_event_collector()
+        if collector is not None and events:
+            collector.commit(events)
 
     def mark_changes_as_committed(self) -> None:
         """
@@ -128,9 +273,11 @@ class AggregateRoot(Entity[TId], Generic[TId], ABC):
         This method should be called after events have been successfully
         published and the aggregate has been persisted.
         Following Vaughn Vernon's naming convention.
+
+        Subclasses that change how committing works override
+        ``drain_uncommitted_changes``, which this method calls.
         """
-        self._uncommitted_events.clear()
-        self._increment_version()
+        self.drain_uncommitted_changes()
 
     def _increment_version(self) -> None:
         """
@@ -1,3 +1,4 @@
+from .concurrency_error import ConcurrencyError
 from .domain_error import DomainError
 from .domain_rule_violation_error import DomainRuleViolationError
 from .domain_validation_error import DomainValidationError
@@ -6,4 +7,5 @@ __all__ = [
     "DomainValidationError",
     "DomainRuleViolationError",
     "DomainError",
+    "ConcurrencyError",
 ]
@@ -0,0 +1,38 @@
+from typing import Any, Dict
+
+from .domain_error import DomainError
+
+
+class ConcurrencyError(DomainError):
+    """
+    Raised when an aggregate was changed by someone else since it was loaded.
+
+    Repositories and writers raise it when an optimistic concurrency check
+    fails: the stored version of an aggregate no longer matches the version
+    the aggregate was loaded with. ``conflicts`` maps the ID of every
+    aggregate that failed the check to the version it was expected to have.
+    Reload the aggregates and retry the use case, or report the conflict.
+    """
+
+    def __init__(self, aggregate_type: str, conflicts: Dict[Any, int]) -> None:
+        if not conflicts:
+            raise ValueError("conflicts cannot be empty")
+        self.aggregate_type = aggregate_type
+        self.conflicts = dict(conflicts)
+        if len(self.conflicts) == 1:
+            [(aggregate_id, version)] = self.conflicts.items()
+            message = (
+                f"{aggregate_type} {aggregate_id} was changed concurrently, "
+                f"expected version {version}"
+            )
+        else:
+            ids = ", ".join(str(aggregate_id) for aggregate_id in self.conflicts)
+            message = (
+                f"{len(self.conflicts)} {aggregate_type} aggregates were changed "
+                f"concurrently: {ids}"
+            )
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
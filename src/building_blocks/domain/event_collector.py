@@ -0,0 +1,176 @@
+"""
+Context-scoped domain event collection.
+
+This module provides EventCollector and the collect_events context manager.
+While a collector is active, every event an aggregate records is also added
+to it, so the events of all the aggregates a use case touches can be handed
+off together, in the order they were recorded. Aggregates also report the
+events they commit, so only events whose changes were stored need be handed
+off.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional, Set
+
+from building_blocks.domain.messages.event import Event
+
+_current_collector: ContextVar[Optional[EventCollector]] = ContextVar(
+    "building_blocks_event_collector", default=None
+)
+
+
+class EventCollector:
+    """
+    Collects the events recorded by any aggregate while it is active.
+
+    Events are kept in the order they were recorded, across aggregates, so
+    an event always comes after the events recorded before it, whichever
+    aggregate recorded them. Aggregates keep their own uncommitted changes
+    as well: the collector only decides which events are published together,
+    while repositories and units of work still commit each aggregate.
+
+    Aggregates report their events to ``commit`` when their changes are
+    marked as committed, so ``drain_committed`` leaves out the events of
+    changes that were rolled back. Events that another channel delivers,
+    such as the transactional outbox, are withdrawn with ``discard``.
+
+    Create collectors with ``collect_events``.
+    """
+
+    __slots__ = ("_events", "_recorded", "_committed", "_discarded")
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self._events: List[Event] = []
+        self._recorded: Set[int] = set()
+        self._committed: Set[int] = set()
+        self._discarded: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, event: Event) -> None:
+        """
+        Add an event after those already collected.
+
+        Called by ``AggregateRoot.record_event``.
+
+        Args:
+            event: The recorded domain event
+        """
+        self._events.append(event)
+        self._recorded.add(id(event))
+
+    def commit(self, events: Iterable[Event]) -> None:
+        """
+        Mark collected events as committed.
+
+        Called by ``AggregateRoot.drain_uncommitted_changes``. Events that
+        were not collected are ignored.
+
+        Args:
+            events: Events whose changes have been committed
+        """
+        recorded = self._recorded
+        self._committed.update(key for key in map(id, events) if key in recorded)
+
+    def discard(self, events: Iterable[Event]) -> None:
+        """
+        Withdraw collected events from ``drain_committed``.
+
+        Used when the events are delivered by other means, for example by
+        a unit of work that stores them in an outbox.
+
+        Args:
+            events: Events that must not be handed off
+        """
+        recorded = self._recorded
+        self._discarded.update(key for key in map(id, events) if key in recorded)
+
+    def drain(self) -> List[Event]:
+        """
+        Hand off all the collected events and start collecting anew.
+
+        The buffer itself is returned and replaced by an empty one, without
+        copying the events.
+
+        Returns:
+            List[Event]: The collected events, in the order they were recorded
+        """
+        events = self._events
+        self._events = []
+        self._recorded = set()
+        self._committed = set()
+        self._discarded = set()
+        return events
+
+    def drain_committed(self) -> List[Event]:
+        """
+        Hand off the committed events and keep collecting the others.
+
+        Discarded events are dropped; events not committed yet stay
+        collected.
+
+        Returns:
+            List[Event]: The committed events, in the order they were
+                recorded
+        """
+        if not self._committed:
+            return []
+        committed: List[Event] = []
+        pending: List[Event] = []
+        for event in self._events:
+            key = id(event)
+            if key in self._discarded:
+                continue
+            if key in self._committed:
+                committed.append(event)
+            else:
+                pending.append(event)
+        self._events = pending
+        self._recorded = {id(event) for event in pending}
+        self._committed = set()
+        self._discarded = set()
+        return committed
+
+
+@contextmanager
+def collect_events() -> Iterator[EventCollector]:
+    """
+    Collect the events recorded in the current context until the block ends.
+
+    The collector is stored in a context variable, so it only sees events
+    recorded by the current thread or asyncio task, and by tasks created
+    from it inside the block. A nested block collects its events on its own:
+    they do not reach the enclosing collector.
+
+    Yields:
+        EventCollector: The active collector
+
+    Example:
+        >>> with collect_events() as collector:
+        ...     order.place()
+        ...     customer.add_loyalty_points(order.total)
+        ...     await uow.commit()
+        >>> await publisher.publish_many(collector.drain_committed())
+    """
+    collector = EventCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def current_event_collector() -> Optional[EventCollector]:
+    """
+    Return the collector active in the current context.
+
+    Returns:
+        Optional[EventCollector]: The collector, or None outside
+            ``collect_events``
+    """
+    return _current_collector.get()
@@ -0,0 +1,348 @@
+"""
+Event-sourced aggregate roots.
+
+This module provides EventSourcedAggregateRoot, an AggregateRoot whose state is
+only changed by applying its events, so it can be rebuilt from its event
+history, and Snapshot, a copy of that state at a version that lets it skip
+most of the history.
+"""
+
+from __future__ import annotations
+
+import copy
+from abc import ABC
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from building_blocks.domain.aggregate_root import AggregateRoot, AggregateVersion
+from building_blocks.domain.messages.event import Event
+
+TId = TypeVar("TId")
+TEvent = TypeVar("TEvent", bound=Event)
+TEventSourced = TypeVar("TEventSourced", bound="EventSourcedAggregateRoot[Any]")
+
+EventHandler = Callable[[Any, Any], None]
+"""An unbound handler method, called with the aggregate and the event."""
+
+_HANDLES = "__handles_event__"
+_BASE_ATTRIBUTES = frozenset(
+    {"_id", "_version", "_uncommitted_events", "_snapshot_version"}
+)
+
+
+def handles(
+    event_type: Type[TEvent],
+) -> Callable[[Callable[[Any, TEvent], None]], Callable[[Any, TEvent], None]]:
+    """
+    Mark a method of an EventSourcedAggregateRoot as the handler of an event.
+
+    Args:
+        event_type: The event class the method applies
+
+    Returns:
+        A decorator returning the method unchanged
+
+    Example:
+        >>> class Account(EventSourcedAggregateRoot[UUID]):
+        ...     @handles(MoneyDeposited)
+        ...     def _on_deposited(self, event: MoneyDeposited) -> None:
+        ...         self._balance += event.amount
+    """
+
+    def decorator(
+        method: Callable[[Any, TEvent], None],
+    ) -> Callable[[Any, TEvent], None]:
+        setattr(method, _HANDLES, event_type)
+        return method
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    The state of an event-sourced aggregate at a version.
+
+    Attributes:
+        aggregate_id: ID of the aggregate
+        version: Version of the aggregate when the snapshot was taken, that is
+            the number of events it reflects
+        state: The aggregate's state, as returned by ``_snapshot_state``
+    """
+
+    aggregate_id: Any
+    version: AggregateVersion
+    state: Dict[str, Any]
+
+
+class EventSourcedAggregateRoot(AggregateRoot[TId], Generic[TId], ABC):
+    """
+    Base class for aggregate roots rebuilt from their events.
+
+    State changes only through events: command methods check their rules and
+    call ``record_event``, which applies the event to the aggregate through
+    its handler before recording it for publishing. ``replay`` builds an
+    aggregate by applying its stored events in order, with the same handlers.
+
+    Handlers are methods decorated with ``handles``. They are collected once
+    per class when it is defined, including those inherited, and each event
+    is dispatched with one dictionary lookup on its type, falling back to
+    the handler of its closest base class. A subclass replaces an inherited
+    handler by decorating a method for the same event type.
+
+    The version counts the events applied: each event replayed advances it by
+    one and committing the changes advances it by the number of events
+    recorded. It is the stream version an event store checks when appending.
+
+    Long histories are cut short with snapshots. Set ``snapshot_every`` to N
+    and ``snapshot_due`` becomes true once N events were committed since the
+    aggregate was created, restored or last snapshotted; ``take_snapshot``
+    then copies the state and ``replay`` can start from it, applying only
+    the events after it. The state is the aggregate's instance attributes by
+    default; override ``_snapshot_state`` and ``_restore_state`` to choose
+    what goes in it, for example to keep it serializable.
+
+    Subclasses must be constructible with the aggregate ID alone, which
+    builds the state before the first event.
+
+    Example:
+        >>> class Account(EventSourcedAggregateRoot[UUID]):
+        ...     snapshot_every = 100
+        ...
+        ...     def __init__(self, account_id: UUID) -> None:
+        ...         super().__init__(account_id)
+        ...         self._balance = 0
+        ...
+        ...     def deposit(self, amount: int) -> None:
+        ...         if amount <= 0:
+        ...             raise DomainValidationError("Amount must be positive")
+        ...         self.record_event(MoneyDeposited(amount=amount))
+        ...
+        ...     @handles(MoneyDeposited)
+        ...     def _on_deposited(self, event: MoneyDeposited) -> None:
+        ...         self._balance += event.amount
+        >>> account = Account.replay(account_id, events, snapshot)
+    """
+
+    snapshot_every: ClassVar[Optional[int]] = None
+    _declared_handlers: ClassVar[Dict[type, EventHandler]] = {}
+    _event_handlers: ClassVar[Dict[type, EventHandler]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.snapshot_every is not None and cls.snapshot_every < 1:
+            raise ValueError(
+                f"snapshot_every must be at least 1, got {cls.snapshot_every}"
+            )
+        own: Dict[type, EventHandler] = {}
+        for name, member in vars(cls).items():
+            event_type = getattr(member, _HANDLES, None)
+            if event_type is None:
+                continue
+            if event_type in own:
+                raise TypeError(
+                    f"{cls.__name__} has two handlers for {event_type.__name__}: "
+                    f"{own[event_type].__name__} and {name}"
+                )
+            own[event_type] = member
+        # Only declared handlers are inherited: those resolved for subtypes
+        # of their events are cached per class, in _event_handlers, so they
+        # never hide an override declared by a subclass.
+        cls._declared_handlers = {**cls._declared_handlers, **own}
+        cls._event_handlers = dict(cls._declared_handlers)
+
+    def __init__(
+        self, aggregate_id: TId, version: Optional[AggregateVersion] = None
+    ) -> None:
+        """
+        Initialize the event-sourced aggregate root.
+
+        Args:
+            aggregate_id: Unique identifier for this aggregate
+            version: Optional initial version. Defaults to AggregateVersion(0).
+        """
+        super().__init__(aggregate_id, version)
+        self._snapshot_version = self._version.value
+
+    @classmethod
+    def replay(
+        cls: Type[TEventSourced],
+        aggregate_id: Any,
+        history: Iterable[Event],
+        snapshot: Optional[Snapshot] = None,
+    ) -> TEventSourced:
+        """
+        Rebuild an aggregate from its stored events.
+
+        Args:
+            aggregate_id: ID of the aggregate
+            history: The stored events in order, starting after the snapshot
+                if one is given, or with the first event otherwise
+            snapshot: A snapshot of the aggregate to start from
+
+        Returns:
+            The aggregate, at the version of its last event
+
+        Raises:
+            TypeError: If an event has no handler
+            ValueError: If the snapshot is of another aggregate
+        """
+        aggregate = cls(aggregate_id)
+        if snapshot is not None:
+            aggregate.restore_snapshot(snapshot)
+        aggregate.load_from_history(history)
+        return aggregate
+
+    @property
+    def snapshot_due(self) -> bool:
+        """
+        Whether ``snapshot_every`` events were committed since the last snapshot.
+
+        Returns:
+            bool: False if the class does not take snapshots
+        """
+        every = self.snapshot_every
+        return (
+            every is not None and self._version.value - self._snapshot_version >= every
+        )
+
+    def record_event(self, domain_event: Event) -> None:
+        """
+        Apply a new event to the aggregate and record it to be published.
+
+        Args:
+            domain_event: The domain event to apply and record
+
+        Raises:
+            TypeError: If the event has no handler
+        """
+        self._apply(domain_event)
+        super().record_event(domain_event)
+
+    def load_from_history(self, history: Iterable[Event]) -> None:
+        """
+        Apply stored events, advancing the version by one per event.
+
+        Args:
+            history: The stored events that follow the current version, in
+                order
+
+        Raises:
+            TypeError: If an event has no handler
+            ValueError: If the aggregate has uncommitted changes
+        """
+        self._check_no_uncommitted_changes("load history into")
+        version = self._version.value
+        for event in history:
+            self._apply(event)
+            version += 1
+        self._version = AggregateVersion.of(version)
+
+    def drain_uncommitted_changes(self) -> List[Event]:
+        """
+        Hand off the recorded events and advance the version past them.
+
+        Each committed event advances the version by one, so it stays equal
+        to the length of the aggregate's event stream. This also applies to
+        ``mark_changes_as_committed``, which drains the events. The events are
+        reported to the active ``EventCollector``, if any, as committed.
+
+        Returns:
+            List[Event]: The events that were uncommitted, owned by the caller
+        """
+        events = self._uncommitted_events
+        self._uncommitted_events = []
+        self._version = AggregateVersion.of(self._version.value + len(events))
+        self._report_committed(events)
+        return events
+
+    def take_snapshot(self) -> Snapshot:
+        """
+        Copy the aggregate's state at its current version.
+
+        Returns:
+            Snapshot: The snapshot
+
+        Raises:
+            ValueError: If the aggregate has uncommitted changes
+        """
+        self._check_no_uncommitted_changes("snapshot")
+        snapshot = Snapshot(self.id, self._version, self._snapshot_state())
+        self._snapshot_version = self._version.value
+        return snapshot
+
+    def restore_snapshot(self, snapshot: Snapshot) -> None:
+        """
+        Set the aggregate's state and version to those of a snapshot.
+
+        Args:
+            snapshot: A snapshot of this aggregate
+
+        Raises:
+            ValueError: If the snapshot is of another aggregate, or the
+                aggregate has uncommitted changes
+        """
+        if snapshot.aggregate_id != self.id:
+            raise ValueError(
+                f"Snapshot of {snapshot.aggregate_id!r} cannot be restored into "
+                f"{type(self).__name__} {self.id!r}"
+            )
+        self._check_no_uncommitted_changes("restore a snapshot into")
+        self._restore_state(snapshot.state)
+        self._version = snapshot.version
+        self._snapshot_version = snapshot.version.value
+
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """
+        Return a copy of the aggregate's state.
+
+        Defaults to a deep copy of the instance attributes, leaving out those
+        of the base classes.
+        """
+        return {
+            name: copy.deepcopy(value)
+            for name, value in vars(self).items()
+            if name not in _BASE_ATTRIBUTES
+        }
+
+    def _restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Set the aggregate's state from a copy made by ``_snapshot_state``.
+
+        Defaults to setting a deep copy of each attribute.
+        """
+        for name, value in state.items():
+            setattr(self, name, copy.deepcopy(value))
+
+    def _apply(self, event: Event) -> None:
+        handler = self._event_handlers.get(type(event))
+        if handler is None:
+            handler = self._resolve_handler(type(event))
+        handler(self, event)
+
+    @classmethod
+    def _resolve_handler(cls, event_type: type) -> EventHandler:
+        for base in event_type.__mro__[1:]:
+            handler = cls._declared_handlers.get(base)
+            if handler is not None:
+                cls._event_handlers[event_type] = handler
+                return handler
+        raise TypeError(f"{cls.__name__} has no handler for {event_type.__name__}")
+
+    def _check_no_uncommitted_changes(self, action: str) -> None:
+        if self._uncommitted_events:
+            raise ValueError(
+                f"Cannot {action} {type(self).__name__} {self.id!r} with "
+                f"{len(self._uncommitted_events)} uncommitted changes"
+            )
@@ -1,5 +1,6 @@
+from building_blocks.domain.messages.codec import MessageCodec
 from building_blocks.domain.messages.command import Command
 from building_blocks.domain.messages.event import Event
 from building_blocks.domain.messages.message import Message, MessageMetadata
 
-__all__ = ["Message", "MessageMetadata", "Event", "Command"]
+__all__ = ["Message", "MessageMetadata", "Event", "Command", "MessageCodec"]
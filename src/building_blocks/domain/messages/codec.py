@@ -0,0 +1,700 @@
+"""
+Binary codec for domain messages.
+
+This module provides MessageCodec, which turns Event and Command instances into
+a compact binary representation and back, without going through JSON or the
+intermediate dictionaries built by ``Message.to_dict``.
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from building_blocks.domain.messages.message import Message, MessageMetadata
+
+TMessage = TypeVar("TMessage", bound=Message)
+
+MessageFactory = Callable[[Dict[str, Any], MessageMetadata], Message]
+"""Builds a message from its decoded payload and metadata."""
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+FORMAT_VERSION = 1
+BATCH_FORMAT_VERSION = 0x81
+MAX_DEPTH = 64
+"""How deeply lists and dicts may be nested in a decoded value."""
+
+_NIL = 0xC0
+_FALSE = 0xC2
+_TRUE = 0xC3
+_BIN = 0xC4
+_BIG_INT = 0xC7
+_FLOAT = 0xCB
+_DECIMAL = 0xD5
+_NAIVE_DATETIME = 0xD6
+_DATETIME = 0xD7
+_UUID = 0xD8
+_OFFSET_DATETIME = 0xD9
+_INT = 0xD3
+_STR = 0xDB
+_ARRAY = 0xDD
+_MAP = 0xDF
+_FIXSTR = 0xA0
+_FIXSTR_MAX_LENGTH = 0x1F
+_FIXINT_MAX = 0x7F
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_U32 = struct.Struct(">I")
+_TAG_U32 = struct.Struct(">BI")
+_TAG_I64 = struct.Struct(">Bq")
+_TAG_F64 = struct.Struct(">Bd")
+_TAG_I64_I64 = struct.Struct(">Bqq")
+_I64 = struct.Struct(">q")
+_F64 = struct.Struct(">d")
+_I64_I64 = struct.Struct(">qq")
+_HEADER = struct.Struct(">B16sqH")
+_BATCH_HEADER = struct.Struct(">BHI")
+_BATCH_RECORD = struct.Struct(">H16sq")
+_NAME_LENGTH = struct.Struct(">H")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class MessageCodec:
+    """
+    Encodes messages to bytes and decodes them back.
+
+    Each message is written as a fixed header followed by its payload:
+
+    - format version (1 byte)
+    - message ID (16 bytes)
+    - creation time as microseconds since the Unix epoch (8 bytes, signed)
+    - message type name length (2 bytes) and UTF-8 name
+    - payload, encoded as a map
+
+    Payload values use a msgpack-style tagged encoding. Supported types are
+    None, bool, int, float, str, bytes, Decimal, UUID, datetime, list, tuple
+    and dict; tuples are decoded as lists. Aware datetimes keep their UTC
+    offset, as a fixed-offset ``timezone``: the name of a ``zoneinfo`` zone
+    is not kept. Lists and dicts nested more than ``MAX_DEPTH`` levels deep
+    are rejected as malformed when decoded. Encoded records are
+    self-delimiting, so several can be written back to back into one buffer.
+
+    ``encode_many`` frames a whole batch in one buffer: a header with the
+    number of messages, a table of the distinct message type names, then one
+    record per message that refers to its type by index. The batch format
+    is distinct from the single-message one; use ``decode_many`` to read it.
+
+    Decoding needs to know which class to build for each message type, so
+    message classes are registered with the codec under their ``message_type``
+    (the class name unless the class overrides it), the name the encoder
+    writes. ``message_type`` must therefore not depend on the state of an
+    instance. By default a message is rebuilt by calling its class
+    with the payload as keyword arguments plus ``metadata``; messages whose
+    constructor does not mirror their payload can register a factory instead.
+
+    Example:
+        >>> codec = MessageCodec()
+        >>> codec.register(OrderCreated)
+        >>> buffer = bytearray()
+        >>> codec.encode_into(OrderCreated("order-1", "customer-1", 9.5), buffer)
+        >>> event = codec.decode(buffer)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty codec with no registered message types."""
+        self._factories: Dict[str, MessageFactory] = {}
+        self._classes: Dict[str, Type[Message]] = {}
+
+    def register(
+        self, message_class: Type[TMessage], factory: Optional[MessageFactory] = None
+    ) -> Type[TMessage]:
+        """
+        Register a message class for decoding.
+
+        Can be used as a class decorator.
+
+        Args:
+            message_class: The concrete message class to register
+            factory: Builds the message from its payload and metadata. Defaults to
+                calling the class with the payload as keyword arguments.
+
+        Returns:
+            Type[TMessage]: The registered class, unchanged
+
+        Raises:
+            ValueError: If another class is already registered under the same
+                message type
+        """
+        message_type = _message_type_of(message_class)
+        registered = self._classes.get(message_type)
+        if registered is not None and registered is not message_class:
+            raise ValueError(f"Message type '{message_type}' is already registered")
+        self._classes[message_type] = message_class
+        self._factories[message_type] = factory or _keyword_factory(message_class)
+        return message_class
+
+    def is_registered(self, message_type: str) -> bool:
+        """
+        Check whether a message type can be decoded.
+
+        Args:
+            message_type: The message type name
+
+        Returns:
+            bool: True if a class is registered under this name
+        """
+        return message_type in self._factories
+
+    def encode(self, message: Message) -> bytes:
+        """
+        Encode a message to a new bytes object.
+
+        Args:
+            message: The message to encode
+
+        Returns:
+            bytes: The encoded message
+
+        Raises:
+            TypeError: If the payload contains a value of an unsupported type
+        """
+        buffer = bytearray()
+        self.encode_into(message, buffer)
+        return bytes(buffer)
+
+    def encode_into(self, message: Message, buffer: bytearray) -> int:
+        """
+        Append an encoded message to an existing buffer.
+
+        Reusing one buffer across many messages avoids allocating a new bytes
+        object per message.
+
+        Args:
+            message: The message to encode
+            buffer: The buffer to append to
+
+        Returns:
+            int: The number of bytes written
+
+        Raises:
+            TypeError: If the payload contains a value of an unsupported type
+        """
+        start = len(buffer)
+        type_name = message.message_type.encode()
+        metadata = message.metadata
+        buffer += _HEADER.pack(
+            FORMAT_VERSION,
+            metadata.message_id.bytes,
+            _epoch_micros(metadata.created_at),
+            len(type_name),
+        )
+        buffer += type_name
+        _write_value(buffer, message.payload)
+        return len(buffer) - start
+
+    def decode(self, data: Buffer) -> Message:
+        """
+        Decode a single message.
+
+        Args:
+            data: The encoded message
+
+        Returns:
+            Message: The decoded message
+
+        Raises:
+            ValueError: If the data is malformed or the message type is not
+                registered
+        """
+        message, end = self.decode_from(data)
+        if end != len(data):
+            raise ValueError(f"Unexpected {len(data) - end} trailing bytes")
+        return message
+
+    def decode_from(self, data: Buffer, offset: int = 0) -> Tuple[Message, int]:
+        """
+        Decode one message starting at an offset of a larger buffer.
+
+        The buffer is read in place through a memoryview; it is not copied.
+
+        Args:
+            data: The buffer to read from
+            offset: Position of the first byte of the message
+
+        Returns:
+            Tuple[Message, int]: The decoded message and the offset just past it
+
+        Raises:
+            ValueError: If the data is malformed or the message type is not
+                registered
+        """
+        view = memoryview(data)
+        try:
+            version, id_bytes, micros, name_length = _HEADER.unpack_from(view, offset)
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported message format version {version}")
+            offset += _HEADER.size
+            end = offset + name_length
+            message_type = _read_str(view, offset, end)
+            offset = end
+            factory = self._factories.get(message_type)
+            if factory is None:
+                raise ValueError(f"Unknown message type '{message_type}'")
+            payload, offset = _read_value(view, offset)
+        except (struct.error, IndexError, UnicodeDecodeError, InvalidOperation) as e:
+            raise ValueError(f"Malformed message data: {e}") from e
+        metadata = MessageMetadata(
+            message_id=UUID(bytes=bytes(id_bytes)),
+            created_at=_EPOCH + timedelta(microseconds=micros),
+        )
+        return factory(payload, metadata), offset
+
+    def encode_many(self, messages: Iterable[Message]) -> bytes:
+        """
+        Encode a batch of messages into one buffer.
+
+        Each message type name is written once, in a table at the start of the
+        buffer, and the records refer to it by index.
+
+        Args:
+            messages: The messages to encode, e.g. an aggregate's uncommitted
+                changes
+
+        Returns:
+            bytes: The encoded batch
+
+        Raises:
+            TypeError: If a payload contains a value of an unsupported type
+        """
+        batch = messages if isinstance(messages, list) else list(messages)
+        type_indexes: Dict[str, int] = {}
+        for message in batch:
+            type_indexes.setdefault(message.message_type, len(type_indexes))
+
+        buffer = bytearray(
+            _BATCH_HEADER.pack(BATCH_FORMAT_VERSION, len(type_indexes), len(batch))
+        )
+        for type_name in type_indexes:
+            data = type_name.encode()
+            buffer += _NAME_LENGTH.pack(len(data))
+            buffer += data
+        for message in batch:
+            metadata = message.metadata
+            buffer += _BATCH_RECORD.pack(
+                type_indexes[message.message_type],
+                metadata.message_id.bytes,
+                _epoch_micros(metadata.created_at),
+            )
+            _write_value(buffer, message.payload)
+        return bytes(buffer)
+
+    def decode_many(self, data: Buffer) -> Iterator[Message]:
+        """
+        Decode a batch written by ``encode_many``.
+
+        Messages are decoded lazily, one per iteration step, straight from the
+        buffer. Every type in the batch is resolved before the first message
+        is returned. The buffer is only exported, through a memoryview, from
+        the first iteration step until the iterator is exhausted, closed or
+        fails, so a ``bytearray`` cannot be resized in between.
+
+        Args:
+            data: The encoded batch
+
+        Returns:
+            Iterator[Message]: The messages, in the order they were encoded
+
+        Raises:
+            ValueError: If the data is malformed or a message type is not
+                registered
+        """
+        with memoryview(data) as view:
+            try:
+                version, type_count, message_count = _BATCH_HEADER.unpack_from(view)
+                if version != BATCH_FORMAT_VERSION:
+                    raise ValueError(f"Unsupported batch format version {version}")
+                offset = _BATCH_HEADER.size
+                factories: List[MessageFactory] = []
+                for _ in range(type_count):
+                    (length,) = _NAME_LENGTH.unpack_from(view, offset)
+                    offset += _NAME_LENGTH.size
+                    message_type = _read_str(view, offset, offset + length)
+                    offset += length
+                    factory = self._factories.get(message_type)
+                    if factory is None:
+                        raise ValueError(f"Unknown message type '{message_type}'")
+                    factories.append(factory)
+            except (struct.error, IndexError, UnicodeDecodeError) as e:
+                raise ValueError(f"Malformed message data: {e}") from e
+        return self._iter_batch(data, offset, message_count, factories)
+
+    def _iter_batch(
+        self,
+        data: Buffer,
+        offset: int,
+        message_count: int,
+        factories: List[MessageFactory],
+    ) -> Iterator[Message]:
+        # The view is taken here rather than in decode_many so that it only
+        # exists while iterating: leaving the with block, on exhaustion, error
+        # or close(), releases it.
+        with memoryview(data) as view:
+            for _ in range(message_count):
+                try:
+                    type_index, id_bytes, micros = _BATCH_RECORD.unpack_from(
+                        view, offset
+                    )
+                    factory = factories[type_index]
+                    payload, offset = _read_value(view, offset + _BATCH_RECORD.size)
+                except (
+                    struct.error,
+                    IndexError,
+                    UnicodeDecodeError,
+                    InvalidOperation,
+                ) as e:
+                    raise ValueError(f"Malformed message data: {e}") from e
+                metadata = MessageMetadata(
+                    message_id=UUID(bytes=bytes(id_bytes)),
+                    created_at=_EPOCH + timedelta(microseconds=micros),
+                )
+                yield factory(payload, metadata)
+            if offset != len(view):
+                raise ValueError(f"Unexpected {len(view) - offset} trailing bytes")
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encode a single value in the codec's payload format.
+
+    Supports the types allowed in message payloads: None, bool, int, float,
+    str, bytes, Decimal, UUID, datetime, and lists, tuples and dicts of them.
+
+    Args:
+        value: The value to encode
+
+    Returns:
+        bytes: The encoded value
+
+    Raises:
+        TypeError: If the value, or a value nested in it, has an unsupported
+            type
+    """
+    buffer = bytearray()
+    _write_value(buffer, value)
+    return bytes(buffer)
+
+
+def decode_value(data: Buffer) -> Any:
+    """
+    Decode a value encoded by ``encode_value``.
+
+    Tuples are decoded as lists.
+
+    Args:
+        data: The encoded value
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the data is malformed
+    """
+    view = memoryview(data)
+    try:
+        value, end = _read_value(view, 0)
+    except (struct.error, IndexError, UnicodeDecodeError, InvalidOperation) as e:
+        raise ValueError(f"Malformed value data: {e}") from e
+    if end != len(view):
+        raise ValueError(f"Unexpected {len(view) - end} trailing bytes")
+    return value
+
+
+def _message_type_of(message_class: Type[Message]) -> str:
+    # message_type is an instance property; read it from a bare instance so an
+    # override returning a constant is honoured without building a message.
+    message_type: str = object.__new__(message_class).message_type
+    return message_type
+
+
+def _keyword_factory(message_class: Type[Message]) -> MessageFactory:
+    def factory(payload: Dict[str, Any], metadata: MessageMetadata) -> Message:
+        return message_class(metadata=metadata, **payload)
+
+    return factory
+
+
+def _epoch_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _write_value(buffer: bytearray, value: Any) -> None:
+    writer = _WRITERS.get(type(value))
+    if writer is None:
+        writer = _find_writer(value)
+    writer(buffer, value)
+
+
+def _find_writer(value: Any) -> Callable[[bytearray, Any], None]:
+    for value_type, writer in _WRITERS.items():
+        if isinstance(value, value_type):
+            return writer
+    raise TypeError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _write_none(buffer: bytearray, value: None) -> None:
+    buffer.append(_NIL)
+
+
+def _write_bool(buffer: bytearray, value: bool) -> None:
+    buffer.append(_TRUE if value else _FALSE)
+
+
+def _write_int(buffer: bytearray, value: int) -> None:
+    if 0 <= value <= _FIXINT_MAX:
+        buffer.append(value)
+    elif _INT64_MIN <= value <= _INT64_MAX:
+        buffer += _TAG_I64.pack(_INT, value)
+    else:
+        data = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+        buffer += _TAG_U32.pack(_BIG_INT, len(data))
+        buffer += data
+
+
+def _write_float(buffer: bytearray, value: float) -> None:
+    buffer += _TAG_F64.pack(_FLOAT, value)
+
+
+def _write_str(buffer: bytearray, value: str) -> None:
+    data = value.encode()
+    if len(data) <= _FIXSTR_MAX_LENGTH:
+        buffer.append(_FIXSTR | len(data))
+    else:
+        buffer += _TAG_U32.pack(_STR, len(data))
+    buffer += data
+
+
+def _write_bytes(buffer: bytearray, value: bytes) -> None:
+    buffer += _TAG_U32.pack(_BIN, len(value))
+    buffer += value
+
+
+def _write_decimal(buffer: bytearray, value: Decimal) -> None:
+    data = str(value).encode()
+    buffer += _TAG_U32.pack(_DECIMAL, len(data))
+    buffer += data
+
+
+def _write_uuid(buffer: bytearray, value: UUID) -> None:
+    buffer.append(_UUID)
+    buffer += value.bytes
+
+
+def _write_datetime(buffer: bytearray, value: datetime) -> None:
+    if value.tzinfo is None:
+        micros = (value - _NAIVE_EPOCH) // _MICROSECOND
+        buffer += _TAG_I64.pack(_NAIVE_DATETIME, micros)
+    else:
+        micros = (value - _EPOCH) // _MICROSECOND
+        offset = value.utcoffset()
+        if offset:
+            buffer += _TAG_I64_I64.pack(
+                _OFFSET_DATETIME, micros, offset // _MICROSECOND
+            )
+        else:
+            buffer += _TAG_I64.pack(_DATETIME, micros)
+
+
+def _write_list(buffer: bytearray, value: Union[List[Any], Tuple[Any, ...]]) -> None:
+    buffer += _TAG_U32.pack(_ARRAY, len(value))
+    for item in value:
+        _write_value(buffer, item)
+
+
+def _write_dict(buffer: bytearray, value: Dict[Any, Any]) -> None:
+    buffer += _TAG_U32.pack(_MAP, len(value))
+    for key, item in value.items():
+        _write_value(buffer, key)
+        _write_value(buffer, item)
+
+
+_WRITERS: Dict[type, Callable[[bytearray, Any], None]] = {
+    type(None): _write_none,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    str: _write_str,
+    bytes: _write_bytes,
+    bytearray: _write_bytes,
+    Decimal: _write_decimal,
+    UUID: _write_uuid,
+    datetime: _write_datetime,
+    list: _write_list,
+    tuple: _write_list,
+    dict: _write_dict,
+}
+
+
+def _read_str(view: memoryview, offset: int, end: int) -> str:
+    if end > len(view):
+        raise IndexError("unexpected end of data")
+    return str(view[offset:end], "utf-8")
+
+
+def _read_bytes(view: memoryview, offset: int, end: int) -> bytes:
+    if end > len(view):
+        raise IndexError("unexpected end of data")
+    return bytes(view[offset:end])
+
+
+def _read_value(view: memoryview, offset: int, depth: int = 0) -> Tuple[Any, int]:
+    tag = view[offset]
+    offset += 1
+    if tag <= _FIXINT_MAX:
+        return tag, offset
+    if tag & 0xE0 == _FIXSTR:
+        end = offset + (tag & _FIXSTR_MAX_LENGTH)
+        return _read_str(view, offset, end), end
+    reader = _READERS.get(tag)
+    if reader is not None:
+        return reader(view, offset)
+    container_reader = _CONTAINER_READERS.get(tag)
+    if container_reader is None:
+        raise ValueError(f"Malformed message data: unknown value tag 0x{tag:02X}")
+    if depth >= MAX_DEPTH:
+        raise ValueError(
+            f"Malformed payload: values nested more than {MAX_DEPTH} levels deep"
+        )
+    return container_reader(view, offset, depth + 1)
+
+
+def _read_none(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return None, offset
+
+
+def _read_true(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return True, offset
+
+
+def _read_false(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return False, offset
+
+
+def _read_int(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return _I64.unpack_from(view, offset)[0], offset + 8
+
+
+def _read_float(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return _F64.unpack_from(view, offset)[0], offset + 8
+
+
+def _read_uuid(view: memoryview, offset: int) -> Tuple[Any, int]:
+    end = offset + 16
+    return UUID(bytes=_read_bytes(view, offset, end)), end
+
+
+def _read_datetime(view: memoryview, offset: int) -> Tuple[Any, int]:
+    micros = _I64.unpack_from(view, offset)[0]
+    return _EPOCH + timedelta(microseconds=micros), offset + 8
+
+
+def _read_offset_datetime(view: memoryview, offset: int) -> Tuple[Any, int]:
+    micros, offset_micros = _I64_I64.unpack_from(view, offset)
+    zone = timezone(timedelta(microseconds=offset_micros))
+    return (_EPOCH + timedelta(microseconds=micros)).astimezone(zone), offset + 16
+
+
+def _read_naive_datetime(view: memoryview, offset: int) -> Tuple[Any, int]:
+    micros = _I64.unpack_from(view, offset)[0]
+    return _NAIVE_EPOCH + timedelta(microseconds=micros), offset + 8
+
+
+def _read_long_str(view: memoryview, offset: int) -> Tuple[Any, int]:
+    end = offset + 4 + _U32.unpack_from(view, offset)[0]
+    return _read_str(view, offset + 4, end), end
+
+
+def _read_bin(view: memoryview, offset: int) -> Tuple[Any, int]:
+    end = offset + 4 + _U32.unpack_from(view, offset)[0]
+    return _read_bytes(view, offset + 4, end), end
+
+
+def _read_decimal(view: memoryview, offset: int) -> Tuple[Any, int]:
+    end = offset + 4 + _U32.unpack_from(view, offset)[0]
+    return Decimal(_read_str(view, offset + 4, end)), end
+
+
+def _read_big_int(view: memoryview, offset: int) -> Tuple[Any, int]:
+    end = offset + 4 + _U32.unpack_from(view, offset)[0]
+    data = _read_bytes(view, offset + 4, end)
+    return int.from_bytes(data, "big", signed=True), end
+
+
+def _read_array(view: memoryview, offset: int, depth: int) -> Tuple[Any, int]:
+    (size,) = _U32.unpack_from(view, offset)
+    offset += 4
+    items: List[Any] = []
+    for _ in range(size):
+        item, offset = _read_value(view, offset, depth)
+        items.append(item)
+    return items, offset
+
+
+def _read_map(view: memoryview, offset: int, depth: int) -> Tuple[Any, int]:
+    (size,) = _U32.unpack_from(view, offset)
+    offset += 4
+    result: Dict[Any, Any] = {}
+    for _ in range(size):
+        key, offset = _read_value(view, offset, depth)
+        value, offset = _read_value(view, offset, depth)
+        try:
+            result[key] = value
+        except TypeError:
+            raise ValueError(
+                f"Malformed payload: unhashable map key of type {type(key).__name__}"
+            ) from None
+    return result, offset
+
+
+_READERS: Dict[int, Callable[[memoryview, int], Tuple[Any, int]]] = {
+    _NIL: _read_none,
+    _TRUE: _read_true,
+    _FALSE: _read_false,
+    _INT: _read_int,
+    _FLOAT: _read_float,
+    _UUID: _read_uuid,
+    _DATETIME: _read_datetime,
+    _OFFSET_DATETIME: _read_offset_datetime,
+    _NAIVE_DATETIME: _read_naive_datetime,
+    _STR: _read_long_str,
+    _BIN: _read_bin,
+    _DECIMAL: _read_decimal,
+    _BIG_INT: _read_big_int,
+}
+
+_CONTAINER_READERS: Dict[int, Callable[[memoryview, int, int], Tuple[Any, int]]] = {
+    _ARRAY: _read_array,
+    _MAP: _read_map,
+}
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from building_blocks.domain.messages.message import Message
+from building_blocks.domain.messages.message import Message, MessageMetadata
 
 
 class Command(Message):
@@ -42,6 +43,19 @@ class Command(Message):
         ...         }
     """
 
+    def __init__(self, metadata: Optional[MessageMetadata] = None) -> None:
+        """
+        Initialize the command with metadata.
+
+        Declared explicitly so that type checkers accept hand-written
+        subclasses passing ``metadata`` positionally to ``super().__init__``.
+
+        Args:
+            metadata: Command metadata. If None, creates new metadata with
+                generated ID and current timestamp.
+        """
+        super().__init__(metadata)
+
     @property
     def command_id(self) -> UUID:
         """
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from building_blocks.domain.messages.message import Message
+from building_blocks.domain.messages.message import Message, MessageMetadata
 
 
 class Event(Message):
@@ -49,6 +50,19 @@ class Event(Message):
         ...         }
     """
 
+    def __init__(self, metadata: Optional[MessageMetadata] = None) -> None:
+        """
+        Initialize the event with metadata.
+
+        Declared explicitly so that type checkers accept hand-written
+        subclasses passing ``metadata`` positionally to ``super().__init__``.
+
+        Args:
+            metadata: Event metadata. If None, creates new metadata with
+                generated ID and current timestamp.
+        """
+        super().__init__(metadata)
+
     @property
     def event_id(self) -> UUID:
         """
@@ -7,13 +7,42 @@ domain messages following Domain-Driven Design (DDD) and CQRS principles.
 
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from uuid import UUID, uuid4
 
 from building_blocks.domain.value_object import ValueObject
 
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+
+    from building_blocks.domain.ports.outbound.id_generator import IdGenerator
+else:
+
+    def dataclass_transform(**kwargs: Any) -> Callable[[type], type]:
+        return lambda cls: cls
+
+
+TMessage = TypeVar("TMessage", bound="Message")
+
+_ENVELOPE_KEYS = frozenset({"message_id", "created_at", "message_type"})
+
+_message_id_lock = threading.Lock()
+
 
 class MessageMetadata(ValueObject):
     """
@@ -27,6 +56,17 @@ class MessageMetadata(ValueObject):
     This separation allows messages to focus on domain data while keeping
     infrastructure concerns in metadata.
 
+    Generated values are produced lazily: the message ID is only generated the
+    first time it is read, and the creation time is captured as a raw clock
+    reading and only turned into a datetime when read. Messages that are
+    created and dropped without being published never pay for either. The
+    message ID is assigned once, so threads reading it concurrently all get
+    the same ID.
+
+    Message IDs are random UUIDs by default. Call ``use_id_generator`` once at
+    startup to switch every new message to another scheme, such as a
+    time-ordered UUIDv7 generator.
+
     Example:
         >>> metadata = MessageMetadata()
         >>> # Or with custom values
@@ -36,6 +76,12 @@ class MessageMetadata(ValueObject):
         ... )
     """
 
+    __slots__ = ("_message_id", "_created_at", "_timestamp")
+
+    _message_id: Optional[UUID]
+    _created_at: Optional[datetime]
+    _id_generator: ClassVar[Optional[IdGenerator[UUID]]] = None
+
     def __init__(
         self, message_id: Optional[UUID] = None, created_at: Optional[datetime] = None
     ) -> None:
@@ -43,11 +89,14 @@ class MessageMetadata(ValueObject):
         Initialize message metadata.
 
         Args:
-            message_id: Uniqu identifier for the message. If None, generates a new UUID.
-            created_at: When the message was created. If None, uses current UTC time.
+            message_id: Unique identifier for the message. If None, a new UUID is
+                generated on first access.
+            created_at: When the message was created. If None, the current UTC time
+                is recorded now and converted to a datetime on first access.
         """
-        self._message_id = message_id or uuid4()
-        self._created_at = created_at or datetime.now(timezone.utc)
+        self._message_id = message_id
+        self._created_at = created_at
+        self._timestamp = time.time() if created_at is None else 0.0
 
     @property
     def message_id(self) -> UUID:
@@ -57,7 +106,15 @@ class MessageMetadata(ValueObject):
         Returns:
             UUID: The unique message identifier
         """
-        return self._message_id
+        message_id = self._message_id
+        if message_id is None:
+            generator = MessageMetadata._id_generator
+            generated = uuid4() if generator is None else generator.next_id()
+            with _message_id_lock:
+                if self._message_id is None:
+                    self._message_id = generated
+                message_id = self._message_id
+        return message_id
 
     @property
     def created_at(self) -> datetime:
@@ -67,8 +124,23 @@ class MessageMetadata(ValueObject):
         Returns:
             datetime: When the message was created (UTC timezone)
         """
+        if self._created_at is None:
+            self._created_at = datetime.fromtimestamp(self._timestamp, timezone.utc)
         return self._created_at
 
+    @classmethod
+    def use_id_generator(cls, id_generator: Optional[IdGenerator[UUID]]) -> None:
+        """
+        Set the generator used for message IDs that are not given explicitly.
+
+        This is process-wide configuration, meant to be called once while
+        wiring the application.
+
+        Args:
+            id_generator: The generator to use, or None to go back to uuid4()
+        """
+        MessageMetadata._id_generator = id_generator
+
     def _equality_components(self) -> Tuple[Any, ...]:
         """
         Message metadata equality is based on message ID and timestamp.
@@ -76,7 +148,7 @@ class MessageMetadata(ValueObject):
         Returns:
             tuple[Any, ...]: Tuple containing message_id and created_at
         """
-        return (self._message_id, self._created_at)
+        return (self.message_id, self.created_at)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -86,12 +158,209 @@ class MessageMetadata(ValueObject):
             dict[str, Any]: dictionary representation of the metadata
         """
         return {
-            "message_id": str(self._message_id),
-            "created_at": self._created_at.isoformat(),
+            "message_id": str(self.message_id),
+            "created_at": self.created_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> MessageMetadata:
+        """
+        Rebuild metadata from its dictionary representation.
+
+        Extra keys, such as the rest of a message dictionary, are ignored.
+
+        Args:
+            data: Dictionary produced by ``to_dict``
+
+        Returns:
+            MessageMetadata: The rebuilt metadata
+
+        Raises:
+            KeyError: If the message ID or creation time is missing
+        """
+        return cls(
+            message_id=UUID(data["message_id"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+
+def _build_message_init(
+    class_name: str,
+    fields: Tuple[str, ...],
+    defaults: Dict[str, Any],
+    post_init: bool,
+) -> Callable[..., None]:
+    """
+    Generate the ``__init__`` of a declarative message.
+
+    The fields are taken in declaration order and ``metadata`` as a keyword-only
+    argument.
+
+    Args:
+        class_name: Name of the class being built, used for the qualname
+        fields: Field names in declaration order
+        defaults: Default values by field name
+        post_init: Whether the class defines ``__post_init__``
+
+    Returns:
+        Callable[..., None]: The generated ``__init__``
+    """
+    parameters = []
+    seen_default = False
+    for field in fields:
+        if field in defaults:
+            parameters.append(f"{field}=_defaults[{field!r}]")
+            seen_default = True
+        elif seen_default:
+            raise TypeError(
+                f"non-default field '{field}' follows default field in {class_name}"
+            )
+        else:
+            parameters.append(field)
+    parameters.extend(["*", "metadata=None"])
+
+    body = ["    _setattr(self, '_metadata', metadata or _MessageMetadata())"]
+    body.extend(f"    _setattr(self, {field!r}, {field})" for field in fields)
+    if post_init:
+        body.append("    self.__post_init__()")
+    source = f"def __init__(self, {', '.join(parameters)}):\n" + "\n".join(body)
+
+    scope: Dict[str, Any] = {
+        "_setattr": object.__setattr__,
+        "_defaults": defaults,
+        "_MessageMetadata": MessageMetadata,
+    }
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    init = cast(Callable[..., None], scope["__init__"])
+    init.__qualname__ = f"{class_name}.__init__"
+    return init
+
+
+def _build_payload(fields: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate the ``payload`` getter of a declarative message.
+
+    Args:
+        fields: Field names in declaration order
+
+    Returns:
+        Callable[[Any], dict[str, Any]]: The generated getter
+    """
+    items = "".join(f"{field!r}: self.{field}, " for field in fields)
+    source = f"def payload(self):\n    return {{{items}}}"
+    scope: Dict[str, Any] = {}
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    return cast(Callable[[Any], Dict[str, Any]], scope["payload"])
+
+
+def _build_to_dict(fields: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate ``to_dict`` of a declarative message as a single dict literal.
+
+    Args:
+        fields: Field names in declaration order
+
+    Returns:
+        Callable[[Any], dict[str, Any]]: The generated method
+    """
+    items = "".join(f"{field!r}: self.{field}, " for field in fields)
+    source = (
+        "def to_dict(self):\n"
+        "    metadata = self._metadata\n"
+        "    return {'message_id': str(metadata.message_id), "
+        "'created_at': metadata.created_at.isoformat(), "
+        f"'message_type': self.message_type, {items}}}"
+    )
+    scope: Dict[str, Any] = {}
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    return cast(Callable[[Any], Dict[str, Any]], scope["to_dict"])
+
+
+def _build_from_dict(
+    fields: Tuple[str, ...], defaults: Dict[str, Any]
+) -> Callable[[Any, Dict[str, Any]], Any]:
+    """
+    Generate ``from_dict`` of a declarative message.
+
+    Fields with a default may be missing from the dictionary.
+
+    Args:
+        fields: Field names in declaration order
+        defaults: Default values by field name
+
+    Returns:
+        Callable[[Any, dict[str, Any]], Any]: The generated function, to be
+            wrapped in ``classmethod``
+    """
+    arguments = "".join(
+        (
+            f"data.get({field!r}, _defaults[{field!r}]), "
+            if field in defaults
+            else f"data[{field!r}], "
+        )
+        for field in fields
+    )
+    source = (
+        "def from_dict(cls, data):\n"
+        f"    return cls({arguments}metadata=_metadata_from_dict(data))"
+    )
+    scope: Dict[str, Any] = {
+        "_defaults": defaults,
+        "_metadata_from_dict": MessageMetadata.from_dict,
+    }
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    return cast(Callable[[Any, Dict[str, Any]], Any], scope["from_dict"])
+
+
+def _message_field(*, default: Any = None, kw_only: bool = True) -> Any:
+    """
+    Field specifier describing ``Message.metadata`` to type checkers.
+
+    Declarative messages do not use it; their fields are plain annotations.
+
+    Args:
+        default: Default value of the field
+        kw_only: Whether the field is a keyword-only argument of ``__init__``
+
+    Returns:
+        Any: The default value
+    """
+    return default
+
+
+@dataclass_transform(frozen_default=True, field_specifiers=(_message_field,))
+class _DeclarativeMessage:
+    """
+    Marks Message and its subclasses as declarative for type checkers.
 
-class Message(ValueObject, ABC):
+    Message itself is then seen as a frozen dataclass whose only field is the
+    keyword-only ``metadata``, so the ``__init__`` that type checkers
+    synthesize for a declarative subclass takes its fields, then ``metadata``
+    as a keyword argument, like the one compiled at runtime.
+    """
+
+    __slots__ = ()
+
+
+def _frozen_message_setattr(self: Message, name: str, value: Any) -> None:
+    """Reject assignment to the declared fields of a declarative message."""
+    if name in self._fields:
+        raise AttributeError(
+            f"cannot assign to field '{name}' of frozen {self.__class__.__name__}"
+        )
+    object.__setattr__(self, name, value)
+
+
+def _frozen_message_delattr(self: Message, name: str) -> None:
+    """Reject deletion of the fields and metadata of a declarative message."""
+    if name in self._fields or name == "_metadata":
+        raise AttributeError(
+            f"cannot delete field '{name}' of frozen {self.__class__.__name__}"
+        )
+    object.__delattr__(self, name)
+
+
+class Message(_DeclarativeMessage, ValueObject, ABC):
     """
     Base class for all domain messages.
 
@@ -105,9 +374,72 @@ class Message(ValueObject, ABC):
     - Focus on domain data in subclasses
     - Each message instance is unique (based on metadata.message_id)
 
+    Subclasses either write ``__init__`` and ``payload`` by hand, or declare
+    their fields as class annotations and leave ``__init__`` out. For a
+    declarative subclass, specialized ``__init__``, ``payload``, ``to_dict`` and
+    ``from_dict`` functions are compiled once when the class is created, so
+    serializing a message builds a single dict without going through
+    properties. Fields are read-only after construction, class-level values
+    are defaults, and ``metadata`` is accepted as a keyword-only argument.
+
+    Example:
+        >>> class OrderShipped(Event):
+        ...     order_id: str
+        ...     carrier: str = "post"
+        >>>
+        >>> event = OrderShipped("order-1")
+        >>> OrderShipped.from_dict(event.to_dict()) == event
+        True
+
     This class should not be used directly. Use Event or Command instead.
     """
 
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _field_defaults: ClassVar[Dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Compile the serialization functions of declarative subclasses.
+
+        Classes that define their own ``__init__`` are left untouched.
+        """
+        super().__init_subclass__(**kwargs)
+        namespace = cls.__dict__
+        if "__init__" in namespace:
+            return
+
+        inherited = cls._fields
+        own = tuple(
+            field
+            for field, annotation in namespace.get("__annotations__", {}).items()
+            if "ClassVar" not in str(annotation) and field not in inherited
+        )
+        fields = inherited + own
+        if not fields:
+            return
+
+        defaults = dict(cls._field_defaults)
+        for field in own:
+            if field in namespace:
+                defaults[field] = namespace[field]
+                delattr(cls, field)
+
+        cls._fields = fields
+        cls._field_defaults = defaults
+        generated: Dict[str, Any] = {
+            "__init__": _build_message_init(
+                cls.__name__, fields, defaults, hasattr(cls, "__post_init__")
+            ),
+            "__setattr__": _frozen_message_setattr,
+            "__delattr__": _frozen_message_delattr,
+            "payload": property(_build_payload(fields)),
+            "to_dict": _build_to_dict(fields),
+            "from_dict": classmethod(_build_from_dict(fields, defaults)),
+        }
+        for name, function in generated.items():
+            if name not in namespace:
+                setattr(cls, name, function)
+
     def __init__(self, metadata: Optional[MessageMetadata] = None) -> None:
         """
         Initialize the message with metadata.
@@ -118,15 +450,19 @@ class Message(ValueObject, ABC):
         """
         self._metadata = metadata or MessageMetadata()
 
-    @property
-    def metadata(self) -> MessageMetadata:
-        """
-        Get the message metadata.
+    if TYPE_CHECKING:
+        metadata: MessageMetadata = _message_field(default=None, kw_only=True)
+    else:
 
-        Returns:
-            MessageMetadata: The message metadata containing ID, timestamp, etc.
-        """
-        return self._metadata
+        @property
+        def metadata(self) -> MessageMetadata:
+            """
+            Get the message metadata.
+
+            Returns:
+                MessageMetadata: The message metadata containing ID, timestamp, etc.
+            """
+            return self._metadata
 
     @property
     def message_id(self) -> UUID:
@@ -160,19 +496,28 @@ class Message(ValueObject, ABC):
         """
         return self.__class__.__name__
 
-    @property
-    @abstractmethod
-    def payload(self) -> Dict[str, Any]:
-        """
-        Get the domain-specific data carried by this message.
+    if TYPE_CHECKING:
+        # Declarative subclasses get a compiled payload that type checkers
+        # cannot see, so it is only abstract at runtime.
+        @property
+        def payload(self) -> Dict[str, Any]: ...
 
-        Subclasses must implement this property to provide their specific message data.
-        This makes the Message class truly abstract.
+    else:
 
-        Returns:
-            dict[str, Any]: The message payload
-        """
-        pass
+        @property
+        @abstractmethod
+        def payload(self) -> Dict[str, Any]:
+            """
+            Get the domain-specific data carried by this message.
+
+            Subclasses must implement this property to provide their specific
+            message data, unless they declare their fields. This makes the
+            Message class truly abstract.
+
+            Returns:
+                dict[str, Any]: The message payload
+            """
+            pass
 
     def _equality_components(self) -> Tuple[Any, ...]:
         """
@@ -194,8 +539,35 @@ class Message(ValueObject, ABC):
         Returns:
             dict[str, Any]: Complete dictionary representation of the message
         """
-        return {
-            **self._metadata.to_dict(),
+        metadata = self._metadata
+        data = {
+            "message_id": str(metadata.message_id),
+            "created_at": metadata.created_at.isoformat(),
             "message_type": self.message_type,
-            **self.payload,
         }
+        data.update(self.payload)
+        return data
+
+    @classmethod
+    def from_dict(cls: Type[TMessage], data: Dict[str, Any]) -> TMessage:
+        """
+        Rebuild a message from its dictionary representation.
+
+        The payload keys are passed to the class as keyword arguments, together
+        with the rebuilt ``metadata``. Declarative messages get a compiled
+        version of this method; messages whose constructor does not mirror their
+        payload should override it.
+
+        Args:
+            data: Dictionary produced by ``to_dict``
+
+        Returns:
+            The rebuilt message
+
+        Raises:
+            KeyError: If the message ID or creation time is missing
+        """
+        payload = {
+            key: value for key, value in data.items() if key not in _ENVELOPE_KEYS
+        }
+        return cls(metadata=MessageMetadata.from_dict(data), **payload)
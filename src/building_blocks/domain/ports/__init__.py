@@ -3,6 +3,12 @@ Domain ports module.
 Contains inbound and outbound port definitions.
 """
 
+from building_blocks.domain.ports.outbound.id_generator import IdGenerator
+from building_blocks.domain.ports.outbound.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 from building_blocks.domain.ports.outbound.read_only_repository import (
     AsyncReadOnlyRepository,
     SyncReadOnlyRepository,
@@ -23,4 +29,8 @@ __all__ = [
     "SyncReadOnlyRepository",
     "AsyncWriteOnlyRepository",
     "SyncWriteOnlyRepository",
+    "IdGenerator",
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
 ]
@@ -0,0 +1,52 @@
+"""
+Identifier generator interface.
+
+This module provides the outbound port used by the domain to obtain new
+identifiers for aggregates and messages without depending on a specific
+generation scheme.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+TId = TypeVar("TId")
+
+
+class IdGenerator(ABC, Generic[TId]):
+    """
+    Outbound port for generating unique identifiers.
+
+    Aggregate factories and message metadata depend on this interface instead of
+    calling ``uuid4()`` directly, so the identifier scheme can be chosen by the
+    application. Time-ordered schemes (UUIDv7, ULID, Snowflake) keep new rows
+    at the right-hand edge of B-tree indexes, which avoids page splits on
+    insert-heavy tables.
+
+    Implementations must be safe to call from multiple threads.
+
+    Example:
+        >>> from uuid import UUID, uuid4
+        >>>
+        >>> class RandomUUIDGenerator(IdGenerator[UUID]):
+        ...     def next_id(self) -> UUID:
+        ...         return uuid4()
+        >>>
+        >>> class Order(AggregateRoot[UUID]):
+        ...     @classmethod
+        ...     def place(cls, id_generator: IdGenerator[UUID]) -> Order:
+        ...         return cls(id_generator.next_id())
+    """
+
+    @abstractmethod
+    def next_id(self) -> TId:
+        """
+        Generate a new unique identifier.
+
+        Each call returns an identifier this generator has not returned
+        before. May be called from several threads at once.
+
+        Returns:
+            TId: The new identifier
+        """
@@ -0,0 +1,139 @@
+"""
+Keyset pagination primitives for repositories.
+
+This module provides Page, the result of a ``find_page`` call, and the helpers
+that turn the sort key of the last item of a page into an opaque cursor and
+back.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from building_blocks.domain.messages.codec import decode_value, encode_value
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    One page of results and the cursor to the next one.
+
+    Attributes:
+        items: The items of the page, in key order
+        next_cursor: Cursor to pass as ``after`` to get the next page, or None
+            if this is the last page
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        """Whether another page follows this one."""
+        return self.next_cursor is not None
+
+
+def encode_cursor(*key: Any) -> str:
+    """
+    Build an opaque cursor from the sort key of the last item of a page.
+
+    Args:
+        *key: The key values, in sort order, such as ``(created_at, id)``
+
+    Returns:
+        str: A URL-safe cursor
+
+    Raises:
+        TypeError: If a key value cannot be encoded
+    """
+    data = base64.urlsafe_b64encode(encode_value(list(key)))
+    return data.rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """
+    Recover the sort key encoded in a cursor.
+
+    Args:
+        cursor: A cursor built by ``encode_cursor``
+
+    Returns:
+        Tuple[Any, ...]: The key values, in the order they were encoded
+
+    Raises:
+        ValueError: If the cursor was not built by ``encode_cursor``, however
+            it fails to decode
+    """
+    # Cursors come from clients: any failure to decode one, including the
+    # recursion of deeply nested data, is reported as an invalid cursor.
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = decode_value(data)
+    except (
+        binascii.Error,
+        ValueError,
+        TypeError,
+        OverflowError,
+        RecursionError,
+        UnicodeEncodeError,
+    ) as e:
+        raise ValueError(f"Invalid page cursor '{cursor}'") from e
+    if not isinstance(key, list) or any(
+        isinstance(value, (list, dict)) for value in key
+    ):
+        raise ValueError(f"Invalid page cursor '{cursor}'")
+    return tuple(key)
+
+
+def check_limit(limit: int) -> None:
+    """
+    Validate a page size.
+
+    Args:
+        limit: The requested page size
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+
+def paginate(
+    items: Sequence[T],
+    after: Optional[str],
+    limit: int,
+    key: Callable[[T], Any] = lambda item: item.id,  # type: ignore[attr-defined]
+) -> Page[T]:
+    """
+    Cut a page out of items held in memory, the way a keyset query would.
+
+    Used by the default ``find_page`` of the repository ports. Items are
+    sorted by ``key``; the page holds the first ``limit`` items whose key is
+    greater than the key in ``after``.
+
+    Args:
+        items: All items, in any order
+        after: Cursor returned with the previous page, or None for the first
+        limit: Maximum number of items in the page
+        key: Sort key of an item. Defaults to its ``id`` attribute.
+
+    Returns:
+        Page[T]: The page
+
+    Raises:
+        ValueError: If limit is less than 1 or the cursor is invalid
+    """
+    check_limit(limit)
+    ordered = sorted(items, key=key)
+    if after is not None:
+        (last_key,) = decode_cursor(after)
+        ordered = [item for item in ordered if key(item) > last_key]
+    page = ordered[:limit]
+    next_cursor = encode_cursor(key(page[-1])) if len(ordered) > limit else None
+    return Page(page, next_cursor)
@@ -8,7 +8,18 @@ useful for CQRS implementations where you separate command and query responsibil
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import (
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from building_blocks.domain.ports.outbound.pagination import Page, paginate
 
 TAggregateRoot = TypeVar("TAggregateRoot")
 TId = TypeVar("TId")
@@ -94,6 +105,78 @@ class AsyncReadOnlyRepository(ABC, Generic[TAggregateRoot, TId]):
             All aggregates in the repository
         """
 
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[TAggregateRoot]:
+        """
+        Iterate over all aggregates without loading them all at once.
+
+        Implementations should fetch rows in batches of ``batch_size``, for
+        example through a server-side cursor, so memory use does not grow
+        with the number of aggregates. The default implementation falls back
+        to ``find_all`` and only saves the caller from building its own loop.
+
+        Args:
+            batch_size: Number of aggregates fetched from storage at a time
+
+        Yields:
+            Each aggregate in the repository
+        """
+        for aggregate in await self.find_all():
+            yield aggregate
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        """
+        Return the aggregates that follow a cursor, a page at a time.
+
+        Implementations should use keyset pagination: order by a unique,
+        indexed key and select the rows whose key is greater than the key in
+        ``after`` (``WHERE id > ? ORDER BY id LIMIT ?``) instead of skipping
+        rows with OFFSET, so a deep page costs an index seek rather than a
+        scan of every row before it. Fetching ``limit + 1`` rows tells whether
+        a next page exists without a COUNT query. Build cursors with
+        ``encode_cursor`` from the key of the last aggregate of the page.
+
+        The default implementation pages over ``find_all`` ordered by the
+        aggregates' ``id``. It is correct but loads every aggregate for every
+        page.
+
+        Args:
+            after: Cursor returned with the previous page, or None for the
+                first page
+            limit: Maximum number of aggregates in the page
+
+        Returns:
+            Page[TAggregateRoot]: The aggregates and the cursor to the next page
+
+        Raises:
+            ValueError: If limit is less than 1 or the cursor is invalid
+        """
+        return paginate(await self.find_all(), after, limit)
+
+    async def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        """
+        Find the aggregates with the given IDs.
+
+        Implementations should load them with one query, such as
+        ``WHERE id IN (...)``, split into chunks when there are many IDs so
+        the statement stays within the database's parameter limit. The
+        default implementation calls ``find_by_id`` once per distinct ID.
+
+        Args:
+            ids: The IDs to look up. Duplicates are looked up once.
+
+        Returns:
+            Dict[TId, TAggregateRoot]: The aggregates found, by ID, in the
+                order of ``ids``. IDs with no aggregate are left out.
+        """
+        found: Dict[TId, TAggregateRoot] = {}
+        for id in dict.fromkeys(ids):
+            aggregate = await self.find_by_id(id)
+            if aggregate is not None:
+                found[id] = aggregate
+        return found
+
 
 class SyncReadOnlyRepository(ABC, Generic[TAggregateRoot, TId]):
     """
@@ -174,3 +257,74 @@ class SyncReadOnlyRepository(ABC, Generic[TAggregateRoot, TId]):
         Returns:
             All aggregates in the repository
         """
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[TAggregateRoot]:
+        """
+        Iterate over all aggregates without loading them all at once.
+
+        Implementations should fetch rows in batches of ``batch_size``, for
+        example through a server-side cursor, so memory use does not grow
+        with the number of aggregates. The default implementation falls back
+        to ``find_all`` and only saves the caller from building its own loop.
+
+        Args:
+            batch_size: Number of aggregates fetched from storage at a time
+
+        Yields:
+            Each aggregate in the repository
+        """
+        yield from self.find_all()
+
+    def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        """
+        Return the aggregates that follow a cursor, a page at a time.
+
+        Implementations should use keyset pagination: order by a unique,
+        indexed key and select the rows whose key is greater than the key in
+        ``after`` (``WHERE id > ? ORDER BY id LIMIT ?``) instead of skipping
+        rows with OFFSET, so a deep page costs an index seek rather than a
+        scan of every row before it. Fetching ``limit + 1`` rows tells whether
+        a next page exists without a COUNT query. Build cursors with
+        ``encode_cursor`` from the key of the last aggregate of the page.
+
+        The default implementation pages over ``find_all`` ordered by the
+        aggregates' ``id``. It is correct but loads every aggregate for every
+        page.
+
+        Args:
+            after: Cursor returned with the previous page, or None for the
+                first page
+            limit: Maximum number of aggregates in the page
+
+        Returns:
+            Page[TAggregateRoot]: The aggregates and the cursor to the next page
+
+        Raises:
+            ValueError: If limit is less than 1 or the cursor is invalid
+        """
+        return paginate(self.find_all(), after, limit)
+
+    def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        """
+        Find the aggregates with the given IDs.
+
+        Implementations should load them with one query, such as
+        ``WHERE id IN (...)``, split into chunks when there are many IDs so
+        the statement stays within the database's parameter limit. The
+        default implementation calls ``find_by_id`` once per distinct ID.
+
+        Args:
+            ids: The IDs to look up. Duplicates are looked up once.
+
+        Returns:
+            Dict[TId, TAggregateRoot]: The aggregates found, by ID, in the
+                order of ``ids``. IDs with no aggregate are left out.
+        """
+        found: Dict[TId, TAggregateRoot] = {}
+        for id in dict.fromkeys(ids):
+            aggregate = self.find_by_id(id)
+            if aggregate is not None:
+                found[id] = aggregate
+        return found
@@ -8,7 +8,7 @@ useful for CQRS implementations where you separate command and query responsibil
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Iterable, TypeVar
 
 AggregateRootType = TypeVar("AggregateRootType")
 IdType = TypeVar("IdType")
@@ -73,6 +73,38 @@ class AsyncWriteOnlyRepository(ABC, Generic[AggregateRootType, IdType]):
             RepositoryException: If deletion fails
         """
 
+    async def save_many(self, aggregates: Iterable[AggregateRootType]) -> None:
+        """
+        Save several aggregates.
+
+        Implementations should write them together, for example with one
+        multi-row statement and one commit, instead of one round trip per
+        aggregate. The default implementation calls ``save`` for each
+        aggregate.
+
+        Args:
+            aggregates: The aggregates to save
+
+        Raises:
+            ConcurrencyError: If optimistic locking fails for any aggregate
+        """
+        for aggregate in aggregates:
+            await self.save(aggregate)
+
+    async def delete_by_ids(self, ids: Iterable[IdType]) -> None:
+        """
+        Delete several aggregates using their ids.
+
+        Implementations should delete them together, for example with one
+        ``DELETE ... WHERE id IN (...)``. The default implementation calls
+        ``delete_by_id`` for each ID.
+
+        Args:
+            ids: The IDs of the aggregates to delete
+        """
+        for id in ids:
+            await self.delete_by_id(id)
+
 
 class SyncWriteOnlyRepository(ABC, Generic[AggregateRootType, IdType]):
     """
@@ -131,7 +163,7 @@ class SyncWriteOnlyRepository(ABC, Generic[AggregateRootType, IdType]):
             aggregate: The aggregate to save
 
         Raises:
-            ConcurrencyException: If optimistic locking fails
+            ConcurrencyError: If optimistic locking fails
             RepositoryException: If persistence fails
         """
 
@@ -151,3 +183,35 @@ class SyncWriteOnlyRepository(ABC, Generic[AggregateRootType, IdType]):
         Raises:
             RepositoryException: If deletion fails
         """
+
+    def save_many(self, aggregates: Iterable[AggregateRootType]) -> None:
+        """
+        Save several aggregates.
+
+        Implementations should write them together, for example with one
+        multi-row statement and one commit, instead of one round trip per
+        aggregate. The default implementation calls ``save`` for each
+        aggregate.
+
+        Args:
+            aggregates: The aggregates to save
+
+        Raises:
+            ConcurrencyError: If optimistic locking fails for any aggregate
+        """
+        for aggregate in aggregates:
+            self.save(aggregate)
+
+    def delete_by_ids(self, ids: Iterable[IdType]) -> None:
+        """
+        Delete several aggregates using their ids.
+
+        Implementations should delete them together, for example with one
+        ``DELETE ... WHERE id IN (...)``. The default implementation calls
+        ``delete_by_id`` for each ID.
+
+        Args:
+            ids: The IDs of the aggregates to delete
+        """
+        for id in ids:
+            self.delete_by_id(id)
@@ -1,13 +1,36 @@
 """
 Domain value objects module.
 This module provides the base ValueObject class for implementing domain value objects
-following the principles of Domain-Driven Design (DDD).
+following the principles of Domain-Driven Design (DDD), plus the opt-in
+SlottedValueObject and FrozenValueObject bases for hot paths.
 """
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Hashable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+else:
+
+    def dataclass_transform(**kwargs: Any) -> Callable[[type], type]:
+        return lambda cls: cls
+
+
+TFrozenValueObject = TypeVar("TFrozenValueObject", bound="FrozenValueObject")
 
 
 class ValueObject(ABC):
@@ -36,6 +59,8 @@ class ValueObject(ABC):
         ...         return (self._value,)
     """
 
+    __slots__ = ()
+
     def __eq__(self, other: object) -> bool:
         """
         Check equality based on equality components.
@@ -92,3 +117,368 @@ class ValueObject(ABC):
             tuple[Hashable, ...]: Tuple of components for equality comparison
         """
         pass
+
+
+class SlottedValueObject(ValueObject):
+    """
+    Opt-in base class for value objects used heavily as dict or set keys.
+
+    Behaves like ValueObject, but:
+    - the equality components and their hash are computed once, the first time
+      they are needed, instead of on every ``__eq__`` and ``__hash__`` call;
+    - equality compares the cached hashes first and then the cached component
+      tuples, without calling ``_equality_components()`` again; components
+      that cannot be hashed are compared directly, as ValueObject does;
+    - it declares ``__slots__``, so subclasses that declare their own
+      ``__slots__`` carry no per-instance ``__dict__``.
+
+    Since the components are cached, instances must not change after
+    construction. Subclasses should list every attribute they assign in
+    ``__slots__``; otherwise Python silently adds a ``__dict__`` back.
+
+    Example:
+        >>> class Email(SlottedValueObject):
+        ...     __slots__ = ("_value",)
+        ...
+        ...     def __init__(self, value: str):
+        ...         if "@" not in value:
+        ...             raise ValueError("Invalid email format")
+        ...         self._value = value
+        ...
+        ...     @property
+        ...     def value(self) -> str:
+        ...         return self._value
+        ...
+        ...     def _equality_components(self) -> tuple[Hashable, ...]:
+        ...         return (self._value,)
+    """
+
+    __slots__ = ("_components", "_hash")
+
+    _components: tuple[Hashable, ...]
+    _hash: int
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Fill the component and hash caches the first time either is read.
+
+        Only called when normal lookup fails, i.e. while a cache slot is still
+        empty; every later read is a plain slot access.
+
+        Args:
+            name: Name of the attribute that was not found
+
+        Returns:
+            Any: The freshly cached value
+        """
+        if name == "_components":
+            components = self._equality_components()
+            object.__setattr__(self, "_components", components)
+            return components
+        if name == "_hash":
+            value = hash(self._components)
+            object.__setattr__(self, "_hash", value)
+            return value
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check equality based on the cached equality components.
+
+        Args:
+            other: Object to compare with
+
+        Returns:
+            bool: True if objects are equal, False otherwise
+        """
+        if self is other:
+            return True
+        if not isinstance(other, self.__class__):
+            return False
+        try:
+            if self._hash != other._hash:
+                return False
+        except TypeError:
+            pass
+        return self._components == other._components
+
+    def __hash__(self) -> int:
+        """
+        Return the cached hash of the equality components.
+
+        Returns:
+            int: Hash value for the object
+        """
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the instance state for pickling and copying.
+
+        The caches are left out on purpose: string hashes are salted per
+        process, so they are rebuilt on first use after unpickling. The
+        attributes of subclasses that do not declare ``__slots__`` live in
+        the instance ``__dict__`` and are included too.
+
+        Returns:
+            dict[str, Any]: Mapping of attribute name to value
+        """
+        state: Dict[str, Any] = {}
+        try:
+            state.update(object.__getattribute__(self, "__dict__"))
+        except AttributeError:
+            pass
+        for name in _instance_slots(type(self)):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the instance state produced by __getstate__.
+
+        Args:
+            state: Mapping of attribute name to value
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+def _instance_slots(cls: type) -> Iterator[str]:
+    """
+    Yield the slot names declared along the MRO of ``cls``, minus the caches.
+
+    Args:
+        cls: The value object class to inspect
+
+    Returns:
+        Iterator[str]: Slot names holding instance state
+    """
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("_components", "_hash", "__dict__", "__weakref__"):
+                yield name
+
+
+def _build_init(
+    class_name: str,
+    fields: Tuple[str, ...],
+    defaults: Dict[str, Any],
+    post_init: bool,
+) -> Callable[..., None]:
+    """
+    Generate the ``__init__`` of a FrozenValueObject subclass.
+
+    The function is compiled from source, like dataclasses do, so that setting
+    the fields costs one slot store each instead of a loop over field names.
+
+    Args:
+        class_name: Name of the class being built, used for the qualname
+        fields: Field names in declaration order
+        defaults: Default values by field name
+        post_init: Whether the class defines ``__post_init__``
+
+    Returns:
+        Callable[..., None]: The generated ``__init__``
+    """
+    parameters = []
+    seen_default = False
+    for field in fields:
+        if field in defaults:
+            parameters.append(f"{field}=_defaults[{field!r}]")
+            seen_default = True
+        elif seen_default:
+            raise TypeError(
+                f"non-default field '{field}' follows default field in {class_name}"
+            )
+        else:
+            parameters.append(field)
+
+    body = [f"    _setattr(self, {field!r}, {field})" for field in fields]
+    if post_init:
+        body.append("    self.__post_init__()")
+    if not body:
+        body.append("    pass")
+    source = f"def __init__(self, {', '.join(parameters)}):\n" + "\n".join(body)
+
+    scope: Dict[str, Any] = {"_setattr": object.__setattr__, "_defaults": defaults}
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    init = cast(Callable[..., None], scope["__init__"])
+    init.__qualname__ = f"{class_name}.__init__"
+    return init
+
+
+def _build_equality_components(
+    fields: Tuple[str, ...],
+) -> Callable[[Any], Tuple[Hashable, ...]]:
+    """
+    Generate ``_equality_components`` returning the fields in order.
+
+    Args:
+        fields: Field names in declaration order
+
+    Returns:
+        Callable[[Any], tuple[Hashable, ...]]: The generated method
+    """
+    items = "".join(f"self.{field}, " for field in fields)
+    source = f"def _equality_components(self):\n    return ({items})"
+    scope: Dict[str, Any] = {}
+    exec(source, scope)  # nosec B102 - source is built from field names only
+    return cast(Callable[[Any], Tuple[Hashable, ...]], scope["_equality_components"])
+
+
+@dataclass_transform(frozen_default=True)
+class _FrozenValueObjectMeta(ABCMeta):
+    """
+    Metaclass for FrozenValueObject.
+
+    Turns the annotated attributes of a class body into fields: it declares
+    them as ``__slots__`` and generates ``__init__`` and
+    ``_equality_components`` unless the class defines its own.
+    """
+
+    def __new__(
+        mcls,
+        name: str,
+        bases: Tuple[type, ...],
+        namespace: Dict[str, Any],
+        **kwargs: Any,
+    ) -> _FrozenValueObjectMeta:
+        if not any(isinstance(base, _FrozenValueObjectMeta) for base in bases):
+            return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        inherited: Tuple[str, ...] = ()
+        defaults: Dict[str, Any] = {}
+        for base in reversed(bases):
+            inherited += tuple(
+                field
+                for field in getattr(base, "_fields", ())
+                if field not in inherited
+            )
+            defaults.update(getattr(base, "_field_defaults", {}))
+
+        own = tuple(
+            field
+            for field, annotation in namespace.get("__annotations__", {}).items()
+            if "ClassVar" not in str(annotation) and field not in inherited
+        )
+        for field in own:
+            if field in namespace:
+                defaults[field] = namespace.pop(field)
+
+        fields = inherited + own
+        namespace.setdefault("__slots__", own)
+        namespace["_fields"] = fields
+        namespace["_field_defaults"] = defaults
+        if "__init__" not in namespace:
+            post_init = "__post_init__" in namespace or any(
+                hasattr(base, "__post_init__") for base in bases
+            )
+            namespace["__init__"] = _build_init(name, fields, defaults, post_init)
+        if "_equality_components" not in namespace:
+            namespace["_equality_components"] = _build_equality_components(fields)
+
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class FrozenValueObject(SlottedValueObject, metaclass=_FrozenValueObjectMeta):
+    """
+    Declarative, enforced-immutable value object.
+
+    Fields are declared as class annotations. For each subclass this base:
+    - declares the fields as ``__slots__``, so reading one is a plain slot
+      access instead of a property call;
+    - generates ``__init__`` taking the fields in declaration order (base class
+      fields first), with class-level values used as defaults;
+    - generates ``_equality_components`` returning the fields in that order;
+    - rejects any attribute assignment or deletion once constructed.
+
+    Validation goes in ``__post_init__``, which the generated ``__init__`` calls
+    after the fields are set. Hashing and equality are inherited from
+    SlottedValueObject.
+
+    Example:
+        >>> class Money(FrozenValueObject):
+        ...     amount: int
+        ...     currency: str = "EUR"
+        ...
+        ...     def __post_init__(self) -> None:
+        ...         if self.amount < 0:
+        ...             raise ValueError("Amount cannot be negative")
+        >>>
+        >>> price = Money(10)
+        >>> price.amount
+        10
+        >>> price.amount = 20
+        Traceback (most recent call last):
+        ...
+        AttributeError: cannot assign to field 'amount' of frozen Money
+    """
+
+    __slots__ = ()
+
+    _fields: ClassVar[Tuple[str, ...]]
+    _field_defaults: ClassVar[Dict[str, Any]]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Reject attribute assignment; frozen value objects never change.
+
+        Raises:
+            AttributeError: Always
+        """
+        raise AttributeError(
+            f"cannot assign to field '{name}' of frozen {self.__class__.__name__}"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Reject attribute deletion; frozen value objects never change.
+
+        Raises:
+            AttributeError: Always
+        """
+        raise AttributeError(
+            f"cannot delete field '{name}' of frozen {self.__class__.__name__}"
+        )
+
+    def _equality_components(self) -> Tuple[Hashable, ...]:
+        """
+        Return the fields in declaration order.
+
+        Each subclass gets a generated, faster equivalent of this method unless
+        it defines its own.
+
+        Returns:
+            tuple[Hashable, ...]: Tuple of field values
+        """
+        return tuple(getattr(self, field) for field in self._fields)
+
+    @classmethod
+    def _new_unchecked(
+        cls: Type[TFrozenValueObject], *values: Any
+    ) -> TFrozenValueObject:
+        """
+        Build an instance from field values without running ``__init__``.
+
+        Skips ``__post_init__`` validation, so it is only meant for trusted
+        paths where the values are known to be valid, e.g. derived from an
+        existing instance or read back from storage written by this code.
+
+        Args:
+            *values: Field values, in declaration order
+
+        Returns:
+            The new instance
+        """
+        instance = object.__new__(cls)
+        for field, value in zip(cls._fields, values):
+            object.__setattr__(instance, field, value)
+        return instance
@@ -0,0 +1,6 @@
+"""
+Infrastructure building blocks.
+
+Contains generic, dependency-free adapters for ports defined in the domain and
+application layers.
+"""
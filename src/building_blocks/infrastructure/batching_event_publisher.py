@@ -0,0 +1,179 @@
+"""
+Batching event publisher.
+
+This module provides BatchingEventPublisher, an AsyncEventPublisher decorator
+that buffers events and forwards them to another publisher in batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Iterable, List, Optional
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+    TEvent,
+)
+
+FlushErrorHandler = Callable[[List[Any], Exception], None]
+"""Called with the batch and the exception when a flush fails."""
+
+logger = logging.getLogger(__name__)
+
+
+def _log_flush_error(batch: List[Any], error: Exception) -> None:
+    logger.error("Failed to publish a batch of %d events", len(batch), exc_info=error)
+
+
+class BatchingEventPublisher(AsyncEventPublisher[TEvent]):
+    """
+    Publisher decorator that sends events to another publisher in batches.
+
+    Published events are buffered and forwarded with a single ``publish_many``
+    call to the wrapped publisher when either:
+
+    - ``max_batch_size`` events are buffered: the ``publish`` call that fills
+      the batch sends it and waits for it, so a slow broker slows publishers
+      down instead of letting the buffer grow;
+    - ``max_delay_ms`` milliseconds have passed since the first event of the
+      batch was buffered: the batch is sent in the background.
+
+    ``publish`` otherwise returns as soon as the event is buffered, so events
+    are only handed over to the broker once their batch is flushed. Call
+    ``flush`` where delivery must be confirmed, and ``aclose`` (or use the
+    publisher as an async context manager) on shutdown so no event is left in
+    the buffer. Batches are sent one at a time and in order, so the wrapped
+    publisher sees events in the order they were published. Every failed
+    batch is passed to ``on_error``, which logs it by default: a batch holds
+    events that earlier ``publish`` calls returned for, so its failure must
+    be reported even when it does not reach their callers. A flush run by
+    ``publish``, ``publish_many`` or ``flush`` also raises the error to its
+    caller.
+
+    Example:
+        >>> publisher = BatchingEventPublisher(
+        ...     KafkaEventPublisher(producer), max_batch_size=500, max_delay_ms=5
+        ... )
+        >>> async with publisher:
+        ...     await publisher.publish_many(order.uncommitted_changes_view())
+    """
+
+    def __init__(
+        self,
+        publisher: AsyncEventPublisher[TEvent],
+        max_batch_size: int = 100,
+        max_delay_ms: float = 10.0,
+        on_error: Optional[FlushErrorHandler] = None,
+    ) -> None:
+        """
+        Initialize the batching publisher.
+
+        Args:
+            publisher: The publisher that receives the batches
+            max_batch_size: Number of events that triggers a flush
+            max_delay_ms: Maximum time an event waits in the buffer
+            on_error: Called with every batch that fails to be sent. Defaults to
+                logging the error.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1 or max_delay_ms is
+                negative
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_delay_ms < 0:
+            raise ValueError(f"max_delay_ms cannot be negative, got {max_delay_ms}")
+        self._publisher = publisher
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_ms / 1000
+        self._on_error = on_error or _log_flush_error
+        self._buffer: List[TEvent] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._last_send: Optional[asyncio.Future[None]] = None
+
+    async def publish(self, event: TEvent) -> None:
+        """
+        Buffer an event, flushing the batch if it is full.
+
+        Args:
+            event: The domain event to be published.
+        """
+        self._buffer.append(event)
+        if len(self._buffer) >= self._max_batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._start_timer()
+
+    async def publish_many(self, events: Iterable[TEvent]) -> None:
+        """
+        Buffer several events, flushing every batch that fills up.
+
+        Args:
+            events: The domain events to be published.
+        """
+        self._buffer.extend(events)
+        while len(self._buffer) >= self._max_batch_size:
+            batch = self._buffer[: self._max_batch_size]
+            del self._buffer[: self._max_batch_size]
+            await self._send(batch, background=False)
+        if not self._buffer:
+            self._cancel_timer()
+        elif self._timer is None:
+            self._start_timer()
+
+    async def flush(self) -> None:
+        """Send the buffered events now, as one batch."""
+        self._cancel_timer()
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        await self._send(batch, background=False)
+
+    async def aclose(self) -> None:
+        """Flush the buffer and wait for background flushes to finish."""
+        await self.flush()
+        if self._last_send is not None:
+            await asyncio.wait([self._last_send])
+
+    async def __aenter__(self) -> BatchingEventPublisher[TEvent]:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _start_timer(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self._max_delay, self._flush_in_background)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        batch, self._buffer = self._buffer, []
+        self._send(batch, background=True)
+
+    def _send(self, batch: List[TEvent], background: bool) -> asyncio.Future[None]:
+        send = asyncio.ensure_future(
+            self._send_after(self._last_send, batch, background)
+        )
+        self._last_send = send
+        return send
+
+    async def _send_after(
+        self,
+        previous: Optional[asyncio.Future[None]],
+        batch: List[TEvent],
+        background: bool,
+    ) -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        try:
+            await self._publisher.publish_many(batch)
+        except Exception as e:
+            self._on_error(batch, e)
+            if not background:
+                raise
@@ -0,0 +1,751 @@
+"""
+Read-through caching for read-only repositories.
+
+This module provides AggregateCache, a bounded LRU cache of aggregates with
+expiry; AsyncCachingReadOnlyRepository and SyncCachingReadOnlyRepository,
+read-only repository decorators that serve lookups from it; and
+AsyncCachingRepository and SyncCachingRepository, repository decorators that
+also drop the entries of the aggregates written through them.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from building_blocks.domain.ports.outbound.pagination import Page
+from building_blocks.domain.ports.outbound.read_only_repository import (
+    AsyncReadOnlyRepository,
+    SyncReadOnlyRepository,
+    TAggregateRoot,
+    TId,
+)
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    SyncRepository,
+)
+
+
+@dataclass(frozen=True)
+class _Alias:
+    name: str
+    value: Hashable
+
+
+class AggregateCache(Generic[TAggregateRoot, TId]):
+    """
+    Bounded cache of aggregates by ID, with expiry and negative entries.
+
+    Entries expire ``ttl_seconds`` after they are stored. When the cache holds
+    ``max_size`` entries, storing another evicts the least recently used one.
+    IDs with no aggregate can be cached too, as negative entries, so repeated
+    lookups of missing aggregates do not reach storage either; they expire
+    after ``negative_ttl_seconds``.
+
+    Aggregates can also be cached under other unique keys, such as an email
+    address, with ``put_alias``. An alias stores the ID and version of its
+    aggregate and only serves that version, so it never serves an aggregate
+    that was evicted, invalidated or changed since.
+
+    The cache holds the aggregates themselves and hands the same instances to
+    every reader: cached aggregates must not be changed. Writes keep it fresh
+    when they go through AsyncCachingRepository or SyncCachingRepository, or
+    through a TrackingUnitOfWork the cache was added to. Otherwise, call
+    ``on_saved`` after committing a change to an aggregate, and
+    ``on_deleted`` after committing its removal, so readers stop getting the
+    old version before its entry expires. Both drop the aliases of the
+    aggregate, since its keys may have changed, and ``on_saved`` drops every
+    alias cached as missing, since the saved aggregate may now have that key.
+
+    Example:
+        >>> cache = AggregateCache(max_size=10_000, ttl_seconds=30)
+        >>> users = AsyncCachingReadOnlyRepository(user_queries, cache)
+        >>> ...
+        >>> cache.on_saved(user)  # after the unit of work commits
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries, aliases included
+            ttl_seconds: Time an aggregate stays cached
+            negative_ttl_seconds: Time a missing aggregate stays cached.
+                Defaults to ttl_seconds.
+            clock: Returns the current time in seconds
+
+        Raises:
+            ValueError: If max_size is less than 1 or a TTL is not positive
+        """
+        if negative_ttl_seconds is None:
+            negative_ttl_seconds = ttl_seconds
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if negative_ttl_seconds <= 0:
+            raise ValueError(
+                f"negative_ttl_seconds must be positive, got {negative_ttl_seconds}"
+            )
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._aliases_by_id: Dict[Hashable, Set[_Alias]] = {}
+        self._missing_aliases: Set[_Alias] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of lookups served from the cache.
+
+        Returns:
+            float: Between 0 and 1, or 0 before the first lookup
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, id: TId) -> Optional[TAggregateRoot]:
+        """
+        Return the cached aggregate with an ID, counting the hit or miss.
+
+        Args:
+            id: The aggregate ID
+
+        Returns:
+            The cached aggregate, or None if the ID is cached as missing
+
+        Raises:
+            KeyError: If nothing is cached for the ID, or the entry expired
+        """
+        try:
+            aggregate: Optional[TAggregateRoot] = self._get(id)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        return aggregate
+
+    def get_alias(self, name: str, value: Hashable) -> Optional[TAggregateRoot]:
+        """
+        Return the cached aggregate with a unique key, counting the hit or miss.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+
+        Returns:
+            The cached aggregate, or None if the key is cached as missing
+
+        Raises:
+            KeyError: If nothing is cached for the key, the aggregate it maps to
+                is no longer cached in the version the key was cached with, or
+                an entry expired
+        """
+        alias = _Alias(name, value)
+        try:
+            target = self._get(alias)
+            aggregate = None if target is None else self._resolve(alias, target)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        return aggregate
+
+    def put(self, id: TId, aggregate: Optional[TAggregateRoot]) -> None:
+        """
+        Cache an aggregate, or the absence of one.
+
+        Args:
+            id: The aggregate ID
+            aggregate: The aggregate, or None to cache that there is none
+        """
+        self._put(id, aggregate)
+
+    def put_alias(
+        self, name: str, value: Hashable, aggregate: Optional[TAggregateRoot]
+    ) -> None:
+        """
+        Cache an aggregate under a unique key, or the absence of one.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+            aggregate: The aggregate with this key, or None if there is none
+        """
+        if aggregate is None:
+            self._put(_Alias(name, value), None)
+            return
+        id = _id_of(aggregate)
+        self._put(_Alias(name, value), (id, _version_of(aggregate)))
+        self._put(id, aggregate)
+
+    def invalidate(self, id: TId) -> None:
+        """
+        Drop the entry for an ID and the aliases mapping to it.
+
+        Args:
+            id: The aggregate ID
+        """
+        self._entries.pop(id, None)
+        self._drop_aliases(id)
+
+    def on_saved(self, aggregate: TAggregateRoot) -> None:
+        """
+        Drop the entry for an aggregate if it holds another version.
+
+        Call it once a change to the aggregate is committed. A negative entry
+        for its ID is dropped too, since the aggregate now exists. The aliases
+        of the aggregate and every alias cached as missing are dropped as well.
+
+        Args:
+            aggregate: The saved aggregate
+        """
+        id = _id_of(aggregate)
+        self._drop_aliases(id)
+        self._drop_missing_aliases()
+        entry = self._entries.get(id)
+        if entry is None:
+            return
+        cached = entry[1]
+        if cached is None or _version_of(cached) != _version_of(aggregate):
+            del self._entries[id]
+
+    def on_deleted(self, id: TId) -> None:
+        """
+        Drop the entry for a deleted aggregate and the aliases mapping to it.
+
+        Call it once the removal of the aggregate is committed.
+
+        Args:
+            id: ID of the deleted aggregate
+        """
+        self.invalidate(id)
+
+    def clear(self) -> None:
+        """Drop every entry. The counters are kept."""
+        self._entries.clear()
+        self._aliases_by_id.clear()
+        self._missing_aliases.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable) -> Any:
+        expires_at, value = self._entries[key]
+        if expires_at <= self._clock():
+            self._drop(key)
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return value
+
+    def _resolve(self, alias: _Alias, target: Tuple[Any, Any]) -> Any:
+        id, version = target
+        aggregate = self._get(id)
+        if aggregate is None or _version_of(aggregate) != version:
+            # The aggregate changed since the alias was cached, and its key
+            # may have changed with it.
+            self._drop(alias)
+            raise KeyError(alias)
+        return aggregate
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        ttl = self._negative_ttl if value is None else self._ttl
+        if isinstance(key, _Alias):
+            self._drop(key)
+            self._index(key, value)
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            evicted, (_, evicted_value) = self._entries.popitem(last=False)
+            if isinstance(evicted, _Alias):
+                self._unindex(evicted, evicted_value)
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and isinstance(key, _Alias):
+            self._unindex(key, entry[1])
+
+    def _drop_aliases(self, id: Hashable) -> None:
+        for alias in self._aliases_by_id.pop(id, ()):
+            del self._entries[alias]
+
+    def _drop_missing_aliases(self) -> None:
+        for alias in self._missing_aliases:
+            del self._entries[alias]
+        self._missing_aliases.clear()
+
+    def _on_written(self, id: TId) -> None:
+        # Unlike on_saved, called before the write is committed, when the
+        # aggregate may still have the version of the stored entry.
+        self.invalidate(id)
+        self._drop_missing_aliases()
+
+    def _index(self, alias: _Alias, target: Optional[Tuple[Any, Any]]) -> None:
+        if target is None:
+            self._missing_aliases.add(alias)
+        else:
+            self._aliases_by_id.setdefault(target[0], set()).add(alias)
+
+    def _unindex(self, alias: _Alias, target: Optional[Tuple[Any, Any]]) -> None:
+        if target is None:
+            self._missing_aliases.discard(alias)
+            return
+        aliases = self._aliases_by_id.get(target[0])
+        if aliases is not None:
+            aliases.discard(alias)
+            if not aliases:
+                del self._aliases_by_id[target[0]]
+
+
+class AsyncCachingReadOnlyRepository(AsyncReadOnlyRepository[TAggregateRoot, TId]):
+    """
+    Read-only repository decorator that caches lookups by ID.
+
+    ``find_by_id`` and ``find_by_ids`` are served from an AggregateCache when
+    it holds the IDs, and otherwise read through to the wrapped repository and
+    cache what they load, missing IDs included. ``find_by`` does the same for
+    lookups by another unique key. ``find_all``, ``stream_all`` and
+    ``find_page`` are not cached.
+
+    Unlike an identity map, the cache is meant to be shared across requests,
+    for example one per process for the query side. The write side keeps it
+    fresh by calling ``cache.on_saved`` after each commit; anything else is
+    seen once the entry expires.
+
+    Example:
+        >>> users = AsyncCachingReadOnlyRepository(user_queries, cache)
+        >>> user = await users.find_by(
+        ...     "email", email, lambda: user_queries.find_by_email(email)
+        ... )
+    """
+
+    def __init__(
+        self,
+        repository: AsyncReadOnlyRepository[TAggregateRoot, TId],
+        cache: Optional[AggregateCache[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads aggregates
+            cache: The cache to use. Defaults to a new cache with default
+                settings.
+        """
+        self._repository = repository
+        self.cache = cache if cache is not None else AggregateCache()
+
+    async def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.cache.get(id)
+        except KeyError:
+            pass
+        aggregate = await self._repository.find_by_id(id)
+        self.cache.put(id, aggregate)
+        return aggregate
+
+    async def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _get_all(self.cache, ids)
+        if missing:
+            loaded = await self._repository.find_by_ids(missing)
+            _put_all(self.cache, found, missing, loaded)
+        return _present(found)
+
+    async def find_by(
+        self,
+        name: str,
+        value: Hashable,
+        load: Callable[[], Awaitable[Optional[TAggregateRoot]]],
+    ) -> Optional[TAggregateRoot]:
+        """
+        Find an aggregate by a unique key other than its ID, through the cache.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+            load: Loads the aggregate with this key from storage
+
+        Returns:
+            The aggregate if found, None otherwise
+        """
+        try:
+            return self.cache.get_alias(name, value)
+        except KeyError:
+            pass
+        aggregate = await load()
+        self.cache.put_alias(name, value, aggregate)
+        return aggregate
+
+    async def find_all(self) -> List[TAggregateRoot]:
+        return await self._repository.find_all()
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[TAggregateRoot]:
+        async for aggregate in self._repository.stream_all(batch_size):
+            yield aggregate
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return await self._repository.find_page(after, limit)
+
+
+class SyncCachingReadOnlyRepository(SyncReadOnlyRepository[TAggregateRoot, TId]):
+    """
+    Read-only repository decorator that caches lookups by ID.
+
+    This is the synchronous counterpart of AsyncCachingReadOnlyRepository and
+    behaves the same way.
+
+    Example:
+        >>> users = SyncCachingReadOnlyRepository(user_queries, cache)
+        >>> user = users.find_by(
+        ...     "email", email, lambda: user_queries.find_by_email(email)
+        ... )
+    """
+
+    def __init__(
+        self,
+        repository: SyncReadOnlyRepository[TAggregateRoot, TId],
+        cache: Optional[AggregateCache[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads aggregates
+            cache: The cache to use. Defaults to a new cache with default
+                settings.
+        """
+        self._repository = repository
+        self.cache = cache if cache is not None else AggregateCache()
+
+    def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.cache.get(id)
+        except KeyError:
+            pass
+        aggregate = self._repository.find_by_id(id)
+        self.cache.put(id, aggregate)
+        return aggregate
+
+    def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _get_all(self.cache, ids)
+        if missing:
+            loaded = self._repository.find_by_ids(missing)
+            _put_all(self.cache, found, missing, loaded)
+        return _present(found)
+
+    def find_by(
+        self,
+        name: str,
+        value: Hashable,
+        load: Callable[[], Optional[TAggregateRoot]],
+    ) -> Optional[TAggregateRoot]:
+        """
+        Find an aggregate by a unique key other than its ID, through the cache.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+            load: Loads the aggregate with this key from storage
+
+        Returns:
+            The aggregate if found, None otherwise
+        """
+        try:
+            return self.cache.get_alias(name, value)
+        except KeyError:
+            pass
+        aggregate = load()
+        self.cache.put_alias(name, value, aggregate)
+        return aggregate
+
+    def find_all(self) -> List[TAggregateRoot]:
+        return self._repository.find_all()
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[TAggregateRoot]:
+        yield from self._repository.stream_all(batch_size)
+
+    def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return self._repository.find_page(after, limit)
+
+
+class AsyncCachingRepository(AsyncRepository[TAggregateRoot, TId]):
+    """
+    Repository decorator that caches lookups and drops the entries it writes.
+
+    Reads behave as in AsyncCachingReadOnlyRepository. ``save``,
+    ``save_many``, ``delete_by_id`` and ``delete_by_ids`` forward to the
+    wrapped repository, then drop the cached entries and aliases of the
+    aggregates they wrote, and the aliases cached as missing, so no reader of
+    the cache gets the version they replaced.
+
+    If the wrapped repository defers its writes to a unit of work, a reader
+    can cache the old version again before the commit. Add the cache to the
+    TrackingUnitOfWork as well, so the entries are also dropped once the
+    change is committed.
+
+    Example:
+        >>> cache = AggregateCache(max_size=10_000, ttl_seconds=30)
+        >>> users = AsyncCachingRepository(SQLAlchemyUserRepository(uow), cache)
+        >>> uow.add_cache(User, cache)
+    """
+
+    def __init__(
+        self,
+        repository: AsyncRepository[TAggregateRoot, TId],
+        cache: Optional[AggregateCache[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads and stores aggregates
+            cache: The cache to use. Defaults to a new cache with default
+                settings.
+        """
+        self._repository = repository
+        self.cache = cache if cache is not None else AggregateCache()
+
+    async def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.cache.get(id)
+        except KeyError:
+            pass
+        aggregate = await self._repository.find_by_id(id)
+        self.cache.put(id, aggregate)
+        return aggregate
+
+    async def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _get_all(self.cache, ids)
+        if missing:
+            loaded = await self._repository.find_by_ids(missing)
+            _put_all(self.cache, found, missing, loaded)
+        return _present(found)
+
+    async def find_by(
+        self,
+        name: str,
+        value: Hashable,
+        load: Callable[[], Awaitable[Optional[TAggregateRoot]]],
+    ) -> Optional[TAggregateRoot]:
+        """
+        Find an aggregate by a unique key other than its ID, through the cache.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+            load: Loads the aggregate with this key from storage
+
+        Returns:
+            The aggregate if found, None otherwise
+        """
+        try:
+            return self.cache.get_alias(name, value)
+        except KeyError:
+            pass
+        aggregate = await load()
+        self.cache.put_alias(name, value, aggregate)
+        return aggregate
+
+    async def save(self, aggregate: TAggregateRoot) -> None:
+        await self._repository.save(aggregate)
+        self.cache._on_written(_id_of(aggregate))
+
+    async def delete_by_id(self, id: TId) -> None:
+        await self._repository.delete_by_id(id)
+        self.cache.on_deleted(id)
+
+    async def save_many(self, aggregates: Iterable[TAggregateRoot]) -> None:
+        aggregates = list(aggregates)
+        await self._repository.save_many(aggregates)
+        for aggregate in aggregates:
+            self.cache._on_written(_id_of(aggregate))
+
+    async def delete_by_ids(self, ids: Iterable[TId]) -> None:
+        ids = list(ids)
+        await self._repository.delete_by_ids(ids)
+        for id in ids:
+            self.cache.on_deleted(id)
+
+    async def find_all(self) -> List[TAggregateRoot]:
+        return await self._repository.find_all()
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[TAggregateRoot]:
+        async for aggregate in self._repository.stream_all(batch_size):
+            yield aggregate
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return await self._repository.find_page(after, limit)
+
+
+class SyncCachingRepository(SyncRepository[TAggregateRoot, TId]):
+    """
+    Repository decorator that caches lookups and drops the entries it writes.
+
+    This is the synchronous counterpart of AsyncCachingRepository and behaves
+    the same way.
+
+    Example:
+        >>> cache = AggregateCache(max_size=10_000, ttl_seconds=30)
+        >>> users = SyncCachingRepository(SQLAlchemyUserRepository(session), cache)
+    """
+
+    def __init__(
+        self,
+        repository: SyncRepository[TAggregateRoot, TId],
+        cache: Optional[AggregateCache[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads and stores aggregates
+            cache: The cache to use. Defaults to a new cache with default
+                settings.
+        """
+        self._repository = repository
+        self.cache = cache if cache is not None else AggregateCache()
+
+    def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.cache.get(id)
+        except KeyError:
+            pass
+        aggregate = self._repository.find_by_id(id)
+        self.cache.put(id, aggregate)
+        return aggregate
+
+    def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _get_all(self.cache, ids)
+        if missing:
+            loaded = self._repository.find_by_ids(missing)
+            _put_all(self.cache, found, missing, loaded)
+        return _present(found)
+
+    def find_by(
+        self,
+        name: str,
+        value: Hashable,
+        load: Callable[[], Optional[TAggregateRoot]],
+    ) -> Optional[TAggregateRoot]:
+        """
+        Find an aggregate by a unique key other than its ID, through the cache.
+
+        Args:
+            name: Name of the key, such as "email"
+            value: Value of the key
+            load: Loads the aggregate with this key from storage
+
+        Returns:
+            The aggregate if found, None otherwise
+        """
+        try:
+            return self.cache.get_alias(name, value)
+        except KeyError:
+            pass
+        aggregate = load()
+        self.cache.put_alias(name, value, aggregate)
+        return aggregate
+
+    def save(self, aggregate: TAggregateRoot) -> None:
+        self._repository.save(aggregate)
+        self.cache._on_written(_id_of(aggregate))
+
+    def delete_by_id(self, id: TId) -> None:
+        self._repository.delete_by_id(id)
+        self.cache.on_deleted(id)
+
+    def save_many(self, aggregates: Iterable[TAggregateRoot]) -> None:
+        aggregates = list(aggregates)
+        self._repository.save_many(aggregates)
+        for aggregate in aggregates:
+            self.cache._on_written(_id_of(aggregate))
+
+    def delete_by_ids(self, ids: Iterable[TId]) -> None:
+        ids = list(ids)
+        self._repository.delete_by_ids(ids)
+        for id in ids:
+            self.cache.on_deleted(id)
+
+    def find_all(self) -> List[TAggregateRoot]:
+        return self._repository.find_all()
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[TAggregateRoot]:
+        yield from self._repository.stream_all(batch_size)
+
+    def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return self._repository.find_page(after, limit)
+
+
+def _id_of(aggregate: Any) -> Any:
+    return aggregate.id
+
+
+def _version_of(aggregate: Any) -> Any:
+    return aggregate.version
+
+
+def _get_all(
+    cache: AggregateCache[TAggregateRoot, TId], ids: Iterable[TId]
+) -> Tuple[Dict[TId, Optional[TAggregateRoot]], List[TId]]:
+    found: Dict[TId, Optional[TAggregateRoot]] = {}
+    missing: List[TId] = []
+    for id in dict.fromkeys(ids):
+        try:
+            found[id] = cache.get(id)
+        except KeyError:
+            found[id] = None
+            missing.append(id)
+    return found, missing
+
+
+def _put_all(
+    cache: AggregateCache[TAggregateRoot, TId],
+    found: Dict[TId, Optional[TAggregateRoot]],
+    missing: List[TId],
+    loaded: Dict[TId, TAggregateRoot],
+) -> None:
+    for id in missing:
+        aggregate = loaded.get(id)
+        cache.put(id, aggregate)
+        found[id] = aggregate
+
+
+def _present(
+    found: Dict[TId, Optional[TAggregateRoot]],
+) -> Dict[TId, TAggregateRoot]:
+    return {id: aggregate for id, aggregate in found.items() if aggregate is not None}
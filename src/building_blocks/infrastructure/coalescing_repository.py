@@ -0,0 +1,156 @@
+"""
+Request-coalescing repository.
+
+This module provides AsyncCoalescingRepository, a repository decorator that
+gathers the ``find_by_id`` calls made in one event loop iteration and serves
+them with a single ``find_by_ids`` call, like a DataLoader.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+
+from building_blocks.domain.ports.outbound.pagination import Page
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    TAggregateRoot,
+    TId,
+)
+
+
+class AsyncCoalescingRepository(AsyncRepository[TAggregateRoot, TId]):
+    """
+    Repository decorator that batches concurrent lookups by ID.
+
+    ``find_by_id`` does not reach the wrapped repository right away: it queues
+    the ID and waits. Once every coroutine that is ready to run in the current
+    event loop iteration has had its turn, the queued IDs are deduplicated and
+    loaded with one ``find_by_ids`` call, and each caller gets the aggregate
+    for its ID. Fan-out code such as ``asyncio.gather`` over many lookups then
+    costs one round trip instead of one per ID. A batch is also sent as soon
+    as ``max_batch_size`` distinct IDs are queued. ``find_by_ids`` joins the
+    same batches.
+
+    Callers asking for the same ID in one batch share one instance, so create
+    the decorator per unit of work, like an identity map; wrapping an
+    AsyncIdentityMapRepository also skips the IDs already loaded. If the
+    batched lookup fails, every caller of the batch gets the error. The other
+    methods are forwarded unchanged.
+
+    Example:
+        >>> users = AsyncCoalescingRepository(SQLAlchemyUserRepository(session))
+        >>> owners = await asyncio.gather(
+        ...     *(users.find_by_id(task.owner_id) for task in tasks)
+        ... )
+        >>> users.batch_count
+        1
+    """
+
+    def __init__(
+        self,
+        repository: AsyncRepository[TAggregateRoot, TId],
+        max_batch_size: int = 1000,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads and stores aggregates
+            max_batch_size: Number of distinct queued IDs that sends a batch
+                without waiting for the end of the loop iteration
+
+        Raises:
+            ValueError: If max_batch_size is less than 1
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self._repository = repository
+        self._max_batch_size = max_batch_size
+        self._queue: Dict[TId, asyncio.Future[Optional[TAggregateRoot]]] = {}
+        self._dispatch: Optional[asyncio.Handle] = None
+        self._loads: Set[asyncio.Future[None]] = set()
+        self.batch_count = 0
+
+    async def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        # Shielded so a cancelled caller does not cancel the lookup for the
+        # others waiting on the same ID.
+        return await asyncio.shield(self._enqueue(id))
+
+    async def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        futures = {id: self._enqueue(id) for id in ids}
+        await asyncio.shield(asyncio.gather(*futures.values()))
+        found = {id: future.result() for id, future in futures.items()}
+        return {
+            id: aggregate for id, aggregate in found.items() if aggregate is not None
+        }
+
+    async def save(self, aggregate: TAggregateRoot) -> None:
+        await self._repository.save(aggregate)
+
+    async def delete_by_id(self, id: TId) -> None:
+        await self._repository.delete_by_id(id)
+
+    async def find_all(self) -> List[TAggregateRoot]:
+        return await self._repository.find_all()
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[TAggregateRoot]:
+        async for aggregate in self._repository.stream_all(batch_size):
+            yield aggregate
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return await self._repository.find_page(after, limit)
+
+    async def save_many(self, aggregates: Iterable[TAggregateRoot]) -> None:
+        await self._repository.save_many(aggregates)
+
+    async def delete_by_ids(self, ids: Iterable[TId]) -> None:
+        await self._repository.delete_by_ids(ids)
+
+    def _enqueue(self, id: TId) -> asyncio.Future[Optional[TAggregateRoot]]:
+        future = self._queue.get(id)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue[id] = future
+        if len(self._queue) >= self._max_batch_size:
+            self._send()
+        elif self._dispatch is None:
+            self._dispatch = loop.call_soon(self._send)
+        return future
+
+    def _send(self) -> None:
+        if self._dispatch is not None:
+            self._dispatch.cancel()
+            self._dispatch = None
+        batch, self._queue = self._queue, {}
+        self.batch_count += 1
+        load = asyncio.ensure_future(self._load(batch))
+        # The loop only keeps weak references to tasks.
+        self._loads.add(load)
+        load.add_done_callback(self._loads.discard)
+
+    async def _load(
+        self, batch: Dict[TId, asyncio.Future[Optional[TAggregateRoot]]]
+    ) -> None:
+        try:
+            found = await self._repository.find_by_ids(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Marks the error as retrieved in case every caller of
+                    # the batch was cancelled; awaiting still raises it.
+                    future.exception()
+            return
+        except BaseException:
+            # Cancelled, e.g. on shutdown: the callers must not wait forever.
+            for future in batch.values():
+                future.cancel()
+            raise
+        for id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(id))
@@ -0,0 +1,271 @@
+"""
+In-process event bus.
+
+This module provides InMemoryEventBus, an AsyncEventPublisher that delivers
+events to handlers registered in the same process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+)
+from building_blocks.domain.messages.event import Event
+
+TEvent = TypeVar("TEvent", bound=Event)
+
+EventHandler = Callable[[TEvent], Awaitable[None]]
+"""Coroutine function that handles one event."""
+
+ErrorHandler = Callable[[Event, Exception], None]
+"""Called with the event and the exception when a queued handler fails."""
+
+logger = logging.getLogger(__name__)
+
+
+def _log_error(event: Event, error: Exception) -> None:
+    logger.error(
+        "Handler failed for %s %s", event.message_type, event.event_id, exc_info=error
+    )
+
+
+class _Subscription:
+    """A handler registered for one event type, with its delivery settings."""
+
+    __slots__ = (
+        "handler",
+        "max_concurrency",
+        "queue_size",
+        "_on_error",
+        "_semaphore",
+        "_queue",
+        "_workers",
+    )
+
+    def __init__(
+        self,
+        handler: EventHandler[Any],
+        max_concurrency: Optional[int],
+        queue_size: Optional[int],
+        on_error: ErrorHandler,
+    ) -> None:
+        self.handler = handler
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self._on_error = on_error
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queue: Optional[asyncio.Queue[Event]] = None
+        self._workers: List[asyncio.Task[None]] = []
+
+    async def deliver(self, event: Event) -> None:
+        """
+        Run the handler now, or enqueue the event for the background workers.
+
+        Args:
+            event: The event to deliver
+        """
+        if self.queue_size is not None:
+            await self._enqueue(event)
+        elif self.max_concurrency is None:
+            await self.handler(event)
+        else:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                await self.handler(event)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the background workers once the queue is drained."""
+        await self.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._queue = None
+
+    async def _enqueue(self, event: Event) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size or 0)
+            self._workers = [
+                asyncio.ensure_future(self._work(self._queue))
+                for _ in range(self.max_concurrency or 1)
+            ]
+        await self._queue.put(event)
+
+    async def _work(self, queue: asyncio.Queue[Event]) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                await self.handler(event)
+            except Exception as e:
+                self._report(event, e)
+            finally:
+                queue.task_done()
+
+    def _report(self, event: Event, error: Exception) -> None:
+        # A failing error handler must not stop the worker: the queue would
+        # fill up and block every later publish.
+        try:
+            self._on_error(event, error)
+        except Exception:
+            logger.exception(
+                "Error handler failed for %s %s", event.message_type, event.event_id
+            )
+
+
+class InMemoryEventBus(AsyncEventPublisher[Event]):
+    """
+    Event bus that dispatches events to in-process handlers.
+
+    Handlers subscribe to an event class and receive events of that class and
+    its subclasses. The handlers for each concrete event class are resolved
+    once, on the first publish of that class, and kept in a dispatch table, so
+    publishing does not walk the class hierarchy again.
+
+    Publishing an event delivers it to all its handlers concurrently. Each
+    subscription can be tuned:
+
+    - ``max_concurrency`` caps how many events the handler processes at once.
+    - ``queue_size`` makes delivery asynchronous: events are put in a bounded
+      queue consumed by ``max_concurrency`` (default 1) background workers,
+      and ``publish`` only waits while the queue is full. This is how a slow
+      handler applies backpressure to publishers without holding them up
+      otherwise.
+
+    Errors from direct handlers are raised from ``publish`` once every handler
+    has finished. Errors from queued handlers cannot reach the publisher and
+    are passed to ``on_error``, which logs them by default.
+
+    Use the bus as an async context manager, or call ``aclose``, to drain the
+    queues and stop the workers.
+
+    Example:
+        >>> bus = InMemoryEventBus()
+        >>> bus.subscribe(OrderCreated, send_confirmation_email, queue_size=100)
+        >>> bus.subscribe(Event, audit_log)
+        >>> async with bus:
+        ...     await bus.publish(OrderCreated("order-1", "customer-1", 9.5))
+    """
+
+    def __init__(self, on_error: Optional[ErrorHandler] = None) -> None:
+        """
+        Initialize a bus with no subscriptions.
+
+        Args:
+            on_error: Called when a queued handler raises. Defaults to logging
+                the error.
+        """
+        self._on_error = on_error or _log_error
+        self._subscriptions: Dict[Type[Event], List[_Subscription]] = {}
+        self._dispatch: Dict[Type[Event], Tuple[_Subscription, ...]] = {}
+
+    def subscribe(
+        self,
+        event_type: Type[TEvent],
+        handler: EventHandler[TEvent],
+        *,
+        max_concurrency: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        """
+        Register a handler for an event class and its subclasses.
+
+        Args:
+            event_type: The event class to handle
+            handler: Coroutine function called with each event
+            max_concurrency: Maximum number of events handled at once. Unlimited
+                by default for direct handlers, 1 for queued handlers.
+            queue_size: If set, deliver events through a queue of this size
+                instead of awaiting the handler in ``publish``
+
+        Raises:
+            ValueError: If max_concurrency or queue_size is less than 1
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        if queue_size is not None and queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        subscription = _Subscription(
+            handler, max_concurrency, queue_size, self._on_error
+        )
+        self._subscriptions.setdefault(event_type, []).append(subscription)
+        self._dispatch.clear()
+
+    async def publish(self, event: Event) -> None:
+        """
+        Deliver an event to every handler subscribed to its class or a base.
+
+        Args:
+            event: The event to publish
+
+        Raises:
+            Exception: The first error raised by a direct handler, after all
+                handlers have finished
+        """
+        event_type = type(event)
+        subscriptions = self._dispatch.get(event_type)
+        if subscriptions is None:
+            subscriptions = self._resolve(event_type)
+        if len(subscriptions) == 1:
+            await subscriptions[0].deliver(event)
+        elif subscriptions:
+            results = await asyncio.gather(
+                *(subscription.deliver(event) for subscription in subscriptions),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        for subscription in self._all_subscriptions():
+            await subscription.join()
+
+    async def aclose(self) -> None:
+        """Drain the queues and stop the background workers."""
+        for subscription in self._all_subscriptions():
+            await subscription.close()
+
+    async def __aenter__(self) -> InMemoryEventBus:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _resolve(self, event_type: Type[Event]) -> Tuple[_Subscription, ...]:
+        subscriptions = tuple(
+            subscription
+            for cls in reversed(event_type.__mro__)
+            for subscription in self._subscriptions.get(cls, ())
+        )
+        self._dispatch[event_type] = subscriptions
+        return subscriptions
+
+    def _all_subscriptions(self) -> List[_Subscription]:
+        return [
+            subscription
+            for subscriptions in self._subscriptions.values()
+            for subscription in subscriptions
+        ]
@@ -0,0 +1,221 @@
+"""
+Event-sourced repositories.
+
+This module provides AsyncEventSourcedRepository and SyncEventSourcedRepository,
+which store event-sourced aggregates as event streams in an event store and
+load them from their latest snapshot plus the events recorded after it.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Generic, Optional, Type
+
+from building_blocks.application.ports.outbound.event_store import (
+    AsyncEventStore,
+    SyncEventStore,
+)
+from building_blocks.application.ports.outbound.snapshot_store import (
+    AsyncSnapshotStore,
+    SyncSnapshotStore,
+)
+from building_blocks.domain.event_sourced_aggregate_root import (
+    Snapshot,
+    TEventSourced,
+)
+from building_blocks.domain.messages.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEventSourcedRepository(Generic[TEventSourced]):
+    """
+    Repository of event-sourced aggregates, backed by an event store.
+
+    Each aggregate is stored as one stream, named after the aggregate type
+    and ID, for example ``Account-42``. ``save`` appends the aggregate's
+    uncommitted changes, checking that the stream is still at the version
+    the aggregate was loaded at, then marks them as committed.
+
+    With a snapshot store, ``find_by_id`` asks it first and only reads the
+    events recorded after the snapshot, so loading an aggregate with a long
+    history costs a snapshot read plus a few events instead of a full
+    replay. ``save`` stores a new snapshot whenever the aggregate's
+    ``snapshot_due`` is true, that is every ``snapshot_every`` events.
+    Snapshots are an optimization: one that cannot be read or written is
+    logged and the aggregate is loaded from its full stream instead.
+
+    Example:
+        >>> accounts = AsyncEventSourcedRepository(
+        ...     Account, AsyncFileEventStore("var/events", codec),
+        ...     AsyncFileSnapshotStore("var/snapshots/account"),
+        ... )
+        >>> account = await accounts.find_by_id(account_id)
+        >>> account.deposit(10)
+        >>> await accounts.save(account)
+    """
+
+    def __init__(
+        self,
+        aggregate_type: Type[TEventSourced],
+        events: AsyncEventStore[Event],
+        snapshots: Optional[AsyncSnapshotStore] = None,
+    ) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            aggregate_type: The event-sourced aggregate class
+            events: The event store holding the streams
+            snapshots: The store of the aggregate type's snapshots, if any
+        """
+        self._aggregate_type = aggregate_type
+        self._events = events
+        self._snapshots = snapshots
+
+    async def find_by_id(self, id: Any) -> Optional[TEventSourced]:
+        """
+        Load an aggregate from its latest snapshot and the events after it.
+
+        Args:
+            id: ID of the aggregate
+
+        Returns:
+            Optional[TEventSourced]: The aggregate, or None if it has no events
+        """
+        snapshot = await self._load_snapshot(id)
+        after = 0 if snapshot is None else snapshot.version.value
+        history = await self._events.read(self._stream_id(id), after)
+        if snapshot is None and not history:
+            return None
+        return self._aggregate_type.replay(id, history, snapshot)
+
+    async def save(self, aggregate: TEventSourced) -> None:
+        """
+        Append the aggregate's uncommitted changes to its stream.
+
+        Args:
+            aggregate: The aggregate to save
+
+        Raises:
+            ConcurrencyError: If other events were appended to the stream
+                since the aggregate was loaded
+        """
+        await self._events.append(
+            self._stream_id(aggregate.id),
+            aggregate.version.value,
+            aggregate.uncommitted_changes_view(),
+        )
+        aggregate.mark_changes_as_committed()
+        if self._snapshots is not None and aggregate.snapshot_due:
+            snapshot = aggregate.take_snapshot()
+            try:
+                await self._snapshots.save(snapshot)
+            except Exception:
+                logger.warning(
+                    "Failed to save a snapshot of %s",
+                    snapshot.aggregate_id,
+                    exc_info=True,
+                )
+
+    def _stream_id(self, id: Any) -> str:
+        return f"{self._aggregate_type.__name__}-{id}"
+
+    async def _load_snapshot(self, id: Any) -> Optional[Snapshot]:
+        if self._snapshots is None:
+            return None
+        try:
+            return await self._snapshots.load(id)
+        except Exception:
+            logger.warning("Failed to load the snapshot of %s", id, exc_info=True)
+            return None
+
+
+class SyncEventSourcedRepository(Generic[TEventSourced]):
+    """
+    Repository of event-sourced aggregates, backed by an event store.
+
+    Synchronous counterpart of AsyncEventSourcedRepository; see it for how
+    streams are named and how snapshots are used.
+
+    Example:
+        >>> accounts = SyncEventSourcedRepository(
+        ...     Account, SyncFileEventStore("var/events", codec),
+        ...     SyncInMemorySnapshotStore(),
+        ... )
+    """
+
+    def __init__(
+        self,
+        aggregate_type: Type[TEventSourced],
+        events: SyncEventStore[Event],
+        snapshots: Optional[SyncSnapshotStore] = None,
+    ) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            aggregate_type: The event-sourced aggregate class
+            events: The event store holding the streams
+            snapshots: The store of the aggregate type's snapshots, if any
+        """
+        self._aggregate_type = aggregate_type
+        self._events = events
+        self._snapshots = snapshots
+
+    def find_by_id(self, id: Any) -> Optional[TEventSourced]:
+        """
+        Load an aggregate from its latest snapshot and the events after it.
+
+        Args:
+            id: ID of the aggregate
+
+        Returns:
+            Optional[TEventSourced]: The aggregate, or None if it has no events
+        """
+        snapshot = self._load_snapshot(id)
+        after = 0 if snapshot is None else snapshot.version.value
+        history = self._events.read(self._stream_id(id), after)
+        if snapshot is None and not history:
+            return None
+        return self._aggregate_type.replay(id, history, snapshot)
+
+    def save(self, aggregate: TEventSourced) -> None:
+        """
+        Append the aggregate's uncommitted changes to its stream.
+
+        Args:
+            aggregate: The aggregate to save
+
+        Raises:
+            ConcurrencyError: If other events were appended to the stream
+                since the aggregate was loaded
+        """
+        self._events.append(
+            self._stream_id(aggregate.id),
+            aggregate.version.value,
+            aggregate.uncommitted_changes_view(),
+        )
+        aggregate.mark_changes_as_committed()
+        if self._snapshots is not None and aggregate.snapshot_due:
+            snapshot = aggregate.take_snapshot()
+            try:
+                self._snapshots.save(snapshot)
+            except Exception:
+                logger.warning(
+                    "Failed to save a snapshot of %s",
+                    snapshot.aggregate_id,
+                    exc_info=True,
+                )
+
+    def _stream_id(self, id: Any) -> str:
+        return f"{self._aggregate_type.__name__}-{id}"
+
+    def _load_snapshot(self, id: Any) -> Optional[Snapshot]:
+        if self._snapshots is None:
+            return None
+        try:
+            return self._snapshots.load(id)
+        except Exception:
+            logger.warning("Failed to load the snapshot of %s", id, exc_info=True)
+            return None
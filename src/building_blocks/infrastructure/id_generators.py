@@ -0,0 +1,251 @@
+"""
+Identifier generators.
+
+This module provides dependency-free implementations of the IdGenerator port:
+random UUIDs, time-ordered UUIDv7 and ULID, and Snowflake-style 64-bit integers.
+
+The time-ordered generators are monotonic within a process: identifiers
+generated later always sort after earlier ones, even when several are generated
+within the same millisecond or the system clock steps backwards.
+
+Random bits come from a per-process PRNG seeded from ``os.urandom`` (and
+reseeded after ``fork``) instead of one ``os.urandom`` call per identifier.
+This keeps identifiers unique but not unpredictable; do not use them as
+secrets.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from typing import Callable, Optional
+from uuid import UUID, SafeUUID, uuid4
+
+from building_blocks.domain.ports.outbound.id_generator import IdGenerator
+
+_random = random.Random()  # nosec B311 - uniqueness only, not a secret
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random.seed)
+
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class UUID4Generator(IdGenerator[UUID]):
+    """
+    Generates random version 4 UUIDs.
+
+    Equivalent to calling ``uuid4()`` directly. Use it where identifiers must
+    not reveal their creation time.
+    """
+
+    def next_id(self) -> UUID:
+        """
+        Generate a random UUID.
+
+        Returns:
+            UUID: A new version 4 UUID
+        """
+        return uuid4()
+
+
+class UUIDv7Generator(IdGenerator[UUID]):
+    """
+    Generates monotonic, time-ordered version 7 UUIDs (RFC 9562).
+
+    Layout: 48-bit Unix timestamp in milliseconds, 12-bit counter that orders
+    identifiers generated within the same millisecond, 62 random bits. When the
+    counter overflows, the timestamp is advanced by one millisecond instead of
+    waiting for the clock.
+
+    Args:
+        clock: Callable returning the current Unix time in milliseconds.
+            Defaults to the system clock.
+
+    Example:
+        >>> generator = UUIDv7Generator()
+        >>> first, second = generator.next_id(), generator.next_id()
+        >>> first < second
+        True
+    """
+
+    _MAX_COUNTER = 0xFFF
+
+    def __init__(self, clock: Optional[Callable[[], int]] = None) -> None:
+        self._clock = clock or _now_ms
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def next_id(self) -> UUID:
+        """
+        Generate a UUIDv7 that sorts after every one generated before it.
+
+        Returns:
+            UUID: A new version 7 UUID
+        """
+        with self._lock:
+            now = self._clock()
+            if now > self._last_ms:
+                self._last_ms = now
+                self._counter = 0
+            elif self._counter < self._MAX_COUNTER:
+                self._counter += 1
+            else:
+                self._last_ms += 1
+                self._counter = 0
+            value = (
+                (self._last_ms << 80)
+                | (0x7 << 76)
+                | (self._counter << 64)
+                | (0b10 << 62)
+                | _random.getrandbits(62)
+            )
+        return _uuid_from_int(value)
+
+
+class ULIDGenerator(IdGenerator[str]):
+    """
+    Generates monotonic ULIDs as 26-character Crockford base32 strings.
+
+    Layout: 48-bit Unix timestamp in milliseconds followed by 80 random bits.
+    Within the same millisecond the random part of the previous identifier is
+    incremented, as the ULID specification recommends, so identifiers sort
+    lexicographically in generation order.
+
+    Args:
+        clock: Callable returning the current Unix time in milliseconds.
+            Defaults to the system clock.
+    """
+
+    _MAX_RANDOM = (1 << 80) - 1
+
+    def __init__(self, clock: Optional[Callable[[], int]] = None) -> None:
+        self._clock = clock or _now_ms
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def next_id(self) -> str:
+        """
+        Generate a ULID that sorts after every one generated before it.
+
+        Returns:
+            str: A new 26-character ULID
+        """
+        with self._lock:
+            now = self._clock()
+            if now > self._last_ms:
+                self._last_ms = now
+                self._last_random = _random.getrandbits(80)
+            elif self._last_random < self._MAX_RANDOM:
+                self._last_random += 1
+            else:
+                self._last_ms += 1
+                self._last_random = _random.getrandbits(80)
+            value = (self._last_ms << 80) | self._last_random
+        return _encode_crockford_base32(value)
+
+
+class SnowflakeIdGenerator(IdGenerator[int]):
+    """
+    Generates Snowflake-style 64-bit integer identifiers.
+
+    Layout: 41-bit millisecond timestamp since ``epoch_ms``, 10-bit worker ID,
+    12-bit sequence. Identifiers fit in a signed BIGINT column and are unique
+    across workers as long as each process uses a distinct ``worker_id``.
+    When the sequence overflows, the timestamp is advanced by one millisecond
+    instead of waiting for the clock.
+
+    Args:
+        worker_id: Identifier of this process, between 0 and 1023
+        epoch_ms: Custom epoch in Unix milliseconds. Defaults to 2020-01-01.
+        clock: Callable returning the current Unix time in milliseconds.
+            Defaults to the system clock.
+
+    Raises:
+        ValueError: If ``worker_id`` is out of range
+    """
+
+    DEFAULT_EPOCH_MS = 1_577_836_800_000
+    MAX_WORKER_ID = 0x3FF
+    _MAX_SEQUENCE = 0xFFF
+
+    def __init__(
+        self,
+        worker_id: int,
+        epoch_ms: int = DEFAULT_EPOCH_MS,
+        clock: Optional[Callable[[], int]] = None,
+    ) -> None:
+        if not 0 <= worker_id <= self.MAX_WORKER_ID:
+            raise ValueError(
+                f"Worker ID must be between 0 and {self.MAX_WORKER_ID}, "
+                f"got {worker_id}"
+            )
+        self._worker_bits = worker_id << 12
+        self._epoch_ms = epoch_ms
+        self._clock = clock or _now_ms
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._sequence = 0
+
+    def next_id(self) -> int:
+        """
+        Generate an identifier larger than every one generated before it.
+
+        Returns:
+            int: A new non-negative 63-bit identifier
+        """
+        with self._lock:
+            now = self._clock() - self._epoch_ms
+            if now > self._last_ms:
+                self._last_ms = now
+                self._sequence = 0
+            elif self._sequence < self._MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last_ms += 1
+                self._sequence = 0
+            return (self._last_ms << 22) | self._worker_bits | self._sequence
+
+
+def _uuid_from_int(value: int) -> UUID:
+    """
+    Build a UUID from a 128-bit integer without ``UUID.__init__``.
+
+    ``UUID(int=...)`` parses its keyword arguments and range-checks the value on
+    every call; setting the slots directly is about three times faster. The
+    generators always produce an in-range value, so the checks are skipped.
+
+    Args:
+        value: The 128-bit integer value
+
+    Returns:
+        UUID: The UUID with that value
+    """
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, "int", value)
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)
+    return uuid
+
+
+def _encode_crockford_base32(value: int) -> str:
+    """
+    Encode a 128-bit integer as 26 Crockford base32 characters.
+
+    Args:
+        value: The integer to encode
+
+    Returns:
+        str: The encoded, zero-padded string
+    """
+    chars = []
+    for _ in range(26):
+        chars.append(_CROCKFORD_BASE32[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
@@ -0,0 +1,363 @@
+"""
+Identity map for repositories.
+
+This module provides IdentityMap, which keeps one instance per aggregate ID,
+and AsyncIdentityMapRepository and SyncIdentityMapRepository, repository
+decorators that serve repeat lookups from it.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from building_blocks.domain.ports.outbound.pagination import Page
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    SyncRepository,
+    TAggregateRoot,
+    TId,
+)
+
+_MISSING: Any = object()
+_REMOVED: Any = object()
+
+
+class IdentityMap(Generic[TAggregateRoot, TId]):
+    """
+    The aggregates loaded or saved in one unit of work, by ID.
+
+    Besides the aggregates themselves, the map remembers the IDs deleted in
+    the unit of work, so a lookup after a deferred delete does not bring the
+    aggregate back from storage. ``hits`` and ``misses`` count the lookups
+    served from memory and those that had to reach storage.
+
+    Use one map per aggregate type and per unit of work: it never expires
+    entries, so a long-lived map would serve stale aggregates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty identity map."""
+        self._entries: Dict[TId, TAggregateRoot] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of lookups served from memory.
+
+        Returns:
+            float: Between 0 and 1, or 0 before the first lookup
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, id: TId) -> Optional[TAggregateRoot]:
+        """
+        Return the aggregate mapped to an ID, counting the hit or miss.
+
+        Args:
+            id: The aggregate ID
+
+        Returns:
+            The mapped aggregate, or None if it was removed in this scope
+
+        Raises:
+            KeyError: If the map knows nothing about the ID
+        """
+        entry = self._entries.get(id, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            raise KeyError(id)
+        self.hits += 1
+        return None if entry is _REMOVED else entry
+
+    def add(self, id: TId, aggregate: TAggregateRoot) -> Optional[TAggregateRoot]:
+        """
+        Map a loaded aggregate, keeping the instance already mapped to its ID.
+
+        Args:
+            id: The aggregate ID
+            aggregate: A freshly loaded aggregate
+
+        Returns:
+            The instance mapped to the ID, or None if it was removed in this
+            scope
+        """
+        mapped = self._entries.setdefault(id, aggregate)
+        return None if mapped is _REMOVED else mapped
+
+    def resolve(self, id: TId, aggregate: TAggregateRoot) -> Optional[TAggregateRoot]:
+        """
+        Return the instance mapped to an ID, or a loaded aggregate if none is.
+
+        Unlike ``add``, the loaded aggregate is not mapped, so resolving a
+        stream of aggregates does not grow the map.
+
+        Args:
+            id: The aggregate ID
+            aggregate: A freshly loaded aggregate
+
+        Returns:
+            The mapped instance, the loaded aggregate if the ID is not mapped,
+            or None if it was removed in this scope
+        """
+        mapped = self._entries.get(id, aggregate)
+        return None if mapped is _REMOVED else mapped
+
+    def replace(self, id: TId, aggregate: TAggregateRoot) -> None:
+        """
+        Map a saved aggregate, replacing any instance mapped to its ID.
+
+        Args:
+            id: The aggregate ID
+            aggregate: The aggregate to map
+        """
+        self._entries[id] = aggregate
+
+    def remove(self, id: TId) -> None:
+        """
+        Record that the aggregate with this ID was deleted.
+
+        Args:
+            id: The aggregate ID
+        """
+        self._entries[id] = _REMOVED
+
+    def clear(self) -> None:
+        """Forget every entry. The counters are kept."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return sum(entry is not _REMOVED for entry in self._entries.values())
+
+
+class AsyncIdentityMapRepository(AsyncRepository[TAggregateRoot, TId]):
+    """
+    Repository decorator that gives each aggregate one instance per scope.
+
+    ``find_by_id`` returns the instance already loaded or saved through this
+    repository when there is one, without reaching the wrapped repository, so
+    repeat lookups in a request cost nothing and every caller works on the
+    same object. ``find_by_ids`` only asks the wrapped repository for the IDs
+    not in the map. ``find_all`` and ``find_page`` return mapped instances in
+    place of the fresh copies for IDs already in the map. ``stream_all`` does
+    the same but does not map the aggregates it streams, so the map does not
+    grow with the table. After ``delete_by_id``, lookups of the ID return None
+    even if the wrapped repository defers the delete until its unit of work
+    commits.
+
+    Create the decorator together with the unit of work, for example per
+    request, and drop it with it. ``identity_map.hits`` and
+    ``identity_map.misses`` show how many lookups it saved.
+
+    Example:
+        >>> orders = AsyncIdentityMapRepository(SQLAlchemyOrderRepository(session))
+        >>> first = await orders.find_by_id(order_id)
+        >>> assert await orders.find_by_id(order_id) is first
+        >>> orders.identity_map.hits
+        1
+    """
+
+    def __init__(
+        self,
+        repository: AsyncRepository[TAggregateRoot, TId],
+        identity_map: Optional[IdentityMap[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads and stores aggregates
+            identity_map: The map to use. Defaults to a new, empty map.
+        """
+        self._repository = repository
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
+
+    async def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.identity_map.lookup(id)
+        except KeyError:
+            pass
+        loaded = await self._repository.find_by_id(id)
+        if loaded is None:
+            return None
+        return self.identity_map.add(id, loaded)
+
+    async def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _lookup_all(self.identity_map, ids)
+        if missing:
+            loaded = await self._repository.find_by_ids(missing)
+            _add_all(self.identity_map, found, loaded)
+        return _present(found)
+
+    async def save(self, aggregate: TAggregateRoot) -> None:
+        await self._repository.save(aggregate)
+        self.identity_map.replace(_id_of(aggregate), aggregate)
+
+    async def delete_by_id(self, id: TId) -> None:
+        await self._repository.delete_by_id(id)
+        self.identity_map.remove(id)
+
+    async def save_many(self, aggregates: Iterable[TAggregateRoot]) -> None:
+        aggregates = list(aggregates)
+        await self._repository.save_many(aggregates)
+        for aggregate in aggregates:
+            self.identity_map.replace(_id_of(aggregate), aggregate)
+
+    async def delete_by_ids(self, ids: Iterable[TId]) -> None:
+        ids = list(ids)
+        await self._repository.delete_by_ids(ids)
+        for id in ids:
+            self.identity_map.remove(id)
+
+    async def find_all(self) -> List[TAggregateRoot]:
+        return _map_all(self.identity_map, await self._repository.find_all())
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[TAggregateRoot]:
+        async for aggregate in self._repository.stream_all(batch_size):
+            resolved = self.identity_map.resolve(_id_of(aggregate), aggregate)
+            if resolved is not None:
+                yield resolved
+
+    async def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        page = await self._repository.find_page(after, limit)
+        return _map_page(self.identity_map, page)
+
+
+class SyncIdentityMapRepository(SyncRepository[TAggregateRoot, TId]):
+    """
+    Repository decorator that gives each aggregate one instance per scope.
+
+    This is the synchronous counterpart of AsyncIdentityMapRepository and
+    behaves the same way.
+
+    Example:
+        >>> orders = SyncIdentityMapRepository(SQLOrderRepository(connection))
+        >>> assert orders.find_by_id(order_id) is orders.find_by_id(order_id)
+    """
+
+    def __init__(
+        self,
+        repository: SyncRepository[TAggregateRoot, TId],
+        identity_map: Optional[IdentityMap[TAggregateRoot, TId]] = None,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            repository: The repository that loads and stores aggregates
+            identity_map: The map to use. Defaults to a new, empty map.
+        """
+        self._repository = repository
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
+
+    def find_by_id(self, id: TId) -> Optional[TAggregateRoot]:
+        try:
+            return self.identity_map.lookup(id)
+        except KeyError:
+            pass
+        loaded = self._repository.find_by_id(id)
+        if loaded is None:
+            return None
+        return self.identity_map.add(id, loaded)
+
+    def find_by_ids(self, ids: Iterable[TId]) -> Dict[TId, TAggregateRoot]:
+        found, missing = _lookup_all(self.identity_map, ids)
+        if missing:
+            _add_all(self.identity_map, found, self._repository.find_by_ids(missing))
+        return _present(found)
+
+    def save(self, aggregate: TAggregateRoot) -> None:
+        self._repository.save(aggregate)
+        self.identity_map.replace(_id_of(aggregate), aggregate)
+
+    def delete_by_id(self, id: TId) -> None:
+        self._repository.delete_by_id(id)
+        self.identity_map.remove(id)
+
+    def save_many(self, aggregates: Iterable[TAggregateRoot]) -> None:
+        aggregates = list(aggregates)
+        self._repository.save_many(aggregates)
+        for aggregate in aggregates:
+            self.identity_map.replace(_id_of(aggregate), aggregate)
+
+    def delete_by_ids(self, ids: Iterable[TId]) -> None:
+        ids = list(ids)
+        self._repository.delete_by_ids(ids)
+        for id in ids:
+            self.identity_map.remove(id)
+
+    def find_all(self) -> List[TAggregateRoot]:
+        return _map_all(self.identity_map, self._repository.find_all())
+
+    def stream_all(self, batch_size: int = 1000) -> Iterator[TAggregateRoot]:
+        for aggregate in self._repository.stream_all(batch_size):
+            resolved = self.identity_map.resolve(_id_of(aggregate), aggregate)
+            if resolved is not None:
+                yield resolved
+
+    def find_page(
+        self, after: Optional[str] = None, limit: int = 50
+    ) -> Page[TAggregateRoot]:
+        return _map_page(self.identity_map, self._repository.find_page(after, limit))
+
+
+def _id_of(aggregate: Any) -> Any:
+    return aggregate.id
+
+
+def _map_all(
+    identity_map: IdentityMap[TAggregateRoot, TId], aggregates: List[TAggregateRoot]
+) -> List[TAggregateRoot]:
+    mapped = [
+        identity_map.add(_id_of(aggregate), aggregate) for aggregate in aggregates
+    ]
+    return [aggregate for aggregate in mapped if aggregate is not None]
+
+
+def _map_page(
+    identity_map: IdentityMap[TAggregateRoot, TId], page: Page[TAggregateRoot]
+) -> Page[TAggregateRoot]:
+    return Page(_map_all(identity_map, page.items), page.next_cursor)
+
+
+def _lookup_all(
+    identity_map: IdentityMap[TAggregateRoot, TId], ids: Iterable[TId]
+) -> Tuple[Dict[TId, Optional[TAggregateRoot]], List[TId]]:
+    found: Dict[TId, Optional[TAggregateRoot]] = {}
+    missing: List[TId] = []
+    for id in dict.fromkeys(ids):
+        try:
+            found[id] = identity_map.lookup(id)
+        except KeyError:
+            found[id] = None
+            missing.append(id)
+    return found, missing
+
+
+def _add_all(
+    identity_map: IdentityMap[TAggregateRoot, TId],
+    found: Dict[TId, Optional[TAggregateRoot]],
+    loaded: Dict[TId, TAggregateRoot],
+) -> None:
+    for id, aggregate in loaded.items():
+        found[id] = identity_map.add(id, aggregate)
+
+
+def _present(
+    found: Dict[TId, Optional[TAggregateRoot]],
+) -> Dict[TId, TAggregateRoot]:
+    return {id: aggregate for id, aggregate in found.items() if aggregate is not None}
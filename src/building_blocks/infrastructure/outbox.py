@@ -0,0 +1,209 @@
+"""
+Transactional outbox building blocks.
+
+This module provides OutboxUnitOfWork, a unit of work base that stores the
+events of the aggregates it tracks in an outbox as part of the transaction,
+and OutboxRelay, which drains the outbox to an event publisher.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import abstractmethod
+from typing import Any, List, Optional
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+)
+from building_blocks.application.ports.outbound.outbox import AsyncOutbox
+from building_blocks.application.ports.outbound.unit_of_work import AsyncUnitOfWork
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.event_collector import current_event_collector
+from building_blocks.domain.messages.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxUnitOfWork(AsyncUnitOfWork):
+    """
+    Unit of work that writes domain events to an outbox in its transaction.
+
+    Aggregates changed during the unit of work are passed to ``track``. On
+    commit, their uncommitted changes are added to the outbox, then the
+    transaction is committed, then the aggregates' changes are marked as
+    committed. The events therefore become visible to the relay exactly when
+    the state changes do, and no broker is contacted while the request is
+    being served.
+
+    Subclasses implement ``_commit_transaction`` and ``_rollback_transaction``
+    for their storage, and must give the outbox the same transaction as the
+    repositories.
+
+    Example:
+        >>> class SQLAlchemyOutboxUnitOfWork(OutboxUnitOfWork):
+        ...     def __init__(self, session: AsyncSession) -> None:
+        ...         super().__init__(SQLAlchemyOutbox(session))
+        ...         self._session = session
+        ...
+        ...     async def _commit_transaction(self) -> None:
+        ...         await self._session.commit()
+        ...
+        ...     async def _rollback_transaction(self) -> None:
+        ...         await self._session.rollback()
+    """
+
+    def __init__(self, outbox: AsyncOutbox[Event]) -> None:
+        """
+        Initialize the unit of work.
+
+        Args:
+            outbox: Outbox bound to this unit of work's transaction
+        """
+        self._outbox = outbox
+        self._tracked: List[AggregateRoot[Any]] = []
+
+    def track(self, aggregate: AggregateRoot[Any]) -> None:
+        """
+        Include an aggregate's uncommitted changes in the next commit.
+
+        Tracking the same aggregate twice has no effect.
+
+        Args:
+            aggregate: An aggregate changed in this unit of work
+        """
+        if not any(tracked is aggregate for tracked in self._tracked):
+            self._tracked.append(aggregate)
+
+    async def commit(self) -> None:
+        """
+        Store the tracked aggregates' events in the outbox and commit.
+
+        The aggregates' changes are only marked as committed once the
+        transaction has been committed. The events are withdrawn from the
+        active ``EventCollector``, if any, since the relay publishes them. If
+        storing the events or the commit fails, the unit of work is rolled
+        back and the error is raised.
+        """
+        events = [
+            event
+            for aggregate in self._tracked
+            for event in aggregate.uncommitted_changes_view()
+        ]
+        try:
+            if events:
+                await self._outbox.add_all(events)
+            await self._commit_transaction()
+        except Exception:
+            await self.rollback()
+            raise
+        if events:
+            collector = current_event_collector()
+            if collector is not None:
+                collector.discard(events)
+        for aggregate in self._tracked:
+            aggregate.mark_changes_as_committed()
+        self._tracked.clear()
+
+    async def rollback(self) -> None:
+        """Roll back the transaction and forget the tracked aggregates."""
+        self._tracked.clear()
+        await self._rollback_transaction()
+
+    @abstractmethod
+    async def _commit_transaction(self) -> None:
+        """Commit the underlying transaction."""
+
+    @abstractmethod
+    async def _rollback_transaction(self) -> None:
+        """Roll back the underlying transaction."""
+
+
+class OutboxRelay:
+    """
+    Moves events from an outbox to an event publisher, in batches.
+
+    Each pass reads up to ``batch_size`` pending entries, publishes their
+    events with one ``publish_many`` call and marks the entries as published.
+    Delivery is at least once: if the process stops between publishing and
+    marking, the batch is published again by the next pass, so consumers
+    should deduplicate on the event ID.
+
+    Run ``run`` as a background task, or call ``relay_once`` from a scheduler.
+
+    Example:
+        >>> relay = OutboxRelay(SQLAlchemyOutbox(session), KafkaEventPublisher(...))
+        >>> stop = asyncio.Event()
+        >>> task = asyncio.create_task(relay.run(stop))
+    """
+
+    def __init__(
+        self,
+        outbox: AsyncOutbox[Event],
+        publisher: AsyncEventPublisher[Event],
+        batch_size: int = 500,
+        poll_interval_ms: float = 200.0,
+    ) -> None:
+        """
+        Initialize the relay.
+
+        Args:
+            outbox: The outbox to drain
+            publisher: Where the events are published
+            batch_size: Maximum number of events read and published per pass
+            poll_interval_ms: Pause after a pass that found fewer than
+                ``batch_size`` entries, or failed
+
+        Raises:
+            ValueError: If batch_size is less than 1 or poll_interval_ms is
+                negative
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if poll_interval_ms < 0:
+            raise ValueError(
+                f"poll_interval_ms cannot be negative, got {poll_interval_ms}"
+            )
+        self._outbox = outbox
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval_ms / 1000
+
+    async def relay_once(self) -> int:
+        """
+        Publish one batch of pending events.
+
+        Returns:
+            int: The number of events published
+        """
+        entries = await self._outbox.fetch_pending(self._batch_size)
+        if not entries:
+            return 0
+        await self._publisher.publish_many([entry.event for entry in entries])
+        await self._outbox.mark_published(entries)
+        return len(entries)
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """
+        Relay events until ``stop`` is set.
+
+        Full batches are followed immediately by the next pass, so a backlog
+        drains at full speed; otherwise the relay waits for the poll interval.
+        Errors are logged and the pass is retried after the poll interval.
+
+        Args:
+            stop: Event that ends the loop when set. Without it, the loop runs
+                until cancelled.
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                relayed = await self.relay_once()
+            except Exception:
+                logger.exception("Failed to relay outbox events")
+                relayed = 0
+            if relayed < self._batch_size:
+                try:
+                    await asyncio.wait_for(stop.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
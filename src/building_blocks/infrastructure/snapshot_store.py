@@ -0,0 +1,336 @@
+"""
+Snapshot stores.
+
+This module provides snapshot stores for event-sourced aggregates: in-memory
+stores that keep the most recently used snapshots, and file stores that keep
+one compact binary file per aggregate on local disk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from building_blocks.application.ports.outbound.snapshot_store import (
+    AsyncSnapshotStore,
+    SyncSnapshotStore,
+)
+from building_blocks.domain.aggregate_root import AggregateVersion
+from building_blocks.domain.event_sourced_aggregate_root import Snapshot
+from building_blocks.domain.messages.codec import decode_value, encode_value
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct(">Bq")
+_SUFFIX = ".snapshot"
+
+
+class _SnapshotLRU:
+    """Latest snapshot per aggregate, evicting the least recently used."""
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self._max_size = max_size
+        self._snapshots: OrderedDict[Any, Snapshot] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def save(self, snapshot: Snapshot) -> None:
+        stored = self._snapshots.get(snapshot.aggregate_id)
+        if stored is not None and stored.version.value >= snapshot.version.value:
+            return
+        self._snapshots[snapshot.aggregate_id] = snapshot
+        self._snapshots.move_to_end(snapshot.aggregate_id)
+        if len(self._snapshots) > self._max_size:
+            self._snapshots.popitem(last=False)
+
+    def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        snapshot = self._snapshots.get(aggregate_id)
+        if snapshot is not None:
+            self._snapshots.move_to_end(aggregate_id)
+        return snapshot
+
+
+class _SnapshotFiles:
+    """One file per aggregate: a header with the version, then the snapshot."""
+
+    def __init__(self, directory: StrPath) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def save(self, snapshot: Snapshot) -> None:
+        version = snapshot.version.value
+        data = _HEADER.pack(FORMAT_VERSION, version) + encode_value(
+            [snapshot.aggregate_id, snapshot.state]
+        )
+        path = self._path(snapshot.aggregate_id)
+        with self._lock:
+            stored = self._stored_version(path)
+            if stored is not None and stored >= version:
+                return
+            # Write a temporary file and rename it over the old one, so a
+            # crash leaves either snapshot whole and never a torn one.
+            fd, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with open(fd, "wb") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        path = self._path(aggregate_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            format_version, version = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Malformed snapshot file {path}: {e}") from e
+        if format_version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot format version {format_version} in {path}"
+            )
+        value = decode_value(memoryview(data)[_HEADER.size :])
+        if not isinstance(value, list) or len(value) != 2:
+            raise ValueError(f"Malformed snapshot file {path}")
+        stored_id, state = value
+        if stored_id != aggregate_id:
+            # Two IDs with the same digest; the file belongs to the other one.
+            return None
+        return Snapshot(aggregate_id, AggregateVersion.of(version), state)
+
+    def _path(self, aggregate_id: Any) -> Path:
+        digest = hashlib.blake2b(encode_value(aggregate_id), digest_size=16)
+        return self._directory / (digest.hexdigest() + _SUFFIX)
+
+    @staticmethod
+    def _stored_version(path: Path) -> Optional[int]:
+        try:
+            with open(path, "rb") as file:
+                header = file.read(_HEADER.size)
+        except FileNotFoundError:
+            return None
+        if len(header) < _HEADER.size:
+            return None
+        version: int = _HEADER.unpack(header)[1]
+        return version
+
+
+class AsyncInMemorySnapshotStore(AsyncSnapshotStore):
+    """
+    Snapshot store in process memory, bounded to the most recently used.
+
+    Keeps the latest snapshot of up to ``max_size`` aggregates and evicts the
+    least recently saved or loaded one beyond that. Snapshots are kept as
+    they are, without serialization: restoring one copies its state, so
+    several aggregates can be restored from the same snapshot.
+
+    Example:
+        >>> repository = AsyncEventSourcedRepository(
+        ...     Account, event_store, AsyncInMemorySnapshotStore(max_size=1_000)
+        ... )
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            max_size: Maximum number of aggregates with a stored snapshot
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        self._snapshots = _SnapshotLRU(max_size)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    async def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+        """
+        self._snapshots.save(snapshot)
+
+    async def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+        """
+        return self._snapshots.load(aggregate_id)
+
+
+class SyncInMemorySnapshotStore(SyncSnapshotStore):
+    """
+    Snapshot store in process memory, bounded to the most recently used.
+
+    Keeps the latest snapshot of up to ``max_size`` aggregates and evicts the
+    least recently saved or loaded one beyond that. Snapshots are kept as
+    they are, without serialization. The store is not thread-safe.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            max_size: Maximum number of aggregates with a stored snapshot
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        self._snapshots = _SnapshotLRU(max_size)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+        """
+        self._snapshots.save(snapshot)
+
+    def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+        """
+        return self._snapshots.load(aggregate_id)
+
+
+class AsyncFileSnapshotStore(AsyncSnapshotStore):
+    """
+    Snapshot store on local disk, one file per aggregate.
+
+    Each file holds a small header with the aggregate version, then the
+    aggregate ID and state in the MessageCodec value format: a compact
+    binary encoding that is read back without going through JSON. The state
+    must therefore only hold None, bool, int, float, str, bytes, Decimal,
+    UUID, datetime, and lists and dicts of them; tuples come back as lists.
+    Aggregates with other attributes override ``_snapshot_state`` and
+    ``_restore_state`` to convert them.
+
+    A snapshot replaces the previous file atomically, after it is synced to
+    disk. File operations run in the default executor.
+
+    Example:
+        >>> repository = AsyncEventSourcedRepository(
+        ...     Account, event_store, AsyncFileSnapshotStore("var/snapshots/account")
+        ... )
+    """
+
+    def __init__(self, directory: StrPath) -> None:
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Directory of the snapshot files
+        """
+        self._files = _SnapshotFiles(directory)
+
+    async def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+
+        Raises:
+            TypeError: If the ID or state holds a value of an unsupported type
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._files.save, snapshot)
+
+    async def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+
+        Raises:
+            ValueError: If the snapshot file is malformed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._files.load, aggregate_id)
+
+
+class SyncFileSnapshotStore(SyncSnapshotStore):
+    """
+    Snapshot store on local disk, one file per aggregate.
+
+    Uses the same compact binary files as AsyncFileSnapshotStore; see it for
+    the format and the supported state types. The store is thread-safe.
+    """
+
+    def __init__(self, directory: StrPath) -> None:
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Directory of the snapshot files
+        """
+        self._files = _SnapshotFiles(directory)
+
+    def save(self, snapshot: Snapshot) -> None:
+        """
+        Store a snapshot unless a later one is stored for its aggregate.
+
+        Args:
+            snapshot: The snapshot to store
+
+        Raises:
+            TypeError: If the ID or state holds a value of an unsupported type
+        """
+        self._files.save(snapshot)
+
+    def load(self, aggregate_id: Any) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: ID of the aggregate
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if none is stored
+
+        Raises:
+            ValueError: If the snapshot file is malformed
+        """
+        return self._files.load(aggregate_id)
@@ -0,0 +1,446 @@
+"""
+Change-tracking unit of work.
+
+This module provides TrackingUnitOfWork and SyncTrackingUnitOfWork, units of
+work that record which aggregates were created, changed or removed and write
+them all at commit, in one transaction and with one bulk statement per
+aggregate type and kind of change. AsyncAggregateWriter and
+SyncAggregateWriter are the per-type contracts they write through.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Generic, Hashable, List, Sequence, Tuple, Type, TypeVar
+
+from building_blocks.application.ports.outbound.unit_of_work import (
+    AsyncUnitOfWork,
+    SyncUnitOfWork,
+)
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.infrastructure.caching_repository import AggregateCache
+
+TAggregate = TypeVar("TAggregate", bound=AggregateRoot[Any])
+
+_NEW = "new"
+_DIRTY = "dirty"
+_REMOVED = "removed"
+
+
+class AsyncAggregateWriter(ABC, Generic[TAggregate]):
+    """
+    Writes aggregates of one type in bulk.
+
+    Each method receives every aggregate of its kind registered in the unit of
+    work and should write them with as few statements as the storage allows,
+    such as one multi-row INSERT. The unit of work calls them inside its
+    transaction, so they must not commit.
+    """
+
+    @abstractmethod
+    async def insert_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Insert new aggregates.
+
+        Store ``aggregate.version`` plus one as the row version: it is the
+        version the aggregate has once the unit of work commits, and the
+        version the next update of the aggregate will expect.
+
+        Args:
+            aggregates: The aggregates registered as new, in registration order
+        """
+
+    @abstractmethod
+    async def update_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Update existing aggregates, checking their versions.
+
+        Each aggregate should only be written if its stored version still
+        equals ``aggregate.version``, typically with
+        ``UPDATE ... SET version = version + 1 WHERE id = ? AND version = ?``
+        run for the whole batch, and the update fails if any row was not
+        written. The check replaces row locks held while the use case runs.
+
+        Args:
+            aggregates: The aggregates registered as dirty, in registration order
+
+        Raises:
+            ConcurrencyError: If the stored version of any aggregate no longer
+                matches its version
+        """
+
+    @abstractmethod
+    async def delete_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Delete existing aggregates.
+
+        Args:
+            aggregates: The aggregates registered as removed, in registration
+                order
+        """
+
+
+class SyncAggregateWriter(ABC, Generic[TAggregate]):
+    """
+    Writes aggregates of one type in bulk.
+
+    This is the synchronous counterpart of AsyncAggregateWriter, written
+    through by SyncTrackingUnitOfWork, and has the same contract.
+    """
+
+    @abstractmethod
+    def insert_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Insert new aggregates, storing ``aggregate.version`` plus one.
+
+        Args:
+            aggregates: The aggregates registered as new, in registration order
+        """
+
+    @abstractmethod
+    def update_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Update existing aggregates, checking their versions.
+
+        Args:
+            aggregates: The aggregates registered as dirty, in registration order
+
+        Raises:
+            ConcurrencyError: If the stored version of any aggregate no longer
+                matches its version
+        """
+
+    @abstractmethod
+    def delete_many(self, aggregates: Sequence[TAggregate]) -> None:
+        """
+        Delete existing aggregates.
+
+        Args:
+            aggregates: The aggregates registered as removed, in registration
+                order
+        """
+
+
+class _ChangeTracker:
+    """Registrations shared by TrackingUnitOfWork and SyncTrackingUnitOfWork."""
+
+    def __init__(self) -> None:
+        """Initialize a unit of work with no writers and no registrations."""
+        self._writers: Dict[Type[Any], Any] = {}
+        self._resolved: Dict[Type[Any], Type[Any]] = {}
+        self._caches: Dict[Type[Any], AggregateCache[Any, Any]] = {}
+        self._changes: Dict[Tuple[Type[Any], Hashable], Tuple[str, Any]] = {}
+
+    def add_cache(
+        self, aggregate_type: Type[TAggregate], cache: AggregateCache[TAggregate, Any]
+    ) -> None:
+        """
+        Keep a cache of an aggregate type fresh at every commit.
+
+        Once a transaction is committed, the cache gets ``on_saved`` for each
+        aggregate of the type written and ``on_deleted`` for each one removed.
+
+        Args:
+            aggregate_type: The aggregate class, as passed to ``add_writer``
+            cache: The cache serving reads of that type
+
+        Raises:
+            ValueError: If no writer is set for the aggregate type
+        """
+        if aggregate_type not in self._writers:
+            raise ValueError(f"No writer registered for {aggregate_type.__name__}")
+        self._caches[aggregate_type] = cache
+
+    def register_new(self, aggregate: AggregateRoot[Any]) -> None:
+        """
+        Insert an aggregate at the next commit.
+
+        Args:
+            aggregate: An aggregate created in this unit of work
+
+        Raises:
+            ValueError: If no writer handles the aggregate's type, or the
+                aggregate is registered as dirty or removed
+        """
+        key = self._key(aggregate)
+        state = self._state(key)
+        if state is None or state == _NEW:
+            self._changes[key] = (_NEW, aggregate)
+        elif state == _DIRTY:
+            raise ValueError(f"{key[0].__name__} {key[1]!r} is already stored")
+        else:
+            self._raise_removed(key)
+
+    def register_dirty(self, aggregate: AggregateRoot[Any]) -> None:
+        """
+        Update an aggregate at the next commit.
+
+        Args:
+            aggregate: A stored aggregate changed in this unit of work
+
+        Raises:
+            ValueError: If no writer handles the aggregate's type, or the
+                aggregate is registered as removed
+        """
+        key = self._key(aggregate)
+        state = self._state(key)
+        if state is None:
+            self._changes[key] = (_DIRTY, aggregate)
+        elif state == _REMOVED:
+            self._raise_removed(key)
+
+    def register_removed(self, aggregate: AggregateRoot[Any]) -> None:
+        """
+        Delete an aggregate at the next commit.
+
+        Args:
+            aggregate: A stored aggregate removed in this unit of work
+
+        Raises:
+            ValueError: If no writer handles the aggregate's type
+        """
+        key = self._key(aggregate)
+        if self._state(key) == _NEW:
+            del self._changes[key]
+        else:
+            self._changes[key] = (_REMOVED, aggregate)
+
+    def _add_writer(self, aggregate_type: Type[Any], writer: Any) -> None:
+        if aggregate_type in self._writers:
+            raise ValueError(
+                f"A writer is already registered for {aggregate_type.__name__}"
+            )
+        self._writers[aggregate_type] = writer
+        self._resolved.clear()
+
+    def _key(self, aggregate: AggregateRoot[Any]) -> Tuple[Type[Any], Hashable]:
+        aggregate_type = type(aggregate)
+        writer_type = self._resolved.get(aggregate_type)
+        if writer_type is None:
+            writer_type = self._resolve(aggregate_type)
+        return writer_type, aggregate.id
+
+    def _resolve(self, aggregate_type: Type[Any]) -> Type[Any]:
+        for cls in aggregate_type.__mro__:
+            if cls in self._writers:
+                self._resolved[aggregate_type] = cls
+                return cls
+        raise ValueError(f"No writer registered for {aggregate_type.__name__}")
+
+    def _state(self, key: Tuple[Type[Any], Hashable]) -> Any:
+        change = self._changes.get(key)
+        return None if change is None else change[0]
+
+    def _raise_removed(self, key: Tuple[Type[Any], Hashable]) -> None:
+        raise ValueError(f"{key[0].__name__} {key[1]!r} is registered as removed")
+
+    def _buckets(self) -> List[Tuple[Any, Dict[str, List[Any]]]]:
+        buckets: Dict[Type[Any], Dict[str, List[Any]]] = {
+            aggregate_type: {_NEW: [], _DIRTY: [], _REMOVED: []}
+            for aggregate_type in self._writers
+        }
+        for (aggregate_type, _), (state, aggregate) in self._changes.items():
+            buckets[aggregate_type][state].append(aggregate)
+        return [
+            (self._writers[aggregate_type], bucket)
+            for aggregate_type, bucket in buckets.items()
+        ]
+
+    def _mark_committed(self) -> None:
+        for (aggregate_type, _), (state, aggregate) in self._changes.items():
+            aggregate.mark_changes_as_committed()
+            cache = self._caches.get(aggregate_type)
+            if cache is None:
+                continue
+            if state == _REMOVED:
+                cache.on_deleted(aggregate.id)
+            else:
+                cache.on_saved(aggregate)
+        self._changes.clear()
+
+
+class TrackingUnitOfWork(_ChangeTracker, AsyncUnitOfWork):
+    """
+    Unit of work that tracks aggregate changes and flushes them in bulk.
+
+    Use cases register the aggregates they create, change or remove with
+    ``register_new``, ``register_dirty`` and ``register_removed`` instead of
+    writing them one at a time. Nothing is written until ``commit``, which
+    groups the registered aggregates by type and hands each group to the
+    writer registered for that type, so saving N aggregates of one type costs
+    one ``insert_many`` or ``update_many`` call rather than N statements and N
+    commits.
+
+    Writers are flushed in the order they were added with ``add_writer``:
+    inserts for every type first, then updates, then deletes in reverse order.
+    Add the writer of a referenced aggregate before the writers of the
+    aggregates that reference it and foreign keys hold at every step.
+
+    Registrations combine the way a unit of work expects:
+
+    - registering a new aggregate as dirty keeps it new;
+    - removing a new aggregate drops it, since it was never stored;
+    - removing a dirty aggregate only deletes it;
+    - registering a dirty aggregate as new, or a removed aggregate as new or
+      dirty, raises ValueError.
+
+    Aggregates are identified by their type and ID. After the transaction is
+    committed, their changes are marked as committed and the caches added
+    with ``add_cache`` drop the entries of the aggregates written. Subclasses
+    implement ``_commit_transaction`` and ``_rollback_transaction`` for their
+    storage, and the writers must share that transaction.
+
+    Example:
+        >>> class SQLAlchemyUnitOfWork(TrackingUnitOfWork):
+        ...     def __init__(self, session: AsyncSession) -> None:
+        ...         super().__init__()
+        ...         self._session = session
+        ...         self.add_writer(User, SQLAlchemyUserWriter(session))
+        ...         self.add_writer(Task, SQLAlchemyTaskWriter(session))
+        ...         self.add_cache(User, user_cache)
+        ...
+        ...     async def _commit_transaction(self) -> None:
+        ...         await self._session.commit()
+        ...
+        ...     async def _rollback_transaction(self) -> None:
+        ...         await self._session.rollback()
+        >>> async with SQLAlchemyUnitOfWork(session) as uow:
+        ...     for task in tasks:
+        ...         uow.register_new(task)
+    """
+
+    def add_writer(
+        self, aggregate_type: Type[TAggregate], writer: AsyncAggregateWriter[TAggregate]
+    ) -> None:
+        """
+        Set the writer for an aggregate type and its subclasses.
+
+        Args:
+            aggregate_type: The aggregate class the writer stores
+            writer: Writer sharing this unit of work's transaction
+
+        Raises:
+            ValueError: If a writer is already set for the aggregate type
+        """
+        self._add_writer(aggregate_type, writer)
+
+    async def commit(self) -> None:
+        """
+        Write the registered changes and commit the transaction.
+
+        The aggregates' changes are only marked as committed, and the caches
+        updated, once the transaction has been committed. If a writer or the
+        commit fails, the unit of work is rolled back and the error is raised.
+        """
+        try:
+            await self._flush()
+            await self._commit_transaction()
+        except Exception:
+            await self.rollback()
+            raise
+        self._mark_committed()
+
+    async def rollback(self) -> None:
+        """Roll back the transaction and forget the registered changes."""
+        self._changes.clear()
+        await self._rollback_transaction()
+
+    @abstractmethod
+    async def _commit_transaction(self) -> None:
+        """Commit the underlying transaction."""
+
+    @abstractmethod
+    async def _rollback_transaction(self) -> None:
+        """Roll back the underlying transaction."""
+
+    async def _flush(self) -> None:
+        buckets = self._buckets()
+        for writer, bucket in buckets:
+            if bucket[_NEW]:
+                await writer.insert_many(bucket[_NEW])
+        for writer, bucket in buckets:
+            if bucket[_DIRTY]:
+                await writer.update_many(bucket[_DIRTY])
+        for writer, bucket in reversed(buckets):
+            if bucket[_REMOVED]:
+                await writer.delete_many(bucket[_REMOVED])
+
+
+class SyncTrackingUnitOfWork(_ChangeTracker, SyncUnitOfWork):
+    """
+    Unit of work that tracks aggregate changes and flushes them in bulk.
+
+    This is the synchronous counterpart of TrackingUnitOfWork, writing through
+    SyncAggregateWriter, and behaves the same way.
+
+    Example:
+        >>> class SQLAlchemyUnitOfWork(SyncTrackingUnitOfWork):
+        ...     def __init__(self, session: Session) -> None:
+        ...         super().__init__()
+        ...         self._session = session
+        ...         self.add_writer(User, SQLAlchemyUserWriter(session))
+        ...
+        ...     def _commit_transaction(self) -> None:
+        ...         self._session.commit()
+        ...
+        ...     def _rollback_transaction(self) -> None:
+        ...         self._session.rollback()
+        >>> with SQLAlchemyUnitOfWork(session) as uow:
+        ...     uow.register_new(user)
+    """
+
+    def add_writer(
+        self, aggregate_type: Type[TAggregate], writer: SyncAggregateWriter[TAggregate]
+    ) -> None:
+        """
+        Set the writer for an aggregate type and its subclasses.
+
+        Args:
+            aggregate_type: The aggregate class the writer stores
+            writer: Writer sharing this unit of work's transaction
+
+        Raises:
+            ValueError: If a writer is already set for the aggregate type
+        """
+        self._add_writer(aggregate_type, writer)
+
+    def commit(self) -> None:
+        """
+        Write the registered changes and commit the transaction.
+
+        The aggregates' changes are only marked as committed, and the caches
+        updated, once the transaction has been committed. If a writer or the
+        commit fails, the unit of work is rolled back and the error is raised.
+        """
+        try:
+            self._flush()
+            self._commit_transaction()
+        except Exception:
+            self.rollback()
+            raise
+        self._mark_committed()
+
+    def rollback(self) -> None:
+        """Roll back the transaction and forget the registered changes."""
+        self._changes.clear()
+        self._rollback_transaction()
+
+    @abstractmethod
+    def _commit_transaction(self) -> None:
+        """Commit the underlying transaction."""
+
+    @abstractmethod
+    def _rollback_transaction(self) -> None:
+        """Roll back the underlying transaction."""
+
+    def _flush(self) -> None:
+        buckets = self._buckets()
+        for writer, bucket in buckets:
+            if bucket[_NEW]:
+                writer.insert_many(bucket[_NEW])
+        for writer, bucket in buckets:
+            if bucket[_DIRTY]:
+                writer.update_many(bucket[_DIRTY])
+        for writer, bucket in reversed(buckets):
+            if bucket[_REMOVED]:
+                writer.delete_many(bucket[_REMOVED])
@@ -0,0 +1,196 @@
+"""
+Unit tests for the event_publishing_use_case module.
+
+Tests for AsyncEventPublishingUseCase and SyncEventPublishingUseCase classes.
+"""
+
+from typing import Any, Iterable, List
+
+import pytest
+
+from building_blocks.application.ports.inbound.use_case import (
+    AsyncUseCase,
+    SyncUseCase,
+)
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+    SyncEventPublisher,
+)
+from building_blocks.application.ports.outbound.unit_of_work import AsyncUnitOfWork
+from building_blocks.application.services.event_publishing_use_case import (
+    AsyncEventPublishingUseCase,
+    SyncEventPublishingUseCase,
+)
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.messages.event import Event
+
+
+class FakeSomethingHappened(Event):
+    """A fake event naming what happened."""
+
+    what: str
+
+
+class FakeAggregate(AggregateRoot[int]):
+    """A fake aggregate recording events."""
+
+    def happen(self, what: str) -> None:
+        self.record_event(FakeSomethingHappened(what=what))
+
+
+class FakeAsyncUnitOfWork(AsyncUnitOfWork):
+    """Marks the tracked aggregates committed, unless told to fail."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.tracked: List[AggregateRoot[Any]] = []
+
+    async def commit(self) -> None:
+        if self.fail:
+            raise ConnectionError("commit failed")
+        for aggregate in self.tracked:
+            aggregate.mark_changes_as_committed()
+        self.tracked.clear()
+
+    async def rollback(self) -> None:
+        self.tracked.clear()
+
+
+class FakeAsyncUseCase(AsyncUseCase[List[str], int]):
+    """Records one event per request item on two aggregates, in turn."""
+
+    def __init__(self, uow: FakeAsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def execute(self, request: List[str]) -> int:
+        aggregates = [FakeAggregate(1), FakeAggregate(2)]
+        async with self.uow:
+            for i, what in enumerate(request):
+                if what == "fail":
+                    raise ValueError("use case failed")
+                aggregates[i % 2].happen(what)
+            self.uow.tracked.extend(aggregates)
+        return len(request)
+
+
+class FakeForgivingAsyncUseCase(FakeAsyncUseCase):
+    """Handles a failed commit and returns normally."""
+
+    async def execute(self, request: List[str]) -> int:
+        try:
+            return await super().execute(request)
+        except ConnectionError:
+            return 0
+
+
+class FakeSyncUseCase(SyncUseCase[List[str], int]):
+    """Records one event per request item, then commits."""
+
+    def execute(self, request: List[str]) -> int:
+        aggregate = FakeAggregate(1)
+        for what in request:
+            aggregate.happen(what)
+        aggregate.mark_changes_as_committed()
+        return len(request)
+
+
+class FakeAsyncPublisher(AsyncEventPublisher[Event]):
+    """Publisher recording each batch it receives."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    async def publish(self, event: Event) -> None:
+        await self.publish_many([event])
+
+    async def publish_many(self, events: Iterable[Event]) -> None:
+        self.batches.append([event.payload["what"] for event in events])
+
+
+class FakeSyncPublisher(SyncEventPublisher[Event]):
+    """Publisher recording each batch it receives."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def publish(self, event: Event) -> None:
+        self.publish_many([event])
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        self.batches.append([event.payload["what"] for event in events])
+
+
+class TestAsyncEventPublishingUseCase:
+    """Tests for AsyncEventPublishingUseCase class."""
+
+    async def test_execute_when_aggregates_record_events_then_publishes_one_batch(
+        self,
+    ):
+        publisher = FakeAsyncPublisher()
+        use_case = AsyncEventPublishingUseCase(
+            FakeAsyncUseCase(FakeAsyncUnitOfWork()), publisher
+        )
+
+        response = await use_case.execute(["a", "b", "c"])
+
+        assert response == 3
+        assert publisher.batches == [["a", "b", "c"]]
+
+    async def test_execute_when_no_events_then_publishes_nothing(self):
+        publisher = FakeAsyncPublisher()
+        use_case = AsyncEventPublishingUseCase(
+            FakeAsyncUseCase(FakeAsyncUnitOfWork()), publisher
+        )
+
+        await use_case.execute([])
+
+        assert publisher.batches == []
+
+    async def test_execute_when_use_case_raises_then_publishes_nothing(self):
+        publisher = FakeAsyncPublisher()
+        use_case = AsyncEventPublishingUseCase(
+            FakeAsyncUseCase(FakeAsyncUnitOfWork()), publisher
+        )
+
+        with pytest.raises(ValueError, match="use case failed"):
+            await use_case.execute(["a", "fail"])
+
+        assert publisher.batches == []
+
+    async def test_execute_when_use_case_handles_failed_commit_then_publishes_nothing(
+        self,
+    ):
+        publisher = FakeAsyncPublisher()
+        use_case = AsyncEventPublishingUseCase(
+            FakeForgivingAsyncUseCase(FakeAsyncUnitOfWork(fail=True)), publisher
+        )
+
+        response = await use_case.execute(["a", "b"])
+
+        assert response == 0
+        assert publisher.batches == []
+
+    async def test_execute_when_changes_not_committed_then_publishes_nothing(self):
+        class FakeUncommittedUseCase(AsyncUseCase[List[str], int]):
+            async def execute(self, request: List[str]) -> int:
+                FakeAggregate(1).happen("a")
+                return 1
+
+        publisher = FakeAsyncPublisher()
+        use_case = AsyncEventPublishingUseCase(FakeUncommittedUseCase(), publisher)
+
+        await use_case.execute(["a"])
+
+        assert publisher.batches == []
+
+
+class TestSyncEventPublishingUseCase:
+    """Tests for SyncEventPublishingUseCase class."""
+
+    def test_execute_when_aggregates_record_events_then_publishes_one_batch(self):
+        publisher = FakeSyncPublisher()
+        use_case = SyncEventPublishingUseCase(FakeSyncUseCase(), publisher)
+
+        assert use_case.execute(["a", "b"]) == 2
+        assert use_case.execute([]) == 0
+        assert publisher.batches == [["a", "b"]]
@@ -0,0 +1,25 @@
+import pytest
+
+from building_blocks.domain.errors import ConcurrencyError, DomainError
+
+
+class TestConcurrencyError:
+    def test_initialization_with_one_conflict(self):
+        error = ConcurrencyError("Task", {42: 3})
+
+        assert error.aggregate_type == "Task"
+        assert error.conflicts == {42: 3}
+        assert str(error) == "Task 42 was changed concurrently, expected version 3"
+
+    def test_initialization_with_several_conflicts(self):
+        error = ConcurrencyError("Task", {42: 3, 43: 1})
+
+        assert str(error) == "2 Task aggregates were changed concurrently: 42, 43"
+
+    def test_initialization_without_conflicts_raises_value_error(self):
+        with pytest.raises(ValueError, match="conflicts cannot be empty"):
+            ConcurrencyError("Task", {})
+
+    def test_is_a_domain_error(self):
+        with pytest.raises(DomainError):
+            raise ConcurrencyError("Task", {42: 3})
@@ -0,0 +1,421 @@
+"""
+Unit tests for the codec module.
+
+Tests for MessageCodec class.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from building_blocks.domain.messages.codec import (
+    MAX_DEPTH,
+    MessageCodec,
+    decode_value,
+    encode_value,
+)
+from building_blocks.domain.messages.command import Command
+from building_blocks.domain.messages.event import Event
+from building_blocks.domain.messages.message import MessageMetadata
+
+
+class FakeOrderPlaced(Event):
+    """A fake event whose constructor mirrors its payload."""
+
+    def __init__(
+        self,
+        order_id: str,
+        lines: list,
+        total: Decimal,
+        metadata: Optional[MessageMetadata] = None,
+    ):
+        super().__init__(metadata)
+        self._order_id = order_id
+        self._lines = lines
+        self._total = total
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return {"order_id": self._order_id, "lines": self._lines, "total": self._total}
+
+
+class FakeRenameCustomer(Command):
+    """A fake command whose payload keys differ from its constructor."""
+
+    def __init__(self, name: str, metadata: Optional[MessageMetadata] = None):
+        super().__init__(metadata)
+        self.name = name
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return {"new_name": self.name}
+
+
+class FakeAnything(Event):
+    """A fake event carrying an arbitrary payload value."""
+
+    def __init__(self, value: Any, metadata: Optional[MessageMetadata] = None):
+        super().__init__(metadata)
+        self.value = value
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+
+class FakeTaskCreated(Event):
+    """A fake event declaring its fields as annotations."""
+
+    task_id: UUID
+    title: str
+
+
+class FakeVersionedOrderRenamed(Event):
+    """A fake event overriding its message type."""
+
+    name: str
+
+    @property
+    def message_type(self) -> str:
+        return "orders.renamed.v1"
+
+
+@pytest.fixture
+def codec() -> MessageCodec:
+    codec = MessageCodec()
+    codec.register(FakeOrderPlaced)
+    codec.register(FakeAnything)
+    codec.register(FakeTaskCreated)
+    codec.register(FakeVersionedOrderRenamed)
+    codec.register(
+        FakeRenameCustomer,
+        lambda payload, metadata: FakeRenameCustomer(payload["new_name"], metadata),
+    )
+    return codec
+
+
+class TestMessageCodec:
+    """Tests for MessageCodec class."""
+
+    def test_decode_when_encoded_event_then_round_trips(self, codec):
+        metadata = MessageMetadata(
+            message_id=uuid4(),
+            created_at=datetime(2025, 6, 11, 19, 36, 6, 123456, tzinfo=timezone.utc),
+        )
+        event = FakeOrderPlaced("order-1", [1, 2], Decimal("9.95"), metadata)
+
+        result = codec.decode(codec.encode(event))
+
+        assert isinstance(result, FakeOrderPlaced)
+        assert result == event
+        assert result.metadata == metadata
+        assert result.payload == event.payload
+
+    def test_decode_when_declarative_event_then_round_trips(self, codec):
+        event = FakeTaskCreated(uuid4(), "Write tests")
+
+        result = codec.decode(codec.encode(event))
+
+        assert isinstance(result, FakeTaskCreated)
+        assert result == event
+        assert result.payload == event.payload
+
+    def test_decode_when_message_type_overridden_then_round_trips(self, codec):
+        event = FakeVersionedOrderRenamed(name="Ada")
+
+        data = codec.encode(event)
+        result = codec.decode(data)
+
+        assert b"orders.renamed.v1" in data
+        assert codec.is_registered("orders.renamed.v1")
+        assert isinstance(result, FakeVersionedOrderRenamed)
+        assert result == event
+        assert list(codec.decode_many(codec.encode_many([event]))) == [event]
+
+    def test_decode_when_factory_registered_then_uses_factory(self, codec):
+        command = FakeRenameCustomer("Ada")
+
+        result = codec.decode(codec.encode(command))
+
+        assert isinstance(result, FakeRenameCustomer)
+        assert result.name == "Ada"
+        assert result.command_id == command.command_id
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            True,
+            False,
+            0,
+            127,
+            128,
+            -1,
+            2**63 - 1,
+            -(2**63),
+            2**100,
+            -(2**100),
+            1.5,
+            "",
+            "short",
+            "x" * 1000,
+            "żółw",
+            b"\x00\xff",
+            Decimal("-12.340"),
+            UUID("123e4567-e89b-12d3-a456-426614174000"),
+            datetime(2025, 6, 11, 19, 36, 6, 1, tzinfo=timezone.utc),
+            datetime(1960, 1, 1, 0, 0, 0, 999999),
+            [1, "two", [3.0, None]],
+            {"nested": {"key": [True]}, 1: "int key"},
+        ],
+    )
+    def test_decode_when_supported_value_then_round_trips(self, codec, value):
+        result = codec.decode(codec.encode(FakeAnything(value)))
+
+        assert result.payload == {"value": value}
+        assert type(result.payload["value"]) is type(value)
+
+    def test_decode_when_tuple_value_then_returns_list(self, codec):
+        result = codec.decode(codec.encode(FakeAnything((1, 2))))
+
+        assert result.payload == {"value": [1, 2]}
+
+    @pytest.mark.parametrize(
+        "offset", [timedelta(hours=2), timedelta(hours=-9, minutes=-30)]
+    )
+    def test_decode_when_other_timezone_then_keeps_offset(self, codec, offset):
+        value = datetime(2025, 1, 1, 12, 30, 1, 5, tzinfo=timezone(offset))
+
+        result = codec.decode(codec.encode(FakeAnything(value)))
+
+        assert result.payload["value"] == value
+        assert result.payload["value"].utcoffset() == offset
+        assert result.payload["value"].isoformat() == value.isoformat()
+
+    def test_decode_when_utc_then_returns_utc(self, codec):
+        value = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+        result = codec.decode(codec.encode(FakeAnything(value)))
+
+        assert result.payload["value"].tzinfo == timezone.utc
+
+    def test_encode_when_unsupported_value_then_raises_type_error(self, codec):
+        with pytest.raises(TypeError, match="Cannot encode value of type object"):
+            codec.encode(FakeAnything(object()))
+
+    def test_encode_when_value_subclasses_supported_type_then_encodes_base(self, codec):
+        class Label(str):
+            pass
+
+        result = codec.decode(codec.encode(FakeAnything(Label("urgent"))))
+
+        assert result.payload == {"value": "urgent"}
+
+    def test_encode_into_when_called_twice_then_appends_to_buffer(self, codec):
+        first = FakeAnything(1)
+        second = FakeAnything("two")
+        buffer = bytearray(b"prefix")
+
+        first_size = codec.encode_into(first, buffer)
+        second_size = codec.encode_into(second, buffer)
+
+        assert len(buffer) == len(b"prefix") + first_size + second_size
+        message, offset = codec.decode_from(buffer, len(b"prefix"))
+        assert message == first
+        message, offset = codec.decode_from(memoryview(buffer), offset)
+        assert message == second
+        assert offset == len(buffer)
+
+    def test_decode_when_type_not_registered_then_raises_value_error(self):
+        data = MessageCodec().encode(FakeAnything(1))
+
+        with pytest.raises(ValueError, match="Unknown message type 'FakeAnything'"):
+            MessageCodec().decode(data)
+
+    def test_decode_when_truncated_then_raises_value_error(self, codec):
+        data = codec.encode(FakeAnything("x" * 100))
+
+        with pytest.raises(ValueError, match="Malformed message data"):
+            codec.decode(data[:-10])
+
+    def test_decode_when_trailing_bytes_then_raises_value_error(self, codec):
+        data = codec.encode(FakeAnything(1))
+
+        with pytest.raises(ValueError, match="2 trailing bytes"):
+            codec.decode(data + b"\x00\x00")
+
+    def test_decode_when_tuple_map_key_then_raises_value_error(self, codec):
+        data = codec.encode(FakeAnything({(1, 2): "pair"}))
+
+        with pytest.raises(ValueError, match="Malformed payload: unhashable map key"):
+            codec.decode(data)
+
+    def test_decode_when_payload_nested_too_deeply_then_raises_value_error(self, codec):
+        value: Any = 1
+        for _ in range(MAX_DEPTH):
+            value = [value]
+        data = codec.encode(FakeAnything(value))
+
+        with pytest.raises(ValueError, match="Malformed payload: values nested"):
+            codec.decode(data)
+
+    def test_decode_when_unknown_version_then_raises_value_error(self, codec):
+        data = bytearray(codec.encode(FakeAnything(1)))
+        data[0] = 99
+
+        with pytest.raises(ValueError, match="Unsupported message format version 99"):
+            codec.decode(data)
+
+    def test_register_when_other_class_with_same_name_then_raises_value_error(
+        self, codec
+    ):
+        class FakeAnything(Event):
+            @property
+            def payload(self) -> Dict[str, Any]:
+                return {}
+
+        with pytest.raises(ValueError, match="already registered"):
+            codec.register(FakeAnything)
+
+    def test_register_when_used_as_decorator_then_returns_class(self):
+        codec = MessageCodec()
+
+        @codec.register
+        class FakeRegistered(Event):
+            @property
+            def payload(self) -> Dict[str, Any]:
+                return {}
+
+        assert codec.is_registered("FakeRegistered")
+        assert isinstance(codec.decode(codec.encode(FakeRegistered())), FakeRegistered)
+
+    def test_decode_many_when_encoded_batch_then_round_trips_in_order(self, codec):
+        messages = [
+            FakeAnything(1),
+            FakeTaskCreated(uuid4(), "Write tests"),
+            FakeAnything("two"),
+            FakeRenameCustomer("Ada"),
+        ]
+
+        result = list(codec.decode_many(codec.encode_many(messages)))
+
+        assert result == messages
+        assert [type(message) for message in result] == [
+            type(message) for message in messages
+        ]
+        assert [message.payload for message in result] == [
+            message.payload for message in messages
+        ]
+        assert [message.created_at for message in result] == [
+            message.created_at for message in messages
+        ]
+
+    def test_encode_many_when_same_type_repeated_then_writes_name_once(self, codec):
+        data = codec.encode_many(FakeAnything(i) for i in range(50))
+
+        assert data.count(b"FakeAnything") == 1
+        assert len(list(codec.decode_many(data))) == 50
+
+    def test_decode_many_when_empty_batch_then_yields_nothing(self, codec):
+        assert list(codec.decode_many(codec.encode_many([]))) == []
+
+    def test_decode_many_when_type_not_registered_then_raises_value_error(self):
+        data = MessageCodec().encode_many([FakeAnything(1)])
+
+        with pytest.raises(ValueError, match="Unknown message type 'FakeAnything'"):
+            MessageCodec().decode_many(data)
+
+    def test_decode_many_when_single_message_data_then_raises_value_error(self, codec):
+        data = codec.encode(FakeAnything(1))
+
+        with pytest.raises(ValueError, match="Unsupported batch format version 1"):
+            codec.decode_many(data)
+
+    def test_decode_many_when_truncated_then_raises_value_error(self, codec):
+        data = codec.encode_many([FakeAnything(1), FakeAnything("x" * 100)])
+        messages = codec.decode_many(data[:-10])
+
+        assert next(messages).payload == {"value": 1}
+        with pytest.raises(ValueError, match="Malformed message data"):
+            next(messages)
+
+    def test_decode_many_when_trailing_bytes_then_raises_value_error(self, codec):
+        data = codec.encode_many([FakeAnything(1)])
+
+        with pytest.raises(ValueError, match="3 trailing bytes"):
+            list(codec.decode_many(data + b"\x00\x00\x00"))
+
+    def test_decode_many_when_not_iterated_then_does_not_export_buffer(self, codec):
+        data = bytearray(codec.encode_many([FakeAnything(1)]))
+        messages = codec.decode_many(data)
+
+        data += b"\x00"
+
+        with pytest.raises(ValueError, match="1 trailing bytes"):
+            list(messages)
+
+    def test_decode_many_when_malformed_then_releases_buffer(self, codec):
+        data = bytearray(codec.encode_many([FakeAnything(1), FakeAnything("x" * 9)]))
+        del data[-5:]
+
+        with pytest.raises(ValueError, match="Malformed message data") as error:
+            list(codec.decode_many(data))
+
+        data += b"\x00"
+        assert error.traceback
+
+    def test_decode_many_when_closed_early_then_releases_buffer(self, codec):
+        data = bytearray(codec.encode_many([FakeAnything(1), FakeAnything(2)]))
+        messages = codec.decode_many(data)
+        next(messages)
+
+        with pytest.raises(BufferError):
+            data += b"\x00"
+        messages.close()
+        data += b"\x00"
+
+
+class TestEncodeValue:
+    """Tests for encode_value and decode_value functions."""
+
+    def test_decode_value_when_encoded_then_round_trips(self):
+        value = {"id": UUID(int=7), "tags": ["a", 1, None], "total": Decimal("1.50")}
+
+        assert decode_value(encode_value(value)) == value
+
+    def test_encode_value_when_unsupported_then_raises_type_error(self):
+        with pytest.raises(TypeError):
+            encode_value(object())
+
+    def test_decode_value_when_truncated_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="Malformed value data"):
+            decode_value(encode_value("hello")[:-1])
+
+    def test_decode_value_when_map_key_unhashable_then_raises_value_error(self):
+        data = b"\xdf\x00\x00\x00\x01" + encode_value([1]) + encode_value(None)
+
+        with pytest.raises(ValueError, match="unhashable map key of type list"):
+            decode_value(data)
+
+    def test_decode_value_when_nested_at_max_depth_then_round_trips(self):
+        value: Any = 1
+        for _ in range(MAX_DEPTH):
+            value = [value]
+
+        assert decode_value(encode_value(value)) == value
+
+    @pytest.mark.parametrize("container", [b"\xdd", b"\xdf"])
+    def test_decode_value_when_nested_too_deeply_then_raises_value_error(
+        self, container
+    ):
+        data = (container + b"\x00\x00\x00\x01") * 100_000
+
+        with pytest.raises(ValueError, match="Malformed payload: values nested"):
+            decode_value(data)
+
+    def test_decode_value_when_trailing_bytes_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="2 trailing bytes"):
+            decode_value(encode_value(1) + b"\x00\x00")
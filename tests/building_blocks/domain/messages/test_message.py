@@ -4,13 +4,17 @@ Unit tests for the Message module.
 Tests for MessageMetadata and Message classes.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Optional
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
 
 from building_blocks.domain.messages.message import Message, MessageMetadata
+from building_blocks.domain.ports.outbound.id_generator import IdGenerator
 
 
 class FakeMessage(Message):
@@ -29,6 +33,33 @@ class FakeMessage(Message):
         return {"data": self._data}
 
 
+class FakeDeclaredMessage(Message):
+    """A fake message declaring its fields as annotations."""
+
+    order_id: str
+    quantity: int = 1
+
+
+class FakeDeclaredChildMessage(FakeDeclaredMessage):
+    """A fake declarative message adding a field to its parent."""
+
+    note: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.quantity < 1:
+            raise ValueError("Quantity must be positive")
+
+
+class FakeIdGenerator(IdGenerator[UUID]):
+    """An ID generator returning a fixed sequence of UUIDs."""
+
+    def __init__(self, *ids: UUID) -> None:
+        self._ids = list(ids)
+
+    def next_id(self) -> UUID:
+        return self._ids.pop(0)
+
+
 class TestMessageMetadata:
     """Tests for MessageMetadata class."""
 
@@ -39,6 +70,76 @@ class TestMessageMetadata:
         assert isinstance(metadata.created_at, datetime)
         assert metadata.created_at.tzinfo == timezone.utc
 
+    def test_init_when_no_params_then_does_not_generate_id_yet(self):
+        with patch("building_blocks.domain.messages.message.uuid4") as fake_uuid4:
+            MessageMetadata()
+
+        fake_uuid4.assert_not_called()
+
+    def test_message_id_when_read_repeatedly_then_generated_once(self):
+        generated_id = uuid4()
+        with patch(
+            "building_blocks.domain.messages.message.uuid4", return_value=generated_id
+        ) as fake_uuid4:
+            metadata = MessageMetadata()
+
+            first = metadata.message_id
+            second = metadata.message_id
+
+        assert first == second == generated_id
+        fake_uuid4.assert_called_once_with()
+
+    def test_message_id_when_read_concurrently_then_same_id_for_all_threads(self):
+        metadata = MessageMetadata()
+        both_generating = threading.Barrier(2)
+
+        def generate() -> UUID:
+            both_generating.wait(timeout=5)
+            return uuid4()
+
+        with patch(
+            "building_blocks.domain.messages.message.uuid4", side_effect=generate
+        ):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(lambda _: metadata.message_id, range(2)))
+
+        assert results[0] == results[1] == metadata.message_id
+
+    def test_created_at_when_read_later_then_reflects_creation_time(self):
+        with patch(
+            "building_blocks.domain.messages.message.time.time",
+            return_value=1749670000.0,
+        ):
+            metadata = MessageMetadata()
+
+        result = metadata.created_at
+
+        assert result == datetime.fromtimestamp(1749670000.0, timezone.utc)
+
+    def test_message_id_when_id_generator_configured_then_uses_generator(self):
+        generated_id = uuid4()
+        MessageMetadata.use_id_generator(FakeIdGenerator(generated_id))
+        try:
+            metadata = MessageMetadata()
+
+            result = metadata.message_id
+        finally:
+            MessageMetadata.use_id_generator(None)
+
+        assert result == generated_id
+
+    def test_message_id_when_id_given_then_ignores_id_generator(self):
+        custom_id = uuid4()
+        MessageMetadata.use_id_generator(FakeIdGenerator())
+        try:
+            metadata = MessageMetadata(message_id=custom_id)
+
+            result = metadata.message_id
+        finally:
+            MessageMetadata.use_id_generator(None)
+
+        assert result == custom_id
+
     def test_init_when_custom_params_then_uses_provided_values(self):
         custom_id = uuid4()
         custom_time = datetime(2025, 6, 11, 19, 44, 14, tzinfo=timezone.utc)
@@ -187,6 +288,16 @@ class TestMessage:
         }
         assert result == expected
 
+    def test_from_dict_when_to_dict_output_then_rebuilds_message(self):
+        message = FakeMessage("test_data")
+
+        result = FakeMessage.from_dict(message.to_dict())
+
+        assert isinstance(result, FakeMessage)
+        assert result == message
+        assert result.created_at == message.created_at
+        assert result.data == "test_data"
+
     def test_hash_when_same_message_id_then_same_hash(self):
         metadata = MessageMetadata()
 
@@ -205,4 +316,109 @@ class TestMessage:
         with pytest.raises(TypeError, match="abstract"):
             # This should raise TypeError because Message is abstract an payload is
             # abstract
-            Message()  # type: ignore[abstract]
+            Message()
+
+
+class TestDeclarativeMessage:
+    """Tests for messages declaring their fields as annotations."""
+
+    def test_init_when_fields_declared_then_generates_init(self):
+        message = FakeDeclaredMessage("order-1", 3)
+
+        assert message.order_id == "order-1"
+        assert message.quantity == 3
+        assert isinstance(message.metadata, MessageMetadata)
+
+    def test_init_when_default_omitted_then_uses_class_value(self):
+        message = FakeDeclaredMessage(order_id="order-1")
+
+        assert message.quantity == 1
+
+    def test_init_when_metadata_given_then_uses_it(self):
+        metadata = MessageMetadata()
+
+        message = FakeDeclaredMessage("order-1", metadata=metadata)
+
+        assert message.metadata is metadata
+
+    def test_init_when_subclassed_then_includes_parent_fields_first(self):
+        message = FakeDeclaredChildMessage("order-1", 2, "gift")
+
+        assert FakeDeclaredChildMessage._fields == ("order_id", "quantity", "note")
+        assert message.payload == {"order_id": "order-1", "quantity": 2, "note": "gift"}
+
+    def test_init_when_post_init_defined_then_calls_it(self):
+        with pytest.raises(ValueError, match="Quantity must be positive"):
+            FakeDeclaredChildMessage("order-1", 0)
+
+    def test_init_when_non_default_follows_default_then_raises_type_error(self):
+        with pytest.raises(TypeError, match="non-default field 'b' follows default"):
+
+            class Invalid(Message):
+                a: int = 0
+                b: int  # type: ignore[misc]
+
+    def test_setattr_when_field_assigned_then_raises_attribute_error(self):
+        message = FakeDeclaredMessage("order-1")
+
+        with pytest.raises(AttributeError, match="cannot assign to field 'order_id'"):
+            message.order_id = "order-2"  # type: ignore[misc]
+
+    @pytest.mark.parametrize("name", ["order_id", "_metadata"])
+    def test_delattr_when_field_deleted_then_raises_attribute_error(self, name):
+        message = FakeDeclaredMessage("order-1")
+
+        with pytest.raises(AttributeError, match=f"cannot delete field '{name}'"):
+            delattr(message, name)
+
+        assert message == FakeDeclaredMessage("order-1", metadata=message.metadata)
+
+    def test_payload_when_called_then_returns_fields(self):
+        message = FakeDeclaredMessage("order-1", 3)
+
+        assert message.payload == {"order_id": "order-1", "quantity": 3}
+
+    def test_to_dict_when_called_then_matches_generic_layout(self):
+        message_id = uuid4()
+        created_at = datetime(2025, 6, 11, 19, 44, 14, tzinfo=timezone.utc)
+        metadata = MessageMetadata(message_id=message_id, created_at=created_at)
+
+        result = FakeDeclaredMessage("order-1", 3, metadata=metadata).to_dict()
+
+        assert result == {
+            "message_id": str(message_id),
+            "created_at": "2025-06-11T19:44:14+00:00",
+            "message_type": "FakeDeclaredMessage",
+            "order_id": "order-1",
+            "quantity": 3,
+        }
+        assert list(result) == list(Message.to_dict(FakeDeclaredMessage("x")))
+
+    def test_from_dict_when_to_dict_output_then_rebuilds_message(self):
+        message = FakeDeclaredChildMessage("order-1", 2, "gift")
+
+        result = FakeDeclaredChildMessage.from_dict(message.to_dict())
+
+        assert isinstance(result, FakeDeclaredChildMessage)
+        assert result == message
+        assert result.created_at == message.created_at
+        assert result.payload == message.payload
+
+    def test_from_dict_when_defaulted_field_missing_then_uses_default(self):
+        data = FakeDeclaredMessage("order-1").to_dict()
+        del data["quantity"]
+
+        result = FakeDeclaredMessage.from_dict(data)
+
+        assert result.quantity == 1
+
+    def test_from_dict_when_required_field_missing_then_raises_key_error(self):
+        data = FakeDeclaredMessage("order-1").to_dict()
+        del data["order_id"]
+
+        with pytest.raises(KeyError, match="order_id"):
+            FakeDeclaredMessage.from_dict(data)
+
+    def test_subclass_when_init_defined_then_is_not_generated(self):
+        assert FakeMessage._fields == ()
+        assert "payload" in FakeMessage.__dict__
@@ -0,0 +1,155 @@
+"""
+Unit tests for the pagination module.
+
+Tests for Page, encode_cursor, decode_cursor and paginate, and for the default
+find_page of the repository ports.
+"""
+
+import base64
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.ports.outbound.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+from building_blocks.domain.ports.outbound.read_only_repository import (
+    AsyncReadOnlyRepository,
+    SyncReadOnlyRepository,
+)
+
+
+class FakeOrder(AggregateRoot[int]):
+    """A fake aggregate."""
+
+
+class FakeAsyncReadOnlyRepository(AsyncReadOnlyRepository[FakeOrder, int]):
+    """Async read-only repository over a list of orders."""
+
+    def __init__(self, *ids: int) -> None:
+        self.orders = [FakeOrder(order_id) for order_id in ids]
+
+    async def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        return None
+
+    async def find_all(self) -> List[FakeOrder]:
+        return list(self.orders)
+
+
+class FakeSyncReadOnlyRepository(SyncReadOnlyRepository[FakeOrder, int]):
+    """Sync read-only repository over a list of orders."""
+
+    def __init__(self, *ids: int) -> None:
+        self.orders = [FakeOrder(order_id) for order_id in ids]
+
+    def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        return None
+
+    def find_all(self) -> List[FakeOrder]:
+        return list(self.orders)
+
+
+class TestPage:
+    """Tests for Page class."""
+
+    def test_has_next_when_cursor_then_true(self):
+        assert Page([1], "abc").has_next
+
+    def test_has_next_when_no_cursor_then_false(self):
+        assert not Page([1]).has_next
+
+
+class TestCursor:
+    """Tests for encode_cursor and decode_cursor functions."""
+
+    def test_decode_cursor_when_encoded_then_returns_key(self):
+        key = (datetime(2026, 1, 2, tzinfo=timezone.utc), UUID(int=5))
+
+        assert decode_cursor(encode_cursor(*key)) == key
+
+    def test_encode_cursor_when_called_then_url_safe_without_padding(self):
+        cursor = encode_cursor("a" * 10, 12345)
+
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize("cursor", ["!!!", "abc", "", "AQ"])
+    def test_decode_cursor_when_not_a_cursor_then_raises_value_error(self, cursor):
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            decode_cursor(cursor)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"\xdd\x00\x00\x00\x01" * 5000 + b"\xc0",  # nested past the recursion limit
+            b"\xdd\x00\x00\x00\x01\xdf\x00\x00\x00\x01\xdd\x00\x00\x00\x00\xc0",
+            b"\xdd\x00\x00\x00\x01\xd7\x7f\xff\xff\xff\xff\xff\xff\xff",
+            b"\xdd\x00\x00\x00\x01\xdd\x00\x00\x00\x00",
+        ],
+        ids=["deep-nesting", "unhashable-key", "datetime-overflow", "nested-key"],
+    )
+    def test_decode_cursor_when_crafted_then_raises_value_error(self, data):
+        cursor = base64.urlsafe_b64encode(data).decode("ascii")
+
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            decode_cursor(cursor)
+
+
+class TestPaginate:
+    """Tests for paginate function."""
+
+    def test_paginate_when_walked_then_visits_every_item_once_in_order(self):
+        orders = [FakeOrder(order_id) for order_id in (5, 3, 1, 4, 2)]
+        seen: List[int] = []
+        after = None
+        while True:
+            page = paginate(orders, after, 2)
+            seen.extend(order.id for order in page.items)
+            if not page.has_next:
+                break
+            after = page.next_cursor
+
+        assert seen == [1, 2, 3, 4, 5]
+
+    def test_paginate_when_last_page_full_then_has_no_next(self):
+        orders = [FakeOrder(order_id) for order_id in (1, 2)]
+
+        assert not paginate(orders, None, 2).has_next
+
+    def test_paginate_when_key_given_then_orders_by_it(self):
+        page = paginate(["bb", "a", "ccc"], None, 2, key=len)
+
+        assert page.items == ["a", "bb"]
+        assert page.next_cursor is not None
+        assert decode_cursor(page.next_cursor) == (2,)
+
+    def test_paginate_when_limit_below_one_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="limit must be at least 1, got 0"):
+            paginate([], None, 0)
+
+
+class TestFindPage:
+    """Tests for the default find_page of the repository ports."""
+
+    async def test_find_page_when_async_then_pages_over_find_all(self):
+        repository = FakeAsyncReadOnlyRepository(3, 1, 2)
+
+        first = await repository.find_page(limit=2)
+        second = await repository.find_page(after=first.next_cursor, limit=2)
+
+        assert [order.id for order in first.items] == [1, 2]
+        assert [order.id for order in second.items] == [3]
+        assert not second.has_next
+
+    def test_find_page_when_sync_then_pages_over_find_all(self):
+        repository = FakeSyncReadOnlyRepository(3, 1, 2)
+
+        first = repository.find_page(limit=1)
+        second = repository.find_page(after=first.next_cursor, limit=5)
+
+        assert [order.id for order in second.items] == [2, 3]
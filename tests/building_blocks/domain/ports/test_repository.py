@@ -0,0 +1,107 @@
+"""
+Unit tests for the repository module.
+
+Tests for the default methods of AsyncRepository and SyncRepository.
+"""
+
+from typing import List, Optional
+
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    SyncRepository,
+)
+
+
+class FakeOrder(AggregateRoot[int]):
+    """A fake aggregate."""
+
+
+class FakeAsyncRepository(AsyncRepository[FakeOrder, int]):
+    """Async repository over a dict, recording the IDs it looks up."""
+
+    def __init__(self, *ids: int) -> None:
+        self.orders = {order_id: FakeOrder(order_id) for order_id in ids}
+        self.lookups: List[int] = []
+
+    async def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        self.lookups.append(id)
+        return self.orders.get(id)
+
+    async def save(self, aggregate: FakeOrder) -> None:
+        self.orders[aggregate.id] = aggregate
+
+    async def delete_by_id(self, id: int) -> None:
+        self.orders.pop(id, None)
+
+    async def find_all(self) -> List[FakeOrder]:
+        return list(self.orders.values())
+
+
+class FakeSyncRepository(SyncRepository[FakeOrder, int]):
+    """Sync repository over a dict, recording the IDs it looks up."""
+
+    def __init__(self, *ids: int) -> None:
+        self.orders = {order_id: FakeOrder(order_id) for order_id in ids}
+        self.lookups: List[int] = []
+
+    def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        self.lookups.append(id)
+        return self.orders.get(id)
+
+    def save(self, aggregate: FakeOrder) -> None:
+        self.orders[aggregate.id] = aggregate
+
+    def delete_by_id(self, id: int) -> None:
+        self.orders.pop(id, None)
+
+    def find_all(self) -> List[FakeOrder]:
+        return list(self.orders.values())
+
+
+class TestAsyncRepository:
+    """Tests for the default methods of AsyncRepository."""
+
+    async def test_find_by_ids_when_default_then_looks_up_each_distinct_id(self):
+        repository = FakeAsyncRepository(1, 2, 3)
+
+        orders = await repository.find_by_ids([3, 9, 1, 3])
+
+        assert list(orders) == [3, 1]
+        assert orders[3] is repository.orders[3]
+        assert repository.lookups == [3, 9, 1]
+
+    async def test_save_many_when_default_then_saves_each_aggregate(self):
+        repository = FakeAsyncRepository()
+        orders = [FakeOrder(1), FakeOrder(2)]
+
+        await repository.save_many(order for order in orders)
+
+        assert list(repository.orders.values()) == orders
+
+    async def test_delete_by_ids_when_default_then_deletes_each_id(self):
+        repository = FakeAsyncRepository(1, 2, 3)
+
+        await repository.delete_by_ids([1, 3])
+
+        assert list(repository.orders) == [2]
+
+
+class TestSyncRepository:
+    """Tests for the default methods of SyncRepository."""
+
+    def test_find_by_ids_when_default_then_looks_up_each_distinct_id(self):
+        repository = FakeSyncRepository(1, 2)
+
+        orders = repository.find_by_ids(iter([2, 2, 5]))
+
+        assert list(orders) == [2]
+        assert repository.lookups == [2, 5]
+
+    def test_save_many_when_default_then_saves_each_aggregate(self):
+        repository = FakeSyncRepository()
+
+        repository.save_many([FakeOrder(1), FakeOrder(2)])
+        repository.delete_by_ids(iter([1]))
+
+        assert list(repository.orders) == [2]
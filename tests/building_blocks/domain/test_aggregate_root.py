@@ -4,7 +4,7 @@ Unit tests for the AggregateRoot module.
 Tests for AggregateRoot class using Vaughn Vernon's approach.
 """
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, cast
 from uuid import UUID, uuid4
 
 import pytest
@@ -95,6 +95,44 @@ class TestAggregateVersion:
         new_version = version.increment()
         assert new_version.value == 2
 
+    def test_increment_when_in_interned_range_then_returns_shared_instance(self):
+        """Test that low versions are not reallocated on increment."""
+        version = AggregateVersion.of(1)
+        new_version = version.increment()
+        assert new_version is AggregateVersion.of(2)
+
+    def test_increment_when_beyond_interned_range_then_returns_new_instance(self):
+        """Test that high versions are still built and compared by value."""
+        version = AggregateVersion(100_000)
+        new_version = version.increment()
+        assert new_version == AggregateVersion(100_001)
+        assert new_version.value == 100_001
+
+    def test_of_when_low_value_then_returns_shared_instance(self):
+        """Test that AggregateVersion.of reuses interned instances."""
+        assert AggregateVersion.of(3) is AggregateVersion.of(3)
+        assert AggregateVersion.of(3) == AggregateVersion(3)
+
+    def test_of_when_high_value_then_returns_equal_instance(self):
+        """Test that AggregateVersion.of builds versions outside the cache."""
+        assert AggregateVersion.of(100_000) == AggregateVersion(100_000)
+
+    def test_of_when_value_is_negative_then_raises_value_error(self):
+        """Test that AggregateVersion.of still validates its input."""
+        with pytest.raises(ValueError, match="Version cannot be negative"):
+            AggregateVersion.of(-1)
+
+    def test_of_when_value_is_not_int_then_raises_type_error(self):
+        """Test that AggregateVersion.of rejects non-integer values."""
+        with pytest.raises(TypeError, match="Expected int, got str"):
+            AggregateVersion.of("1")  # type: ignore
+
+    def test_setattr_when_value_assigned_then_raises_attribute_error(self):
+        """Test that the version value cannot be reassigned."""
+        version = AggregateVersion(1)
+        with pytest.raises(AttributeError, match="frozen AggregateVersion"):
+            version.value = 2  # type: ignore[misc]
+
 
 class TestAggregateRoot:
     """Tests for AggregateRoot class using Vernon's approach."""
@@ -198,6 +236,53 @@ class TestAggregateRoot:
         assert len(aggregate.uncommitted_changes()) == 0
         assert aggregate.version == expected_version
 
+    def test_drain_uncommitted_changes_when_events_then_hands_off_buffer(self):
+        aggregate = FakeAggregateRoot(uuid4(), self._name)
+        aggregate.perform_business_operation()
+
+        drained = aggregate.drain_uncommitted_changes()
+        aggregate.perform_action("later")
+
+        assert [cast(FakeEvent, event).data for event in drained] == [
+            "Operation started",
+            "Operation in progress",
+            "Operation completed",
+        ]
+        assert aggregate.version.value == 1
+        assert len(aggregate.uncommitted_changes()) == 1
+
+    def test_drain_uncommitted_changes_when_no_events_then_returns_empty_list(self):
+        aggregate = FakeAggregateRoot(uuid4(), self._name)
+
+        assert aggregate.drain_uncommitted_changes() == []
+        assert aggregate.version.value == 1
+
+    def test_uncommitted_changes_view_when_events_recorded_then_reflects_them(self):
+        aggregate = FakeAggregateRoot(uuid4(), self._name)
+        view = aggregate.uncommitted_changes_view()
+
+        aggregate.perform_business_operation()
+
+        assert len(view) == 3
+        assert cast(FakeEvent, view[0]).data == "Operation started"
+        assert [cast(FakeEvent, event).data for event in view[1:]] == [
+            "Operation in progress",
+            "Operation completed",
+        ]
+        assert list(view) == aggregate.uncommitted_changes()
+        aggregate.drain_uncommitted_changes()
+        assert len(view) == 0
+
+    def test_uncommitted_changes_view_when_used_then_cannot_modify_events(self):
+        aggregate = FakeAggregateRoot(uuid4(), self._name)
+        aggregate.perform_action("test_action")
+        view = aggregate.uncommitted_changes_view()
+
+        with pytest.raises(TypeError):
+            view[0] = FakeEvent("replaced")  # type: ignore[index]
+        assert not hasattr(view, "append")
+        assert "UncommittedChangesView" in repr(view)
+
     def test_multiple_operations_when_performed_then_events_accumulate(self):
         aggregate_id = uuid4()
         aggregate = FakeAggregateRoot(aggregate_id, self._name)
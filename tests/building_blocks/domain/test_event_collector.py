@@ -0,0 +1,148 @@
+"""
+Unit tests for the event_collector module.
+
+Tests for EventCollector class and collect_events function.
+"""
+
+import asyncio
+from typing import Iterable, List
+
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.event_collector import (
+    collect_events,
+    current_event_collector,
+)
+from building_blocks.domain.messages.event import Event
+
+
+class FakeSomethingHappened(Event):
+    """A fake event naming what happened."""
+
+    what: str
+
+
+class FakeAggregate(AggregateRoot[int]):
+    """A fake aggregate recording events."""
+
+    def happen(self, what: str) -> None:
+        self.record_event(FakeSomethingHappened(what=what))
+
+
+def whats(events: Iterable[Event]) -> List[str]:
+    return [event.what for event in events if isinstance(event, FakeSomethingHappened)]
+
+
+class TestCollectEvents:
+    """Tests for collect_events function."""
+
+    def test_collect_events_when_aggregates_record_then_collects_in_order(self):
+        order, customer = FakeAggregate(1), FakeAggregate(2)
+
+        with collect_events() as collector:
+            order.happen("placed")
+            customer.happen("charged")
+            order.happen("confirmed")
+
+        assert whats(collector.drain()) == ["placed", "charged", "confirmed"]
+        assert whats(order.uncommitted_changes()) == ["placed", "confirmed"]
+
+    def test_collect_events_when_block_ends_then_stops_collecting(self):
+        aggregate = FakeAggregate(1)
+
+        with collect_events() as collector:
+            assert current_event_collector() is collector
+
+        aggregate.happen("later")
+        assert len(collector) == 0
+        assert current_event_collector() is None
+
+    def test_collect_events_when_nested_then_inner_events_stay_inner(self):
+        aggregate = FakeAggregate(1)
+
+        with collect_events() as outer:
+            aggregate.happen("before")
+            with collect_events() as inner:
+                aggregate.happen("inside")
+            aggregate.happen("after")
+
+        assert whats(outer.drain()) == ["before", "after"]
+        assert whats(inner.drain()) == ["inside"]
+
+    async def test_collect_events_when_concurrent_tasks_then_each_sees_its_own(
+        self,
+    ):
+        async def use_case(name: str) -> list:
+            with collect_events() as collector:
+                aggregate = FakeAggregate(1)
+                aggregate.happen(f"{name} started")
+                await asyncio.sleep(0)
+                aggregate.happen(f"{name} finished")
+            return whats(collector.drain())
+
+        first, second = await asyncio.gather(use_case("a"), use_case("b"))
+
+        assert first == ["a started", "a finished"]
+        assert second == ["b started", "b finished"]
+
+
+class TestEventCollector:
+    """Tests for EventCollector class."""
+
+    def test_drain_when_called_then_hands_off_and_starts_anew(self):
+        aggregate = FakeAggregate(1)
+
+        with collect_events() as collector:
+            aggregate.happen("first")
+            drained = collector.drain()
+            aggregate.happen("second")
+
+        assert whats(drained) == ["first"]
+        assert whats(collector.drain()) == ["second"]
+        assert collector.drain() == []
+
+    def test_drain_committed_when_some_aggregates_committed_then_hands_off_those(
+        self,
+    ):
+        order, customer = FakeAggregate(1), FakeAggregate(2)
+
+        with collect_events() as collector:
+            order.happen("placed")
+            customer.happen("charged")
+            order.happen("confirmed")
+            order.mark_changes_as_committed()
+            committed = collector.drain_committed()
+            customer.mark_changes_as_committed()
+
+        assert whats(committed) == ["placed", "confirmed"]
+        assert whats(collector.drain_committed()) == ["charged"]
+        assert collector.drain_committed() == []
+
+    def test_drain_committed_when_nothing_committed_then_keeps_events(self):
+        aggregate = FakeAggregate(1)
+
+        with collect_events() as collector:
+            aggregate.happen("pending")
+
+        assert collector.drain_committed() == []
+        assert whats(collector.drain()) == ["pending"]
+
+    def test_discard_when_events_committed_later_then_not_handed_off(self):
+        aggregate = FakeAggregate(1)
+
+        with collect_events() as collector:
+            aggregate.happen("stored")
+            collector.discard(aggregate.uncommitted_changes_view())
+            aggregate.happen("published")
+            aggregate.mark_changes_as_committed()
+
+        assert whats(collector.drain_committed()) == ["published"]
+        assert len(collector) == 0
+
+    def test_commit_when_event_not_collected_then_ignores_it(self):
+        aggregate = FakeAggregate(1)
+        aggregate.happen("outside")
+
+        with collect_events() as collector:
+            aggregate.mark_changes_as_committed()
+
+        assert collector.drain_committed() == []
@@ -0,0 +1,260 @@
+"""
+Unit tests for the event_sourced_aggregate_root module.
+
+Tests for EventSourcedAggregateRoot class and handles decorator.
+"""
+
+from typing import ClassVar, List, Optional
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateVersion
+from building_blocks.domain.event_sourced_aggregate_root import (
+    EventSourcedAggregateRoot,
+    Snapshot,
+    handles,
+)
+from building_blocks.domain.messages.event import Event
+
+
+class FakeAccountOpened(Event):
+    """A fake event opening an account."""
+
+    owner: str
+
+
+class FakeMoneyDeposited(Event):
+    """A fake event adding to the balance."""
+
+    amount: int
+
+
+class FakeBonusDeposited(FakeMoneyDeposited):
+    """A fake event with no handler of its own."""
+
+
+class FakeAccountClosed(Event):
+    """A fake event no account handles."""
+
+    reason: str
+
+
+class FakeAccount(EventSourcedAggregateRoot[int]):
+    """A fake event-sourced aggregate."""
+
+    snapshot_every: ClassVar[Optional[int]] = 3
+
+    def __init__(self, account_id: int) -> None:
+        super().__init__(account_id)
+        self.owner = ""
+        self.deposits: List[int] = []
+
+    @property
+    def balance(self) -> int:
+        return sum(self.deposits)
+
+    def open(self, owner: str) -> None:
+        self.record_event(FakeAccountOpened(owner=owner))
+
+    def deposit(self, amount: int) -> None:
+        self.record_event(FakeMoneyDeposited(amount=amount))
+
+    @handles(FakeAccountOpened)
+    def _on_opened(self, event: FakeAccountOpened) -> None:
+        self.owner = event.owner
+
+    @handles(FakeMoneyDeposited)
+    def _on_deposited(self, event: FakeMoneyDeposited) -> None:
+        self.deposits.append(event.amount)
+
+
+class FakeSavingsAccount(FakeAccount):
+    """A fake subclass replacing one inherited handler."""
+
+    snapshot_every = None
+
+    @handles(FakeMoneyDeposited)
+    def _on_saved(self, event: FakeMoneyDeposited) -> None:
+        self.deposits.append(event.amount * 2)
+
+
+def history(*amounts: int) -> List[Event]:
+    return [FakeAccountOpened(owner="ann")] + [
+        FakeMoneyDeposited(amount=amount) for amount in amounts
+    ]
+
+
+class TestEventSourcedAggregateRoot:
+    """Tests for EventSourcedAggregateRoot class."""
+
+    def test_record_event_when_called_then_applies_and_records_event(self):
+        account = FakeAccount(1)
+
+        account.open("ann")
+        account.deposit(5)
+
+        assert (account.owner, account.balance) == ("ann", 5)
+        assert len(account.uncommitted_changes()) == 2
+        assert account.version.value == 0
+
+    def test_record_event_when_no_handler_then_raises_type_error_and_skips(self):
+        account = FakeAccount(1)
+
+        with pytest.raises(TypeError, match="FakeAccount has no handler"):
+            account.record_event(FakeAccountClosed(reason="moved"))
+
+        assert account.uncommitted_changes() == []
+
+    def test_record_event_when_subclass_of_handled_event_then_uses_base_handler(
+        self,
+    ):
+        account = FakeAccount(1)
+
+        account.record_event(FakeBonusDeposited(amount=3))
+        account.record_event(FakeBonusDeposited(amount=4))
+
+        assert account.balance == 7
+
+    def test_record_event_when_subclass_defined_after_resolution_then_uses_override(
+        self,
+    ):
+        FakeAccount(1).record_event(FakeBonusDeposited(amount=1))
+
+        class FakeMatchingAccount(FakeAccount):
+            @handles(FakeMoneyDeposited)
+            def _on_matched(self, event: FakeMoneyDeposited) -> None:
+                self.deposits.append(event.amount * 2)
+
+        account = FakeMatchingAccount(1)
+        account.record_event(FakeBonusDeposited(amount=3))
+
+        assert account.balance == 6
+        assert FakeAccount.replay(1, [FakeBonusDeposited(amount=3)]).balance == 3
+
+    def test_mark_changes_as_committed_when_events_then_advances_by_their_count(
+        self,
+    ):
+        account = FakeAccount(1)
+        account.open("ann")
+        account.deposit(5)
+
+        account.mark_changes_as_committed()
+
+        assert account.version.value == 2
+        assert account.uncommitted_changes() == []
+
+    def test_drain_uncommitted_changes_when_events_then_advances_by_their_count(
+        self,
+    ):
+        account = FakeAccount(1)
+        account.open("ann")
+        account.deposit(5)
+
+        drained = account.drain_uncommitted_changes()
+
+        assert [type(event) for event in drained] == [
+            FakeAccountOpened,
+            FakeMoneyDeposited,
+        ]
+        assert account.version.value == 2
+        assert len(account.uncommitted_changes_view()) == 0
+
+    def test_replay_when_history_then_rebuilds_state_and_version(self):
+        account = FakeAccount.replay(1, history(5, 7))
+
+        assert (account.owner, account.balance) == ("ann", 12)
+        assert account.version.value == 3
+        assert account.uncommitted_changes() == []
+
+    def test_replay_when_subclass_then_uses_replaced_handler(self):
+        account = FakeSavingsAccount.replay(1, history(5))
+
+        assert account.balance == 10
+        assert FakeAccount.replay(1, history(5)).balance == 5
+
+    def test_replay_when_snapshot_then_applies_only_later_events(self):
+        account = FakeAccount.replay(1, history(5, 7))
+        snapshot = account.take_snapshot()
+
+        restored = FakeAccount.replay(1, [FakeMoneyDeposited(amount=1)], snapshot)
+
+        assert (restored.owner, restored.balance) == ("ann", 13)
+        assert restored.version.value == 4
+
+    def test_take_snapshot_when_state_changes_later_then_snapshot_unchanged(self):
+        account = FakeAccount.replay(1, history(5))
+        snapshot = account.take_snapshot()
+
+        account.deposit(1)
+
+        assert snapshot == Snapshot(
+            1, AggregateVersion.of(2), {"owner": "ann", "deposits": [5]}
+        )
+
+    def test_take_snapshot_when_uncommitted_changes_then_raises_value_error(self):
+        account = FakeAccount(1)
+        account.open("ann")
+
+        with pytest.raises(ValueError, match="1 uncommitted changes"):
+            account.take_snapshot()
+
+    def test_restore_snapshot_when_other_aggregate_then_raises_value_error(self):
+        snapshot = FakeAccount.replay(2, history()).take_snapshot()
+
+        with pytest.raises(ValueError, match="cannot be restored"):
+            FakeAccount.replay(1, [], snapshot)
+
+    def test_load_from_history_when_uncommitted_changes_then_raises_value_error(
+        self,
+    ):
+        account = FakeAccount(1)
+        account.open("ann")
+
+        with pytest.raises(ValueError, match="Cannot load history"):
+            account.load_from_history(history())
+
+    def test_snapshot_due_when_enough_events_committed_then_true(self):
+        account = FakeAccount.replay(1, history(5))
+        assert not account.snapshot_due
+
+        account.deposit(1)
+        account.mark_changes_as_committed()
+
+        assert account.snapshot_due
+        account.take_snapshot()
+        assert not account.snapshot_due
+
+    def test_snapshot_due_when_restored_then_counts_from_snapshot(self):
+        snapshot = FakeAccount.replay(1, history(1, 2, 3)).take_snapshot()
+
+        account = FakeAccount.replay(1, history(4)[1:], snapshot)
+
+        assert account.version.value == 5
+        assert not account.snapshot_due
+
+    def test_snapshot_due_when_snapshots_disabled_then_false(self):
+        account = FakeSavingsAccount.replay(1, history(*range(10)))
+
+        assert not account.snapshot_due
+
+    def test_init_subclass_when_two_handlers_for_one_event_then_raises_type_error(
+        self,
+    ):
+        with pytest.raises(TypeError, match="two handlers for FakeMoneyDeposited"):
+
+            class FakeBrokenAccount(FakeAccount):
+                @handles(FakeMoneyDeposited)
+                def _first(self, event: FakeMoneyDeposited) -> None:
+                    pass
+
+                @handles(FakeMoneyDeposited)
+                def _second(self, event: FakeMoneyDeposited) -> None:
+                    pass
+
+    def test_init_subclass_when_snapshot_every_below_one_then_raises_value_error(
+        self,
+    ):
+        with pytest.raises(ValueError, match="snapshot_every must be at least 1"):
+
+            class FakeBrokenAccount(FakeAccount):
+                snapshot_every = 0
@@ -1,6 +1,15 @@
+import copy
+import pickle
 from collections.abc import Hashable
+from typing import ClassVar
 
-from building_blocks.domain.value_object import ValueObject
+import pytest
+
+from building_blocks.domain.value_object import (
+    FrozenValueObject,
+    SlottedValueObject,
+    ValueObject,
+)
 
 
 class FakeValueObject(ValueObject):
@@ -198,3 +207,283 @@ class TestValueObject:
         assert "TwoComponentVO" in result
         assert "first" in result
         assert "second" in result
+
+
+class FakeSlottedValueObject(SlottedValueObject):
+    """
+    A fake slotted value object for testing purposes.
+
+    Counts how many times the equality components are built, so tests can check
+    they are only computed once.
+    """
+
+    __slots__ = ("_value",)
+
+    build_count = 0
+
+    def __init__(self, value: str):
+        self._value = value
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        FakeSlottedValueObject.build_count += 1
+        return (self._value,)
+
+
+class FakeUnslottedValueObject(SlottedValueObject):
+    """A fake slotted value object subclass without ``__slots__``."""
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        return (self.value,)
+
+
+class FakeListValueObject(SlottedValueObject):
+    """A fake slotted value object with an unhashable component."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: list[int]):
+        self.items = items
+
+    def _equality_components(self) -> tuple[Hashable, ...]:
+        return (self.items,)  # type: ignore[return-value]
+
+
+class TestSlottedValueObject:
+    def test_init_when_created_then_has_no_instance_dict(self):
+        vo = FakeSlottedValueObject("test")
+
+        result = hasattr(vo, "__dict__")
+
+        assert result is False, "Slotted value objects should not carry a __dict__"
+
+    def test_eq_when_another_value_object_with_same_value_then_true(self):
+        vo1 = FakeSlottedValueObject("test")
+        vo2 = FakeSlottedValueObject("test")
+
+        result = vo1 == vo2
+
+        assert result is True, "Value objects with the same value should be equal"
+
+    def test_eq_when_another_value_object_with_different_value_then_false(self):
+        vo1 = FakeSlottedValueObject("test1")
+        vo2 = FakeSlottedValueObject("test2")
+
+        result = vo1 == vo2
+
+        assert result is False, "Value objects with different values should differ"
+
+    def test_eq_when_plain_value_object_with_same_value_then_false(self):
+        vo1 = FakeSlottedValueObject("test")
+        vo2 = FakeValueObject("test")
+
+        result = vo1 == vo2
+
+        assert result is False, "Value objects of different types should differ"
+
+    def test_eq_when_component_unhashable_then_compares_components(self):
+        vo = FakeListValueObject([1, 2])
+
+        assert vo == FakeListValueObject([1, 2])
+        assert vo != FakeListValueObject([1, 3])
+        with pytest.raises(TypeError):
+            hash(vo)
+
+    def test_hash_when_value_then_matches_plain_value_object(self):
+        vo = FakeSlottedValueObject("test")
+
+        result = hash(vo)
+
+        assert result == hash(FakeValueObject("test")), "Hash should match base"
+
+    def test_hash_and_eq_when_called_repeatedly_then_components_built_once(self):
+        FakeSlottedValueObject.build_count = 0
+        vo1 = FakeSlottedValueObject("test")
+        vo2 = FakeSlottedValueObject("test")
+
+        for _ in range(10):
+            hash(vo1)
+            _ = vo1 == vo2
+
+        assert FakeSlottedValueObject.build_count == 2
+
+    def test_getattr_when_unknown_attribute_then_raises_attribute_error(self):
+        vo = FakeSlottedValueObject("test")
+
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            _ = vo.missing
+
+    def test_str_when_single_value_then_class_name_and_value(self):
+        vo = FakeSlottedValueObject("test")
+
+        result = str(vo)
+
+        assert result == "FakeSlottedValueObject(test)"
+
+    def test_str_when_multiple_values_then_tuple_representation(self):
+        class MultiValueObject(SlottedValueObject):
+            __slots__ = ("_value1", "_value2")
+
+            def __init__(self, value1: str, value2: int):
+                self._value1 = value1
+                self._value2 = value2
+
+            def _equality_components(self) -> tuple[Hashable, ...]:
+                return (self._value1, self._value2)
+
+        vo = MultiValueObject("test", 42)
+
+        result = repr(vo)
+
+        assert result == "MultiValueObject('test', 42)"
+
+    def test_pickle_when_round_tripped_then_equal_with_same_hash(self):
+        vo = FakeSlottedValueObject("test")
+
+        result = pickle.loads(pickle.dumps(vo))
+
+        assert result == vo
+        assert hash(result) == hash(vo)
+
+    def test_copy_when_copied_then_equal(self):
+        vo = FakeSlottedValueObject("test")
+
+        result = copy.copy(vo)
+
+        assert result == vo
+        assert result.value == "test"
+
+    def test_pickle_when_subclass_without_slots_then_keeps_instance_dict(self):
+        vo = FakeUnslottedValueObject("test")
+
+        result = pickle.loads(pickle.dumps(vo))
+
+        assert result.value == "test"
+        assert result == vo
+        assert hash(result) == hash(vo)
+
+    def test_copy_when_subclass_without_slots_then_keeps_instance_dict(self):
+        vo = FakeUnslottedValueObject("test")
+
+        shallow = copy.copy(vo)
+        deep = copy.deepcopy(vo)
+
+        assert (shallow.value, deep.value) == ("test", "test")
+        assert shallow == deep == vo
+
+
+class FakeMoney(FrozenValueObject):
+    """A fake frozen value object with a defaulted field and validation."""
+
+    amount: int
+    currency: str = "EUR"
+
+    def __post_init__(self) -> None:
+        if self.amount < 0:
+            raise ValueError("Amount cannot be negative")
+
+
+class TestFrozenValueObject:
+    def test_init_when_fields_given_then_exposes_fields(self):
+        money = FakeMoney(10, "USD")
+
+        assert money.amount == 10
+        assert money.currency == "USD"
+
+    def test_init_when_default_field_omitted_then_uses_default(self):
+        money = FakeMoney(amount=10)
+
+        assert money.currency == "EUR"
+
+    def test_init_when_post_init_fails_then_raises(self):
+        with pytest.raises(ValueError, match="Amount cannot be negative"):
+            FakeMoney(-1)
+
+    def test_init_when_created_then_has_no_instance_dict(self):
+        money = FakeMoney(10)
+
+        result = hasattr(money, "__dict__")
+
+        assert result is False, "Frozen value objects should not carry a __dict__"
+
+    def test_setattr_when_field_assigned_then_raises_attribute_error(self):
+        money = FakeMoney(10)
+
+        with pytest.raises(AttributeError, match="cannot assign to field 'amount'"):
+            money.amount = 20  # type: ignore[misc]
+
+    def test_setattr_when_new_attribute_assigned_then_raises_attribute_error(self):
+        money = FakeMoney(10)
+
+        with pytest.raises(AttributeError, match="frozen FakeMoney"):
+            money.other = 20
+
+    def test_delattr_when_field_deleted_then_raises_attribute_error(self):
+        money = FakeMoney(10)
+
+        with pytest.raises(AttributeError, match="cannot delete field 'amount'"):
+            del money.amount
+
+    def test_eq_when_same_fields_then_true(self):
+        result = FakeMoney(10, "EUR") == FakeMoney(10)
+
+        assert result is True
+
+    def test_eq_when_different_fields_then_false(self):
+        result = FakeMoney(10, "EUR") == FakeMoney(10, "USD")
+
+        assert result is False
+
+    def test_hash_when_fields_then_hash_of_fields_tuple(self):
+        result = hash(FakeMoney(10, "EUR"))
+
+        assert result == hash((10, "EUR"))
+
+    def test_str_when_fields_then_class_name_and_fields(self):
+        result = str(FakeMoney(10))
+
+        assert result == "FakeMoney(10, 'EUR')"
+
+    def test_subclass_when_adding_fields_then_base_fields_come_first(self):
+        class FakeLabelledMoney(FakeMoney):
+            label: str = ""
+
+        money = FakeLabelledMoney(10, "USD", "price")
+
+        assert (money.amount, money.currency, money.label) == (10, "USD", "price")
+        assert money == FakeLabelledMoney(10, "USD", "price")
+
+    def test_subclass_when_non_default_follows_default_then_raises_type_error(self):
+        with pytest.raises(TypeError, match="non-default field 'label'"):
+
+            class FakeBrokenMoney(FakeMoney):
+                label: str  # type: ignore[misc]
+
+    def test_subclass_when_class_var_annotated_then_not_a_field(self):
+        class FakeRate(FrozenValueObject):
+            precision: ClassVar[int] = 4
+            value: float
+
+        rate = FakeRate(1.5)
+
+        assert FakeRate.precision == 4
+        assert rate == FakeRate(1.5)
+
+    def test_new_unchecked_when_values_given_then_skips_validation(self):
+        money = FakeMoney._new_unchecked(-1, "USD")
+
+        assert (money.amount, money.currency) == (-1, "USD")
+        assert money == FakeMoney._new_unchecked(-1, "USD")
+
+    def test_pickle_when_round_tripped_then_equal(self):
+        money = FakeMoney(10, "USD")
+
+        result = pickle.loads(pickle.dumps(money))
+
+        assert result == money
@@ -0,0 +1,219 @@
+"""
+Unit tests for the batching event publisher module.
+
+Tests for BatchingEventPublisher class and the publish_many default.
+"""
+
+import asyncio
+from typing import Iterable, List, Tuple
+
+import pytest
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+    SyncEventPublisher,
+)
+from building_blocks.domain.messages.event import Event
+from building_blocks.infrastructure.batching_event_publisher import (
+    BatchingEventPublisher,
+)
+
+
+class FakeTaskEvent(Event):
+    """A fake event."""
+
+    number: int
+
+
+class FakeAsyncPublisher(AsyncEventPublisher[FakeTaskEvent]):
+    """Records single publishes, using the default publish_many."""
+
+    def __init__(self) -> None:
+        self.published: List[FakeTaskEvent] = []
+
+    async def publish(self, event: FakeTaskEvent) -> None:
+        self.published.append(event)
+
+
+class FakeSyncPublisher(SyncEventPublisher[FakeTaskEvent]):
+    """Records single publishes, using the default publish_many."""
+
+    def __init__(self) -> None:
+        self.published: List[FakeTaskEvent] = []
+
+    def publish(self, event: FakeTaskEvent) -> None:
+        self.published.append(event)
+
+
+class FakeBatchPublisher(AsyncEventPublisher[FakeTaskEvent]):
+    """Records the batches it receives."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.batches: List[List[int]] = []
+        self.delay = delay
+        self.fail = fail
+
+    async def publish(self, event: FakeTaskEvent) -> None:
+        await self.publish_many([event])
+
+    async def publish_many(self, events: Iterable[FakeTaskEvent]) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("broker down")
+        self.batches.append([event.number for event in events])
+
+
+def make_events(count: int, start: int = 0) -> List[FakeTaskEvent]:
+    return [FakeTaskEvent(number) for number in range(start, start + count)]
+
+
+class TestPublishMany:
+    """Tests for the default publish_many of the publisher ports."""
+
+    async def test_publish_many_when_not_overridden_then_publishes_each_in_order(
+        self,
+    ):
+        publisher = FakeAsyncPublisher()
+        events = make_events(3)
+
+        await publisher.publish_many(events)
+
+        assert publisher.published == events
+
+    def test_sync_publish_many_when_not_overridden_then_publishes_each_in_order(
+        self,
+    ):
+        publisher = FakeSyncPublisher()
+        events = make_events(3)
+
+        publisher.publish_many(events)
+
+        assert publisher.published == events
+
+
+class TestBatchingEventPublisher:
+    """Tests for BatchingEventPublisher class."""
+
+    async def test_publish_when_batch_fills_then_sends_one_batch(self):
+        inner = FakeBatchPublisher()
+        publisher = BatchingEventPublisher(inner, max_batch_size=3, max_delay_ms=1000)
+
+        for event in make_events(3):
+            await publisher.publish(event)
+
+        assert inner.batches == [[0, 1, 2]]
+
+    async def test_publish_when_batch_not_full_then_buffers(self):
+        inner = FakeBatchPublisher()
+        publisher = BatchingEventPublisher(inner, max_batch_size=3, max_delay_ms=1000)
+
+        await publisher.publish(make_events(1)[0])
+
+        assert inner.batches == []
+        await publisher.aclose()
+        assert inner.batches == [[0]]
+
+    async def test_publish_when_delay_elapses_then_flushes_in_background(self):
+        inner = FakeBatchPublisher()
+        publisher = BatchingEventPublisher(inner, max_batch_size=100, max_delay_ms=5)
+
+        for event in make_events(2):
+            await publisher.publish(event)
+        await asyncio.sleep(0.05)
+
+        assert inner.batches == [[0, 1]]
+
+    async def test_publish_many_when_more_than_batch_size_then_splits_batches(self):
+        inner = FakeBatchPublisher()
+        publisher = BatchingEventPublisher(inner, max_batch_size=2, max_delay_ms=1000)
+
+        await publisher.publish_many(make_events(5))
+
+        assert inner.batches == [[0, 1], [2, 3]]
+        await publisher.flush()
+        assert inner.batches == [[0, 1], [2, 3], [4]]
+
+    async def test_flush_when_empty_then_sends_nothing(self):
+        inner = FakeBatchPublisher()
+        publisher = BatchingEventPublisher(inner)
+
+        await publisher.flush()
+
+        assert inner.batches == []
+
+    async def test_flush_when_background_flush_pending_then_keeps_order(self):
+        inner = FakeBatchPublisher(delay=0.02)
+        publisher = BatchingEventPublisher(inner, max_batch_size=100, max_delay_ms=1)
+
+        await publisher.publish_many(make_events(2))
+        await asyncio.sleep(0.005)
+        await publisher.publish_many(make_events(2, start=2))
+        await publisher.flush()
+
+        assert inner.batches == [[0, 1], [2, 3]]
+
+    async def test_flush_when_inner_fails_then_raises(self):
+        publisher = BatchingEventPublisher(FakeBatchPublisher(fail=True))
+        await publisher.publish(make_events(1)[0])
+
+        with pytest.raises(RuntimeError, match="broker down"):
+            await publisher.flush()
+
+    async def test_publish_when_full_batch_fails_then_calls_on_error_and_raises(
+        self,
+    ):
+        errors: List[Tuple[list, Exception]] = []
+        publisher = BatchingEventPublisher(
+            FakeBatchPublisher(fail=True),
+            max_batch_size=3,
+            on_error=lambda batch, e: errors.append((batch, e)),
+        )
+        events = make_events(3)
+        await publisher.publish(events[0])
+        await publisher.publish(events[1])
+
+        with pytest.raises(RuntimeError, match="broker down"):
+            await publisher.publish(events[2])
+
+        assert len(errors) == 1
+        assert errors[0][0] == events
+        assert str(errors[0][1]) == "broker down"
+
+    async def test_background_flush_when_inner_fails_then_calls_on_error(self):
+        errors: List[Tuple[list, Exception]] = []
+        publisher = BatchingEventPublisher(
+            FakeBatchPublisher(fail=True),
+            max_delay_ms=1,
+            on_error=lambda batch, e: errors.append((batch, e)),
+        )
+        events = make_events(2)
+
+        async with publisher:
+            await publisher.publish_many(events)
+            await asyncio.sleep(0.02)
+
+        assert len(errors) == 1
+        assert errors[0][0] == events
+        assert str(errors[0][1]) == "broker down"
+
+    async def test_background_flush_when_inner_fails_then_logs_by_default(self, caplog):
+        publisher = BatchingEventPublisher(
+            FakeBatchPublisher(fail=True), max_delay_ms=1
+        )
+
+        await publisher.publish_many(make_events(2))
+        await asyncio.sleep(0.02)
+        await publisher.aclose()
+
+        assert "Failed to publish a batch of 2 events" in caplog.text
+
+    @pytest.mark.parametrize(
+        "options, message",
+        [
+            ({"max_batch_size": 0}, "max_batch_size must be at least 1, got 0"),
+            ({"max_delay_ms": -1}, "max_delay_ms cannot be negative, got -1"),
+        ],
+    )
+    def test_init_when_invalid_limits_then_raises_value_error(self, options, message):
+        with pytest.raises(ValueError, match=message):
+            BatchingEventPublisher(FakeBatchPublisher(), **options)
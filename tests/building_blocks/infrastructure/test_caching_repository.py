@@ -0,0 +1,535 @@
+"""
+Unit tests for the caching_repository module.
+
+Tests for AggregateCache, AsyncCachingReadOnlyRepository,
+SyncCachingReadOnlyRepository, AsyncCachingRepository and
+SyncCachingRepository classes.
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateRoot, AggregateVersion
+from building_blocks.domain.ports.outbound.read_only_repository import (
+    AsyncReadOnlyRepository,
+    SyncReadOnlyRepository,
+)
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    SyncRepository,
+)
+from building_blocks.infrastructure.caching_repository import (
+    AggregateCache,
+    AsyncCachingReadOnlyRepository,
+    AsyncCachingRepository,
+    SyncCachingReadOnlyRepository,
+    SyncCachingRepository,
+)
+
+
+class FakeUser(AggregateRoot[int]):
+    """A fake aggregate."""
+
+    def __init__(self, user_id: int, email: str = "", version: int = 0) -> None:
+        super().__init__(user_id, version=AggregateVersion.of(version))
+        self.email = email
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeStore:
+    """Users by ID; every load builds a fresh aggregate and is counted."""
+
+    def __init__(self, *ids: int) -> None:
+        self.emails: Dict[int, str] = {id: f"user{id}@example.com" for id in ids}
+        self.loads = 0
+
+    def load(self, user_id: int) -> Optional[FakeUser]:
+        self.loads += 1
+        if user_id not in self.emails:
+            return None
+        return FakeUser(user_id, self.emails[user_id])
+
+    def load_by_email(self, email: str) -> Optional[FakeUser]:
+        self.loads += 1
+        for user_id, user_email in self.emails.items():
+            if user_email == email:
+                return FakeUser(user_id, email)
+        return None
+
+
+class FakeAsyncUserQueries(AsyncReadOnlyRepository[FakeUser, int]):
+    """Async read-only repository over a FakeStore."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    async def find_by_id(self, id: int) -> Optional[FakeUser]:
+        return self.store.load(id)
+
+    async def find_all(self) -> List[FakeUser]:
+        return [FakeUser(id) for id in self.store.emails]
+
+    async def find_by_email(self, email: str) -> Optional[FakeUser]:
+        return self.store.load_by_email(email)
+
+
+class FakeSyncUserQueries(SyncReadOnlyRepository[FakeUser, int]):
+    """Sync read-only repository over a FakeStore."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    def find_by_id(self, id: int) -> Optional[FakeUser]:
+        return self.store.load(id)
+
+    def find_all(self) -> List[FakeUser]:
+        return [FakeUser(id) for id in self.store.emails]
+
+    def find_by_email(self, email: str) -> Optional[FakeUser]:
+        return self.store.load_by_email(email)
+
+
+class FakeAsyncUserRepository(AsyncRepository[FakeUser, int]):
+    """Async repository over a FakeStore."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    async def find_by_id(self, id: int) -> Optional[FakeUser]:
+        return self.store.load(id)
+
+    async def save(self, aggregate: FakeUser) -> None:
+        self.store.emails[aggregate.id] = aggregate.email
+
+    async def delete_by_id(self, id: int) -> None:
+        self.store.emails.pop(id, None)
+
+    async def find_all(self) -> List[FakeUser]:
+        return [FakeUser(id) for id in self.store.emails]
+
+    async def find_by_email(self, email: str) -> Optional[FakeUser]:
+        return self.store.load_by_email(email)
+
+
+class FakeSyncUserRepository(SyncRepository[FakeUser, int]):
+    """Sync repository over a FakeStore."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    def find_by_id(self, id: int) -> Optional[FakeUser]:
+        return self.store.load(id)
+
+    def save(self, aggregate: FakeUser) -> None:
+        self.store.emails[aggregate.id] = aggregate.email
+
+    def delete_by_id(self, id: int) -> None:
+        self.store.emails.pop(id, None)
+
+    def find_all(self) -> List[FakeUser]:
+        return [FakeUser(id) for id in self.store.emails]
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestAggregateCache:
+    """Tests for AggregateCache class."""
+
+    def test_get_when_unknown_then_raises_key_error_and_counts_miss(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+
+        with pytest.raises(KeyError):
+            cache.get(1)
+
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_get_when_put_then_returns_aggregate_and_counts_hit(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        user = FakeUser(1)
+        cache.put(1, user)
+
+        assert cache.get(1) is user
+        assert cache.hit_ratio == 1.0
+
+    def test_get_when_put_as_missing_then_returns_none(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put(1, None)
+
+        assert cache.get(1) is None
+        assert cache.hits == 1
+
+    def test_get_when_expired_then_raises_key_error_and_drops_entry(self, clock):
+        cache: AggregateCache[FakeUser, int] = AggregateCache(
+            ttl_seconds=10, clock=clock
+        )
+        cache.put(1, FakeUser(1))
+
+        clock.now = 10
+
+        with pytest.raises(KeyError):
+            cache.get(1)
+        assert len(cache) == 0
+
+    def test_get_when_negative_ttl_shorter_then_misses_expire_first(self, clock):
+        cache: AggregateCache[FakeUser, int] = AggregateCache(
+            ttl_seconds=10, negative_ttl_seconds=1, clock=clock
+        )
+        cache.put(1, FakeUser(1))
+        cache.put(2, None)
+
+        clock.now = 5
+
+        assert cache.get(1) is not None
+        with pytest.raises(KeyError):
+            cache.get(2)
+
+    def test_put_when_full_then_evicts_least_recently_used(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache(max_size=2)
+        cache.put(1, FakeUser(1))
+        cache.put(2, FakeUser(2))
+        cache.get(1)
+
+        cache.put(3, FakeUser(3))
+
+        assert cache.get(1) is not None
+        with pytest.raises(KeyError):
+            cache.get(2)
+
+    def test_get_alias_when_put_then_returns_aggregate_by_key(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        user = FakeUser(1, "a@example.com")
+        cache.put_alias("email", "a@example.com", user)
+
+        assert cache.get_alias("email", "a@example.com") is user
+        assert cache.get(1) is user
+        assert (cache.hits, cache.misses) == (2, 0)
+
+    def test_get_alias_when_id_invalidated_then_raises_key_error(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put_alias("email", "a@example.com", FakeUser(1))
+
+        cache.invalidate(1)
+
+        with pytest.raises(KeyError):
+            cache.get_alias("email", "a@example.com")
+
+    def test_get_alias_when_put_as_missing_then_returns_none(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put_alias("email", "a@example.com", None)
+
+        assert cache.get_alias("email", "a@example.com") is None
+
+    def test_get_alias_when_aggregate_recached_with_new_version_then_raises(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put_alias("email", "a@example.com", FakeUser(1, "a@example.com"))
+
+        cache.put(1, FakeUser(1, "b@example.com", version=1))
+
+        with pytest.raises(KeyError):
+            cache.get_alias("email", "a@example.com")
+        assert len(cache) == 1
+
+    def test_put_when_alias_evicted_then_on_saved_keeps_other_entries(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache(max_size=2)
+        cache.put_alias("email", "a@example.com", FakeUser(1))
+        user = FakeUser(2)
+
+        cache.put(2, user)
+        cache.on_saved(FakeUser(1))
+
+        assert cache.get(2) is user
+
+    def test_on_saved_when_aliases_cached_then_drops_them(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        user = FakeUser(1, "a@example.com")
+        cache.put_alias("email", "a@example.com", user)
+        cache.put_alias("name", "alice", user)
+
+        cache.on_saved(FakeUser(1, "b@example.com"))
+
+        with pytest.raises(KeyError):
+            cache.get_alias("email", "a@example.com")
+        with pytest.raises(KeyError):
+            cache.get_alias("name", "alice")
+        assert cache.get(1) is user
+
+    def test_on_saved_when_alias_cached_as_missing_then_drops_it(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put_alias("email", "b@example.com", None)
+
+        cache.on_saved(FakeUser(2, "b@example.com", version=1))
+
+        with pytest.raises(KeyError):
+            cache.get_alias("email", "b@example.com")
+        assert len(cache) == 0
+
+    def test_on_deleted_when_cached_then_drops_entry_and_aliases(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put_alias("email", "a@example.com", FakeUser(1))
+        cache.put(2, FakeUser(2))
+
+        cache.on_deleted(1)
+
+        with pytest.raises(KeyError):
+            cache.get_alias("email", "a@example.com")
+        assert len(cache) == 1
+
+    def test_on_saved_when_version_changed_then_drops_entry(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put(1, FakeUser(1, version=1))
+
+        cache.on_saved(FakeUser(1, version=2))
+
+        assert len(cache) == 0
+
+    def test_on_saved_when_same_version_then_keeps_entry(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        user = FakeUser(1, version=1)
+        cache.put(1, user)
+
+        cache.on_saved(FakeUser(1, version=1))
+        cache.on_saved(FakeUser(2, version=1))
+
+        assert cache.get(1) is user
+
+    def test_on_saved_when_cached_as_missing_then_drops_entry(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put(1, None)
+
+        cache.on_saved(FakeUser(1, version=1))
+
+        assert len(cache) == 0
+
+    def test_clear_when_entries_then_drops_them_but_keeps_counters(self):
+        cache: AggregateCache[FakeUser, int] = AggregateCache()
+        cache.put(1, FakeUser(1))
+        cache.get(1)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 1
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"max_size": 0}, "max_size must be at least 1, got 0"),
+            ({"ttl_seconds": 0}, "ttl_seconds must be positive, got 0"),
+            ({"negative_ttl_seconds": -1}, "negative_ttl_seconds must be positive"),
+        ],
+    )
+    def test_init_when_invalid_settings_then_raises_value_error(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            AggregateCache(**kwargs)
+
+
+class TestAsyncCachingReadOnlyRepository:
+    """Tests for AsyncCachingReadOnlyRepository class."""
+
+    async def test_find_by_id_when_repeated_then_loads_once(self):
+        store = FakeStore(1)
+        repository = AsyncCachingReadOnlyRepository(FakeAsyncUserQueries(store))
+
+        first = await repository.find_by_id(1)
+
+        assert await repository.find_by_id(1) is first
+        assert store.loads == 1
+
+    async def test_find_by_id_when_missing_then_caches_the_miss(self):
+        store = FakeStore()
+        repository = AsyncCachingReadOnlyRepository(FakeAsyncUserQueries(store))
+
+        assert await repository.find_by_id(1) is None
+        assert await repository.find_by_id(1) is None
+        assert store.loads == 1
+
+    async def test_find_by_id_when_saved_with_new_version_then_reloads(self):
+        store = FakeStore(1)
+        repository = AsyncCachingReadOnlyRepository(FakeAsyncUserQueries(store))
+        await repository.find_by_id(1)
+
+        repository.cache.on_saved(FakeUser(1, version=1))
+        await repository.find_by_id(1)
+
+        assert store.loads == 2
+
+    async def test_find_by_ids_when_some_cached_then_loads_only_the_others(self):
+        store = FakeStore(1, 2, 3)
+        repository = AsyncCachingReadOnlyRepository(FakeAsyncUserQueries(store))
+        first = await repository.find_by_id(1)
+        await repository.find_by_id(4)
+
+        users = await repository.find_by_ids([3, 1, 4, 5, 3])
+
+        assert list(users) == [3, 1]
+        assert users[1] is first
+        assert store.loads == 4
+        await repository.find_by_ids([5])
+        assert store.loads == 4
+
+    async def test_find_by_when_repeated_then_loads_once(self):
+        store = FakeStore(1)
+        queries = FakeAsyncUserQueries(store)
+        repository = AsyncCachingReadOnlyRepository(queries)
+        email = "user1@example.com"
+
+        user = await repository.find_by(
+            "email", email, lambda: queries.find_by_email(email)
+        )
+
+        assert (
+            await repository.find_by(
+                "email", email, lambda: queries.find_by_email(email)
+            )
+            is user
+        )
+        assert await repository.find_by_id(1) is user
+        assert store.loads == 1
+
+    async def test_find_all_when_called_then_forwards_without_caching(self):
+        store = FakeStore(1, 2)
+        repository = AsyncCachingReadOnlyRepository(FakeAsyncUserQueries(store))
+
+        assert [user.id for user in await repository.find_all()] == [1, 2]
+        assert [user.id async for user in repository.stream_all()] == [1, 2]
+        assert [user.id for user in (await repository.find_page(limit=1)).items] == [1]
+        assert len(repository.cache) == 0
+
+
+class TestSyncCachingReadOnlyRepository:
+    """Tests for SyncCachingReadOnlyRepository class."""
+
+    def test_find_by_id_when_repeated_then_loads_once(self):
+        store = FakeStore(1)
+        repository = SyncCachingReadOnlyRepository(FakeSyncUserQueries(store))
+
+        assert repository.find_by_id(1) is repository.find_by_id(1)
+        assert store.loads == 1
+
+    def test_find_by_id_when_shared_cache_expired_then_reloads(self, clock):
+        store = FakeStore(1)
+        cache: AggregateCache[FakeUser, int] = AggregateCache(
+            ttl_seconds=1, clock=clock
+        )
+        repository = SyncCachingReadOnlyRepository(FakeSyncUserQueries(store), cache)
+        repository.find_by_id(1)
+
+        clock.now = 1
+        repository.find_by_id(1)
+
+        assert store.loads == 2
+
+    def test_find_by_ids_when_some_cached_then_loads_only_the_others(self):
+        store = FakeStore(1, 2)
+        repository = SyncCachingReadOnlyRepository(FakeSyncUserQueries(store))
+        repository.find_by_id(1)
+
+        assert list(repository.find_by_ids([1, 2])) == [1, 2]
+        assert store.loads == 2
+
+    def test_find_by_when_missing_then_caches_the_miss(self):
+        store = FakeStore()
+        queries = FakeSyncUserQueries(store)
+        repository = SyncCachingReadOnlyRepository(queries)
+
+        for _ in range(2):
+            assert (
+                repository.find_by("email", "x", lambda: queries.find_by_email("x"))
+                is None
+            )
+
+        assert store.loads == 1
+
+    def test_find_all_when_called_then_forwards_without_caching(self):
+        store = FakeStore(1)
+        repository = SyncCachingReadOnlyRepository(FakeSyncUserQueries(store))
+
+        assert [user.id for user in repository.find_all()] == [1]
+        assert [user.id for user in repository.stream_all()] == [1]
+        assert repository.find_page().items[0].id == 1
+
+
+class TestAsyncCachingRepository:
+    """Tests for AsyncCachingRepository class."""
+
+    async def test_find_by_id_when_repeated_then_loads_once(self):
+        store = FakeStore(1)
+        repository = AsyncCachingRepository(FakeAsyncUserRepository(store))
+
+        assert await repository.find_by_id(1) is await repository.find_by_id(1)
+        assert store.loads == 1
+
+    async def test_save_when_cached_then_next_read_loads_saved_version(self):
+        store = FakeStore(1)
+        repository = AsyncCachingRepository(FakeAsyncUserRepository(store))
+        await repository.find_by_id(1)
+
+        await repository.save(FakeUser(1, "new@example.com"))
+
+        user = await repository.find_by_id(1)
+        assert user is not None and user.email == "new@example.com"
+        assert store.loads == 2
+
+    async def test_save_many_when_aliases_cached_then_drops_them(self):
+        store = FakeStore(1)
+        users = FakeAsyncUserRepository(store)
+        repository = AsyncCachingRepository(users)
+        old, new = "user1@example.com", "new@example.com"
+        await repository.find_by("email", old, lambda: users.find_by_email(old))
+        await repository.find_by("email", new, lambda: users.find_by_email(new))
+
+        await repository.save_many(iter([FakeUser(1, new)]))
+
+        assert (
+            await repository.find_by("email", old, lambda: users.find_by_email(old))
+            is None
+        )
+        user = await repository.find_by("email", new, lambda: users.find_by_email(new))
+        assert user is not None and user.id == 1
+
+    async def test_delete_by_ids_when_cached_then_next_read_finds_nothing(self):
+        store = FakeStore(1, 2)
+        repository = AsyncCachingRepository(FakeAsyncUserRepository(store))
+        await repository.find_by_ids([1, 2])
+
+        await repository.delete_by_ids(iter([1, 2]))
+
+        assert await repository.find_by_ids([1, 2]) == {}
+        assert store.loads == 4
+
+
+class TestSyncCachingRepository:
+    """Tests for SyncCachingRepository class."""
+
+    def test_save_when_cached_then_next_read_loads_saved_version(self):
+        store = FakeStore(1)
+        repository = SyncCachingRepository(FakeSyncUserRepository(store))
+        repository.find_by_id(1)
+
+        repository.save(FakeUser(1, "new@example.com"))
+
+        user = repository.find_by_id(1)
+        assert user is not None and user.email == "new@example.com"
+
+    def test_delete_by_id_when_cached_then_next_read_finds_nothing(self):
+        store = FakeStore(1)
+        repository = SyncCachingRepository(FakeSyncUserRepository(store))
+        repository.find_by_id(1)
+
+        repository.delete_by_id(1)
+
+        assert repository.find_by_id(1) is None
+        assert store.loads == 2
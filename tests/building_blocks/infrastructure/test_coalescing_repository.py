@@ -0,0 +1,154 @@
+"""
+Unit tests for the coalescing_repository module.
+
+Tests for AsyncCoalescingRepository class.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.ports.outbound.repository import AsyncRepository
+from building_blocks.infrastructure.coalescing_repository import (
+    AsyncCoalescingRepository,
+)
+
+
+class FakeUser(AggregateRoot[int]):
+    """A fake aggregate."""
+
+
+class FakeUserRepository(AsyncRepository[FakeUser, int]):
+    """Repository over a dict, recording every batch it is asked for."""
+
+    def __init__(self, *ids: int) -> None:
+        self.users = {user_id: FakeUser(user_id) for user_id in ids}
+        self.batches: List[List[int]] = []
+        self.error: Optional[BaseException] = None
+
+    async def find_by_id(self, id: int) -> Optional[FakeUser]:
+        return self.users.get(id)
+
+    async def find_by_ids(self, ids: Iterable[int]) -> Dict[int, FakeUser]:
+        batch = list(ids)
+        self.batches.append(batch)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return {id: self.users[id] for id in batch if id in self.users}
+
+    async def save(self, aggregate: FakeUser) -> None:
+        self.users[aggregate.id] = aggregate
+
+    async def delete_by_id(self, id: int) -> None:
+        self.users.pop(id, None)
+
+    async def find_all(self) -> List[FakeUser]:
+        return list(self.users.values())
+
+
+class TestAsyncCoalescingRepository:
+    """Tests for AsyncCoalescingRepository class."""
+
+    async def test_find_by_id_when_concurrent_then_loads_once_deduplicated(self):
+        wrapped = FakeUserRepository(1, 2)
+        repository = AsyncCoalescingRepository(wrapped)
+
+        users = await asyncio.gather(
+            *(repository.find_by_id(user_id) for user_id in (1, 2, 1, 3))
+        )
+
+        assert wrapped.batches == [[1, 2, 3]]
+        assert users == [wrapped.users[1], wrapped.users[2], wrapped.users[1], None]
+        assert users[0] is users[2]
+        assert repository.batch_count == 1
+
+    async def test_find_by_id_when_sequential_then_loads_once_per_call(self):
+        wrapped = FakeUserRepository(1)
+        repository = AsyncCoalescingRepository(wrapped)
+
+        await repository.find_by_id(1)
+        await repository.find_by_id(1)
+
+        assert wrapped.batches == [[1], [1]]
+
+    async def test_find_by_id_when_max_batch_size_reached_then_sends_early(self):
+        wrapped = FakeUserRepository(1, 2, 3)
+        repository = AsyncCoalescingRepository(wrapped, max_batch_size=2)
+
+        await asyncio.gather(*(repository.find_by_id(user_id) for user_id in (1, 2, 3)))
+
+        assert wrapped.batches == [[1, 2], [3]]
+
+    async def test_find_by_id_when_lookup_fails_then_every_caller_raises(self):
+        wrapped = FakeUserRepository(1)
+        wrapped.error = ConnectionError("down")
+        repository = AsyncCoalescingRepository(wrapped)
+
+        results = await asyncio.gather(
+            repository.find_by_id(1),
+            repository.find_by_id(2),
+            return_exceptions=True,
+        )
+
+        assert [type(result) for result in results] == [ConnectionError] * 2
+
+    async def test_find_by_id_when_lookup_cancelled_then_every_caller_cancelled(
+        self,
+    ):
+        wrapped = FakeUserRepository(1)
+        wrapped.error = asyncio.CancelledError()
+        repository = AsyncCoalescingRepository(wrapped)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                repository.find_by_id(1),
+                repository.find_by_ids([1, 2]),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+        assert [type(result) for result in results] == [asyncio.CancelledError] * 2
+
+    async def test_find_by_id_when_one_caller_cancelled_then_others_get_result(self):
+        wrapped = FakeUserRepository(1)
+        repository = AsyncCoalescingRepository(wrapped)
+        cancelled = asyncio.ensure_future(repository.find_by_id(1))
+        waiting = asyncio.ensure_future(repository.find_by_id(1))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+
+        assert await waiting is wrapped.users[1]
+
+    async def test_find_by_ids_when_concurrent_with_find_by_id_then_shares_batch(
+        self,
+    ):
+        wrapped = FakeUserRepository(1, 2, 3)
+        repository = AsyncCoalescingRepository(wrapped)
+
+        user, users = await asyncio.gather(
+            repository.find_by_id(3), repository.find_by_ids([1, 4, 3])
+        )
+
+        assert wrapped.batches == [[3, 1, 4]]
+        assert list(users) == [1, 3]
+        assert users[3] is user
+
+    async def test_save_when_called_then_forwards_to_wrapped_repository(self):
+        wrapped = FakeUserRepository()
+        repository = AsyncCoalescingRepository(wrapped)
+
+        await repository.save_many([FakeUser(1), FakeUser(2)])
+        await repository.delete_by_ids([2])
+
+        assert [user.id for user in await repository.find_all()] == [1]
+        assert (await repository.find_page()).items == [wrapped.users[1]]
+        assert [user async for user in repository.stream_all()] == [wrapped.users[1]]
+
+    def test_init_when_max_batch_size_below_one_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+            AsyncCoalescingRepository(FakeUserRepository(), max_batch_size=0)
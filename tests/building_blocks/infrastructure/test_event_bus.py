@@ -0,0 +1,260 @@
+"""
+Unit tests for the event bus module.
+
+Tests for InMemoryEventBus class.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import pytest
+
+from building_blocks.domain.messages.event import Event
+from building_blocks.infrastructure.event_bus import InMemoryEventBus
+
+
+class FakeOrderEvent(Event):
+    """A fake base event."""
+
+    order_id: str
+
+
+class FakeOrderPlaced(FakeOrderEvent):
+    """A fake event derived from FakeOrderEvent."""
+
+
+class FakeUserRegistered(Event):
+    """A fake unrelated event."""
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return {}
+
+
+class Recorder:
+    """Collects the events it handles."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.events: List[Event] = []
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, event: Event) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.events.append(event)
+        self.running -= 1
+
+
+class TestInMemoryEventBus:
+    """Tests for InMemoryEventBus class."""
+
+    async def test_publish_when_handler_subscribed_then_calls_handler(self):
+        bus = InMemoryEventBus()
+        handler = Recorder()
+        bus.subscribe(FakeOrderPlaced, handler)
+        event = FakeOrderPlaced("order-1")
+
+        await bus.publish(event)
+
+        assert handler.events == [event]
+
+    async def test_publish_when_no_handler_then_does_nothing(self):
+        bus = InMemoryEventBus()
+
+        await bus.publish(FakeOrderPlaced("order-1"))
+
+    async def test_publish_when_base_class_subscribed_then_calls_handler(self):
+        bus = InMemoryEventBus()
+        base_handler = Recorder()
+        all_handler = Recorder()
+        other_handler = Recorder()
+        bus.subscribe(Event, all_handler)
+        bus.subscribe(FakeOrderEvent, base_handler)
+        bus.subscribe(FakeUserRegistered, other_handler)
+        event = FakeOrderPlaced("order-1")
+
+        await bus.publish(event)
+
+        assert base_handler.events == [event]
+        assert all_handler.events == [event]
+        assert other_handler.events == []
+
+    async def test_publish_when_many_handlers_then_runs_them_concurrently(self):
+        bus = InMemoryEventBus()
+        started: List[str] = []
+        release = asyncio.Event()
+
+        def make_handler(name: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                started.append(name)
+                await release.wait()
+
+            return handler
+
+        bus.subscribe(FakeOrderPlaced, make_handler("first"))
+        bus.subscribe(FakeOrderPlaced, make_handler("second"))
+
+        publishing = asyncio.ensure_future(bus.publish(FakeOrderPlaced("order-1")))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert sorted(started) == ["first", "second"]
+        release.set()
+        await publishing
+
+    async def test_publish_when_handler_fails_then_raises_after_others_finish(self):
+        bus = InMemoryEventBus()
+        handler = Recorder(delay=0.01)
+
+        async def failing(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        bus.subscribe(FakeOrderPlaced, failing)
+        bus.subscribe(FakeOrderPlaced, handler)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await bus.publish(FakeOrderPlaced("order-1"))
+        assert len(handler.events) == 1
+
+    async def test_publish_when_subscribed_after_first_publish_then_includes_it(
+        self,
+    ):
+        bus = InMemoryEventBus()
+        first = Recorder()
+        second = Recorder()
+        bus.subscribe(FakeOrderPlaced, first)
+        await bus.publish(FakeOrderPlaced("order-1"))
+
+        bus.subscribe(FakeOrderEvent, second)
+        await bus.publish(FakeOrderPlaced("order-2"))
+
+        assert len(first.events) == 2
+        assert len(second.events) == 1
+
+    async def test_publish_when_max_concurrency_then_limits_running_handlers(self):
+        bus = InMemoryEventBus()
+        handler = Recorder(delay=0.01)
+        bus.subscribe(FakeOrderPlaced, handler, max_concurrency=2)
+
+        await asyncio.gather(*(bus.publish(FakeOrderPlaced(str(i))) for i in range(6)))
+
+        assert len(handler.events) == 6
+        assert handler.max_running == 2
+
+    async def test_publish_when_queued_then_returns_before_handler_runs(self):
+        bus = InMemoryEventBus()
+        handler = Recorder()
+        bus.subscribe(FakeOrderPlaced, handler, queue_size=10)
+
+        async with bus:
+            await bus.publish(FakeOrderPlaced("order-1"))
+            assert handler.events == []
+
+        assert len(handler.events) == 1
+
+    async def test_publish_when_queue_full_then_waits_for_room(self):
+        bus = InMemoryEventBus()
+        release = asyncio.Event()
+        handled: List[str] = []
+
+        async def blocked(event: FakeOrderPlaced) -> None:
+            await release.wait()
+            handled.append(event.order_id)
+
+        bus.subscribe(FakeOrderPlaced, blocked, queue_size=1)
+        await bus.publish(FakeOrderPlaced("1"))
+        await asyncio.sleep(0)
+        await bus.publish(FakeOrderPlaced("2"))
+
+        third = asyncio.ensure_future(bus.publish(FakeOrderPlaced("3")))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        release.set()
+        await third
+        await bus.aclose()
+        assert handled == ["1", "2", "3"]
+
+    async def test_publish_when_queued_with_concurrency_then_uses_workers(self):
+        bus = InMemoryEventBus()
+        handler = Recorder(delay=0.01)
+        bus.subscribe(FakeOrderPlaced, handler, queue_size=10, max_concurrency=3)
+
+        for i in range(6):
+            await bus.publish(FakeOrderPlaced(str(i)))
+        await bus.join()
+
+        assert len(handler.events) == 6
+        assert handler.max_running == 3
+        await bus.aclose()
+
+    async def test_publish_when_queued_handler_fails_then_calls_on_error(self):
+        errors: List[Tuple[Event, Exception]] = []
+        bus = InMemoryEventBus(on_error=lambda event, e: errors.append((event, e)))
+
+        async def failing(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        bus.subscribe(FakeOrderPlaced, failing, queue_size=10)
+        event = FakeOrderPlaced("order-1")
+
+        async with bus:
+            await bus.publish(event)
+
+        assert len(errors) == 1
+        assert errors[0][0] is event
+        assert str(errors[0][1]) == "boom"
+
+    async def test_publish_when_queued_handler_fails_then_logs_by_default(self, caplog):
+        bus = InMemoryEventBus()
+
+        async def failing(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        bus.subscribe(FakeOrderPlaced, failing, queue_size=10)
+
+        async with bus:
+            await bus.publish(FakeOrderPlaced("order-1"))
+
+        assert "Handler failed for FakeOrderPlaced" in caplog.text
+
+    async def test_publish_when_on_error_fails_then_worker_keeps_handling(self, caplog):
+        def failing_on_error(event: Event, error: Exception) -> None:
+            raise ValueError("error handler broken")
+
+        bus = InMemoryEventBus(on_error=failing_on_error)
+        handled: List[str] = []
+
+        async def handler(event: Event) -> None:
+            if len(handled) == 0:
+                handled.append("failed")
+                raise RuntimeError("boom")
+            handled.append("handled")
+
+        bus.subscribe(FakeOrderPlaced, handler, queue_size=1)
+
+        for i in range(3):
+            await asyncio.wait_for(bus.publish(FakeOrderPlaced(f"order-{i}")), 1)
+        await asyncio.wait_for(bus.join(), 1)
+        await bus.aclose()
+
+        assert handled == ["failed", "handled", "handled"]
+        assert "Error handler failed for FakeOrderPlaced" in caplog.text
+
+    @pytest.mark.parametrize(
+        "options, message",
+        [
+            ({"max_concurrency": 0}, "max_concurrency must be at least 1, got 0"),
+            ({"queue_size": 0}, "queue_size must be at least 1, got 0"),
+        ],
+    )
+    def test_subscribe_when_invalid_limit_then_raises_value_error(
+        self, options, message
+    ):
+        bus = InMemoryEventBus()
+
+        with pytest.raises(ValueError, match=message):
+            bus.subscribe(FakeOrderPlaced, Recorder(), **options)
@@ -0,0 +1,191 @@
+"""
+Unit tests for the event_sourced_repository module.
+
+Tests for AsyncEventSourcedRepository and SyncEventSourcedRepository classes.
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from building_blocks.application.ports.outbound.snapshot_store import (
+    AsyncSnapshotStore,
+)
+from building_blocks.domain.aggregate_root import AggregateVersion
+from building_blocks.domain.errors.concurrency_error import ConcurrencyError
+from building_blocks.domain.event_sourced_aggregate_root import (
+    EventSourcedAggregateRoot,
+    Snapshot,
+    handles,
+)
+from building_blocks.domain.messages.codec import MessageCodec
+from building_blocks.domain.messages.event import Event
+from building_blocks.infrastructure.event_sourced_repository import (
+    AsyncEventSourcedRepository,
+    SyncEventSourcedRepository,
+)
+from building_blocks.infrastructure.file_event_store import (
+    AsyncFileEventStore,
+    SyncFileEventStore,
+)
+from building_blocks.infrastructure.snapshot_store import (
+    AsyncFileSnapshotStore,
+    SyncInMemorySnapshotStore,
+)
+
+
+class FakeMoneyDeposited(Event):
+    """A fake event adding to the balance."""
+
+    amount: int
+
+
+class FakeAccount(EventSourcedAggregateRoot[int]):
+    """A fake event-sourced aggregate, snapshotted every three events."""
+
+    snapshot_every = 3
+
+    def __init__(self, account_id: int) -> None:
+        super().__init__(account_id)
+        self.deposits: List[int] = []
+
+    def deposit(self, amount: int) -> None:
+        self.record_event(FakeMoneyDeposited(amount=amount))
+
+    @handles(FakeMoneyDeposited)
+    def _on_deposited(self, event: FakeMoneyDeposited) -> None:
+        self.deposits.append(event.amount)
+
+
+class FakeBrokenSnapshotStore(AsyncSnapshotStore):
+    """Snapshot store whose every call fails."""
+
+    async def save(self, snapshot: Snapshot) -> None:
+        raise OSError("disk gone")
+
+    async def load(self, aggregate_id: int) -> Optional[Snapshot]:
+        raise OSError("disk gone")
+
+
+@pytest.fixture
+def codec() -> MessageCodec:
+    codec = MessageCodec()
+    codec.register(FakeMoneyDeposited)
+    return codec
+
+
+def account_with(*amounts: int) -> FakeAccount:
+    account = FakeAccount(1)
+    for amount in amounts:
+        account.deposit(amount)
+    return account
+
+
+class TestAsyncEventSourcedRepository:
+    """Tests for AsyncEventSourcedRepository class."""
+
+    async def test_find_by_id_when_saved_then_replays_events(self, tmp_path, codec):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as events:
+            repository = AsyncEventSourcedRepository(FakeAccount, events)
+            account = account_with(5, 7)
+
+            await repository.save(account)
+            found = await repository.find_by_id(1)
+
+            assert found is not None
+            assert account.version.value == 2
+            assert account.uncommitted_changes() == []
+            assert found.deposits == [5, 7]
+            assert found.version.value == 2
+            assert await events.read("FakeAccount-1") != []
+            assert await repository.find_by_id(2) is None
+
+    async def test_save_when_loaded_version_stale_then_raises_concurrency_error(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as events:
+            repository = AsyncEventSourcedRepository(FakeAccount, events)
+            await repository.save(account_with(1))
+            first = await repository.find_by_id(1)
+            second = await repository.find_by_id(1)
+            assert first is not None and second is not None
+            first.deposit(2)
+            await repository.save(first)
+            second.deposit(3)
+
+            with pytest.raises(ConcurrencyError):
+                await repository.save(second)
+
+    async def test_save_when_snapshot_due_then_stores_snapshot(self, tmp_path, codec):
+        async with AsyncFileEventStore[Event](tmp_path / "events", codec) as events:
+            snapshots = AsyncFileSnapshotStore(tmp_path / "snapshots")
+            repository = AsyncEventSourcedRepository(FakeAccount, events, snapshots)
+
+            await repository.save(account_with(1, 2))
+            assert await snapshots.load(1) is None
+            found = await repository.find_by_id(1)
+            assert found is not None
+            found.deposit(3)
+            await repository.save(found)
+
+            snapshot = await snapshots.load(1)
+            assert snapshot is not None
+            assert snapshot.version.value == 3
+            assert snapshot.state == {"deposits": [1, 2, 3]}
+
+    async def test_find_by_id_when_snapshot_then_reads_only_later_events(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path / "events", codec) as events:
+            snapshots = AsyncFileSnapshotStore(tmp_path / "snapshots")
+            repository = AsyncEventSourcedRepository(FakeAccount, events, snapshots)
+            account = account_with(1, 2, 3)
+            await repository.save(account)
+            account.deposit(4)
+            await repository.save(account)
+            # A snapshot with different state shows it was used.
+            await snapshots.save(Snapshot(1, AggregateVersion.of(3), {"deposits": []}))
+
+            found = await repository.find_by_id(1)
+
+            assert found is not None
+            assert found.deposits == [1, 2, 3, 4]
+            assert found.version.value == 4
+
+    async def test_find_by_id_when_snapshot_store_fails_then_replays_full_stream(
+        self, tmp_path, codec, caplog
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as events:
+            repository = AsyncEventSourcedRepository(
+                FakeAccount, events, FakeBrokenSnapshotStore()
+            )
+
+            await repository.save(account_with(1, 2, 3))
+            found = await repository.find_by_id(1)
+
+            assert found is not None
+            assert found.deposits == [1, 2, 3]
+            assert "Failed to save a snapshot of 1" in caplog.text
+            assert "Failed to load the snapshot of 1" in caplog.text
+
+
+class TestSyncEventSourcedRepository:
+    """Tests for SyncEventSourcedRepository class."""
+
+    def test_find_by_id_when_snapshot_then_restores_from_it(self, tmp_path, codec):
+        with SyncFileEventStore[Event](tmp_path, codec) as events:
+            snapshots = SyncInMemorySnapshotStore()
+            repository = SyncEventSourcedRepository(FakeAccount, events, snapshots)
+            account = account_with(1, 2, 3)
+            repository.save(account)
+            account.deposit(4)
+            repository.save(account)
+
+            found = repository.find_by_id(1)
+            snapshot = snapshots.load(1)
+
+            assert found is not None
+            assert found.deposits == [1, 2, 3, 4]
+            assert snapshot is not None
+            assert snapshot.version.value == 3
+            assert repository.find_by_id(2) is None
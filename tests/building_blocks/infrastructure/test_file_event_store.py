@@ -0,0 +1,293 @@
+"""
+Unit tests for the file_event_store module.
+
+Tests for AsyncFileEventStore and SyncFileEventStore classes.
+"""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from building_blocks.domain.errors.concurrency_error import ConcurrencyError
+from building_blocks.domain.messages.codec import MessageCodec
+from building_blocks.domain.messages.event import Event
+from building_blocks.infrastructure.file_event_store import (
+    AsyncFileEventStore,
+    SyncFileEventStore,
+)
+
+
+class FakeMoneyDeposited(Event):
+    """A fake event stored in the tests."""
+
+    amount: int
+
+
+class FakeUnregistered(Event):
+    """A fake event the codec does not know."""
+
+    reason: str
+
+
+@pytest.fixture
+def codec() -> MessageCodec:
+    codec = MessageCodec()
+    codec.register(FakeMoneyDeposited)
+    return codec
+
+
+def deposits(*amounts: int) -> List[FakeMoneyDeposited]:
+    return [FakeMoneyDeposited(amount=amount) for amount in amounts]
+
+
+def amounts(events: List[Event]) -> List[int]:
+    return [event.payload["amount"] for event in events]
+
+
+def segments(directory: Path) -> List[Path]:
+    return sorted(directory.glob("*.log"))
+
+
+class TestAsyncFileEventStore:
+    """Tests for AsyncFileEventStore class."""
+
+    async def test_append_when_new_stream_then_read_returns_events(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            events = deposits(5, 7)
+
+            version = await store.append("account-1", 0, events)
+
+            assert version == 2
+            assert await store.read("account-1") == events
+            assert await store.read("account-2") == []
+
+    async def test_read_when_from_version_then_returns_only_later_events(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            await store.append("account-1", 0, deposits(1, 2))
+            await store.append("account-1", 2, deposits(3))
+
+            assert amounts(await store.read("account-1", 1)) == [2, 3]
+            assert await store.read("account-1", 3) == []
+
+    async def test_append_when_expected_version_stale_then_raises_and_stores_nothing(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            await store.append("account-1", 0, deposits(1))
+
+            with pytest.raises(ConcurrencyError, match="expected version 0"):
+                await store.append("account-1", 0, deposits(2))
+
+            assert amounts(await store.read("account-1")) == [1]
+
+    async def test_append_when_concurrent_on_one_stream_then_one_succeeds(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            results = await asyncio.gather(
+                store.append("account-1", 0, deposits(1)),
+                store.append("account-1", 0, deposits(2)),
+                return_exceptions=True,
+            )
+
+            assert results[0] == 1
+            assert isinstance(results[1], ConcurrencyError)
+            assert amounts(await store.read("account-1")) == [1]
+
+    async def test_append_when_concurrent_then_shares_one_fsync(self, tmp_path, codec):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            versions = await asyncio.gather(
+                *(store.append(f"account-{i}", 0, deposits(i)) for i in range(10))
+            )
+
+            assert versions == [1] * 10
+            assert store.sync_count == 1
+
+    async def test_append_when_no_events_then_checks_version_and_writes_nothing(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            assert await store.append("account-1", 0, []) == 0
+            with pytest.raises(ConcurrencyError):
+                await store.append("account-1", 1, [])
+
+            assert store.sync_count == 0
+
+    async def test_init_when_reopened_then_rebuilds_streams(self, tmp_path, codec):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            await store.append("account-1", 0, deposits(1, 2))
+            await store.append("account-2", 0, deposits(3))
+
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            assert amounts(await store.read("account-1")) == [1, 2]
+            assert await store.append("account-2", 1, deposits(4)) == 2
+
+    async def test_append_when_segment_full_then_rolls_to_new_segment(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](
+            tmp_path, codec, max_segment_bytes=1
+        ) as store:
+            for version in range(3):
+                await store.append("account-1", version, deposits(version))
+
+            assert len(segments(tmp_path)) == 3
+            assert amounts(await store.read("account-1")) == [0, 1, 2]
+
+        async with AsyncFileEventStore[Event](
+            tmp_path, codec, max_segment_bytes=1
+        ) as store:
+            assert amounts(await store.read("account-1", 1)) == [1, 2]
+
+    async def test_init_when_last_append_torn_then_drops_it(self, tmp_path, codec):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            await store.append("account-1", 0, deposits(1))
+            await store.append("account-1", 1, deposits(2, 3))
+        [segment] = segments(tmp_path)
+        size = segment.stat().st_size
+        os.truncate(segment, size - 1)
+
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            assert amounts(await store.read("account-1")) == [1]
+            await store.append("account-1", 1, deposits(4))
+
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            assert amounts(await store.read("account-1")) == [1, 4]
+
+    async def test_init_when_earlier_segment_corrupt_then_raises_value_error(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](
+            tmp_path, codec, max_segment_bytes=1
+        ) as store:
+            await store.append("account-1", 0, deposits(1))
+            await store.append("account-1", 1, deposits(2))
+        first = segments(tmp_path)[0]
+        first.write_bytes(first.read_bytes()[:-1] + b"\xff")
+
+        with pytest.raises(ValueError, match="Corrupt frame"):
+            AsyncFileEventStore(tmp_path, codec)
+
+    async def test_append_when_fsync_fails_then_raises_and_stops(
+        self, tmp_path, codec, monkeypatch
+    ):
+        store: AsyncFileEventStore[Event] = AsyncFileEventStore(tmp_path, codec)
+
+        def failing_fsync(fd: int) -> None:
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+
+        with pytest.raises(OSError, match="disk gone"):
+            await store.append("account-1", 0, deposits(1))
+        monkeypatch.undo()
+        with pytest.raises(OSError, match="stopped after a failed fsync"):
+            await store.append("account-2", 0, deposits(1))
+        await store.aclose()
+
+    async def test_append_when_event_type_not_registered_then_raises_value_error(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            with pytest.raises(
+                ValueError, match="'FakeUnregistered' is not registered"
+            ):
+                await store.append("account-1", 0, [FakeUnregistered(reason="x")])
+
+            assert await store.append("account-1", 0, deposits(1)) == 1
+
+    async def test_append_when_closed_then_raises_value_error(self, tmp_path, codec):
+        store: AsyncFileEventStore[Event] = AsyncFileEventStore(tmp_path, codec)
+        await store.aclose()
+
+        with pytest.raises(ValueError, match="closed"):
+            await store.append("account-1", 0, deposits(1))
+
+    async def test_append_when_expected_version_negative_then_raises_value_error(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            with pytest.raises(ValueError, match="expected_version cannot be negative"):
+                await store.append("account-1", -1, deposits(1))
+
+    async def test_read_when_from_version_negative_then_raises_value_error(
+        self, tmp_path, codec
+    ):
+        async with AsyncFileEventStore[Event](tmp_path, codec) as store:
+            with pytest.raises(ValueError, match="from_version cannot be negative"):
+                await store.read("account-1", -1)
+
+    def test_init_when_max_segment_bytes_below_one_then_raises_value_error(
+        self, tmp_path, codec
+    ):
+        with pytest.raises(ValueError, match="max_segment_bytes must be at least 1"):
+            AsyncFileEventStore(tmp_path, codec, max_segment_bytes=0)
+
+
+class TestSyncFileEventStore:
+    """Tests for SyncFileEventStore class."""
+
+    def test_append_when_new_stream_then_read_returns_events(self, tmp_path, codec):
+        with SyncFileEventStore[Event](tmp_path, codec) as store:
+            events = deposits(5, 7)
+
+            assert store.append("account-1", 0, events) == 2
+            assert store.read("account-1") == events
+            assert store.read("account-1", 1) == events[1:]
+
+    def test_append_when_expected_version_stale_then_raises_concurrency_error(
+        self, tmp_path, codec
+    ):
+        with SyncFileEventStore[Event](tmp_path, codec) as store:
+            store.append("account-1", 0, deposits(1))
+
+            with pytest.raises(ConcurrencyError):
+                store.append("account-1", 0, deposits(2))
+
+    def test_append_when_threads_then_stores_every_append(self, tmp_path, codec):
+        with SyncFileEventStore[Event](tmp_path, codec) as store:
+
+            def append_all(stream_id: str) -> None:
+                for version in range(20):
+                    store.append(stream_id, version, deposits(version))
+
+            threads = [
+                threading.Thread(target=append_all, args=(f"account-{i}",))
+                for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            for i in range(4):
+                assert amounts(store.read(f"account-{i}")) == list(range(20))
+            assert store.sync_count <= 80
+
+        with SyncFileEventStore[Event](tmp_path, codec) as store:
+            assert len(store.read("account-3")) == 20
+
+    def test_append_when_fsync_fails_then_raises_and_stops(
+        self, tmp_path, codec, monkeypatch
+    ):
+        store: SyncFileEventStore[Event] = SyncFileEventStore(tmp_path, codec)
+
+        def failing_fsync(fd: int) -> None:
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+
+        with pytest.raises(OSError, match="disk gone"):
+            store.append("account-1", 0, deposits(1))
+        monkeypatch.undo()
+        with pytest.raises(OSError, match="stopped after a failed fsync"):
+            store.read("account-1")
+        store.close()
@@ -0,0 +1,168 @@
+import threading
+from typing import Iterator, List
+from uuid import UUID
+
+import pytest
+
+from building_blocks.infrastructure.id_generators import (
+    SnowflakeIdGenerator,
+    ULIDGenerator,
+    UUID4Generator,
+    UUIDv7Generator,
+)
+
+_CLOCK_MS = 1_749_670_000_000
+
+
+def fake_clock(*readings: int) -> Iterator[int]:
+    """Yield the given clock readings, then keep repeating the last one."""
+    yield from readings
+    while True:
+        yield readings[-1]
+
+
+class TestUUID4Generator:
+    def test_next_id_when_called_then_returns_random_uuid(self):
+        generator = UUID4Generator()
+
+        result = generator.next_id()
+
+        assert isinstance(result, UUID)
+        assert result.version == 4
+
+
+class TestUUIDv7Generator:
+    def test_next_id_when_called_then_returns_version_7_uuid(self):
+        generator = UUIDv7Generator()
+
+        result = generator.next_id()
+
+        assert isinstance(result, UUID)
+        assert result.version == 7
+        assert result.variant == "specified in RFC 4122"
+        assert UUID(str(result)) == result
+
+    def test_next_id_when_called_then_embeds_clock_milliseconds(self):
+        generator = UUIDv7Generator(clock=lambda: _CLOCK_MS)
+
+        result = generator.next_id()
+
+        assert result.int >> 80 == _CLOCK_MS
+
+    def test_next_id_when_same_millisecond_then_monotonic(self):
+        generator = UUIDv7Generator(clock=lambda: _CLOCK_MS)
+
+        result = [generator.next_id() for _ in range(1_000)]
+
+        assert result == sorted(result)
+        assert len(set(result)) == 1_000
+
+    def test_next_id_when_counter_overflows_then_advances_timestamp(self):
+        generator = UUIDv7Generator(clock=lambda: _CLOCK_MS)
+
+        result = [generator.next_id() for _ in range(0x1001)]
+
+        assert result == sorted(result)
+        assert result[-1].int >> 80 == _CLOCK_MS + 1
+
+    def test_next_id_when_clock_goes_backwards_then_still_monotonic(self):
+        readings = fake_clock(_CLOCK_MS, _CLOCK_MS - 5_000)
+        generator = UUIDv7Generator(clock=lambda: next(readings))
+
+        first = generator.next_id()
+        second = generator.next_id()
+
+        assert second > first
+
+    def test_next_id_when_called_from_threads_then_unique(self):
+        generator = UUIDv7Generator()
+        results: List[UUID] = []
+
+        def generate() -> None:
+            ids = [generator.next_id() for _ in range(500)]
+            results.extend(ids)
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 2_000
+
+
+class TestULIDGenerator:
+    def test_next_id_when_called_then_returns_26_char_crockford_string(self):
+        generator = ULIDGenerator()
+
+        result = generator.next_id()
+
+        assert len(result) == 26
+        assert set(result) <= set("0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+
+    def test_next_id_when_called_then_encodes_clock_in_first_ten_chars(self):
+        generator = ULIDGenerator(clock=lambda: 0)
+
+        result = generator.next_id()
+
+        assert result[:10] == "0000000000"
+
+    def test_next_id_when_same_millisecond_then_lexicographically_monotonic(self):
+        generator = ULIDGenerator(clock=lambda: _CLOCK_MS)
+
+        result = [generator.next_id() for _ in range(1_000)]
+
+        assert result == sorted(result)
+        assert len(set(result)) == 1_000
+
+    def test_next_id_when_later_millisecond_then_sorts_after(self):
+        readings = fake_clock(_CLOCK_MS, _CLOCK_MS + 1)
+        generator = ULIDGenerator(clock=lambda: next(readings))
+
+        first = generator.next_id()
+        second = generator.next_id()
+
+        assert second > first
+
+
+class TestSnowflakeIdGenerator:
+    def test_init_when_worker_id_out_of_range_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="Worker ID must be between 0 and 1023"):
+            SnowflakeIdGenerator(worker_id=1024)
+
+    def test_next_id_when_called_then_packs_timestamp_worker_and_sequence(self):
+        generator = SnowflakeIdGenerator(
+            worker_id=7, epoch_ms=_CLOCK_MS - 10, clock=lambda: _CLOCK_MS
+        )
+
+        first = generator.next_id()
+        second = generator.next_id()
+
+        assert first == (10 << 22) | (7 << 12) | 0
+        assert second == (10 << 22) | (7 << 12) | 1
+
+    def test_next_id_when_called_then_fits_signed_64_bits(self):
+        generator = SnowflakeIdGenerator(worker_id=1023)
+
+        result = generator.next_id()
+
+        assert 0 < result < 2**63
+
+    def test_next_id_when_sequence_overflows_then_advances_timestamp(self):
+        generator = SnowflakeIdGenerator(
+            worker_id=0, epoch_ms=_CLOCK_MS, clock=lambda: _CLOCK_MS
+        )
+
+        result = [generator.next_id() for _ in range(0x1001)]
+
+        assert result == sorted(result)
+        assert result[-1] >> 22 == 1
+
+    def test_next_id_when_clock_goes_backwards_then_still_monotonic(self):
+        readings = fake_clock(_CLOCK_MS, _CLOCK_MS - 5_000)
+        generator = SnowflakeIdGenerator(worker_id=1, clock=lambda: next(readings))
+
+        first = generator.next_id()
+        second = generator.next_id()
+
+        assert second > first
@@ -0,0 +1,368 @@
+"""
+Unit tests for the identity_map module.
+
+Tests for IdentityMap, AsyncIdentityMapRepository and SyncIdentityMapRepository
+classes.
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.ports.outbound.repository import (
+    AsyncRepository,
+    SyncRepository,
+)
+from building_blocks.infrastructure.identity_map import (
+    AsyncIdentityMapRepository,
+    IdentityMap,
+    SyncIdentityMapRepository,
+)
+
+
+class FakeOrder(AggregateRoot[int]):
+    """A fake aggregate."""
+
+    def __init__(self, order_id: int, total: float = 0.0) -> None:
+        super().__init__(order_id)
+        self.total = total
+
+
+class FakeStore:
+    """Rows keyed by ID; every load builds a fresh aggregate."""
+
+    def __init__(self, *ids: int) -> None:
+        self.rows: Dict[int, float] = dict.fromkeys(ids, 0.0)
+        self.loads = 0
+
+    def load(self, order_id: int) -> Optional[FakeOrder]:
+        self.loads += 1
+        if order_id not in self.rows:
+            return None
+        return FakeOrder(order_id, self.rows[order_id])
+
+    def load_all(self) -> List[FakeOrder]:
+        self.loads += 1
+        return [FakeOrder(order_id, total) for order_id, total in self.rows.items()]
+
+
+class FakeAsyncRepository(AsyncRepository[FakeOrder, int]):
+    """Async repository over a FakeStore. Deletes are deferred, like in a UoW."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    async def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        return self.store.load(id)
+
+    async def save(self, aggregate: FakeOrder) -> None:
+        self.store.rows[aggregate.id] = aggregate.total
+
+    async def delete_by_id(self, id: int) -> None:
+        pass
+
+    async def find_all(self) -> List[FakeOrder]:
+        return self.store.load_all()
+
+
+class FakeSyncRepository(SyncRepository[FakeOrder, int]):
+    """Sync repository over a FakeStore. Deletes are deferred, like in a UoW."""
+
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    def find_by_id(self, id: int) -> Optional[FakeOrder]:
+        return self.store.load(id)
+
+    def save(self, aggregate: FakeOrder) -> None:
+        self.store.rows[aggregate.id] = aggregate.total
+
+    def delete_by_id(self, id: int) -> None:
+        pass
+
+    def find_all(self) -> List[FakeOrder]:
+        return self.store.load_all()
+
+
+class TestIdentityMap:
+    """Tests for IdentityMap class."""
+
+    def test_lookup_when_unknown_then_raises_key_error_and_counts_miss(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+
+        with pytest.raises(KeyError):
+            identity_map.lookup(1)
+
+        assert (identity_map.hits, identity_map.misses) == (0, 1)
+
+    def test_lookup_when_added_then_returns_instance_and_counts_hit(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        order = FakeOrder(1)
+        identity_map.add(1, order)
+
+        assert identity_map.lookup(1) is order
+        assert (identity_map.hits, identity_map.misses) == (1, 0)
+
+    def test_add_when_already_mapped_then_keeps_first_instance(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        first = FakeOrder(1)
+        identity_map.add(1, first)
+
+        assert identity_map.add(1, FakeOrder(1)) is first
+
+    def test_add_when_removed_then_returns_none(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        identity_map.remove(1)
+
+        assert identity_map.add(1, FakeOrder(1)) is None
+        assert len(identity_map) == 0
+
+    def test_replace_when_removed_then_maps_again(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        order = FakeOrder(1)
+        identity_map.remove(1)
+
+        identity_map.replace(1, order)
+
+        assert identity_map.lookup(1) is order
+
+    def test_hit_ratio_when_lookups_then_returns_share_of_hits(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        assert identity_map.hit_ratio == 0.0
+        identity_map.add(1, FakeOrder(1))
+        for order_id in (1, 1, 1, 2):
+            try:
+                identity_map.lookup(order_id)
+            except KeyError:
+                pass
+
+        assert identity_map.hit_ratio == 0.75
+
+    def test_clear_when_entries_then_forgets_them_but_keeps_counters(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        identity_map.add(1, FakeOrder(1))
+        identity_map.lookup(1)
+
+        identity_map.clear()
+
+        assert len(identity_map) == 0
+        assert identity_map.hits == 1
+
+
+class TestAsyncIdentityMapRepository:
+    """Tests for AsyncIdentityMapRepository class."""
+
+    async def test_find_by_id_when_repeated_then_loads_once_and_returns_same(self):
+        store = FakeStore(1)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+
+        first = await repository.find_by_id(1)
+        second = await repository.find_by_id(1)
+
+        assert first is second
+        assert store.loads == 1
+        assert (repository.identity_map.hits, repository.identity_map.misses) == (1, 1)
+
+    async def test_find_by_id_when_not_found_then_returns_none_and_asks_again(self):
+        store = FakeStore()
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+
+        assert await repository.find_by_id(1) is None
+        assert await repository.find_by_id(1) is None
+        assert store.loads == 2
+
+    async def test_find_by_id_when_saved_then_returns_saved_instance(self):
+        store = FakeStore()
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        order = FakeOrder(1, 9.5)
+
+        await repository.save(order)
+
+        assert await repository.find_by_id(1) is order
+        assert store.loads == 0
+
+    async def test_find_by_id_when_deleted_then_returns_none_without_loading(self):
+        store = FakeStore(1)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        await repository.find_by_id(1)
+
+        await repository.delete_by_id(1)
+
+        assert await repository.find_by_id(1) is None
+        assert store.loads == 1
+
+    async def test_find_by_ids_when_some_mapped_then_loads_only_the_others(self):
+        store = FakeStore(1, 2, 3)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        first = await repository.find_by_id(1)
+        await repository.delete_by_id(2)
+
+        orders = await repository.find_by_ids([3, 2, 1, 4, 3])
+
+        assert list(orders) == [3, 1]
+        assert orders[1] is first
+        assert store.loads == 3
+        assert await repository.find_by_id(3) is orders[3]
+
+    async def test_save_many_when_saved_then_maps_each_instance(self):
+        store = FakeStore()
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        orders = [FakeOrder(1, 1.0), FakeOrder(2, 2.0)]
+
+        await repository.save_many(order for order in orders)
+
+        assert store.rows == {1: 1.0, 2: 2.0}
+        assert await repository.find_by_id(2) is orders[1]
+        assert store.loads == 0
+
+    async def test_delete_by_ids_when_deleted_then_returns_none_without_loading(
+        self,
+    ):
+        store = FakeStore(1, 2)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+
+        await repository.delete_by_ids(iter([1, 2]))
+
+        assert await repository.find_by_ids([1, 2]) == {}
+        assert store.loads == 0
+
+    async def test_find_all_when_some_mapped_then_reuses_mapped_instances(self):
+        store = FakeStore(1, 2)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        first = await repository.find_by_id(1)
+
+        orders = await repository.find_all()
+
+        assert orders[0] is first
+        assert await repository.find_by_id(2) is orders[1]
+
+    async def test_find_all_when_deleted_then_leaves_it_out(self):
+        store = FakeStore(1, 2)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+
+        await repository.delete_by_id(1)
+
+        assert [order.id for order in await repository.find_all()] == [2]
+
+    async def test_stream_all_when_default_then_yields_find_all_results(self):
+        store = FakeStore(1, 2, 3)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+
+        orders = [order async for order in repository.stream_all(batch_size=2)]
+
+        assert [order.id for order in orders] == [1, 2, 3]
+
+    async def test_stream_all_when_some_mapped_then_reuses_without_growing(self):
+        store = FakeStore(1, 2, 3)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        first = await repository.find_by_id(1)
+        await repository.delete_by_id(3)
+
+        orders = [order async for order in repository.stream_all()]
+
+        assert [order.id for order in orders] == [1, 2]
+        assert orders[0] is first
+        assert len(repository.identity_map) == 1
+
+    async def test_find_page_when_some_mapped_then_reuses_mapped_instances(self):
+        store = FakeStore(1, 2, 3)
+        repository = AsyncIdentityMapRepository(FakeAsyncRepository(store))
+        first = await repository.find_by_id(1)
+        await repository.delete_by_id(2)
+
+        page = await repository.find_page(limit=2)
+
+        assert page.items == [first]
+        assert page.has_next
+
+    async def test_init_when_map_given_then_shares_it(self):
+        identity_map: IdentityMap[FakeOrder, int] = IdentityMap()
+        store = FakeStore(1)
+        first = AsyncIdentityMapRepository(FakeAsyncRepository(store), identity_map)
+        second = AsyncIdentityMapRepository(FakeAsyncRepository(store), identity_map)
+
+        assert await first.find_by_id(1) is await second.find_by_id(1)
+        assert store.loads == 1
+
+
+class TestSyncIdentityMapRepository:
+    """Tests for SyncIdentityMapRepository class."""
+
+    def test_find_by_id_when_repeated_then_loads_once_and_returns_same(self):
+        store = FakeStore(1)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+
+        assert repository.find_by_id(1) is repository.find_by_id(1)
+        assert store.loads == 1
+
+    def test_find_by_id_when_not_found_then_returns_none(self):
+        repository = SyncIdentityMapRepository(FakeSyncRepository(FakeStore()))
+
+        assert repository.find_by_id(1) is None
+
+    def test_find_by_id_when_saved_then_returns_saved_instance(self):
+        store = FakeStore()
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        order = FakeOrder(1)
+
+        repository.save(order)
+
+        assert repository.find_by_id(1) is order
+        assert store.loads == 0
+
+    def test_find_by_id_when_deleted_then_returns_none_without_loading(self):
+        store = FakeStore(1)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+
+        repository.delete_by_id(1)
+
+        assert repository.find_by_id(1) is None
+        assert store.loads == 0
+
+    def test_find_all_when_some_mapped_then_reuses_mapped_instances(self):
+        store = FakeStore(1, 2)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        first = repository.find_by_id(1)
+
+        assert repository.find_all()[0] is first
+
+    def test_stream_all_when_default_then_yields_find_all_results(self):
+        store = FakeStore(1, 2)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        first = repository.find_by_id(1)
+        repository.delete_by_id(2)
+
+        assert list(repository.stream_all(batch_size=10)) == [first]
+
+    def test_find_page_when_some_mapped_then_reuses_mapped_instances(self):
+        store = FakeStore(1, 2)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        first = repository.find_by_id(1)
+
+        page = repository.find_page(limit=1)
+
+        assert page.items == [first]
+        assert repository.find_page(page.next_cursor).items[0] is not first
+
+    def test_find_by_ids_when_some_mapped_then_loads_only_the_others(self):
+        store = FakeStore(1, 2)
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        first = repository.find_by_id(1)
+
+        orders = repository.find_by_ids([1, 2])
+
+        assert orders[1] is first
+        assert store.loads == 2
+
+    def test_save_many_when_saved_then_maps_each_instance(self):
+        store = FakeStore()
+        repository = SyncIdentityMapRepository(FakeSyncRepository(store))
+        order = FakeOrder(1)
+
+        repository.save_many([order])
+        repository.delete_by_ids([2])
+
+        assert repository.find_by_id(1) is order
+        assert repository.find_by_id(2) is None
+        assert store.loads == 0
@@ -0,0 +1,343 @@
+"""
+Unit tests for the outbox module.
+
+Tests for OutboxUnitOfWork and OutboxRelay classes, against an outbox stored
+in SQLite.
+"""
+
+import asyncio
+import sqlite3
+from typing import Iterable, List, Sequence, cast
+from uuid import UUID, uuid4
+
+import pytest
+
+from building_blocks.application.ports.outbound.event_publisher import (
+    AsyncEventPublisher,
+)
+from building_blocks.application.ports.outbound.outbox import AsyncOutbox, OutboxEntry
+from building_blocks.domain.aggregate_root import AggregateRoot
+from building_blocks.domain.event_collector import collect_events
+from building_blocks.domain.messages.codec import MessageCodec
+from building_blocks.domain.messages.event import Event
+from building_blocks.infrastructure.outbox import OutboxRelay, OutboxUnitOfWork
+
+
+class FakeTaskRenamed(Event):
+    """A fake event."""
+
+    task_id: UUID
+    title: str
+
+
+class FakeTask(AggregateRoot[UUID]):
+    """A fake aggregate recording an event per rename."""
+
+    def __init__(self, task_id: UUID, title: str) -> None:
+        super().__init__(task_id)
+        self.title = title
+
+    def rename(self, title: str) -> None:
+        self.title = title
+        self.record_event(FakeTaskRenamed(self.id, title))
+
+
+class SQLiteOutbox(AsyncOutbox[Event]):
+    """Outbox stored in an SQLite table, sharing the caller's connection."""
+
+    def __init__(self, connection: sqlite3.Connection, codec: MessageCodec) -> None:
+        self._connection = connection
+        self._codec = codec
+
+    async def add_all(self, events: Sequence[Event]) -> None:
+        self._connection.executemany(
+            "INSERT INTO outbox (data) VALUES (?)",
+            [(self._codec.encode(event),) for event in events],
+        )
+
+    async def fetch_pending(self, limit: int) -> List[OutboxEntry[Event]]:
+        rows = self._connection.execute(
+            "SELECT position, data FROM outbox ORDER BY position LIMIT ?", (limit,)
+        ).fetchall()
+        return [
+            OutboxEntry(position, cast(Event, self._codec.decode(data)))
+            for position, data in rows
+        ]
+
+    async def mark_published(self, entries: Sequence[OutboxEntry[Event]]) -> None:
+        self._connection.executemany(
+            "DELETE FROM outbox WHERE position = ?",
+            [(entry.position,) for entry in entries],
+        )
+        self._connection.commit()
+
+
+class SQLiteUnitOfWork(OutboxUnitOfWork):
+    """Unit of work over an SQLite connection."""
+
+    def __init__(self, connection: sqlite3.Connection, outbox: SQLiteOutbox) -> None:
+        super().__init__(outbox)
+        self.connection = connection
+
+    def save(self, task: FakeTask) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tasks (id, title) VALUES (?, ?)",
+            (str(task.id), task.title),
+        )
+        self.track(task)
+
+    async def _commit_transaction(self) -> None:
+        self.connection.commit()
+
+    async def _rollback_transaction(self) -> None:
+        self.connection.rollback()
+
+
+class FakePublisher(AsyncEventPublisher[Event]):
+    """Records the batches it receives."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.batches: List[List[Event]] = []
+        self.failures = failures
+
+    async def publish(self, event: Event) -> None:
+        await self.publish_many([event])
+
+    async def publish_many(self, events: Iterable[Event]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("broker down")
+        self.batches.append(list(events))
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE tasks (id TEXT PRIMARY KEY, title TEXT)")
+    connection.execute(
+        "CREATE TABLE outbox (position INTEGER PRIMARY KEY AUTOINCREMENT, data BLOB)"
+    )
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def outbox(connection):
+    codec = MessageCodec()
+    codec.register(FakeTaskRenamed)
+    return SQLiteOutbox(connection, codec)
+
+
+@pytest.fixture
+def unit_of_work(connection, outbox):
+    return SQLiteUnitOfWork(connection, outbox)
+
+
+def count_rows(connection: sqlite3.Connection, table: str) -> int:
+    count: int = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    return count
+
+
+def renamed_task(*titles: str) -> FakeTask:
+    task = FakeTask(uuid4(), "draft")
+    for title in titles:
+        task.rename(title)
+    return task
+
+
+class TestOutboxUnitOfWork:
+    """Tests for OutboxUnitOfWork class."""
+
+    async def test_commit_when_aggregate_tracked_then_stores_events_with_state(
+        self, unit_of_work, outbox, connection
+    ):
+        task = renamed_task("first", "second")
+        events = task.uncommitted_changes()
+
+        async with unit_of_work:
+            unit_of_work.save(task)
+
+        pending = await outbox.fetch_pending(10)
+        assert [entry.event for entry in pending] == events
+        assert [entry.event.payload for entry in pending] == [
+            event.payload for event in events
+        ]
+        assert count_rows(connection, "tasks") == 1
+
+    async def test_commit_when_committed_then_marks_aggregate_changes_committed(
+        self, unit_of_work
+    ):
+        task = renamed_task("first")
+
+        async with unit_of_work:
+            unit_of_work.save(task)
+
+        assert task.uncommitted_changes() == []
+        assert task.version.value == 1
+
+    async def test_commit_when_tracked_twice_then_stores_events_once(
+        self, unit_of_work, outbox
+    ):
+        task = renamed_task("first")
+
+        async with unit_of_work:
+            unit_of_work.save(task)
+            unit_of_work.save(task)
+
+        assert len(await outbox.fetch_pending(10)) == 1
+
+    async def test_commit_when_no_events_then_only_commits(
+        self, unit_of_work, outbox, connection
+    ):
+        async with unit_of_work:
+            unit_of_work.save(renamed_task())
+
+        assert await outbox.fetch_pending(10) == []
+        assert count_rows(connection, "tasks") == 1
+
+    async def test_commit_when_collecting_events_then_withdraws_stored_events(
+        self, unit_of_work
+    ):
+        with collect_events() as collector:
+            task = renamed_task("first")
+            async with unit_of_work:
+                unit_of_work.save(task)
+
+        assert len(collector) == 1
+        assert collector.drain_committed() == []
+
+    async def test_rollback_when_error_then_discards_state_and_events(
+        self, unit_of_work, connection
+    ):
+        task = renamed_task("first")
+
+        with pytest.raises(RuntimeError):
+            async with unit_of_work:
+                unit_of_work.save(task)
+                raise RuntimeError("use case failed")
+
+        assert count_rows(connection, "tasks") == 0
+        assert count_rows(connection, "outbox") == 0
+        assert len(task.uncommitted_changes()) == 1
+
+    async def test_commit_when_outbox_fails_then_rolls_back_and_forgets_tracked(
+        self, unit_of_work, outbox, connection, monkeypatch
+    ):
+        async def failing_add_all(events: Sequence[Event]) -> None:
+            raise sqlite3.OperationalError("disk full")
+
+        task = renamed_task("first")
+        unit_of_work.save(task)
+        monkeypatch.setattr(outbox, "add_all", failing_add_all)
+
+        with pytest.raises(sqlite3.OperationalError, match="disk full"):
+            await unit_of_work.commit()
+
+        assert count_rows(connection, "tasks") == 0
+        assert len(task.uncommitted_changes()) == 1
+        monkeypatch.undo()
+        await unit_of_work.commit()
+        assert await outbox.fetch_pending(10) == []
+
+    async def test_commit_when_after_rollback_then_forgets_earlier_aggregates(
+        self, unit_of_work, outbox
+    ):
+        discarded = renamed_task("discarded")
+        unit_of_work.track(discarded)
+        await unit_of_work.rollback()
+        kept = renamed_task("kept")
+
+        async with unit_of_work:
+            unit_of_work.save(kept)
+
+        pending = await outbox.fetch_pending(10)
+        assert [entry.event.title for entry in pending] == ["kept"]
+
+
+class TestOutboxRelay:
+    """Tests for OutboxRelay class."""
+
+    async def commit_events(self, unit_of_work: SQLiteUnitOfWork, count: int) -> None:
+        async with unit_of_work:
+            unit_of_work.save(renamed_task(*(f"title {i}" for i in range(count))))
+
+    async def test_relay_once_when_pending_then_publishes_batch_and_marks(
+        self, unit_of_work, outbox, connection
+    ):
+        await self.commit_events(unit_of_work, 3)
+        publisher = FakePublisher()
+        relay = OutboxRelay(outbox, publisher, batch_size=10)
+
+        relayed = await relay.relay_once()
+
+        assert relayed == 3
+        assert [
+            [cast(FakeTaskRenamed, event).title for event in batch]
+            for batch in publisher.batches
+        ] == [["title 0", "title 1", "title 2"]]
+        assert count_rows(connection, "outbox") == 0
+
+    async def test_relay_once_when_nothing_pending_then_publishes_nothing(self, outbox):
+        publisher = FakePublisher()
+
+        relayed = await OutboxRelay(outbox, publisher).relay_once()
+
+        assert relayed == 0
+        assert publisher.batches == []
+
+    async def test_relay_once_when_publish_fails_then_keeps_entries_pending(
+        self, unit_of_work, outbox, connection
+    ):
+        await self.commit_events(unit_of_work, 2)
+        relay = OutboxRelay(outbox, FakePublisher(failures=1))
+
+        with pytest.raises(RuntimeError, match="broker down"):
+            await relay.relay_once()
+
+        assert count_rows(connection, "outbox") == 2
+
+    async def test_run_when_backlog_then_drains_in_batches_of_batch_size(
+        self, unit_of_work, outbox, connection
+    ):
+        await self.commit_events(unit_of_work, 5)
+        publisher = FakePublisher()
+        relay = OutboxRelay(outbox, publisher, batch_size=2, poll_interval_ms=1)
+        stop = asyncio.Event()
+
+        running = asyncio.ensure_future(relay.run(stop))
+        await asyncio.sleep(0.02)
+        stop.set()
+        await running
+
+        assert [len(batch) for batch in publisher.batches] == [2, 2, 1]
+        assert count_rows(connection, "outbox") == 0
+
+    async def test_run_when_publish_fails_then_logs_and_retries(
+        self, unit_of_work, outbox, caplog
+    ):
+        await self.commit_events(unit_of_work, 1)
+        publisher = FakePublisher(failures=1)
+        relay = OutboxRelay(outbox, publisher, poll_interval_ms=1)
+        stop = asyncio.Event()
+
+        running = asyncio.ensure_future(relay.run(stop))
+        await asyncio.sleep(0.02)
+        stop.set()
+        await running
+
+        assert "Failed to relay outbox events" in caplog.text
+        assert len(publisher.batches) == 1
+
+    @pytest.mark.parametrize(
+        "options, message",
+        [
+            ({"batch_size": 0}, "batch_size must be at least 1, got 0"),
+            ({"poll_interval_ms": -1}, "poll_interval_ms cannot be negative, got -1"),
+        ],
+    )
+    def test_init_when_invalid_options_then_raises_value_error(
+        self, outbox, options, message
+    ):
+        with pytest.raises(ValueError, match=message):
+            OutboxRelay(outbox, FakePublisher(), **options)
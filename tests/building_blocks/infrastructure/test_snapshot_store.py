@@ -0,0 +1,137 @@
+"""
+Unit tests for the snapshot_store module.
+
+Tests for in-memory and file snapshot store classes.
+"""
+
+import os
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateVersion
+from building_blocks.domain.event_sourced_aggregate_root import Snapshot
+from building_blocks.infrastructure.snapshot_store import (
+    AsyncFileSnapshotStore,
+    AsyncInMemorySnapshotStore,
+    SyncFileSnapshotStore,
+    SyncInMemorySnapshotStore,
+)
+
+
+def snapshot(aggregate_id: Any, version: int, **state: Any) -> Snapshot:
+    return Snapshot(aggregate_id, AggregateVersion.of(version), state)
+
+
+class TestAsyncInMemorySnapshotStore:
+    """Tests for AsyncInMemorySnapshotStore class."""
+
+    async def test_load_when_saved_then_returns_latest_snapshot(self):
+        store = AsyncInMemorySnapshotStore()
+        await store.save(snapshot(1, 3, balance=3))
+        await store.save(snapshot(1, 5, balance=5))
+
+        assert await store.load(1) == snapshot(1, 5, balance=5)
+        assert await store.load(2) is None
+
+    async def test_save_when_older_than_stored_then_keeps_stored(self):
+        store = AsyncInMemorySnapshotStore()
+        await store.save(snapshot(1, 5, balance=5))
+
+        await store.save(snapshot(1, 3, balance=3))
+
+        stored = await store.load(1)
+        assert stored is not None
+        assert stored.version.value == 5
+
+    async def test_save_when_full_then_evicts_least_recently_used(self):
+        store = AsyncInMemorySnapshotStore(max_size=2)
+        await store.save(snapshot(1, 1))
+        await store.save(snapshot(2, 1))
+        await store.load(1)
+
+        await store.save(snapshot(3, 1))
+
+        assert len(store) == 2
+        assert await store.load(1) is not None
+        assert await store.load(2) is None
+
+    def test_init_when_max_size_below_one_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="max_size must be at least 1, got 0"):
+            AsyncInMemorySnapshotStore(max_size=0)
+
+
+class TestSyncInMemorySnapshotStore:
+    """Tests for SyncInMemorySnapshotStore class."""
+
+    def test_load_when_saved_then_returns_latest_snapshot(self):
+        store = SyncInMemorySnapshotStore(max_size=1)
+        store.save(snapshot(1, 2))
+        store.save(snapshot(1, 1))
+
+        assert store.load(1) == snapshot(1, 2)
+        store.save(snapshot(2, 1))
+        assert store.load(1) is None
+        assert len(store) == 1
+
+
+class TestAsyncFileSnapshotStore:
+    """Tests for AsyncFileSnapshotStore class."""
+
+    async def test_load_when_saved_then_returns_equal_snapshot(self, tmp_path):
+        store = AsyncFileSnapshotStore(tmp_path)
+        aggregate_id = uuid4()
+        saved = snapshot(aggregate_id, 7, owner="ann", deposits=[5, 2])
+
+        await store.save(saved)
+
+        assert await AsyncFileSnapshotStore(tmp_path).load(aggregate_id) == saved
+        assert await store.load(uuid4()) is None
+
+    async def test_save_when_older_than_stored_then_keeps_stored(self, tmp_path):
+        store = AsyncFileSnapshotStore(tmp_path)
+        await store.save(snapshot("a", 5, balance=5))
+
+        await store.save(snapshot("a", 3, balance=3))
+        await store.save(snapshot("b", 1))
+
+        stored = await store.load("a")
+        assert stored is not None
+        assert stored.state == {"balance": 5}
+        assert len(list(tmp_path.iterdir())) == 2
+
+    async def test_save_when_state_not_encodable_then_raises_and_keeps_stored(
+        self, tmp_path
+    ):
+        store = AsyncFileSnapshotStore(tmp_path)
+        await store.save(snapshot(1, 1, balance=1))
+
+        with pytest.raises(TypeError):
+            await store.save(snapshot(1, 2, balance=object()))
+
+        stored = await store.load(1)
+        assert stored is not None
+        assert stored.version.value == 1
+        assert len(list(tmp_path.iterdir())) == 1
+
+    async def test_load_when_file_malformed_then_raises_value_error(self, tmp_path):
+        store = AsyncFileSnapshotStore(tmp_path)
+        await store.save(snapshot(1, 1))
+        [path] = tmp_path.iterdir()
+        os.truncate(path, 4)
+
+        with pytest.raises(ValueError, match="Malformed snapshot file"):
+            await store.load(1)
+
+
+class TestSyncFileSnapshotStore:
+    """Tests for SyncFileSnapshotStore class."""
+
+    def test_load_when_saved_then_returns_latest_snapshot(self, tmp_path):
+        store = SyncFileSnapshotStore(tmp_path / "snapshots")
+        store.save(snapshot(1, 1, owner="ann"))
+        store.save(snapshot(1, 2, owner="bob"))
+
+        assert store.load(1) == snapshot(1, 2, owner="bob")
+        assert store.load(2) is None
@@ -0,0 +1,488 @@
+"""
+Unit tests for the unit_of_work module.
+
+Tests for TrackingUnitOfWork and SyncTrackingUnitOfWork classes, flushing
+through writers that store aggregates in SQLite.
+"""
+
+import sqlite3
+from typing import List, Sequence, Tuple
+
+import pytest
+
+from building_blocks.domain.aggregate_root import AggregateRoot, AggregateVersion
+from building_blocks.domain.errors import ConcurrencyError
+from building_blocks.infrastructure.caching_repository import AggregateCache
+from building_blocks.infrastructure.unit_of_work import (
+    AsyncAggregateWriter,
+    SyncAggregateWriter,
+    SyncTrackingUnitOfWork,
+    TrackingUnitOfWork,
+)
+
+
+class FakeProject(AggregateRoot[int]):
+    """A fake aggregate referenced by tasks."""
+
+    def __init__(self, project_id: int, name: str) -> None:
+        super().__init__(project_id)
+        self.name = name
+
+
+class FakeTask(AggregateRoot[int]):
+    """A fake aggregate referencing a project."""
+
+    def __init__(
+        self,
+        task_id: int,
+        project_id: int,
+        title: str,
+        version: AggregateVersion = AggregateVersion.of(0),
+    ) -> None:
+        super().__init__(task_id, version)
+        self.project_id = project_id
+        self.title = title
+
+
+class FakeUrgentTask(FakeTask):
+    """A fake aggregate subclass, stored by the task writer."""
+
+
+class FakeUnknown(AggregateRoot[int]):
+    """A fake aggregate with no writer."""
+
+
+class SQLiteTaskWriter(AsyncAggregateWriter[FakeTask]):
+    """Writes tasks with executemany, recording each call."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.calls: List[Tuple[str, List[int]]] = []
+
+    async def insert_many(self, aggregates: Sequence[FakeTask]) -> None:
+        self.calls.append(("insert", [task.id for task in aggregates]))
+        self.connection.executemany(
+            "INSERT INTO tasks (id, project_id, title, version) VALUES (?, ?, ?, ?)",
+            [
+                (task.id, task.project_id, task.title, task.version.value + 1)
+                for task in aggregates
+            ],
+        )
+
+    async def update_many(self, aggregates: Sequence[FakeTask]) -> None:
+        self.calls.append(("update", [task.id for task in aggregates]))
+        conflicts = {}
+        for task in aggregates:
+            cursor = self.connection.execute(
+                "UPDATE tasks SET title = ?, version = version + 1"
+                " WHERE id = ? AND version = ?",
+                (task.title, task.id, task.version.value),
+            )
+            if cursor.rowcount == 0:
+                conflicts[task.id] = task.version.value
+        if conflicts:
+            raise ConcurrencyError("FakeTask", conflicts)
+
+    async def delete_many(self, aggregates: Sequence[FakeTask]) -> None:
+        self.calls.append(("delete", [task.id for task in aggregates]))
+        self.connection.executemany(
+            "DELETE FROM tasks WHERE id = ?", [(task.id,) for task in aggregates]
+        )
+
+
+class SQLiteProjectWriter(AsyncAggregateWriter[FakeProject]):
+    """Writes projects with executemany, recording each call."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.calls: List[Tuple[str, List[int]]] = []
+
+    async def insert_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("insert", [project.id for project in aggregates]))
+        self.connection.executemany(
+            "INSERT INTO projects (id, name) VALUES (?, ?)",
+            [(project.id, project.name) for project in aggregates],
+        )
+
+    async def update_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("update", [project.id for project in aggregates]))
+
+    async def delete_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("delete", [project.id for project in aggregates]))
+        self.connection.executemany(
+            "DELETE FROM projects WHERE id = ?",
+            [(project.id,) for project in aggregates],
+        )
+
+
+class SQLiteUnitOfWork(TrackingUnitOfWork):
+    """Unit of work over an SQLite connection."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        super().__init__()
+        self.connection = connection
+        self.projects = SQLiteProjectWriter(connection)
+        self.tasks = SQLiteTaskWriter(connection)
+        self.add_writer(FakeProject, self.projects)
+        self.add_writer(FakeTask, self.tasks)
+
+    async def _commit_transaction(self) -> None:
+        self.connection.commit()
+
+    async def _rollback_transaction(self) -> None:
+        self.connection.rollback()
+
+
+class SyncSQLiteProjectWriter(SyncAggregateWriter[FakeProject]):
+    """Writes projects with executemany, recording each call."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.calls: List[Tuple[str, List[int]]] = []
+
+    def insert_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("insert", [project.id for project in aggregates]))
+        self.connection.executemany(
+            "INSERT INTO projects (id, name) VALUES (?, ?)",
+            [(project.id, project.name) for project in aggregates],
+        )
+
+    def update_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("update", [project.id for project in aggregates]))
+
+    def delete_many(self, aggregates: Sequence[FakeProject]) -> None:
+        self.calls.append(("delete", [project.id for project in aggregates]))
+        self.connection.executemany(
+            "DELETE FROM projects WHERE id = ?",
+            [(project.id,) for project in aggregates],
+        )
+
+
+class SyncSQLiteUnitOfWork(SyncTrackingUnitOfWork):
+    """Synchronous unit of work over an SQLite connection."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        super().__init__()
+        self.connection = connection
+        self.projects = SyncSQLiteProjectWriter(connection)
+        self.add_writer(FakeProject, self.projects)
+
+    def _commit_transaction(self) -> None:
+        self.connection.commit()
+
+    def _rollback_transaction(self) -> None:
+        self.connection.rollback()
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.execute(
+        "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, version INTEGER,"
+        " project_id INTEGER NOT NULL REFERENCES projects (id))"
+    )
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def unit_of_work(connection):
+    return SQLiteUnitOfWork(connection)
+
+
+def stored_titles(connection: sqlite3.Connection) -> List[str]:
+    rows = connection.execute("SELECT title FROM tasks ORDER BY id").fetchall()
+    return [title for (title,) in rows]
+
+
+async def store(
+    unit_of_work: SQLiteUnitOfWork, *aggregates: AggregateRoot[int]
+) -> None:
+    async with unit_of_work:
+        for aggregate in aggregates:
+            unit_of_work.register_new(aggregate)
+    unit_of_work.projects.calls.clear()
+    unit_of_work.tasks.calls.clear()
+
+
+class TestTrackingUnitOfWork:
+    """Tests for TrackingUnitOfWork class."""
+
+    async def test_commit_when_many_new_then_inserts_them_in_one_call(
+        self, unit_of_work, connection
+    ):
+        tasks = [FakeTask(i, 1, f"task {i}") for i in range(3)]
+
+        async with unit_of_work:
+            unit_of_work.register_new(FakeProject(1, "project"))
+            for task in tasks:
+                unit_of_work.register_new(task)
+
+        assert unit_of_work.tasks.calls == [("insert", [0, 1, 2])]
+        assert stored_titles(connection) == ["task 0", "task 1", "task 2"]
+
+    async def test_commit_when_registered_before_writer_order_then_follows_writers(
+        self, unit_of_work
+    ):
+        project = FakeProject(1, "project")
+        task = FakeTask(1, 1, "task")
+
+        async with unit_of_work:
+            unit_of_work.register_new(task)
+            unit_of_work.register_new(project)
+
+        assert unit_of_work.projects.calls == [("insert", [1])]
+        assert unit_of_work.tasks.calls == [("insert", [1])]
+
+    async def test_commit_when_removed_then_deletes_in_reverse_writer_order(
+        self, unit_of_work, connection
+    ):
+        project = FakeProject(1, "project")
+        task = FakeTask(1, 1, "task")
+        await store(unit_of_work, project, task)
+
+        async with unit_of_work:
+            unit_of_work.register_removed(project)
+            unit_of_work.register_removed(task)
+
+        assert unit_of_work.tasks.calls == [("delete", [1])]
+        assert stored_titles(connection) == []
+        assert connection.execute("SELECT COUNT(*) FROM projects").fetchone() == (0,)
+
+    async def test_commit_when_dirty_then_updates_after_inserts(
+        self, unit_of_work, connection
+    ):
+        await store(unit_of_work, FakeProject(1, "project"), FakeTask(1, 1, "old"))
+        changed = FakeTask(1, 1, "new", AggregateVersion.of(1))
+
+        async with unit_of_work:
+            unit_of_work.register_dirty(changed)
+            unit_of_work.register_new(FakeTask(2, 1, "added"))
+
+        assert unit_of_work.tasks.calls == [("insert", [2]), ("update", [1])]
+        assert stored_titles(connection) == ["new", "added"]
+
+    async def test_commit_when_versions_match_then_updates_and_bumps_versions(
+        self, unit_of_work, connection
+    ):
+        task = FakeTask(1, 1, "old")
+        await store(unit_of_work, FakeProject(1, "project"), task)
+        task.title = "new"
+
+        async with unit_of_work:
+            unit_of_work.register_dirty(task)
+        task.title = "newer"
+        async with unit_of_work:
+            unit_of_work.register_dirty(task)
+
+        assert task.version.value == 3
+        assert connection.execute("SELECT version FROM tasks").fetchone() == (3,)
+        assert stored_titles(connection) == ["newer"]
+
+    async def test_commit_when_version_conflict_then_raises_and_rolls_back(
+        self, unit_of_work, connection
+    ):
+        await store(
+            unit_of_work,
+            FakeProject(1, "project"),
+            FakeTask(1, 1, "first"),
+            FakeTask(2, 1, "second"),
+        )
+        stale = FakeTask(1, 1, "stale", AggregateVersion.of(1))
+        fresh = FakeTask(2, 1, "fresh", AggregateVersion.of(1))
+        connection.execute("UPDATE tasks SET version = 2 WHERE id = 1")
+        connection.commit()
+
+        with pytest.raises(ConcurrencyError) as exc_info:
+            async with unit_of_work:
+                unit_of_work.register_dirty(stale)
+                unit_of_work.register_dirty(fresh)
+
+        assert exc_info.value.conflicts == {1: 1}
+        assert stored_titles(connection) == ["first", "second"]
+        assert (stale.version.value, fresh.version.value) == (1, 1)
+
+    async def test_commit_when_committed_then_marks_changes_committed(
+        self, unit_of_work
+    ):
+        project = FakeProject(1, "project")
+
+        async with unit_of_work:
+            unit_of_work.register_new(project)
+
+        assert project.version.value == 1
+
+    async def test_commit_when_nothing_registered_then_calls_no_writer(
+        self, unit_of_work
+    ):
+        async with unit_of_work:
+            pass
+
+        assert unit_of_work.projects.calls == []
+        assert unit_of_work.tasks.calls == []
+
+    async def test_register_dirty_when_new_then_stays_new(self, unit_of_work):
+        project = FakeProject(1, "project")
+
+        async with unit_of_work:
+            unit_of_work.register_new(project)
+            unit_of_work.register_dirty(project)
+
+        assert unit_of_work.projects.calls == [("insert", [1])]
+
+    async def test_register_removed_when_new_then_writes_nothing(self, unit_of_work):
+        project = FakeProject(1, "project")
+
+        async with unit_of_work:
+            unit_of_work.register_new(project)
+            unit_of_work.register_removed(project)
+
+        assert unit_of_work.projects.calls == []
+
+    async def test_register_removed_when_dirty_then_only_deletes(self, unit_of_work):
+        project = FakeProject(1, "project")
+
+        async with unit_of_work:
+            unit_of_work.register_dirty(project)
+            unit_of_work.register_removed(project)
+
+        assert unit_of_work.projects.calls == [("delete", [1])]
+
+    async def test_register_new_when_subclass_then_uses_base_writer(self, unit_of_work):
+        async with unit_of_work:
+            unit_of_work.register_new(FakeProject(1, "project"))
+            unit_of_work.register_new(FakeTask(1, 1, "task"))
+            unit_of_work.register_new(FakeUrgentTask(2, 1, "urgent"))
+
+        assert unit_of_work.tasks.calls == [("insert", [1, 2])]
+
+    def test_register_new_when_no_writer_then_raises_value_error(self, unit_of_work):
+        with pytest.raises(ValueError, match="No writer registered for FakeUnknown"):
+            unit_of_work.register_new(FakeUnknown(1))
+
+    def test_register_new_when_dirty_then_raises_value_error(self, unit_of_work):
+        unit_of_work.register_dirty(FakeProject(1, "project"))
+
+        with pytest.raises(ValueError, match="FakeProject 1 is already stored"):
+            unit_of_work.register_new(FakeProject(1, "project"))
+
+    @pytest.mark.parametrize("method", ["register_new", "register_dirty"])
+    def test_register_when_removed_then_raises_value_error(self, unit_of_work, method):
+        project = FakeProject(1, "project")
+        unit_of_work.register_removed(project)
+
+        with pytest.raises(ValueError, match="FakeProject 1 is registered as removed"):
+            getattr(unit_of_work, method)(project)
+
+    def test_add_writer_when_type_already_has_one_then_raises_value_error(
+        self, unit_of_work, connection
+    ):
+        with pytest.raises(ValueError, match="already registered for FakeTask"):
+            unit_of_work.add_writer(FakeTask, SQLiteTaskWriter(connection))
+
+    async def test_commit_when_cache_added_then_drops_written_aggregates(
+        self, unit_of_work
+    ):
+        cache: AggregateCache[FakeProject, int] = AggregateCache()
+        unit_of_work.add_cache(FakeProject, cache)
+        await store(unit_of_work, FakeProject(2, "removed"))
+        cache.put(1, None)
+        cache.put(2, FakeProject(2, "removed"))
+
+        async with unit_of_work:
+            unit_of_work.register_new(FakeProject(1, "new"))
+            unit_of_work.register_removed(FakeProject(2, "removed"))
+
+        assert len(cache) == 0
+
+    async def test_commit_when_writer_fails_then_cache_keeps_entries(
+        self, unit_of_work
+    ):
+        cache: AggregateCache[FakeTask, int] = AggregateCache()
+        unit_of_work.add_cache(FakeTask, cache)
+        cache.put(1, None)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            async with unit_of_work:
+                unit_of_work.register_new(FakeTask(1, 2, "orphan"))
+
+        assert cache.get(1) is None
+
+    def test_add_cache_when_type_has_no_writer_then_raises_value_error(
+        self, unit_of_work
+    ):
+        with pytest.raises(ValueError, match="No writer registered for FakeUnknown"):
+            unit_of_work.add_cache(FakeUnknown, AggregateCache())
+
+    async def test_commit_when_writer_fails_then_rolls_back_everything(
+        self, unit_of_work, connection
+    ):
+        project = FakeProject(1, "project")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            async with unit_of_work:
+                unit_of_work.register_new(project)
+                unit_of_work.register_new(FakeTask(1, 2, "orphan"))
+
+        assert connection.execute("SELECT COUNT(*) FROM projects").fetchone() == (0,)
+        assert project.version.value == 0
+        await unit_of_work.commit()
+        assert unit_of_work.projects.calls == [("insert", [1])]
+
+    async def test_rollback_when_error_then_forgets_registrations(
+        self, unit_of_work, connection
+    ):
+        with pytest.raises(RuntimeError):
+            async with unit_of_work:
+                unit_of_work.register_new(FakeProject(1, "project"))
+                raise RuntimeError("use case failed")
+
+        await unit_of_work.commit()
+        assert unit_of_work.projects.calls == []
+
+
+class TestSyncTrackingUnitOfWork:
+    """Tests for SyncTrackingUnitOfWork class."""
+
+    def test_commit_when_many_new_then_inserts_them_in_one_call(self, connection):
+        unit_of_work = SyncSQLiteUnitOfWork(connection)
+        projects = [FakeProject(1, "first"), FakeProject(2, "second")]
+
+        with unit_of_work:
+            for project in projects:
+                unit_of_work.register_new(project)
+
+        assert unit_of_work.projects.calls == [("insert", [1, 2])]
+        assert [project.version.value for project in projects] == [1, 1]
+
+    def test_commit_when_removed_then_deletes_and_updates_cache(self, connection):
+        unit_of_work = SyncSQLiteUnitOfWork(connection)
+        cache: AggregateCache[FakeProject, int] = AggregateCache()
+        unit_of_work.add_cache(FakeProject, cache)
+        with unit_of_work:
+            unit_of_work.register_new(FakeProject(1, "project"))
+        cache.put(1, FakeProject(1, "project"))
+
+        with unit_of_work:
+            unit_of_work.register_removed(FakeProject(1, "project"))
+
+        assert connection.execute("SELECT COUNT(*) FROM projects").fetchone() == (0,)
+        assert len(cache) == 0
+
+    def test_commit_when_writer_fails_then_rolls_back_and_raises(self, connection):
+        unit_of_work = SyncSQLiteUnitOfWork(connection)
+        project = FakeProject(1, "project")
+
+        connection.execute("INSERT INTO projects (id, name) VALUES (2, 'stored')")
+        connection.commit()
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with unit_of_work:
+                unit_of_work.register_new(project)
+                unit_of_work.register_new(FakeProject(2, "duplicate"))
+
+        assert connection.execute("SELECT COUNT(*) FROM projects").fetchone() == (1,)
+        assert project.version.value == 0